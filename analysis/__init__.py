@@ -1,21 +1,35 @@
 """
 Analysis package
-"""
-
-from .correlation_analysis import CorrelationAnalyzer, generate_correlation_report
-from .spike_detector import SpikeDetector, RealTimeSpikeMonitor
-
-__all__ = [
-    'CorrelationAnalyzer',
-    'generate_correlation_report',
-    'SpikeDetector',
-    'RealTimeSpikeMonitor'
-]
 
+클래스는 처음 사용할 때 해당 모듈을 import 합니다 (모듈 수준 __getattr__).
+`from analysis.spike_detector import SpikeDetector` 처럼 하위 모듈 하나만 쓰는 경우
+다른 분석 모듈은 불러오지 않습니다.
+"""
 
+import importlib
 
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY_ATTRS = {
+    'CorrelationAnalyzer': '.correlation_analysis',
+    'generate_correlation_report': '.correlation_analysis',
+    'SpikeDetector': '.spike_detector',
+    'RealTimeSpikeMonitor': '.spike_detector',
+    'PriorityEngine': '.priority_engine',
+    'EventStudy': '.event_study',
+    'SignalBacktester': '.backtest',
+    'SpikeSweep': '.spike_sweep',
+}
 
+__all__ = list(_LAZY_ATTRS)
 
 
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,279 @@
+"""
+신호 백테스트 엔진
+
+종합 점수(composite_score) / 스파이크 알람을 매매 신호로 보고
+ETH/BTC 다음 시간 수익률에 대해 성과를 측정합니다.
+
+파라미터 조합(가중치 x 진입/청산 임계값, 임계값 x 보유 시간)을 배열의 축 하나로 두고
+[시간, 조합] 포지션 행렬 전체를 한 번의 벡터 연산으로 평가합니다.
+조합이 많으면 조합 축을 나눠 프로세스 풀에서 계산합니다.
+
+- 포지션: t 시점 신호로 t 종가에 진입, t -> t+1 수익률을 얻음 (미래 정보 없음)
+- 종합 점수: score >= entry 이면 매수, score < exit 이면 청산 (그 사이는 유지)
+- 스파이크: Z-score > threshold 이후 hold 시간 동안 보유
+- 지표: 거래 수, 적중률(수익 거래 비율), 평균 거래 수익률, 총 수익률, 최대 낙폭, 회전율, 보유 비율
+  (거래별 수익률은 진입/청산 양쪽 비용을 차감)
+"""
+
+import itertools
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.priority_engine import rolling_zscores
+from utils.profiling import instrument
+
+
+# 편도 거래 비용 (bp)
+DEFAULT_FEE_BPS = 10
+
+# 작업 하나당 조합 수
+CHUNK_COMBOS = 512
+
+# 이 이하의 조합 수는 프로세스 풀 없이 계산
+PARALLEL_MIN_COMBOS = 4096
+
+COMPONENTS = ['telegram', 'news', 'twitter']
+
+METRIC_COLUMNS = ['trades', 'hit_rate', 'avg_trade', 'total_return', 'max_drawdown', 'turnover', 'exposure']
+
+
+def weight_grid(names=COMPONENTS, step=0.1):
+    """
+    합이 1인 가중치 격자
+
+    Args:
+        names: 구성 요소 이름
+        step: 격자 간격
+
+    Returns:
+        ndarray: [조합, 구성 요소 수]
+    """
+    n = int(round(1 / step))
+    rows = [c for c in itertools.product(range(n + 1), repeat=len(names) - 1) if sum(c) <= n]
+    grid = np.array([list(c) + [n - sum(c)] for c in rows], dtype=np.float64)
+    return grid / n
+
+
+def log_returns(close):
+    """t -> t+1 로그 수익률 (마지막 시점은 0)"""
+    close = np.asarray(close, dtype=np.float64)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        r = np.log(close[1:] / close[:-1])
+    return np.append(np.nan_to_num(r, nan=0.0, posinf=0.0, neginf=0.0), 0.0)
+
+
+def hysteresis_positions(scores, entry, exit_):
+    """
+    진입/청산 임계값 포지션
+
+    Args:
+        scores: [시간, P] 점수
+        entry: [Q] 진입 임계값
+        exit_: [Q] 청산 임계값 (entry 이하)
+
+    Returns:
+        ndarray: [시간, P * Q] 0/1 포지션 (float)
+    """
+    T = scores.shape[0]
+    s = scores[:, :, None]
+    state = np.where(s >= entry[None, None, :], 1, np.where(s < exit_[None, None, :], 0, -1)).reshape(T, -1)
+
+    # 마지막으로 상태가 정해진 시점의 값을 앞으로 채움
+    idx = np.where(state >= 0, np.arange(T)[:, None], 0)
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    positions = np.take_along_axis(state, idx, axis=0)
+    return np.clip(positions, 0, 1).astype(np.float64)
+
+
+def holding_positions(events, hold):
+    """
+    이벤트 후 hold 시간 보유 포지션
+
+    Args:
+        events: [시간, Q] 이벤트 여부
+        hold: [H] 보유 시간
+
+    Returns:
+        ndarray: [시간, Q * H] 0/1 포지션
+    """
+    T = events.shape[0]
+    cs = np.vstack((np.zeros((1, events.shape[1])), np.cumsum(events, axis=0)))
+    lagged = np.clip(np.arange(1, T + 1)[:, None] - hold[None, :], 0, None)
+    # [시간, Q, H]: (t-hold, t] 구간 이벤트 수
+    counts = cs[1:, :, None] - cs[lagged].transpose(0, 2, 1)
+    return (counts > 0).reshape(T, -1).astype(np.float64)
+
+
+def evaluate_positions(positions, logr, fee_bps=DEFAULT_FEE_BPS):
+    """
+    포지션 행렬 성과 지표 (조합 축 전체를 한 번에)
+
+    Args:
+        positions: [시간, N] 0/1 포지션
+        logr: [시간] t -> t+1 로그 수익률
+        fee_bps: 편도 거래 비용 (bp)
+
+    Returns:
+        dict: 지표 이름 -> [N] 배열
+    """
+    T, N = positions.shape
+    prev = np.vstack((np.zeros((1, N)), positions[:-1]))
+    changes = np.abs(positions - prev)
+
+    # 거래 비용은 포지션이 바뀌는 시점에 차감
+    strat = positions * logr[:, None] + np.log1p(-fee_bps / 1e4) * changes
+    equity = np.cumsum(strat, axis=0)
+
+    # 거래별 수익: 청산 시점 누적값 - 진입 직전 누적값 (청산 시점 값에 청산 비용까지 포함)
+    entries = (positions > 0) & (prev == 0)
+    exits = (positions == 0) & (prev > 0)
+    before = np.vstack((np.zeros((1, N)), equity[:-1]))
+    last_entry = np.where(entries, np.arange(T)[:, None], 0)
+    np.maximum.accumulate(last_entry, axis=0, out=last_entry)
+    entry_equity = np.take_along_axis(before, last_entry, axis=0)
+
+    closed = exits[1:]
+    trade_returns = np.where(closed, equity[1:] - entry_equity[1:], np.nan)
+    # 마지막까지 보유 중인 거래는 끝에서 청산한 것으로 처리 (청산 비용도 차감)
+    open_at_end = positions[-1] > 0
+    final_trade = np.where(open_at_end, equity[-1] - entry_equity[-1] + np.log1p(-fee_bps / 1e4), np.nan)
+
+    n_trades = closed.sum(axis=0) + open_at_end
+    wins = np.nansum(trade_returns > 0, axis=0) + (final_trade > 0)
+    trade_sum = np.nansum(np.expm1(trade_returns), axis=0) + np.nan_to_num(np.expm1(final_trade))
+
+    running_max = np.maximum.accumulate(np.vstack((np.zeros((1, N)), equity)), axis=0)[1:]
+    drawdown = running_max - equity
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return {
+            'trades': n_trades,
+            'hit_rate': np.where(n_trades > 0, wins / np.maximum(n_trades, 1), np.nan),
+            'avg_trade': np.where(n_trades > 0, trade_sum / np.maximum(n_trades, 1), np.nan),
+            'total_return': np.expm1(equity[-1]),
+            'max_drawdown': -np.expm1(-drawdown.max(axis=0)),
+            'turnover': changes.sum(axis=0) / T,
+            'exposure': positions.mean(axis=0),
+        }
+
+
+def _composite_chunk(args):
+    """가중치 조합 묶음 하나 평가 (프로세스 풀 작업 단위)"""
+    components, weights, entry, exit_, logr, fee_bps = args
+    scores = components @ weights.T
+    return evaluate_positions(hysteresis_positions(scores, entry, exit_), logr, fee_bps)
+
+
+def _spike_chunk(args):
+    """임계값 묶음 하나 평가 (프로세스 풀 작업 단위)"""
+    zscores, thresholds, hold, logr, fee_bps = args
+    with np.errstate(invalid='ignore'):
+        events = zscores[:, None] > thresholds[None, :]
+    return evaluate_positions(holding_positions(events, hold), logr, fee_bps)
+
+
+class SignalBacktester:
+    """신호 백테스트"""
+
+    def __init__(self, close, fee_bps=DEFAULT_FEE_BPS, n_jobs=None):
+        """
+        Args:
+            close: 시간별 종가 (시간 순)
+            fee_bps: 편도 거래 비용 (bp)
+            n_jobs: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스)
+        """
+        self.close = np.asarray(close, dtype=np.float64)
+        self.logr = log_returns(self.close)
+        self.fee_bps = fee_bps
+        self.n_jobs = n_jobs
+
+    @classmethod
+    def from_processed(cls, df, coin='ETH', **kwargs):
+        """processed_data.csv 의 <coin>_close 사용"""
+        close = df.sort_values('timestamp')[f'{coin}_close'].ffill().bfill()
+        return cls(close.to_numpy(), **kwargs)
+
+    @property
+    def buy_and_hold(self):
+        return float(np.expm1(self.logr.sum()))
+
+    def _map(self, fn, tasks, n_combos):
+        """작업 목록 실행 후 지표 이어붙이기 (조합이 많으면 프로세스 풀)"""
+        if self.n_jobs != 1 and len(tasks) > 1 and n_combos >= PARALLEL_MIN_COMBOS:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+                parts = list(pool.map(fn, tasks))
+        else:
+            parts = [fn(task) for task in tasks]
+        return {k: np.concatenate([p[k] for p in parts]) for k in METRIC_COLUMNS}
+
+    @instrument()
+    def run_composite_grid(self, components, weights=None, entry=(60, 65, 70, 75), exit_=None, names=COMPONENTS):
+        """
+        종합 점수 가중치 x 진입/청산 임계값 격자 백테스트
+
+        Args:
+            components: [시간, K] 구성 요소 점수 (0-100, 예: telegram/news/twitter_score)
+            weights: [P, K] 가중치 격자 (None이면 0.1 간격 전체)
+            entry: 진입 임계값 목록
+            exit_: 청산 임계값 목록 (None이면 40 = neutral 하한, entry 와 같은 길이)
+            names: 구성 요소 이름 (결과 컬럼명)
+
+        Returns:
+            DataFrame: w_<이름>, entry, exit + 지표 (총 수익률 내림차순)
+        """
+        components = np.nan_to_num(np.asarray(components, dtype=np.float64), nan=50.0)
+        weights = weight_grid(names) if weights is None else np.atleast_2d(np.asarray(weights, dtype=np.float64))
+        entry = np.asarray(entry, dtype=np.float64)
+        exit_ = np.full_like(entry, 40.0) if exit_ is None else np.asarray(exit_, dtype=np.float64)
+
+        step = max(1, CHUNK_COMBOS // len(entry))
+        tasks = [
+            (components, weights[i:i + step], entry, exit_, self.logr, self.fee_bps)
+            for i in range(0, len(weights), step)
+        ]
+        metrics = self._map(_composite_chunk, tasks, len(weights) * len(entry))
+
+        params = {f'w_{name}': np.repeat(weights[:, k], len(entry)) for k, name in enumerate(names)}
+        params['entry'] = np.tile(entry, len(weights))
+        params['exit'] = np.tile(exit_, len(weights))
+        return self._result(params, metrics)
+
+    @instrument()
+    def run_spike_grid(self, values, thresholds=(2.0, 2.5, 3.0), hold=(1, 3, 6, 12, 24), window=24):
+        """
+        스파이크 임계값 x 보유 시간 격자 백테스트
+
+        Args:
+            values: 감지 대상 시계열 (예: message_count, tx_frequency)
+            thresholds: Z-score 임계값 목록
+            hold: 보유 시간 목록
+            window: Z-score 이동 윈도우
+
+        Returns:
+            DataFrame: threshold, hold + 지표 (총 수익률 내림차순)
+        """
+        zscores = rolling_zscores(np.asarray(values, dtype=np.float64)[:, None], window)[:, 0]
+        thresholds = np.asarray(thresholds, dtype=np.float64)
+        hold = np.asarray(hold, dtype=np.int64)
+
+        step = max(1, CHUNK_COMBOS // len(hold))
+        tasks = [
+            (zscores, thresholds[i:i + step], hold, self.logr, self.fee_bps)
+            for i in range(0, len(thresholds), step)
+        ]
+        metrics = self._map(_spike_chunk, tasks, len(thresholds) * len(hold))
+
+        params = {'threshold': np.repeat(thresholds, len(hold)), 'hold': np.tile(hold, len(thresholds))}
+        return self._result(params, metrics)
+
+    def _result(self, params, metrics):
+        result = pd.DataFrame({**params, **metrics})
+        result['trades'] = result['trades'].astype(np.int64)
+        result.attrs['buy_and_hold'] = self.buy_and_hold
+        return result.sort_values('total_return', ascending=False).reset_index(drop=True)
@@ -5,17 +5,98 @@
 - 피어슨/스피어만 상관계수
 - 시차 상관관계 (Lag Correlation)
 - 그랜저 인과관계 (Granger Causality)
+- 이동/누적 상관계수 (누적합 기반 O(n), 여러 쌍/윈도우 일괄 계산)
 """
 
 import pandas as pd
 import numpy as np
-from scipy import stats
-from statsmodels.tsa.stattools import grangercausalitytests
 import warnings
+import os
+import sys
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.profiling import instrument
 
 warnings.filterwarnings('ignore')
 
 
+# 대시보드 상관관계 지표와 같은 (커뮤니티 지표, 대상) 쌍
+DEFAULT_CORRELATION_PAIRS = [
+    (source, target)
+    for target in ['ETH_close', 'tx_frequency']
+    for source in ['twitter_count', 'twitter_sentiment_compound', 'message_count', 'avg_sentiment']
+]
+
+# 이동 상관계수 기본 윈도우 (1일, 1주, 30일)
+DEFAULT_CORRELATION_WINDOWS = (24, 168, 720)
+
+
+def _window_sums(cs, end, start):
+    """누적합 [T+1, P] 에서 각 윈도우 (start, end] 합 [T, W, P]"""
+    return cs[end] - cs[start]
+
+
+def rolling_corr(x, y, windows, min_periods=None):
+    """
+    여러 (x, y) 쌍 / 여러 윈도우의 이동 피어슨 상관계수를 누적합으로 한 번에 계산
+
+    윈도우 크기와 무관하게 O(T) 이며, 결측치는 쌍별로 제외합니다 (pandas rolling.corr 과 동일).
+    표본이 min_periods 보다 적거나 분산이 0인 윈도우는 NaN 입니다.
+
+    Args:
+        x: [시간, P] 배열 (쌍별 첫 번째 변수)
+        y: [시간, P] 배열 (쌍별 두 번째 변수)
+        windows: 윈도우 크기 목록 (None 또는 0이면 처음부터 누적 = expanding)
+        min_periods: 최소 관측 수 (None이면 윈도우 크기, expanding은 2)
+
+    Returns:
+        ndarray: [시간, 윈도우 수, P]
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x.ndim == 1:
+        x, y = x[:, None], y[:, None]
+    T = x.shape[0]
+
+    # 두 값이 모두 있는 시점만 사용
+    valid = np.isfinite(x) & np.isfinite(y)
+    with np.errstate(invalid='ignore'):
+        # 상쇄 오차를 줄이기 위해 쌍별 평균을 빼고 누적
+        x = np.where(valid, x - np.nanmean(np.where(valid, x, np.nan), axis=0), 0.0)
+        y = np.where(valid, y - np.nanmean(np.where(valid, y, np.nan), axis=0), 0.0)
+
+    zero = np.zeros((1, x.shape[1]))
+    cs = {
+        name: np.vstack((zero, np.cumsum(arr, axis=0)))
+        for name, arr in [('n', valid.astype(np.float64)), ('x', x), ('y', y),
+                          ('xx', x * x), ('yy', y * y), ('xy', x * y)]
+    }
+
+    sizes = np.array([w or T for w in windows], dtype=np.int64)
+    end = np.arange(1, T + 1)[:, None]
+    start = np.maximum(end - sizes[None, :], 0)
+    if min_periods is None:
+        needed = np.array([w if w else 2 for w in windows], dtype=np.float64)
+    else:
+        needed = np.full(len(windows), max(min_periods, 2), dtype=np.float64)
+
+    n = _window_sums(cs['n'], end, start)
+    sx, sy = _window_sums(cs['x'], end, start), _window_sums(cs['y'], end, start)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        cov = _window_sums(cs['xy'], end, start) - sx * sy / n
+        vx = _window_sums(cs['xx'], end, start) - sx * sx / n
+        vy = _window_sums(cs['yy'], end, start) - sy * sy / n
+
+        # 분산이 누적합 반올림 오차 수준이면 상수 구간으로 보고 NaN
+        tol_x = 1e-12 * cs['xx'][end]
+        tol_y = 1e-12 * cs['yy'][end]
+        r = cov / np.sqrt(vx * vy)
+
+    ok = (n >= needed[None, :, None]) & (vx > tol_x) & (vy > tol_y)
+    return np.where(ok, np.clip(r, -1.0, 1.0), np.nan)
+
+
 class CorrelationAnalyzer:
     """상관관계 분석 클래스"""
     
@@ -26,6 +107,7 @@ class CorrelationAnalyzer:
         """
         self.df = df.copy()
         
+    @instrument()
     def pearson_correlation(self, columns=None):
         """
         피어슨 상관계수 계산
@@ -45,6 +127,7 @@ class CorrelationAnalyzer:
         corr_matrix = self.df[columns].corr(method='pearson')
         return corr_matrix
     
+    @instrument()
     def spearman_correlation(self, columns=None):
         """
         스피어만 상관계수 계산 (비선형 관계 측정)
@@ -62,6 +145,7 @@ class CorrelationAnalyzer:
         corr_matrix = self.df[columns].corr(method='spearman')
         return corr_matrix
     
+    @instrument()
     def lag_correlation(self, col1, col2, max_lag=24):
         """
         시차 상관관계 계산
@@ -74,6 +158,9 @@ class CorrelationAnalyzer:
         Returns:
             DataFrame: 시차별 상관계수
         """
+        # scipy 는 이 기능을 쓸 때만 로드 (대시보드 시작 시간 단축)
+        from scipy import stats
+        
         lags = []
         correlations = []
         p_values = []
@@ -117,6 +204,7 @@ class CorrelationAnalyzer:
         
         return result
     
+    @instrument()
     def granger_causality_test(self, col1, col2, max_lag=12):
         """
         그랜저 인과관계 검정
@@ -130,6 +218,9 @@ class CorrelationAnalyzer:
         Returns:
             dict: 검정 결과
         """
+        # statsmodels 는 이 기능을 쓸 때만 로드 (대시보드 시작 시간 단축)
+        from statsmodels.tsa.stattools import grangercausalitytests
+        
         # 결측치 제거
         data = self.df[[col1, col2]].dropna()
         
@@ -142,7 +233,7 @@ class CorrelationAnalyzer:
             # 그랜저 인과관계 검정
             # H0: col1은 col2의 원인이 아니다
             # p-value < 0.05이면 H0 기각 -> col1이 col2의 원인이다
-            test_result = grangercausalitytests(data[[col2, col1]], max_lag, verbose=False)
+            test_result = grangercausalitytests(data[[col2, col1]], max_lag)
             
             # 결과 정리
             results = []
@@ -160,6 +251,7 @@ class CorrelationAnalyzer:
         except Exception as e:
             return {'error': str(e)}
     
+    @instrument()
     def volatility_analysis(self, trigger_col, target_col, threshold=2.0):
         """
         트리거 이벤트 발생 시 타겟 변수의 변동성 분석
@@ -231,6 +323,59 @@ class CorrelationAnalyzer:
         
         return result
     
+    def _pair_matrices(self, pairs):
+        """존재하는 쌍만 골라 ([시간, P] x, [시간, P] y, 쌍 이름 목록)"""
+        if pairs is None:
+            pairs = DEFAULT_CORRELATION_PAIRS
+        pairs = [(a, b) for a, b in pairs if a in self.df.columns and b in self.df.columns]
+        x = self.df[[a for a, _ in pairs]].to_numpy(dtype=np.float64)
+        y = self.df[[b for _, b in pairs]].to_numpy(dtype=np.float64)
+        return x, y, [f'{a} ~ {b}' for a, b in pairs]
+    
+    @instrument()
+    def rolling_correlation(self, pairs=None, windows=DEFAULT_CORRELATION_WINDOWS, min_periods=None):
+        """
+        이동 상관계수 (상관관계 추이)
+        
+        Args:
+            pairs: [(col1, col2)] 목록 (None이면 DEFAULT_CORRELATION_PAIRS, 없는 컬럼 쌍은 제외)
+            windows: 윈도우 크기 목록 (시간)
+            min_periods: 최소 관측 수 (None이면 윈도우 크기)
+            
+        Returns:
+            DataFrame: timestamp, window, '<col1> ~ <col2>' 쌍별 상관계수 (윈도우별로 이어붙임)
+        """
+        x, y, names = self._pair_matrices(pairs)
+        if not names:
+            return pd.DataFrame(columns=['timestamp', 'window'])
+        
+        corr = rolling_corr(x, y, windows, min_periods)
+        frames = []
+        for i, window in enumerate(windows):
+            frame = pd.DataFrame(corr[:, i, :], columns=names)
+            frame.insert(0, 'window', window)
+            frame.insert(0, 'timestamp', self.df['timestamp'].to_numpy())
+            frames.append(frame)
+        return pd.concat(frames, ignore_index=True)
+    
+    @instrument()
+    def expanding_correlation(self, pairs=None, min_periods=24):
+        """
+        누적 상관계수 (처음부터 각 시점까지)
+        
+        Args:
+            pairs: [(col1, col2)] 목록 (None이면 DEFAULT_CORRELATION_PAIRS)
+            min_periods: 최소 관측 수
+            
+        Returns:
+            DataFrame: timestamp, '<col1> ~ <col2>' 쌍별 상관계수
+        """
+        x, y, names = self._pair_matrices(pairs)
+        frame = pd.DataFrame(rolling_corr(x, y, [None], min_periods)[:, 0, :], columns=names)
+        frame.insert(0, 'timestamp', self.df['timestamp'].to_numpy())
+        return frame
+    
+    @instrument()
     def get_top_correlations(self, target_col, n=10, method='pearson'):
         """
         특정 컬럼과 가장 상관관계가 높은 변수들 반환
@@ -0,0 +1,330 @@
+"""
+다중 소스 우선순위 점수 엔진
+
+시간 축이 맞춰진 N개 소스(텔레그램 메시지, 고래 거래, 트위터 참여도 등)의
+Z-score를 한 번에 2차원 배열 [시간, 소스]로 계산하고,
+단일 소스 급증과 동시 급증 규칙을 비트마스크로 평가해
+우선순위 점수와 알람 레벨을 벡터 연산으로 구합니다.
+
+- 소스 i 급증 -> 비트 i
+- 동시 급증 규칙은 필요한 비트 묶음 (mask & rule == rule 이면 발동)
+- 우선순위 = 급증한 소스 점수 합 + 발동한 규칙 점수 합
+- 사유 문자열(reasons)은 출력할 행에 대해서만 만듭니다.
+
+규칙은 data/monitor_config.json 의 priority_sources / co_spike_rules /
+alert_level_thresholds 에서 읽고, 없으면 아래 기본값을 사용합니다.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.profiling import instrument
+from utils.timestamps import hour_key, hour_from_key
+
+
+DEFAULT_CONFIG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'monitor_config.json'
+)
+
+# 소스별 급증 규칙 (비트 순서 = 리스트 순서)
+DEFAULT_SOURCES = [
+    {'name': 'telegram', 'column': 'telegram_msgs', 'label': '텔레그램 메시지 급증', 'points': 2},
+    {'name': 'whale', 'column': 'whale_txs', 'label': '고래 거래 급증', 'points': 3},
+    {'name': 'twitter', 'column': 'twitter_engagement', 'label': '트위터 인플루언서 활동 급증', 'points': 2},
+]
+
+# 동시 급증 규칙 (level 을 지정하면 점수와 무관하게 해당 레벨)
+DEFAULT_CO_SPIKE_RULES = [
+    {'sources': ['telegram', 'whale'], 'label': '⚠️ 텔레그램+고래 동시 급증', 'points': 5},
+    {'sources': ['twitter', 'whale'], 'label': '⚠️ 트위터+고래 동시 급증', 'points': 4},
+    {'sources': ['telegram', 'whale', 'twitter'], 'label': '🚨 3개 소스 모두 급증 (CRITICAL)',
+     'points': 10, 'level': 'CRITICAL'},
+]
+
+# 레벨별 최소 우선순위 (CRITICAL 은 critical_priority_threshold)
+DEFAULT_LEVEL_THRESHOLDS = {'HIGH': 5, 'MEDIUM': 1}
+
+LEVELS = ['CRITICAL', 'HIGH', 'MEDIUM']
+
+# 출력에 함께 저장할 참고 컬럼
+CONTEXT_COLUMNS = ['telegram_sentiment', 'twitter_sentiment']
+
+
+def load_monitor_config(config_path=None):
+    """
+    모니터링 설정 로드 (없는 항목은 기본값)
+
+    Args:
+        config_path: 설정 파일 경로 (기본값: data/monitor_config.json)
+
+    Returns:
+        dict: 설정
+    """
+    config = {
+        'spike_threshold': 2.0,
+        'window_hours': 24,
+        'critical_priority_threshold': 10,
+        'priority_sources': DEFAULT_SOURCES,
+        'co_spike_rules': DEFAULT_CO_SPIKE_RULES,
+        'alert_level_thresholds': DEFAULT_LEVEL_THRESHOLDS,
+    }
+
+    path = config_path or DEFAULT_CONFIG_PATH
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                config.update(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"경고: 모니터링 설정 로드 실패 - {e}")
+
+    return config
+
+
+def rolling_zscores(values, window):
+    """
+    열별 롤링 Z-score (현재 값 포함 윈도우, SpikeDetector 와 동일한 방식)
+
+    Args:
+        values: [시간, 소스] 배열
+        window: 윈도우 크기
+
+    Returns:
+        ndarray: [시간, 소스] Z-score (표본이 부족하면 NaN)
+    """
+    rolling = pd.DataFrame(values).rolling(window=window, min_periods=1)
+    mean = rolling.mean().to_numpy()
+    std = rolling.std().to_numpy()
+    return (values - mean) / (std + 1e-10)
+
+
+class PriorityResult:
+    """점수 계산 결과 (사유 문자열은 to_frame() 시점에 출력 행만 생성)"""
+
+    def __init__(self, engine, frame, zscores, spike_mask, rule_mask, priority, level, emitted):
+        self.engine = engine
+        self.frame = frame
+        self.zscores = zscores
+        self.spike_mask = spike_mask
+        self.rule_mask = rule_mask
+        self.priority = priority
+        self.level = level
+        self.emitted = emitted
+
+    def __len__(self):
+        return len(self.emitted)
+
+    def reasons(self, rows=None):
+        """
+        행별 사유 문자열
+
+        같은 (급증 비트, 규칙 비트) 조합은 템플릿을 한 번만 만들고 Z-score만 채웁니다.
+
+        Args:
+            rows: 행 위치 배열 (기본값: 출력 행)
+
+        Returns:
+            list: 사유 문자열
+        """
+        rows = self.emitted if rows is None else rows
+        templates = {}
+        result = []
+
+        for row in rows:
+            key = (int(self.spike_mask[row]), int(self.rule_mask[row]))
+            template = templates.get(key)
+            if template is None:
+                template = templates[key] = self.engine.reason_template(*key)
+
+            source_idx, rule_labels = template
+            parts = [
+                f"{self.engine.sources[i]['label']} (z={self.zscores[row, i]:.2f})" for i in source_idx
+            ]
+            result.append('; '.join(parts + rule_labels))
+
+        return result
+
+    def to_frame(self, min_level=None, first_row=0):
+        """
+        알람 테이블 (우선순위 내림차순, 같은 점수는 최근 순)
+
+        Args:
+            min_level: 최소 레벨 ('MEDIUM', 'HIGH', 'CRITICAL', None이면 전체)
+            first_row: 이 위치 이후 행만 (앞부분이 Z-score 윈도우용 이력일 때)
+
+        Returns:
+            DataFrame: timestamp, priority_score, alert_level, reasons, 소스 값, 참고 컬럼
+        """
+        rows = self.emitted[self.emitted >= first_row]
+        if min_level is not None:
+            allowed = LEVELS[:LEVELS.index(min_level) + 1]
+            rows = rows[np.isin(self.level[rows], allowed)]
+
+        timestamps = self.frame['timestamp'].to_numpy()[rows]
+        order = np.lexsort((-timestamps.astype('datetime64[ns]').astype(np.int64), -self.priority[rows]))
+        rows = rows[order]
+
+        out = pd.DataFrame({
+            'timestamp': self.frame['timestamp'].to_numpy()[rows],
+            'priority_score': self.priority[rows],
+            'alert_level': self.level[rows],
+            'reasons': self.reasons(rows),
+        })
+        columns = [s['column'] for s in self.engine.sources]
+        columns += [c for c in CONTEXT_COLUMNS if c in self.frame.columns and c not in columns]
+        for col in columns:
+            out[col] = self.frame[col].to_numpy()[rows]
+        return out
+
+
+class PriorityEngine:
+    """다중 소스 우선순위 점수 엔진"""
+
+    def __init__(self, config=None, config_path=None):
+        """
+        Args:
+            config: 설정 덮어쓰기 딕셔너리 (monitor_config.json 값보다 우선)
+            config_path: 설정 파일 경로 (기본값: data/monitor_config.json)
+        """
+        cfg = load_monitor_config(config_path)
+        cfg.update(config or {})
+        self.config = cfg
+
+        self.threshold = float(cfg['spike_threshold'])
+        self.window = int(cfg['window_hours'])
+        self.sources = list(cfg['priority_sources'])
+        self.rules = list(cfg['co_spike_rules'])
+
+        bits = {s['name']: 1 << i for i, s in enumerate(self.sources)}
+        missing = {name for r in self.rules for name in r['sources']} - set(bits)
+        if missing:
+            raise ValueError(f"동시 급증 규칙에 정의되지 않은 소스: {missing}")
+
+        self.source_points = np.array([s['points'] for s in self.sources], dtype=np.int64)
+        self.rule_bits = np.array([sum(bits[n] for n in r['sources']) for r in self.rules], dtype=np.int64)
+        self.rule_points = np.array([r['points'] for r in self.rules], dtype=np.int64)
+        self.rule_levels = [r.get('level') for r in self.rules]
+
+        thresholds = dict(cfg['alert_level_thresholds'])
+        thresholds['CRITICAL'] = cfg['critical_priority_threshold']
+        self.level_thresholds = thresholds
+
+    @property
+    def columns(self):
+        return [s['column'] for s in self.sources]
+
+    def reason_template(self, spike_mask, rule_mask):
+        """(급증 비트, 규칙 비트) -> (급증 소스 인덱스, 발동 규칙 라벨)"""
+        source_idx = [i for i in range(len(self.sources)) if spike_mask >> i & 1]
+        rule_labels = [r['label'] for j, r in enumerate(self.rules) if rule_mask >> j & 1]
+        return source_idx, rule_labels
+
+    @instrument()
+    def score(self, frame, zscores=None):
+        """
+        전체 기간 점수 계산 (한 번의 NumPy 연산)
+
+        Args:
+            frame: timestamp + 소스 컬럼이 있는 시간별 데이터프레임 (시간 순)
+            zscores: 미리 계산한 [시간, 소스] Z-score (frame 행 순서, None이면 rolling_zscores)
+
+        Returns:
+            PriorityResult: 점수 결과
+        """
+        missing = [c for c in self.columns if c not in frame.columns]
+        if missing:
+            raise KeyError(f"소스 컬럼이 없습니다: {missing}")
+
+        if zscores is None:
+            frame = frame.sort_values('timestamp').reset_index(drop=True)
+            zscores = rolling_zscores(frame[self.columns].to_numpy(dtype=np.float64), self.window)
+        else:
+            frame = frame.reset_index(drop=True)
+            zscores = np.asarray(zscores, dtype=np.float64)
+        with np.errstate(invalid='ignore'):
+            spikes = zscores > self.threshold
+
+        n_sources = len(self.sources)
+        spike_mask = spikes.astype(np.int64) @ (np.int64(1) << np.arange(n_sources, dtype=np.int64))
+
+        # [시간, 규칙] 발동 여부
+        fired = (spike_mask[:, None] & self.rule_bits[None, :]) == self.rule_bits[None, :]
+        rule_mask = fired.astype(np.int64) @ (np.int64(1) << np.arange(len(self.rules), dtype=np.int64))
+
+        priority = spikes.astype(np.int64) @ self.source_points + fired.astype(np.int64) @ self.rule_points
+
+        forced = {name: np.zeros(len(frame), dtype=bool) for name in LEVELS}
+        for j, level in enumerate(self.rule_levels):
+            if level in forced:
+                forced[level] |= fired[:, j]
+
+        conditions = [forced[name] | (priority >= self.level_thresholds[name]) for name in LEVELS]
+        level = np.select(conditions, LEVELS, default='')
+        emitted = np.flatnonzero((spike_mask != 0) & (level != ''))
+
+        return PriorityResult(self, frame, zscores, spike_mask, rule_mask, priority, level, emitted)
+
+
+def _hour_index(df):
+    """timestamp 컬럼 -> 시간 버킷 정수 키 (그룹 키)"""
+    return pd.Series(hour_key(df['timestamp']), index=df.index, name='hour')
+
+
+def _hourly_twitter(twitter_df):
+    """트위터 게시글 -> 시간별 참여도 합계 / 평균 감정 점수"""
+    hour = _hour_index(twitter_df)
+    engagement = (
+        pd.to_numeric(twitter_df.get('likes'), errors='coerce').fillna(0)
+        + 2 * pd.to_numeric(twitter_df.get('shares'), errors='coerce').fillna(0)
+        + 3 * pd.to_numeric(twitter_df.get('comments'), errors='coerce').fillna(0)
+    )
+    return pd.DataFrame({
+        'twitter_engagement': engagement.groupby(hour).sum(),
+        'twitter_sentiment': pd.to_numeric(twitter_df['sentiment_score'], errors='coerce').groupby(hour).mean(),
+    })
+
+
+def build_source_frame(loader):
+    """
+    원본 데이터에서 시간별 소스 프레임 생성
+
+    Args:
+        loader: DataLoader
+
+    Returns:
+        DataFrame: timestamp, telegram_msgs, whale_txs, twitter_engagement,
+                   telegram_sentiment, twitter_sentiment (빈 시간은 0)
+    """
+    parts = []
+
+    whale = loader.load_whale_transactions()
+    if not whale.empty:
+        hour = _hour_index(whale)
+        parts.append(whale['tx_frequency'].groupby(hour).sum().rename('whale_txs').to_frame())
+
+    telegram = loader.load_telegram_data()
+    if not telegram.empty:
+        hour = _hour_index(telegram)
+        parts.append(pd.DataFrame({
+            'telegram_msgs': telegram['message_count'].groupby(hour).sum(),
+            'telegram_sentiment': telegram['avg_sentiment'].groupby(hour).mean(),
+        }))
+
+    twitter = loader.load_twitter_data()
+    if not twitter.empty:
+        parts.append(_hourly_twitter(twitter))
+
+    columns = ['whale_txs', 'telegram_msgs', 'twitter_engagement', 'telegram_sentiment', 'twitter_sentiment']
+    if not parts:
+        return pd.DataFrame(columns=['timestamp'] + columns)
+
+    frame = pd.concat(parts, axis=1).sort_index()
+    keys = np.arange(frame.index.min(), frame.index.max() + 1)
+    frame = frame.reindex(keys).reindex(columns=columns).fillna(0)
+    frame.index = pd.DatetimeIndex(hour_from_key(keys), name='timestamp')
+    return frame.reset_index()
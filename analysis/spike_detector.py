@@ -10,6 +10,13 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
+import os
+import sys
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.profiling import instrument
+from analysis.spike_sweep import SpikeSweep
 
 
 class SpikeDetector:
@@ -24,6 +31,7 @@ class SpikeDetector:
         self.df = df.copy()
         self.window = window
         
+    @instrument()
     def detect_zscore_spike(self, column, threshold=2.5):
         """
         Z-score 기반 스파이크 감지
@@ -56,6 +64,7 @@ class SpikeDetector:
         
         return spikes[['timestamp', 'spike_column', 'spike_type', 'spike_magnitude', column, zscore_col]]
     
+    @instrument()
     def detect_moving_average_spike(self, column, threshold_pct=50):
         """
         이동평균 대비 급등/급락 감지
@@ -88,6 +97,7 @@ class SpikeDetector:
         
         return spikes[['timestamp', 'spike_column', 'spike_type', 'spike_magnitude', column, ma_col, 'pct_from_ma']]
     
+    @instrument()
     def detect_rate_of_change_spike(self, column, window=3, threshold_pct=30):
         """
         변화율 기반 급증 감지 (단기간 급등)
@@ -115,6 +125,7 @@ class SpikeDetector:
         
         return spikes[['timestamp', 'spike_column', 'spike_type', 'spike_magnitude', column, f'{column}_roc']]
     
+    @instrument()
     def detect_multi_indicator_spike(self, columns, weights=None, threshold=0.7):
         """
         다중 지표 통합 스파이크 감지
@@ -161,6 +172,7 @@ class SpikeDetector:
         
         return spikes
     
+    @instrument()
     def detect_correlation_spike(self, col1, col2, threshold=2.5):
         """
         상관관계 스파이크 감지
@@ -188,6 +200,7 @@ class SpikeDetector:
         
         return spikes
     
+    @instrument()
     def detect_telegram_whale_combined_spike(self, telegram_col='message_count', whale_col='tx_frequency', threshold=2.0):
         """
         텔레그램과 고래 거래의 동시 스파이크 감지 (Critical 알람용)
@@ -268,6 +281,36 @@ class SpikeDetector:
         alerts['alert_message'] = alerts.apply(create_message, axis=1)
         
         return alerts
+    
+    def sweep(self, column, windows=None, z_thresholds=(2.0, 2.5, 3.0), ma_thresholds=(30, 50, 100),
+              roc_thresholds=(30, 50, 100), events=None, roc_window=3, tolerance=3, n_jobs=None):
+        """
+        감지 파라미터 조합 전체의 스파이크 수 / 라벨 대비 정밀도
+        
+        Args:
+            column: 감지할 컬럼명
+            windows: 이동 윈도우 목록 (None이면 self.window 하나)
+            z_thresholds: Z-score 임계값 목록
+            ma_thresholds: 이동평균 대비 변화율 임계값 목록 (%)
+            roc_thresholds: 변화율 임계값 목록 (%)
+            events: 라벨 이벤트 시각 목록 (None이면 스파이크 수만 계산)
+            roc_window: 변화율 계산 윈도우 (시간)
+            tolerance: 라벨 이벤트 허용 오차 (시간)
+            n_jobs: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스)
+            
+        Returns:
+            DataFrame: 조합별 결과 (analysis.spike_sweep.RESULT_COLUMNS)
+        """
+        sweep = SpikeSweep(
+            windows=(self.window,) if windows is None else windows,
+            z_thresholds=z_thresholds,
+            ma_thresholds=ma_thresholds,
+            roc_thresholds=roc_thresholds,
+            roc_window=roc_window,
+            tolerance=tolerance,
+            n_jobs=n_jobs
+        )
+        return sweep.run(self.df[column].to_numpy(), self.df['timestamp'], events)
 
 
 class RealTimeSpikeMonitor:
@@ -293,6 +336,7 @@ class RealTimeSpikeMonitor:
         
         self.alert_history = []
     
+    @instrument()
     def check_all_spikes(self):
         """
         모든 스파이크 감지 메서드를 실행하고 결과 반환
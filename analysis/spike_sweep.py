@@ -0,0 +1,279 @@
+"""
+스파이크 감지 파라미터 스윕
+
+SpikeDetector 의 Z-score / 이동평균 / 변화율 감지를
+(window, z 임계값, 이동평균 임계값 %, 변화율 임계값 %) 조합 전체에 대해 한 번에 평가합니다.
+
+- 모든 window 의 이동 평균/표준편차는 누적합(cumsum) 두 개로 한 번에 계산
+- 임계값 비교는 배열 브로드캐스트 [시간, z, ma, roc]
+- 라벨 이벤트(예: benchmarks.synthetic 매니페스트의 events)가 있으면 정밀도/재현율 계산
+- 조합이 많으면 window 별로 나눠 프로세스 풀에서 계산 (입력 배열은 공유 메모리)
+
+감지 규칙은 SpikeDetector 와 같습니다.
+    zscore: |x - mean| / (std + 1e-10) > z        (mean/std: 현재 값 포함 최근 window개, 표본 1개면 NaN)
+    ma:     |(x - mean) / (mean + 1e-10)| * 100 > ma
+    roc:    |x / x[t - roc_window] - 1| * 100 > roc
+한 조합의 스파이크는 세 감지 중 하나라도 발생한 시점입니다.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.profiling import instrument
+
+
+# 이 이하의 작업량(시간 x 조합 수)은 프로세스 풀 없이 계산
+PARALLEL_MIN_WORK = 20_000_000
+
+RESULT_COLUMNS = [
+    'window', 'z_threshold', 'ma_threshold_pct', 'roc_threshold_pct',
+    'zscore_spikes', 'ma_spikes', 'roc_spikes', 'spikes',
+    'true_positives', 'precision', 'recall',
+]
+
+
+def rolling_moments(values, windows):
+    """
+    여러 window 의 이동 평균 / 표본 표준편차 (min_periods=1, 결측치 제외 - pandas rolling 과 동일)
+
+    Args:
+        values: [시간] 배열 (NaN / inf 는 제외하고 계산)
+        windows: window 크기 목록
+
+    Returns:
+        tuple: (mean, std) 각 [시간, window 수] (유효 값이 없으면 mean NaN, 1개 이하면 std NaN)
+    """
+    x = np.asarray(values, dtype=np.float64)
+    windows = np.asarray(windows, dtype=np.int64)
+    T = len(x)
+
+    # 결측치는 0으로 두고 유효 개수를 따로 누적
+    valid = np.isfinite(x)
+    # 상쇄 오차를 줄이기 위해 전체 평균을 빼고 누적
+    offset = x[valid].mean() if valid.any() else 0.0
+    centered = np.where(valid, x - offset, 0.0)
+    cs0 = np.concatenate(([0.0], np.cumsum(valid, dtype=np.float64)))
+    cs1 = np.concatenate(([0.0], np.cumsum(centered)))
+    cs2 = np.concatenate(([0.0], np.cumsum(centered * centered)))
+
+    end = np.arange(1, T + 1)[:, None]
+    start = np.maximum(end - windows[None, :], 0)
+    n = cs0[end] - cs0[start]
+
+    s1 = cs1[end] - cs1[start]
+    s2 = cs2[end] - cs2[start]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(n > 0, s1 / n, np.nan)
+        var = (s2 - s1 * s1 / n) / (n - 1)
+    var = np.where(n > 1, np.maximum(var, 0.0), np.nan)
+    return mean + offset, np.sqrt(var)
+
+
+def roc_flags(values, roc_thresholds, roc_window=3):
+    """변화율 감지 [시간, roc 임계값 수]"""
+    roc = pd.Series(values, dtype=np.float64).pct_change(periods=roc_window).to_numpy() * 100
+    with np.errstate(invalid='ignore'):
+        return np.abs(roc)[:, None] > np.asarray(roc_thresholds, dtype=np.float64)[None, :]
+
+
+def event_mask(timestamps, events, tolerance=0):
+    """
+    라벨 이벤트 -> (이벤트 위치, 허용 오차 안의 시점 여부)
+
+    Args:
+        timestamps: 데이터 시점
+        events: 이벤트 시각 목록
+        tolerance: 허용 오차 (시간 단위 행 수)
+
+    Returns:
+        tuple: (이벤트 행 위치 배열, [시간] bool)
+    """
+    ts = pd.DatetimeIndex(pd.to_datetime(timestamps))
+    ev = pd.DatetimeIndex(pd.to_datetime(list(events)))
+    if ts.tz is not None and ev.tz is None:
+        ev = ev.tz_localize(ts.tz)
+    elif ts.tz is None and ev.tz is not None:
+        ev = ev.tz_convert('UTC').tz_localize(None)
+
+    positions = ts.get_indexer(ev)
+    positions = positions[positions >= 0]
+
+    near = np.zeros(len(ts), dtype=bool)
+    for shift in range(-tolerance, tolerance + 1):
+        idx = positions + shift
+        near[idx[(idx >= 0) & (idx < len(ts))]] = True
+    return positions, near
+
+
+def _sweep_windows(values, windows, z, ma, roc, roc_flag, event_pos, near, tolerance):
+    """
+    window 묶음 하나의 모든 임계값 조합 평가
+
+    Returns:
+        DataFrame: RESULT_COLUMNS (라벨이 없으면 true_positives/precision/recall 은 NaN)
+    """
+    x = np.asarray(values, dtype=np.float64)
+    T = len(x)
+    mean, std = rolling_moments(x, windows)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        zscore = np.abs(x[:, None] - mean) / (std + 1e-10)
+        pct = np.abs((x[:, None] - mean) / (mean + 1e-10)) * 100
+
+    shape = (len(z), len(ma), len(roc))
+    zi, mi, ri = (a.ravel() for a in np.indices(shape))
+    roc_counts = roc_flag.sum(axis=0)
+
+    blocks = []
+    for i, window in enumerate(windows):
+        with np.errstate(invalid='ignore'):
+            z_flag = zscore[:, i, None] > z[None, :]
+            ma_flag = pct[:, i, None] > ma[None, :]
+
+        # [시간, z, ma, roc]
+        union = z_flag[:, :, None, None] | ma_flag[:, None, :, None] | roc_flag[:, None, None, :]
+        spikes = union.sum(axis=0).ravel()
+
+        true_pos = np.full(spikes.shape, np.nan)
+        recall = np.full(spikes.shape, np.nan)
+        if near is not None:
+            true_pos = union[near].sum(axis=0).ravel().astype(np.float64)
+            if len(event_pos):
+                # 이벤트 ±tolerance 안에 스파이크가 하나라도 있으면 재현
+                cs = np.concatenate((np.zeros((1,) + shape, dtype=np.int64), np.cumsum(union, axis=0)))
+                lo = np.clip(event_pos - tolerance, 0, T)
+                hi = np.clip(event_pos + tolerance + 1, 0, T)
+                recall = ((cs[hi] - cs[lo]) > 0).mean(axis=0).ravel()
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            precision = np.where(spikes > 0, true_pos / spikes, np.nan)
+
+        blocks.append(pd.DataFrame({
+            'window': np.full(len(zi), window),
+            'z_threshold': z[zi],
+            'ma_threshold_pct': ma[mi],
+            'roc_threshold_pct': roc[ri],
+            'zscore_spikes': z_flag.sum(axis=0)[zi],
+            'ma_spikes': ma_flag.sum(axis=0)[mi],
+            'roc_spikes': roc_counts[ri],
+            'spikes': spikes,
+            'true_positives': true_pos,
+            'precision': precision,
+            'recall': recall,
+        }))
+
+    return pd.concat(blocks, ignore_index=True)
+
+
+def _shared_copy(array):
+    """배열을 공유 메모리에 복사 -> (SharedMemory, (이름, shape, dtype))"""
+    shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+    return shm, (shm.name, array.shape, array.dtype.str)
+
+
+def _sweep_shared(args):
+    """공유 메모리의 입력으로 window 묶음 평가 (프로세스 풀 작업 단위)"""
+    handles, windows, z, ma, roc, tolerance = args
+    attached = [shared_memory.SharedMemory(name=name) for name, _, _ in handles]
+    try:
+        arrays = [
+            np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+            for shm, (_, shape, dtype) in zip(attached, handles)
+        ]
+        values, roc_flag, event_pos, near = arrays
+        has_labels = near.shape[0] > 0
+        return _sweep_windows(
+            values, windows, z, ma, roc, roc_flag,
+            event_pos if has_labels else None, near if has_labels else None, tolerance
+        )
+    finally:
+        for shm in attached:
+            shm.close()
+
+
+class SpikeSweep:
+    """스파이크 감지 파라미터 스윕"""
+
+    def __init__(self, windows=(12, 24, 48, 72), z_thresholds=(2.0, 2.5, 3.0),
+                 ma_thresholds=(30, 50, 100), roc_thresholds=(30, 50, 100),
+                 roc_window=3, tolerance=3, n_jobs=None):
+        """
+        Args:
+            windows: 이동 윈도우 목록 (시간)
+            z_thresholds: Z-score 임계값 목록
+            ma_thresholds: 이동평균 대비 변화율 임계값 목록 (%)
+            roc_thresholds: 변화율 임계값 목록 (%)
+            roc_window: 변화율 계산 윈도우 (시간)
+            tolerance: 라벨 이벤트와 스파이크 시점의 허용 오차 (시간)
+            n_jobs: 프로세스 수 (None이면 CPU 수, 1이면 현재 프로세스)
+        """
+        self.windows = np.asarray(windows, dtype=np.int64)
+        self.z_thresholds = np.asarray(z_thresholds, dtype=np.float64)
+        self.ma_thresholds = np.asarray(ma_thresholds, dtype=np.float64)
+        self.roc_thresholds = np.asarray(roc_thresholds, dtype=np.float64)
+        self.roc_window = roc_window
+        self.tolerance = tolerance
+        self.n_jobs = n_jobs
+
+    @property
+    def n_combos(self):
+        return len(self.windows) * len(self.z_thresholds) * len(self.ma_thresholds) * len(self.roc_thresholds)
+
+    @instrument()
+    def run(self, values, timestamps=None, events=None):
+        """
+        전체 조합 평가
+
+        Args:
+            values: 감지 대상 시계열 (시간 순)
+            timestamps: values 의 시점 (events 가 있을 때 필요)
+            events: 라벨 이벤트 시각 목록 (None이면 스파이크 수만 계산)
+
+        Returns:
+            DataFrame: RESULT_COLUMNS (정밀도 내림차순, 라벨이 없으면 조합 순서)
+        """
+        values = np.asarray(values, dtype=np.float64)
+        roc_flag = roc_flags(values, self.roc_thresholds, self.roc_window)
+
+        event_pos, near = None, None
+        if events is not None:
+            if timestamps is None:
+                raise ValueError("events 를 쓰려면 timestamps 가 필요합니다.")
+            event_pos, near = event_mask(timestamps, events, self.tolerance)
+
+        params = (self.z_thresholds, self.ma_thresholds, self.roc_thresholds)
+        n_tasks = len(self.windows) if self.n_jobs is None else min(self.n_jobs, len(self.windows))
+        parallel = self.n_jobs != 1 and n_tasks > 1 and len(values) * self.n_combos >= PARALLEL_MIN_WORK
+
+        if parallel:
+            empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool))
+            arrays = [values, roc_flag] + list((event_pos, near) if near is not None else empty)
+            shared = [_shared_copy(a) for a in arrays]
+            handles = [h for _, h in shared]
+            tasks = [
+                (handles, windows, *params, self.tolerance)
+                for windows in np.array_split(self.windows, n_tasks)
+            ]
+            try:
+                with ProcessPoolExecutor(max_workers=self.n_jobs) as pool:
+                    parts = list(pool.map(_sweep_shared, tasks))
+            finally:
+                for shm, _ in shared:
+                    shm.close()
+                    shm.unlink()
+        else:
+            parts = [_sweep_windows(values, self.windows, *params, roc_flag, event_pos, near, self.tolerance)]
+
+        result = pd.concat(parts, ignore_index=True)
+        result.attrs['n_events'] = 0 if event_pos is None else len(event_pos)
+        if near is None:
+            return result
+        return result.sort_values(['precision', 'recall'], ascending=False, na_position='last').reset_index(drop=True)
@@ -11,10 +11,14 @@ import os
 from datetime import timedelta
 
 # 경로 추가
-sys.path.append('/Volumes/T7/class/2025-FALL/big_data')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.data_loader import DataLoader
-from analysis.correlation_analysis import CorrelationAnalyzer
+from utils.cache import SharedCache, derive_fingerprint
+from utils.rollup import RollupStore
+from utils.profiling import stage
+from components import debug_panel
+from analysis.correlation_analysis import CorrelationAnalyzer, DEFAULT_CORRELATION_WINDOWS
 from analysis.spike_detector import RealTimeSpikeMonitor
 from utils.alert_system import AlertSystem
 from components import charts, metrics, filters, alerts
@@ -33,19 +37,29 @@ st.set_page_config(
 st.markdown(get_global_css(dark_mode=False), unsafe_allow_html=True)
 
 
-@st.cache_data(ttl=3600)  # 1시간 캐시
+@st.cache_resource
+def get_shared_cache():
+    """세션 간 공유 캐시 (프로세스당 1개)"""
+    return SharedCache()
+
+
 def load_data():
-    """데이터 로드 (캐시됨)"""
-    try:
-        df = pd.read_csv('/Volumes/T7/class/2025-FALL/big_data/data/processed_data.csv')
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        return df
-    except FileNotFoundError:
+    """
+    데이터 로드 (원본 파일이 바뀐 경우에만 다시 읽음)
+    
+    Returns:
+        tuple: (전처리 데이터, 입력 지문)
+    """
+    loader = DataLoader()
+    path = os.path.join(loader.data_dir, 'processed_data.csv')
+    
+    df, fingerprint = get_shared_cache().load_frame('processed', path, loader.load_processed_data)
+    if df.empty:
         st.error("전처리된 데이터 파일이 없습니다. `python scripts/preprocess_data.py`를 먼저 실행하세요.")
-        return pd.DataFrame()
+    return df, fingerprint
 
 
-def overview_page(df):
+def overview_page(df, fingerprint):
     """Overview 페이지"""
     if df.empty:
         st.warning("데이터가 없습니다.")
@@ -56,7 +70,13 @@ def overview_page(df):
     start_date, end_date = filters.date_range_filter(df, key_prefix="overview")
     filtered_df = filters.apply_date_filter(df, start_date, end_date)
     
+    # 차트용 데이터: 기간이 길면 4시간/일/주 단위 집계 사용
+    rollup = get_shared_cache().derived('rollup', fingerprint, None, lambda: RollupStore.for_processed(df))
+    chart_df = filters.apply_rollup_filter(rollup, start_date, end_date)
+    
     st.sidebar.markdown(f"**데이터 범위:** {len(filtered_df)} 시간")
+    if chart_df.attrs.get('resolution', '1h') != '1h':
+        st.sidebar.caption(f"차트 해상도: {chart_df.attrs['resolution']}")
     
     # 실시간 티커 (코인니스 스타일)
     if not filtered_df.empty:
@@ -102,11 +122,12 @@ def overview_page(df):
     st.markdown('### 주요 지표', unsafe_allow_html=True)
     st.markdown('<div style="margin-bottom: 24px;"></div>', unsafe_allow_html=True)
     
-    # 메트릭 데이터 계산
-    current_eth, change_eth, change_pct_eth = metrics.calculate_price_change(filtered_df, 'ETH', '24h')
-    current_btc, change_btc, change_pct_btc = metrics.calculate_price_change(filtered_df, 'BTC', '24h')
-    community_stats = metrics.calculate_community_stats(filtered_df, 24)
-    whale_stats = metrics.calculate_whale_activity(filtered_df, 24)
+    # 메트릭 데이터 계산 (범위 집계 인덱스에서 카드 전체를 한 번에)
+    cards = metrics.calculate_metric_cards(filtered_df, periods=['24h'])['24h']
+    current_eth, change_eth, change_pct_eth = cards['price']['ETH']
+    current_btc, change_btc, change_pct_btc = cards['price']['BTC']
+    community_stats = cards['community']
+    whale_stats = cards['whale']
     
     # 코인니스 스타일 메트릭 카드 표시
     metrics_data = [
@@ -141,14 +162,23 @@ def overview_page(df):
     ]
     
     metrics.display_coinness_metrics_row(metrics_data)
-    
+
+    # 추세 / 변동성 / 성과 요약 (컬럼 x 기간을 한 번에 계산)
+    with st.expander("추세 · 변동성 · 성과 요약"):
+        trend_columns = [col for col in ['ETH_close', 'BTC_close', 'message_count', 'avg_sentiment', 'tx_frequency']
+                         if col in filtered_df.columns]
+        trend_table = metrics.calculate_trend_table(filtered_df, trend_columns, windows=['24h', '7d', '30d'])
+        st.dataframe(trend_table, hide_index=True, use_container_width=True)
+        performance_table = metrics.calculate_performance_table(filtered_df, windows=['24h', '7d', '30d', None])
+        st.dataframe(performance_table, hide_index=True, use_container_width=True)
+
     # === 메인 통합 차트 (3-in-1) ===
     st.markdown('### 통합 분석: 가격 vs 고래 거래 vs 텔레그램 활동', unsafe_allow_html=True)
     st.markdown('<div style="margin-bottom: 16px;"></div>', unsafe_allow_html=True)
     
     # 3-in-1 통합 차트 생성
     fig_integrated = charts.create_triple_axis_chart(
-        filtered_df,
+        chart_df,
         title="",
         height=600
     )
@@ -165,7 +195,7 @@ def overview_page(df):
         # 이중 축 차트: ETH 가격 & 메시지 수
         if 'message_count' in filtered_df.columns:
             fig = charts.create_multi_axis_chart(
-                filtered_df,
+                chart_df,
                 'ETH_close',
                 'message_count',
                 title="ETH 가격 vs 텔레그램 메시지 수",
@@ -177,23 +207,23 @@ def overview_page(df):
         
         # 캔들스틱 차트
         coin = filters.coin_selector("코인 선택", default="ETH", key_prefix="overview_candle")
-        fig_candle = charts.create_candlestick_chart(filtered_df, coin=coin, height=400)
+        fig_candle = charts.create_candlestick_chart(chart_df, coin=coin, height=400)
         st.plotly_chart(fig_candle, use_container_width=True)
     
     with tab2:
         # 거래량 차트
         col1, col2 = st.columns(2)
         with col1:
-            fig_vol_eth = charts.create_volume_chart(filtered_df, 'ETH', height=350)
+            fig_vol_eth = charts.create_volume_chart(chart_df, 'ETH', height=350)
             st.plotly_chart(fig_vol_eth, use_container_width=True)
         with col2:
-            fig_vol_btc = charts.create_volume_chart(filtered_df, 'BTC', height=350)
+            fig_vol_btc = charts.create_volume_chart(chart_df, 'BTC', height=350)
             st.plotly_chart(fig_vol_btc, use_container_width=True)
     
     with tab3:
         # 감정 분석 차트
         if 'avg_sentiment' in filtered_df.columns:
-            fig_sentiment = charts.create_sentiment_chart(filtered_df, height=400)
+            fig_sentiment = charts.create_sentiment_chart(chart_df, height=400)
             st.plotly_chart(fig_sentiment, use_container_width=True)
             
             # 감정 통계
@@ -225,7 +255,7 @@ def overview_page(df):
     
     if compare_cols:
         fig_compare = charts.create_comparison_chart(
-            filtered_df,
+            chart_df,
             compare_cols,
             normalize=True,
             title="주요 지표 비교 (0~1 정규화)",
@@ -234,7 +264,7 @@ def overview_page(df):
         st.plotly_chart(fig_compare, use_container_width=True)
 
 
-def correlation_page(df):
+def correlation_page(df, fingerprint):
     """🔍 상관관계 분석 페이지"""
     st.markdown('# 🔍 상관관계 분석', unsafe_allow_html=True)
     
@@ -247,6 +277,9 @@ def correlation_page(df):
     start_date, end_date = filters.date_range_filter(df, key_prefix="corr")
     filtered_df = filters.apply_date_filter(df, start_date, end_date)
     
+    # 분석 결과는 (필터된 데이터 지문, 파라미터) 기준으로 캐시
+    cache = get_shared_cache()
+    filtered_fp = derive_fingerprint(fingerprint, str(start_date), str(end_date))
     analyzer = CorrelationAnalyzer(filtered_df)
     
     # 상관계수 히트맵
@@ -262,7 +295,10 @@ def correlation_page(df):
             if col in filtered_df.columns:
                 key_columns.append(col)
         
-        pearson_corr = analyzer.pearson_correlation(key_columns)
+        pearson_corr = cache.derived(
+            'pearson', filtered_fp, key_columns,
+            lambda: analyzer.pearson_correlation(key_columns)
+        )
         fig_pearson = charts.create_correlation_heatmap(
             pearson_corr,
             title="Pearson 상관계수 (선형 관계)",
@@ -271,7 +307,10 @@ def correlation_page(df):
         st.plotly_chart(fig_pearson, use_container_width=True)
     
     with tab2:
-        spearman_corr = analyzer.spearman_correlation(key_columns)
+        spearman_corr = cache.derived(
+            'spearman', filtered_fp, key_columns,
+            lambda: analyzer.spearman_correlation(key_columns)
+        )
         fig_spearman = charts.create_correlation_heatmap(
             spearman_corr,
             title="Spearman 상관계수 (순위 기반)",
@@ -282,7 +321,10 @@ def correlation_page(df):
     # ETH 가격과의 상관관계 Top 10
     st.markdown('### 🏆 ETH 가격과 상관관계 Top 10', unsafe_allow_html=True)
     
-    top_corr = analyzer.get_top_correlations('ETH_close', n=10, method='pearson')
+    top_corr = cache.derived(
+        'top_correlations', filtered_fp, ('ETH_close', 10, 'pearson'),
+        lambda: analyzer.get_top_correlations('ETH_close', n=10, method='pearson')
+    )
     
     if not top_corr.empty:
         corr_df = pd.DataFrame({
@@ -293,6 +335,43 @@ def correlation_page(df):
         
         st.dataframe(corr_df, hide_index=True, use_container_width=True)
     
+    # 상관관계 추이 (모든 쌍/윈도우를 한 번에 계산해 캐시, 윈도우 변경은 재계산 없음)
+    rolling_corr = cache.derived(
+        'rolling_correlation', filtered_fp, DEFAULT_CORRELATION_WINDOWS,
+        lambda: analyzer.rolling_correlation(windows=DEFAULT_CORRELATION_WINDOWS)
+    )
+    pair_columns = [c for c in rolling_corr.columns if c not in ('timestamp', 'window')]
+    
+    if pair_columns:
+        st.markdown('### 📈 상관관계 추이', unsafe_allow_html=True)
+    
+        col1, col2 = st.columns([2, 1])
+    
+        with col2:
+            window_labels = {24: '1일', 168: '1주', 720: '30일'}
+            corr_window = st.selectbox(
+                "이동 윈도우",
+                options=list(DEFAULT_CORRELATION_WINDOWS),
+                index=1,
+                format_func=lambda w: f"{window_labels.get(w, w)} ({w}시간)",
+                key="corr_window"
+            )
+            selected_pairs = st.multiselect(
+                "변수 쌍",
+                options=pair_columns,
+                default=pair_columns,
+                key="corr_pairs"
+            )
+    
+        with col1:
+            fig_rolling = charts.create_rolling_correlation_chart(
+                rolling_corr[rolling_corr['window'] == corr_window],
+                columns=selected_pairs,
+                title=f"이동 상관계수 ({window_labels.get(corr_window, corr_window)})",
+                height=400
+            )
+            st.plotly_chart(fig_rolling, use_container_width=True)
+    
     # 시차 상관관계 분석
     if 'message_count' in filtered_df.columns:
         st.markdown('### ⏰ 시차 상관관계 분석', unsafe_allow_html=True)
@@ -321,7 +400,10 @@ def correlation_page(df):
         
         with col1:
             if lag_var1 and lag_var2:
-                lag_corr = analyzer.lag_correlation(lag_var1, lag_var2, max_lag=max_lag)
+                lag_corr = cache.derived(
+                    'lag_correlation', filtered_fp, (lag_var1, lag_var2, max_lag),
+                    lambda: analyzer.lag_correlation(lag_var1, lag_var2, max_lag=max_lag)
+                )
                 
                 if not lag_corr.empty:
                     fig_lag = charts.create_lag_correlation_chart(
@@ -343,7 +425,10 @@ def correlation_page(df):
         
         st.write("**메시지 수 → ETH 가격** 인과관계 검정")
         
-        granger_result = analyzer.granger_causality_test('message_count', 'ETH_close', max_lag=12)
+        granger_result = cache.derived(
+            'granger', filtered_fp, ('message_count', 'ETH_close', 12),
+            lambda: analyzer.granger_causality_test('message_count', 'ETH_close', max_lag=12)
+        )
         
         if isinstance(granger_result, pd.DataFrame):
             significant = granger_result[granger_result['significant']]
@@ -366,7 +451,10 @@ def correlation_page(df):
         
         threshold_vol = st.slider("Z-score 임계값", 1.0, 5.0, 2.0, 0.1, key="vol_threshold")
         
-        vol_result = analyzer.volatility_analysis('message_count_zscore', 'ETH_close', threshold=threshold_vol)
+        vol_result = cache.derived(
+            'volatility', filtered_fp, ('message_count_zscore', 'ETH_close', threshold_vol),
+            lambda: analyzer.volatility_analysis('message_count_zscore', 'ETH_close', threshold=threshold_vol)
+        )
         
         if 'error' not in vol_result:
             col1, col2, col3, col4 = st.columns(4)
@@ -389,7 +477,7 @@ def correlation_page(df):
             st.warning(vol_result['error'])
 
 
-def alerts_page(df):
+def alerts_page(df, fingerprint):
     """스파이크 알람 페이지"""
     st.markdown('# 스파이크 알람', unsafe_allow_html=True)
     
@@ -410,11 +498,15 @@ def alerts_page(df):
     st.markdown("---")
     
     # 스파이크 모니터 초기화
+    cache = get_shared_cache()
     monitor = RealTimeSpikeMonitor(df, config=alert_settings)
     
-    # 스파이크 감지 실행
+    # 스파이크 감지 실행 (데이터 지문, 알람 설정 기준으로 캐시)
     with st.spinner("스파이크 감지 중..."):
-        spike_results = monitor.check_all_spikes()
+        spike_results = cache.derived(
+            'spikes', fingerprint, alert_settings,
+            monitor.check_all_spikes
+        )
     
     # 결과 요약
     st.markdown('### 감지 결과 요약', unsafe_allow_html=True)
@@ -442,7 +534,11 @@ def alerts_page(df):
     st.markdown('### 🔔 최근 감지된 스파이크', unsafe_allow_html=True)
     
     hours = filters.convert_period_to_hours(filter_settings['time_range'])
-    recent_alerts_df = monitor.get_recent_alerts(hours=hours if hours else 24 * 365)
+    alert_hours = hours if hours else 24 * 365
+    recent_alerts_df = cache.derived(
+        'recent_alerts', fingerprint, (alert_settings, alert_hours),
+        lambda: monitor.get_recent_alerts(hours=alert_hours)
+    )
     
     if not recent_alerts_df.empty:
         # 레벨 필터 적용
@@ -525,18 +621,18 @@ def main():
     
     # 데이터 로드
     with st.spinner("데이터 로딩 중..."):
-        df = load_data()
+        df, fingerprint = load_data()
     
     if not df.empty:
         st.sidebar.success(f"데이터 로드 완료\n\n**기간:** {df['timestamp'].min().date()} ~ {df['timestamp'].max().date()}\n\n**총 {len(df):,} 시간**")
     
     # 페이지 라우팅
     if page == "Overview":
-        overview_page(df)
+        overview_page(df, fingerprint)
     elif page == "상관관계 분석":
-        correlation_page(df)
+        correlation_page(df, fingerprint)
     elif page == "스파이크 알람":
-        alerts_page(df)
+        alerts_page(df, fingerprint)
     
     # 푸터
     st.sidebar.markdown("---")
@@ -553,5 +649,8 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
-
+    # ?debug=1 이면 렌더링 단계별 계측 결과 표시
+    debug_panel.begin()
+    with stage('page.app'):
+        main()
+    debug_panel.render(get_shared_cache())
@@ -16,8 +16,12 @@ from datetime import datetime, timedelta
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.data_loader import DataLoader
+from utils.cache import SharedCache, derive_fingerprint
+from utils.profiling import stage
+from components import debug_panel
 from utils.composite_score import CompositeScoreCalculator
 from analysis.spike_detector import SpikeDetector
+from components.downsample import downsample_frame
 
 # 페이지 설정
 st.set_page_config(
@@ -214,24 +218,43 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data(ttl=300)
+# 이 페이지가 사용하는 전처리 데이터 컬럼
+PAGE_COLUMNS = ['timestamp', 'message_count', 'avg_sentiment']
+
+
+@st.cache_resource
+def get_shared_cache():
+    """세션 간 공유 캐시 (프로세스당 1개)"""
+    return SharedCache()
+
+
 def load_all_data():
-    """모든 데이터 로드 (5분 캐시)"""
+    """
+    모든 데이터 로드 (원본 파일이 바뀐 경우에만 다시 읽음)
+    
+    Returns:
+        tuple: (전처리 데이터, 개별 소스 데이터, 입력 지문)
+    """
+    cache = get_shared_cache()
     loader = DataLoader()
     
-    # 전처리된 데이터 로드 (상대 경로)
-    try:
-        data_path = os.path.join(os.path.dirname(__file__), 'data', 'processed_data.csv')
-        df_main = pd.read_csv(data_path)
-        df_main['timestamp'] = pd.to_datetime(df_main['timestamp'])
-    except Exception as e:
-        st.error(f"데이터 로드 실패: {e}")
-        df_main = pd.DataFrame()
+    # 전처리된 데이터 로드 (이 페이지에서 쓰는 컬럼만)
+    df_main, main_fp = cache.load_frame(
+        'app_new_main',
+        os.path.join(loader.data_dir, 'processed_data.csv'),
+        lambda: loader.load_processed_data(columns=PAGE_COLUMNS)
+    )
+    if df_main.empty:
+        st.error("데이터 로드 실패: data/processed_data.csv")
     
     # 개별 소스 데이터
-    data = loader.load_all_data()
+    data, data_fp = cache.load_frame(
+        'all_sources',
+        list(loader.get_source_paths().values()),
+        loader.load_all_data
+    )
     
-    return df_main, data
+    return df_main, data, derive_fingerprint(main_fp, data_fp)
 
 
 def create_signal_box_html(source_name, score, arrow="→", color="#00d4ff"):
@@ -258,7 +281,7 @@ def render_top_navigation():
     """, unsafe_allow_html=True)
 
 
-def render_signal_boxes(df_main, data):
+def render_signal_boxes(df_main, data, fingerprint):
     """3가지 신호 박스 렌더링"""
     st.markdown("## 📡 Market Signals")
     
@@ -269,10 +292,13 @@ def render_signal_boxes(df_main, data):
     # 종합 점수 계산
     calculator = CompositeScoreCalculator()
     try:
-        df_scored = calculator.calculate_composite_score(
-            df_main, 
-            df_news=data.get('coinness', pd.DataFrame()), 
-            df_twitter=data.get('twitter', pd.DataFrame())
+        df_scored = get_shared_cache().derived(
+            'composite_score', fingerprint, calculator.weights,
+            lambda: calculator.calculate_composite_score(
+                df_main, 
+                df_news=data.get('coinness', pd.DataFrame()), 
+                df_twitter=data.get('twitter', pd.DataFrame())
+            )
         )
     except Exception as e:
         st.error(f"종합 점수 계산 실패: {e}")
@@ -404,14 +430,14 @@ def main():
     
     # 데이터 로드
     with st.spinner("Loading market data..."):
-        df_main, data = load_all_data()
+        df_main, data, fingerprint = load_all_data()
     
     if df_main.empty:
         st.error("데이터를 로드할 수 없습니다. 먼저 python scripts/preprocess_data.py를 실행하세요.")
         return
     
     # 신호 박스
-    df_scored = render_signal_boxes(df_main, data)
+    df_scored = render_signal_boxes(df_main, data, fingerprint)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -425,9 +451,12 @@ def main():
             # 종합 점수 차트
             fig = go.Figure()
             
+            # 차트 너비에 맞게 다운샘플링 (스파이크 보존)
+            df_chart = downsample_frame(df_scored, 'composite_score')
+            
             fig.add_trace(go.Scatter(
-                x=df_scored['timestamp'],
-                y=df_scored['composite_score'],
+                x=df_chart['timestamp'],
+                y=df_chart['composite_score'],
                 name='Composite Score',
                 line=dict(color='#00d4ff', width=3),
                 fill='tozeroy',
@@ -464,5 +493,8 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
-
+    # ?debug=1 이면 렌더링 단계별 계측 결과 표시
+    debug_panel.begin()
+    with stage('page.app_new'):
+        main()
+    debug_panel.render(get_shared_cache())
@@ -0,0 +1,119 @@
+"""
+차트 생성 마이크로 벤치마크
+
+components.charts 빌더가 10k / 100k 행에서 Figure를 만들고
+JSON으로 직렬화하는 데 걸리는 시간과 페이로드 크기를 측정합니다.
+
+사용법:
+    python -m benchmarks.chart_build
+    python -m benchmarks.chart_build --rows 10000 100000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from components import charts
+
+
+def make_chart_frame(n_rows, seed=42):
+    """
+    차트 벤치마크용 시간별 데이터 생성
+
+    Args:
+        n_rows: 행 수
+        seed: 난수 시드
+
+    Returns:
+        DataFrame: timestamp, ETH/BTC 가격/거래량, 고래/텔레그램 컬럼
+    """
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'timestamp': pd.date_range('2015-01-01', periods=n_rows, freq='h'),
+        'ETH_close': 3000 + rng.normal(0, 10, n_rows).cumsum(),
+        'BTC_close': 90000 + rng.normal(0, 200, n_rows).cumsum(),
+        'ETH_volume': rng.gamma(2.0, 4000.0, n_rows),
+        'BTC_volume': rng.gamma(2.0, 400.0, n_rows),
+        'tx_frequency': rng.poisson(6, n_rows),
+        'message_count': rng.poisson(3, n_rows).astype(float),
+        'avg_sentiment': np.clip(rng.normal(0.1, 0.3, n_rows), -1, 1),
+    })
+    return df
+
+
+def _scenarios():
+    """(이름, 빌더 함수) 리스트"""
+    return [
+        ('time_series', lambda df: charts.create_time_series_chart(df, ['ETH_close', 'BTC_close'])),
+        ('multi_axis', lambda df: charts.create_multi_axis_chart(df, 'ETH_close', 'message_count')),
+        ('triple_axis', lambda df: charts.create_triple_axis_chart(df)),
+        ('comparison', lambda df: charts.create_comparison_chart(df, ['ETH_close', 'tx_frequency', 'message_count'])),
+        ('sentiment', lambda df: charts.create_sentiment_chart(df)),
+        ('volume', lambda df: charts.create_volume_chart(df, 'ETH')),
+    ]
+
+
+def run(rows=(10_000, 100_000), repeat=3):
+    """
+    벤치마크 실행
+
+    Args:
+        rows: 테스트할 행 수 리스트
+        repeat: 반복 횟수 (최소 시간 사용)
+
+    Returns:
+        list: 시나리오별 결과 딕셔너리
+    """
+    results = []
+
+    for n_rows in rows:
+        df = make_chart_frame(n_rows)
+
+        for name, build in _scenarios():
+            build_times = []
+            json_times = []
+            payload = 0
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fig = build(df)
+                build_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                payload = len(fig.to_json())
+                json_times.append(time.perf_counter() - start)
+
+            results.append({
+                'scenario': f'chart.{name}',
+                'rows': n_rows,
+                'build_seconds': min(build_times),
+                'to_json_seconds': min(json_times),
+                'payload_bytes': payload,
+                'trace_types': sorted({trace.type for trace in fig.data}),
+            })
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='차트 생성 마이크로 벤치마크')
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("=== 차트 생성 벤치마크 ===\n")
+    for r in run(args.rows, args.repeat):
+        print(f"{r['scenario']:24s} {r['rows']:>8,}행  "
+              f"build {r['build_seconds'] * 1000:8.1f}ms  "
+              f"json {r['to_json_seconds'] * 1000:8.1f}ms  "
+              f"{r['payload_bytes'] / 1024:9.1f}KB  {','.join(r['trace_types'])}")
+
+
+if __name__ == '__main__':
+    main()
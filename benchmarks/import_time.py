@@ -0,0 +1,185 @@
+"""
+Streamlit 진입점 콜드 스타트 import 벤치마크
+
+각 진입점(main.py, app.py, app_new.py)의 모듈 수준 import 문만 뽑아
+새 파이썬 프로세스에서 실행하고 다음을 측정합니다.
+
+    wall        import 문 전체 실행 시간 (프로세스 시작 제외)
+    modules     로드된 모듈 수
+    heavy       로드된 무거운 의존성 (scipy, statsmodels, plotly.express ...)
+    top         -X importtime 누적 시간 상위 모듈
+
+페이지 코드(st.set_page_config 등)는 실행하지 않으므로 새 레플리카가
+첫 요청을 받기 전에 치르는 import 비용만 측정합니다.
+이전 결과 파일을 --baseline 으로 주면 pipeline 벤치마크와 같은 방식으로 회귀를 표시합니다.
+
+사용법:
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --entries main.py --repeat 10 --baseline benchmarks/results/import_time_20250101_000000.json
+"""
+
+import argparse
+import ast
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+
+# 경로 설정
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from benchmarks.pipeline import RESULTS_DIR, DEFAULT_TOLERANCE, compare, save_report
+
+
+DEFAULT_ENTRIES = ['main.py', 'app.py', 'app_new.py']
+
+# 로드 여부를 보고할 무거운 의존성
+HEAVY_MODULES = ['scipy', 'statsmodels', 'plotly.express', 'plotly.graph_objects', 'analysis.correlation_analysis',
+                 'utils.alert_system', 'vaderSentiment', 'transformers']
+
+# 하위 프로세스에서 import 문 실행 후 측정값을 JSON 한 줄로 출력
+_RUNNER = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+start = time.perf_counter()
+exec(compile({source!r}, {entry!r}, 'exec'), {{'__name__': '__bench__', '__file__': {path!r}}})
+wall = time.perf_counter() - start
+print(json.dumps({{'wall': wall, 'modules': len(sys.modules),
+                  'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def entry_imports(path):
+    """
+    진입점 파일의 모듈 수준 import 문 (sys.path 설정 포함)
+
+    Args:
+        path: 진입점 파일 경로
+
+    Returns:
+        str: import 문만 모은 소스
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+
+    nodes = [n for n in tree.body if isinstance(n, (ast.Import, ast.ImportFrom))]
+    return 'import os, sys\n' + '\n'.join(ast.unparse(n) for n in nodes)
+
+
+def _parse_importtime(stderr, n=10):
+    """-X importtime 출력 -> 누적 시간 상위 n개 (모듈, 초)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        # "import time: self [us] | cumulative | imported package"
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3:
+            continue
+        rows.append((parts[2].rstrip(), int(parts[1]) / 1e6))
+
+    # 최상위 항목(들여쓰기 1칸)만 누적 시간이 겹치지 않음
+    top_level = [(name.strip(), seconds) for name, seconds in rows if not name.startswith('  ')]
+    return sorted(top_level, key=lambda r: -r[1])[:n]
+
+
+def measure(entry, repeat=5):
+    """
+    진입점 하나의 콜드 스타트 import 측정
+
+    Args:
+        entry: 진입점 파일 (저장소 루트 기준)
+        repeat: 반복 횟수 (매번 새 프로세스)
+
+    Returns:
+        dict: 측정 결과
+    """
+    path = os.path.join(ROOT, entry)
+    source = entry_imports(path)
+    code = _RUNNER.format(root=ROOT, source=source, entry=entry, path=path, heavy=HEAVY_MODULES)
+
+    walls = []
+    stats, top = None, []
+    for i in range(repeat):
+        cmd = [sys.executable] + (['-X', 'importtime'] if i == 0 else []) + ['-c', code]
+        proc = subprocess.run(cmd, cwd=ROOT, capture_output=True, text=True)
+        if proc.returncode != 0:
+            raise RuntimeError(f"{entry} import 실패:\n{proc.stderr[-2000:]}")
+        stats = json.loads(proc.stdout.strip().splitlines()[-1])
+        if i == 0:
+            top = _parse_importtime(proc.stderr)
+            # -X importtime 자체 오버헤드가 있으므로 첫 실행은 시간 집계에서 제외 (repeat 1 이면 사용)
+            if repeat > 1:
+                continue
+        walls.append(stats['wall'])
+
+    return {
+        'scenario': f'import.{entry}',
+        'scale': 1,
+        'repeat': len(walls),
+        'median_seconds': statistics.median(walls),
+        'min_seconds': min(walls),
+        'modules': stats['modules'],
+        'heavy': stats['heavy'],
+        'top': [{'module': name, 'seconds': seconds} for name, seconds in top],
+    }
+
+
+def run(entries=DEFAULT_ENTRIES, repeat=5):
+    """
+    벤치마크 실행
+
+    Returns:
+        dict: 환경 정보 + 진입점별 결과 (pipeline 벤치마크와 같은 형식)
+    """
+    return {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'results': [measure(entry, repeat) for entry in entries if os.path.exists(os.path.join(ROOT, entry))],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='진입점 import 시간 벤치마크')
+    parser.add_argument('--entries', nargs='+', default=DEFAULT_ENTRIES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--output', default=None, help='결과 JSON 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    report = run(args.entries, args.repeat)
+
+    print("=== 진입점 import 시간 ===\n")
+    for r in report['results']:
+        print(f"{r['scenario']:24s} median {r['median_seconds'] * 1000:8.1f}ms  "
+              f"min {r['min_seconds'] * 1000:8.1f}ms  modules {r['modules']:5d}")
+        print(f"  무거운 의존성: {', '.join(r['heavy']) or '없음'}")
+        for item in r['top'][:5]:
+            print(f"    {item['module']:40s} {item['seconds'] * 1000:8.1f}ms")
+
+    path = args.output or os.path.join(
+        RESULTS_DIR, f"import_time_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    path = save_report(report, path)
+    print(f"\n결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n⚠️ import 시간 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+            for scenario, _, before, after, change in regressions:
+                print(f"  {scenario:24s} {before * 1000:.1f}ms -> {after * 1000:.1f}ms (+{change:.0%})")
+            sys.exit(1)
+        print("\nimport 시간 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,331 @@
+"""
+데이터 파이프라인 벤치마크
+
+합성 데이터(benchmarks.synthetic)를 1× / 10× / 100× 규모로 만들고
+다음 단계의 실행 시간을 측정해 JSON으로 저장합니다.
+
+    loader.*        DataLoader 원본 로드
+    preprocess.*    DataPreprocessor 병합 / 파생 변수
+    spike.*         SpikeDetector 감지기, RealTimeSpikeMonitor
+    correlation.*   CorrelationAnalyzer 주요 메서드
+    composite.*     CompositeScoreCalculator
+    alert.*         AlertSystem 알람 기록
+
+이전 결과 파일을 --baseline 으로 주면 시나리오별 중앙값을 비교해
+허용 범위를 넘게 느려진 항목을 표시하고 종료 코드 1을 반환합니다.
+
+사용법:
+    python -m benchmarks.pipeline
+    python -m benchmarks.pipeline --scales 1 10 100 --repeat 3
+    python -m benchmarks.pipeline --only spike correlation --baseline benchmarks/results/pipeline_20250101_000000.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.synthetic import generate_dataset
+from utils.data_loader import DataLoader
+from utils.composite_score import CompositeScoreCalculator
+from utils.alert_system import AlertSystem
+from analysis.spike_detector import SpikeDetector, RealTimeSpikeMonitor
+from analysis.correlation_analysis import CorrelationAnalyzer
+from scripts.preprocess_data import DataPreprocessor
+
+
+# 결과 저장 디렉토리
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# 회귀로 판단할 중앙값 증가율 (20%)
+DEFAULT_TOLERANCE = 0.2
+
+# 상관관계 분석 대상 컬럼
+KEY_COLUMNS = ['ETH_close', 'BTC_close', 'message_count', 'tx_frequency',
+               'avg_sentiment', 'ETH_volume', 'total_reactions']
+
+SPIKE_COLUMNS = ['message_count', 'ETH_close', 'tx_frequency']
+
+
+def _rows(value):
+    """결과 객체의 행 수 (DataFrame/dict/list)"""
+    if isinstance(value, (pd.DataFrame, pd.Series, list)):
+        return len(value)
+    if isinstance(value, dict):
+        sized = [v for v in value.values() if isinstance(v, (pd.DataFrame, pd.Series, list))]
+        return sum(len(v) for v in sized) if sized else None
+    return None
+
+
+def _measure(name, fn, repeat, rows_in):
+    """
+    시나리오 실행 시간 측정
+
+    Returns:
+        tuple: (마지막 실행 결과, 결과 딕셔너리)
+    """
+    times = []
+    value = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        times.append(time.perf_counter() - start)
+
+    return value, {
+        'scenario': name,
+        'rows_in': rows_in,
+        'rows_out': _rows(value),
+        'min_seconds': min(times),
+        'median_seconds': statistics.median(times),
+        'repeat': repeat,
+    }
+
+
+def _selected(name, only):
+    return not only or any(name.startswith(prefix) for prefix in only)
+
+
+def run_scale(data_dir, scale, repeat=3, only=None):
+    """
+    한 규모에 대해 전체 시나리오 실행
+
+    앞 단계의 결과(로드된 데이터, 전처리 결과)는 다음 단계의 입력이 되므로
+    --only 로 제외한 단계도 입력 준비를 위해 한 번은 실행됩니다.
+
+    Args:
+        data_dir: 합성 데이터 디렉토리
+        scale: 규모 배수 (결과 기록용)
+        repeat: 반복 횟수
+        only: 실행할 시나리오 접두사 리스트 (None이면 전체)
+
+    Returns:
+        list: 시나리오별 결과 딕셔너리
+    """
+    results = []
+
+    def measure(name, fn, rows_in):
+        n = repeat if _selected(name, only) else 1
+        value, result = _measure(name, fn, n, rows_in)
+        if _selected(name, only):
+            result['scale'] = scale
+            results.append(result)
+        return value
+
+    # 1. 원본 로드
+    loader = DataLoader(data_dir)
+    data = {
+        'whale_transactions': measure('loader.whale_transactions', loader.load_whale_transactions, None),
+        'eth_price': measure('loader.eth_price', lambda: loader.load_price_data('ETH'), None),
+        'btc_price': measure('loader.btc_price', lambda: loader.load_price_data('BTC'), None),
+        'telegram': measure('loader.telegram', loader.load_telegram_data, None),
+        'twitter': measure('loader.twitter', loader.load_twitter_data, None),
+        'coinness': measure('loader.coinness', loader.load_coinness_data, None),
+    }
+
+    # 2. 전처리 (입력을 수정하므로 복사본 사용)
+    preprocessor = DataPreprocessor(data_dir)
+    merged = measure(
+        'preprocess.merge_all_data',
+        lambda: preprocessor.merge_all_data(
+            data['whale_transactions'], data['eth_price'], data['btc_price'], data['telegram'].copy()
+        ),
+        len(data['whale_transactions'])
+    )
+    df = measure(
+        'preprocess.create_derived_features',
+        lambda: preprocessor.create_derived_features(merged.copy()),
+        len(merged)
+    )
+    processed_path = os.path.join(data_dir, 'processed_data.csv')
+    measure('preprocess.write_csv',
+            lambda: df.to_csv(processed_path, index=False), len(df))
+    measure('loader.processed_data', loader.load_processed_data, len(df))
+
+    # 3. 스파이크 감지
+    n = len(df)
+    detector = SpikeDetector(df)
+    zscore_spikes = measure('spike.zscore', lambda: detector.detect_zscore_spike('message_count', 2.5), n)
+    measure('spike.moving_average', lambda: detector.detect_moving_average_spike('message_count', 50), n)
+    measure('spike.rate_of_change', lambda: detector.detect_rate_of_change_spike('message_count', 3, 30), n)
+    measure('spike.multi_indicator', lambda: detector.detect_multi_indicator_spike(SPIKE_COLUMNS, threshold=0.7), n)
+    measure('spike.monitor_check_all', lambda: RealTimeSpikeMonitor(df).check_all_spikes(), n)
+
+    # 4. 상관관계
+    analyzer = CorrelationAnalyzer(df)
+    measure('correlation.pearson', lambda: analyzer.pearson_correlation(KEY_COLUMNS), n)
+    measure('correlation.spearman', lambda: analyzer.spearman_correlation(KEY_COLUMNS), n)
+    measure('correlation.lag', lambda: analyzer.lag_correlation('message_count', 'ETH_close', max_lag=24), n)
+    measure('correlation.granger', lambda: analyzer.granger_causality_test('message_count', 'ETH_close', max_lag=12), n)
+    measure('correlation.volatility',
+            lambda: analyzer.volatility_analysis('message_count_zscore', 'ETH_close', threshold=2.0), n)
+
+    # 5. 종합 점수
+    calculator = CompositeScoreCalculator()
+    measure('composite.calculate_composite_score',
+            lambda: calculator.calculate_composite_score(df, df_news=data['coinness'], df_twitter=data['twitter']), n)
+
+    # 6. 알람 기록 (매 반복마다 빈 이력에서 시작)
+    alert_path = os.path.join(data_dir, 'alert_history.csv')
+
+    def record_alerts():
+        if os.path.exists(alert_path):
+            os.remove(alert_path)
+        system = AlertSystem(alert_history_path=alert_path)
+        system.add_alerts_from_spikes(zscore_spikes, 'zscore')
+        return system.history
+
+    measure('alert.add_alerts_from_spikes', record_alerts, len(zscore_spikes))
+
+    return results
+
+
+def run(scales=(1, 10), repeat=3, seed=42, only=None, workdir=None, keep_data=False):
+    """
+    벤치마크 실행
+
+    Args:
+        scales: 규모 배수 리스트
+        repeat: 반복 횟수
+        seed: 합성 데이터 시드
+        only: 실행할 시나리오 접두사 리스트
+        workdir: 합성 데이터 디렉토리 (None이면 임시 디렉토리)
+        keep_data: 합성 데이터 보존 여부
+
+    Returns:
+        dict: 실행 환경과 시나리오별 결과
+    """
+    root = workdir or tempfile.mkdtemp(prefix='bench_pipeline_')
+    report = {
+        'benchmark': 'pipeline',
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'cpu_count': os.cpu_count(),
+        },
+        'seed': seed,
+        'repeat': repeat,
+        'datasets': [],
+        'results': [],
+    }
+
+    try:
+        for scale in scales:
+            data_dir = os.path.join(root, f'scale_{scale}')
+            start = time.perf_counter()
+            manifest = generate_dataset(data_dir, scale=scale, seed=seed)
+            report['datasets'].append({
+                'scale': scale,
+                'hours': manifest['hours'],
+                'channels': manifest['channels'],
+                'rows': {name: info['rows'] for name, info in manifest['files'].items()},
+                'generate_seconds': time.perf_counter() - start,
+            })
+            report['results'].extend(run_scale(data_dir, scale, repeat, only))
+    finally:
+        if not keep_data and workdir is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+    return report
+
+
+def compare(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    기준 결과와 비교해 느려진 시나리오 찾기
+
+    Args:
+        report: run() 결과
+        baseline: 기준 run() 결과
+        tolerance: 허용 증가율 (0.2 = 20%)
+
+    Returns:
+        list: (시나리오, 규모, 기준 초, 현재 초, 변화율) 회귀 리스트
+    """
+    base = {(r['scenario'], r['scale']): r['median_seconds'] for r in baseline.get('results', [])}
+    regressions = []
+
+    for r in report['results']:
+        key = (r['scenario'], r['scale'])
+        if key not in base or base[key] <= 0:
+            continue
+        change = r['median_seconds'] / base[key] - 1
+        if change > tolerance:
+            regressions.append((r['scenario'], r['scale'], base[key], r['median_seconds'], change))
+
+    return regressions
+
+
+def save_report(report, path=None):
+    """
+    결과를 JSON으로 저장
+
+    Args:
+        report: run() 결과
+        path: 저장 경로 (None이면 benchmarks/results/pipeline_<시각>.json)
+
+    Returns:
+        str: 저장 경로
+    """
+    if path is None:
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        path = os.path.join(RESULTS_DIR, f'pipeline_{stamp}.json')
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='데이터 파이프라인 벤치마크')
+    parser.add_argument('--scales', type=float, nargs='+', default=[1, 10])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', nargs='+', default=None, help='시나리오 접두사 (예: spike correlation.lag)')
+    parser.add_argument('--workdir', default=None, help='합성 데이터 디렉토리 (지정하면 보존)')
+    parser.add_argument('--output', default=None, help='결과 JSON 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    scales = [int(s) if float(s).is_integer() else s for s in args.scales]
+    report = run(scales, args.repeat, args.seed, args.only, args.workdir)
+
+    print("=== 파이프라인 벤치마크 ===\n")
+    for r in report['results']:
+        rows_out = f"{r['rows_out']:,}" if r['rows_out'] is not None else '-'
+        print(f"{r['scenario']:40s} x{r['scale']:<4} "
+              f"median {r['median_seconds'] * 1000:10.1f}ms  "
+              f"min {r['min_seconds'] * 1000:10.1f}ms  out {rows_out}")
+
+    path = save_report(report, args.output)
+    print(f"\n결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n⚠️ 성능 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+            for scenario, scale, before, after, change in regressions:
+                print(f"  {scenario:40s} x{scale:<4} {before * 1000:.1f}ms -> {after * 1000:.1f}ms (+{change:.0%})")
+            sys.exit(1)
+        print("\n성능 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+"""
+스트리밍 재생(replay) 벤치마크
+
+과거 시간별 데이터를 실제 시간 간격에 speedup 배속을 적용해 흘려 보내고
+수집 -> 전처리 -> 감지 -> 알람 경로(모니터링 데몬과 같은 코드)의
+지연 시간과 처리량을 측정합니다. 네트워크 없이 로컬 파일만 사용합니다.
+
+    ingest      도착한 행 묶음 -> 데이터프레임
+    preprocess  MonitorDaemon.preprocess - FeatureKernel 소스별 Z-score (직전 window-1 행 + 새 행만)
+    detect      MonitorDaemon.detect(전처리 결과 사용) + 쿨다운 (PriorityEngine 규칙 / 우선순위)
+    alert       AlertSystem.add_alerts (임시 이력 파일)
+
+측정값:
+    row latency     행의 예정 도착 시각 -> 그 행이 알람 단계까지 끝난 시각
+    alert latency   알람이 생긴 행만의 row latency (스파이크 -> 알람)
+    rows/sec        전체 처리 행 / 재생 시간 (speedup 0 = 최대 속도)
+    behind          묶음 처리가 다음 묶음 도착 시각을 넘긴 횟수, 최대 지연, 처음 밀린 데이터 시각
+
+speedup 0 은 대기 없이 --batch-rows 행씩 최대 속도로 처리합니다 (순수 처리량).
+결과는 pipeline 벤치마크와 같은 형식이라 --baseline 으로 단계별 회귀를 확인할 수 있습니다.
+
+사용법:
+    python -m benchmarks.replay
+    python -m benchmarks.replay --source processed --speedups 0 360000 --limit 2000
+    python -m benchmarks.replay --baseline benchmarks/results/replay_20250101_000000.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.pipeline import RESULTS_DIR, DEFAULT_TOLERANCE, compare, save_report
+from utils.data_loader import DataLoader
+from utils.monitor_daemon import MonitorDaemon
+from analysis.priority_engine import build_source_frame
+
+
+STAGES = ['ingest', 'preprocess', 'detect', 'alert']
+
+# 지연 히스토그램 버킷 상한 (ms, 마지막은 무한대)
+LATENCY_BUCKETS_MS = [0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, float('inf')]
+
+# processed_data.csv 컬럼 -> 우선순위 엔진 소스 컬럼 (없는 소스는 0)
+PROCESSED_SOURCES = {'message_count': 'telegram_msgs', 'tx_frequency': 'whale_txs',
+                     'avg_sentiment': 'telegram_sentiment'}
+SOURCE_COLUMNS = ['telegram_msgs', 'whale_txs', 'twitter_engagement']
+
+
+def load_source(source='raw', data_dir=None):
+    """
+    재생할 시간별 프레임
+
+    Args:
+        source: 'raw' (고래 / 텔레그램 / 트위터 원본 -> build_source_frame) 또는 'processed'
+        data_dir: 데이터 디렉토리
+
+    Returns:
+        DataFrame: timestamp + 우선순위 엔진 소스 컬럼 (시간 순)
+    """
+    loader = DataLoader(data_dir)
+    if source == 'raw':
+        return build_source_frame(loader)
+
+    df = loader.load_processed_data(columns=['timestamp'] + list(PROCESSED_SOURCES))
+    frame = df.rename(columns=PROCESSED_SOURCES)
+    for col in SOURCE_COLUMNS:
+        if col not in frame.columns:
+            frame[col] = 0.0
+    return frame.sort_values('timestamp').reset_index(drop=True)
+
+
+def latency_summary(latencies):
+    """지연 시간 배열(초) -> 백분위수 + 히스토그램"""
+    values = np.asarray(latencies, dtype=np.float64)
+    if not len(values):
+        return {'count': 0}
+    ms = values * 1000
+    counts = np.histogram(ms, bins=[0.0] + LATENCY_BUCKETS_MS)[0]
+    return {
+        'count': int(len(values)),
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p95_ms': float(np.percentile(ms, 95)),
+        'p99_ms': float(np.percentile(ms, 99)),
+        'max_ms': float(ms.max()),
+        'histogram': [
+            {'le_ms': None if np.isinf(edge) else edge, 'count': int(c)}
+            for edge, c in zip(LATENCY_BUCKETS_MS, counts)
+        ],
+    }
+
+
+class ReplayHarness:
+    """과거 데이터 재생 -> 스트리밍 경로 지연 / 처리량 측정"""
+
+    def __init__(self, frame, workdir, config_path=None, warmup_hours=None):
+        """
+        Args:
+            frame: load_source() 결과
+            workdir: 알람 이력 / 상태 파일용 임시 디렉토리
+            config_path: 모니터링 설정 (기본값: data/monitor_config.json)
+            warmup_hours: 재생 전 이력으로 넣을 행 수 (None이면 window_hours - 1)
+        """
+        self.frame = frame.reset_index(drop=True)
+        self.workdir = workdir
+        self.config_path = config_path
+        self.warmup_hours = warmup_hours
+
+    def _daemon(self):
+        """재생마다 새 상태의 모니터링 데몬 (임시 디렉토리에 알람 기록)"""
+        path = os.path.join(self.workdir, 'alert_history.csv')
+        if os.path.exists(path):
+            os.remove(path)
+        daemon = MonitorDaemon(self.workdir, self.config_path, publish_snapshot=False)
+        daemon.status_path = os.path.join(self.workdir, 'replay_status.json')
+        return daemon
+
+    def _arrivals(self, start, end, speedup):
+        """
+        행별 예정 도착 시각 (재생 시작 기준 초)
+
+        speedup > 0 이면 데이터 시각 간격 / speedup 마다 행이 도착하고
+        처리 중에 도착한 행은 다음 묶음으로 함께 처리됩니다 (묶음 경계는 실행 중 결정).
+        """
+        if speedup:
+            ts = self.frame['timestamp'].to_numpy()[start:end]
+            offsets = (ts - ts[0]) / np.timedelta64(1, 's') / speedup
+            return offsets.astype(np.float64)
+        return np.zeros(end - start)
+
+    def run(self, speedup=0, batch_rows=24, limit=None):
+        """
+        재생 한 번
+
+        Args:
+            speedup: 배속 (0이면 대기 없이 batch_rows 씩)
+            batch_rows: speedup 0 일 때 묶음 크기
+            limit: 재생할 최대 행 수 (None이면 전체)
+
+        Returns:
+            dict: 단계별 시간, 지연 요약, 처리량, 밀림 정보
+        """
+        daemon = self._daemon()
+        context_rows = daemon.engine.window - 1
+
+        warmup = context_rows if self.warmup_hours is None else self.warmup_hours
+        start = min(warmup, len(self.frame))
+        end = len(self.frame) if limit is None else min(len(self.frame), start + limit)
+        daemon.history = self.frame.iloc[max(0, start - context_rows):start].reset_index(drop=True)
+
+        arrivals = self._arrivals(start, end, speedup)
+        stage_times = {stage: [] for stage in STAGES}
+        row_latency = np.zeros(end - start)
+        alert_latency = []
+        lags = []
+        first_behind = None
+
+        t0 = time.perf_counter()
+        pos = start
+        while pos < end:
+            now = time.perf_counter() - t0
+            i = pos - start
+            if speedup:
+                if arrivals[i] > now:
+                    time.sleep(arrivals[i] - now)
+                    now = time.perf_counter() - t0
+                # 지금까지 도착한 행 전부
+                stop = start + int(np.searchsorted(arrivals, now, side='right'))
+            else:
+                stop = pos + batch_rows
+            stop = max(pos + 1, min(stop, end))
+
+            t = time.perf_counter()
+            rows = self.frame.iloc[pos:stop].reset_index(drop=True)
+            t_ingest = time.perf_counter()
+
+            prepared = daemon.preprocess(rows)
+            t_pre = time.perf_counter()
+
+            alerts = daemon.apply_cooldown(daemon.detect(rows, prepared))
+            t_detect = time.perf_counter()
+
+            daemon.record(alerts)
+            done = time.perf_counter()
+
+            for stage, (a, b) in zip(STAGES, [(t, t_ingest), (t_ingest, t_pre), (t_pre, t_detect), (t_detect, done)]):
+                stage_times[stage].append(b - a)
+
+            finished = done - t0
+            batch_arrivals = arrivals[pos - start:stop - start] if speedup else np.full(stop - pos, now)
+            latencies = finished - batch_arrivals
+            row_latency[pos - start:stop - start] = latencies
+            if len(alerts):
+                alerted = np.isin(rows['timestamp'].to_numpy(), alerts['timestamp'].to_numpy())
+                alert_latency.extend(latencies[alerted])
+
+            # 다음 행이 이미 도착했는데 아직 처리 중이었다면 밀린 것
+            if speedup and stop < end:
+                lag = finished - arrivals[stop - start]
+                if lag > 0:
+                    lags.append(lag)
+                    if first_behind is None:
+                        first_behind = rows['timestamp'].iloc[-1].isoformat()
+            pos = stop
+
+        elapsed = time.perf_counter() - t0
+        n = end - start
+        return {
+            'speedup': speedup,
+            'batch_rows': None if speedup else batch_rows,
+            'rows': n,
+            'batches': len(stage_times['ingest']),
+            'alerts': daemon.stats['alerts'],
+            'elapsed_seconds': elapsed,
+            'rows_per_second': n / elapsed if elapsed > 0 else None,
+            'processing_rows_per_second': n / sum(sum(v) for v in stage_times.values()),
+            'stages': {
+                stage: {'median_seconds': statistics.median(v), 'max_seconds': max(v), 'total_seconds': sum(v)}
+                for stage, v in stage_times.items() if v
+            },
+            'row_latency': latency_summary(row_latency),
+            'alert_latency': latency_summary(alert_latency),
+            'behind': {
+                'batches': len(lags),
+                'max_lag_seconds': max(lags) if lags else 0.0,
+                'first_behind_at': first_behind,
+            },
+        }
+
+
+def run(source='raw', speedups=(0,), batch_rows=24, limit=None, data_dir=None, config_path=None):
+    """
+    벤치마크 실행
+
+    Returns:
+        dict: 환경 정보 + 재생 결과 + 단계별 시나리오 (pipeline 벤치마크와 같은 형식)
+    """
+    frame = load_source(source, data_dir)
+    workdir = tempfile.mkdtemp(prefix='bench_replay_')
+    report = {
+        'benchmark': 'replay',
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'cpu_count': os.cpu_count(),
+        },
+        'source': source,
+        'source_rows': len(frame),
+        'replays': [],
+        'results': [],
+    }
+
+    try:
+        harness = ReplayHarness(frame, workdir, config_path)
+        for speedup in speedups:
+            replay = harness.run(speedup, batch_rows, limit)
+            report['replays'].append(replay)
+
+            mode = f'x{speedup:g}' if speedup else f'max.b{batch_rows}'
+            for stage, s in replay['stages'].items():
+                report['results'].append({'scenario': f'replay.{mode}.{stage}', 'scale': 1,
+                                          'median_seconds': s['median_seconds']})
+            if replay['row_latency']['count']:
+                report['results'].append({'scenario': f'replay.{mode}.row_latency_p95', 'scale': 1,
+                                          'median_seconds': replay['row_latency']['p95_ms'] / 1000})
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return report
+
+
+def _print_replay(r):
+    mode = f"x{r['speedup']:g}" if r['speedup'] else f"최대 속도 (묶음 {r['batch_rows']}행)"
+    print(f"--- {mode}: {r['rows']:,}행 / 묶음 {r['batches']:,}개 / 알람 {r['alerts']:,}개 ---")
+    print(f"  재생 시간 {r['elapsed_seconds']:.2f}s, {r['rows_per_second']:,.0f} rows/s "
+          f"(처리만 {r['processing_rows_per_second']:,.0f} rows/s)")
+    for stage, s in r['stages'].items():
+        print(f"  {stage:10s} median {s['median_seconds'] * 1000:8.2f}ms  max {s['max_seconds'] * 1000:8.2f}ms")
+
+    for label, key in [('행 지연', 'row_latency'), ('알람 지연', 'alert_latency')]:
+        lat = r[key]
+        if not lat['count']:
+            continue
+        print(f"  {label}: p50 {lat['p50_ms']:.2f}ms  p95 {lat['p95_ms']:.2f}ms  "
+              f"p99 {lat['p99_ms']:.2f}ms  max {lat['max_ms']:.2f}ms  (n={lat['count']:,})")
+        for bucket in lat['histogram']:
+            if bucket['count']:
+                edge = f"<= {bucket['le_ms']:g}ms" if bucket['le_ms'] is not None else '>  그 이상'
+                print(f"      {edge:>12s} {bucket['count']:7,d}")
+
+    behind = r['behind']
+    if behind['batches']:
+        print(f"  ⚠️ 처리 밀림 {behind['batches']:,}회, 최대 {behind['max_lag_seconds'] * 1000:.1f}ms "
+              f"(처음: {behind['first_behind_at']})")
+    elif r['speedup']:
+        print("  밀림 없음")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스트리밍 재생 벤치마크')
+    parser.add_argument('--source', default='raw', choices=['raw', 'processed'], help='재생할 데이터')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--config', default=None, help='모니터링 설정 (기본값: data/monitor_config.json)')
+    parser.add_argument('--speedups', type=float, nargs='+', default=[0, 360000],
+                        help='배속 (0 = 대기 없이 최대 속도, 3600 = 1시간 데이터를 1초에)')
+    parser.add_argument('--batch-rows', type=int, default=24, help='최대 속도 모드 묶음 크기')
+    parser.add_argument('--limit', type=int, default=None, help='재생할 최대 행 수')
+    parser.add_argument('--output', default=None, help='결과 JSON 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 이전 결과 JSON')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    report = run(args.source, args.speedups, args.batch_rows, args.limit, args.data_dir, args.config)
+
+    print(f"=== 스트리밍 재생 벤치마크 ({report['source']}, {report['source_rows']:,}행) ===\n")
+    for replay in report['replays']:
+        _print_replay(replay)
+        print()
+
+    path = args.output or os.path.join(RESULTS_DIR, f"replay_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    path = save_report(report, path)
+    print(f"결과 저장: {path}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n⚠️ 성능 회귀 {len(regressions)}건 (허용 {args.tolerance:.0%}):")
+            for scenario, _, before, after, change in regressions:
+                print(f"  {scenario:36s} {before * 1000:.2f}ms -> {after * 1000:.2f}ms (+{change:.0%})")
+            sys.exit(1)
+        print("\n성능 회귀 없음")
+
+
+if __name__ == '__main__':
+    main()
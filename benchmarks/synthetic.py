@@ -0,0 +1,271 @@
+"""
+합성 데이터 생성기
+
+실제 원본 파일과 같은 형식(컬럼, 시간 포맷, 인코딩)의 데이터를
+결정적으로(seed 고정) 생성합니다. scale=1 이 현재 데이터 규모
+(약 7.5k 시간)이고, 10 / 100 으로 키워 확장성을 측정합니다.
+
+생성 파일:
+    whale_transactions_rows_ETH_rev1.csv   고래 거래 (시간별 집계)
+    price_history_eth_rows.csv             ETH 가격 (정렬되지 않음)
+    price_history_btc_rows.csv             BTC 가격 (정렬되지 않음)
+    telegram_data.csv                      채널별 시간 집계
+    twitter_influencer_labeled_rows.csv    인플루언서 게시글
+    coinness_data.csv                      뉴스
+
+각 소스에는 스파이크 이벤트를 심어두고, 그 시각을 반환값의
+'events' 에 기록하므로 감지 정확도 평가에도 사용할 수 있습니다.
+
+사용법:
+    python -m benchmarks.synthetic --output /tmp/synth --scale 10
+"""
+
+import argparse
+import json
+import math
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# scale=1 기준 규모 (현재 데이터와 비슷하게)
+BASE_HOURS = 7500
+BASE_CHANNELS = 5
+BASE_TELEGRAM_ROWS_PER_HOUR = 1.65
+BASE_TWITTER_POSTS_PER_HOUR = 1.5
+BASE_NEWS_PER_HOUR = 1.0
+
+# 1000시간당 심는 스파이크 이벤트 수
+EVENTS_PER_1000_HOURS = 4
+
+START = '2025-01-01'
+
+COINS = ['BTC', 'ETH', 'SOL', 'XRP', 'BNB']
+
+
+def _hour_index(n_hours, start=START):
+    return pd.date_range(start, periods=n_hours, freq='h')
+
+
+def _plant_events(rng, n_hours):
+    """스파이크 이벤트 위치와 지속시간(1~6시간) 생성"""
+    n_events = max(int(n_hours / 1000 * EVENTS_PER_1000_HOURS), 1)
+    starts = np.sort(rng.choice(np.arange(48, n_hours - 8), size=n_events, replace=False))
+    durations = rng.integers(1, 7, size=n_events)
+
+    boost = np.ones(n_hours)
+    for s, d in zip(starts, durations):
+        boost[s:s + d] += rng.uniform(4.0, 10.0)
+    return starts, boost
+
+
+def _price_frame(rng, hours, coin, start_price, vol):
+    """코인 가격 OHLCV (price_history_*_rows.csv 형식)"""
+    n = len(hours)
+    log_ret = rng.normal(0, vol, n)
+    close = start_price * np.exp(np.cumsum(log_ret))
+    open_ = np.concatenate(([start_price], close[:-1]))
+    spread = np.abs(rng.normal(0, vol, n)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.gamma(2.0, 4000.0 if coin == 'ETH' else 400.0, n)
+    trade_count = rng.poisson(80000, n)
+    taker = volume * rng.uniform(0.4, 0.6, n)
+
+    df = pd.DataFrame({
+        'id': [f'{a:08x}-{b:04x}-4{c:03x}-{d:04x}-{e:012x}' for a, b, c, d, e in zip(
+            rng.integers(0, 2**32, n), rng.integers(0, 2**16, n), rng.integers(0, 2**12, n),
+            rng.integers(0, 2**16, n), rng.integers(0, 2**48, n))],
+        'coin_symbol': coin,
+        'timestamp': hours.strftime('%Y-%m-%d %H:%M:%S') + '+00',
+        'open_price': np.round(open_, 8),
+        'high_price': np.round(high, 8),
+        'low_price': np.round(low, 8),
+        'close_price': np.round(close, 8),
+        'volume': np.round(volume, 8),
+        'quote_volume': np.round(volume * close, 2),
+        'trade_count': trade_count,
+        'taker_buy_volume': np.round(taker, 8),
+        'taker_buy_quote_volume': np.round(taker * close, 2),
+    })
+    # 원본 파일은 id 순서로 저장되어 있음
+    return df.sort_values('id').reset_index(drop=True)
+
+
+def _whale_frame(rng, hours, boost):
+    """고래 거래 시간별 집계 (whale_transactions_rows_ETH_rev1.csv 형식)"""
+    n = len(hours)
+    frequency = rng.poisson(6 * boost)
+    amount = frequency * rng.gamma(1.5, 600.0, n)
+
+    df = pd.DataFrame({
+        # 원본은 '2025-01-01 0:00' 처럼 시(hour)에 0을 채우지 않음
+        'Time': hours.strftime('%Y-%m-%d ') + hours.hour.astype(str) + ':00',
+        'frequency': frequency,
+        'sum_amount': np.round(amount, 6),
+        'sum_amount_usd': 0,
+    })
+    # 원본처럼 일부 시간은 누락
+    keep = rng.random(n) > 0.027
+    return df[keep].reset_index(drop=True)
+
+
+def _telegram_frame(rng, hours, boost, n_channels):
+    """채널별 시간 집계 (telegram_data.csv 형식)"""
+    n_hours = len(hours)
+    channels = [f'@channel{i:03d}' for i in range(n_channels)]
+
+    # 전체 행 수가 scale에 선형으로 늘도록 채널당 활동 확률 조정
+    p_active = min(BASE_TELEGRAM_ROWS_PER_HOUR / n_channels, 1.0)
+    active = rng.random((n_channels, n_hours)) < np.minimum(p_active * boost, 1.0)
+    ch_idx, hour_idx = np.nonzero(active)
+    n = len(ch_idx)
+
+    positive = rng.uniform(0.0, 0.4, n)
+    negative = rng.uniform(0.0, 0.2, n)
+    df = pd.DataFrame({
+        'channel': np.array(channels)[ch_idx],
+        'timestamp': hours[hour_idx].strftime('%Y-%m-%d %H:%M:%S') + '+00:00',
+        'message_count': rng.poisson(boost[hour_idx]) + 1,
+        'avg_views': np.round(rng.gamma(2.0, 3000.0, n), 1),
+        'total_forwards': rng.poisson(30, n),
+        'total_reactions': rng.poisson(60 * boost[hour_idx]),
+        'avg_sentiment': np.round(np.clip(rng.normal(0.1, 0.4, n), -1, 1), 4),
+        'avg_positive': np.round(positive, 3),
+        'avg_negative': np.round(negative, 3),
+        'avg_neutral': np.round(1 - positive - negative, 3),
+        'avg_msg_length': np.round(rng.gamma(3.0, 50.0, n), 1),
+    })
+    return df
+
+
+def _posts_per_hour(rng, boost, rate):
+    """시간별 게시글 수 -> 게시글마다 속한 시간 인덱스"""
+    counts = rng.poisson(rate * boost)
+    return np.repeat(np.arange(len(boost)), counts)
+
+
+def _twitter_frame(rng, hours, boost):
+    """인플루언서 게시글 (twitter_influencer_labeled_rows.csv 형식)"""
+    hour_idx = _posts_per_hour(rng, boost, BASE_TWITTER_POSTS_PER_HOUR)
+    n = len(hour_idx)
+    minutes = rng.integers(0, 60, n)
+    post_time = hours[hour_idx] + pd.to_timedelta(minutes, unit='m')
+
+    users = np.array([f'@influencer{i:04d}' for i in range(max(n // 40, 10))])
+    user = users[rng.integers(0, len(users), n)]
+    sentiment = rng.choice(['neutral', 'positive', 'negative'], size=n, p=[0.75, 0.21, 0.04])
+    score = np.where(sentiment == 'positive', 1, np.where(sentiment == 'negative', -1, 0))
+    labeled = rng.random(n) < 0.065
+
+    df = pd.DataFrame({
+        'post_url': [f'https://x.com/{u[1:]}/status/{i}' for u, i in zip(user, rng.integers(10**18, 2 * 10**18, n))],
+        'user_name': user,
+        'profile_url': [f'https://x.com/{u[1:]}' for u in user],
+        'post_content': [f'synthetic post {i}' for i in range(n)],
+        'post_date': post_time.strftime('%Y-%m-%dT%H:%M:00.000Z'),
+        'comments': rng.poisson(10, n).astype(float),
+        'shares': rng.poisson(5, n).astype(float),
+        'likes': rng.poisson(100 * boost[hour_idx]).astype(float),
+        'spc_coin_label': labeled.astype(int),
+        'coin_name': np.where(labeled, rng.choice(COINS, size=n), None),
+        'sentiment': sentiment,
+        'sentiment_score': score,
+    })
+    return df
+
+
+def _coinness_frame(rng, hours, boost):
+    """뉴스 (coinness_data.csv 형식)"""
+    hour_idx = _posts_per_hour(rng, boost, BASE_NEWS_PER_HOUR)
+    n = len(hour_idx)
+    minutes = rng.integers(0, 60, n)
+    post_time = hours[hour_idx] + pd.to_timedelta(minutes, unit='m')
+
+    positive = rng.uniform(0.0, 0.3, n)
+    negative = rng.uniform(0.0, 0.2, n)
+    df = pd.DataFrame({
+        'timestamp': post_time.strftime('%Y-%m-%d %H:%M:%S'),
+        'title': [f'뉴스 제목 {i}' for i in range(n)],
+        'content': [f'뉴스 본문 {i}' for i in range(n)],
+        'link': [f'https://coinness.com/news/{i}' for i in range(n)],
+        'sentiment_compound': np.round(positive - negative, 4),
+        'sentiment_positive': np.round(positive, 3),
+        'sentiment_negative': np.round(negative, 3),
+        'sentiment_neutral': np.round(1 - positive - negative, 3),
+    })
+    # 최신 뉴스가 먼저 오도록 저장 (원본과 동일)
+    return df.iloc[::-1].reset_index(drop=True)
+
+
+def generate_dataset(output_dir, scale=1, seed=42, n_channels=None):
+    """
+    합성 데이터셋 생성
+
+    Args:
+        output_dir: 출력 디렉토리
+        scale: 규모 배수 (1 = 약 7.5k 시간)
+        seed: 난수 시드 (같은 시드 -> 같은 파일)
+        n_channels: 텔레그램 채널 수 (None이면 scale에 따라 증가)
+
+    Returns:
+        dict: 파일별 경로/행 수와 심어둔 스파이크 이벤트 시각
+    """
+    rng = np.random.default_rng(seed)
+    n_hours = int(BASE_HOURS * scale)
+    if n_channels is None:
+        n_channels = BASE_CHANNELS * max(int(math.ceil(math.sqrt(scale))), 1)
+
+    hours = _hour_index(n_hours)
+    event_starts, boost = _plant_events(rng, n_hours)
+
+    frames = {
+        'whale_transactions_rows_ETH_rev1.csv': _whale_frame(rng, hours, boost),
+        'price_history_eth_rows.csv': _price_frame(rng, hours, 'ETH', 3300.0, 0.006),
+        'price_history_btc_rows.csv': _price_frame(rng, hours, 'BTC', 94000.0, 0.004),
+        'telegram_data.csv': _telegram_frame(rng, hours, boost, n_channels),
+        'twitter_influencer_labeled_rows.csv': _twitter_frame(rng, hours, boost),
+        'coinness_data.csv': _coinness_frame(rng, hours, boost),
+    }
+
+    os.makedirs(output_dir, exist_ok=True)
+    files = {}
+    for name, df in frames.items():
+        path = os.path.join(output_dir, name)
+        # 고래 거래 원본 파일은 BOM 포함
+        encoding = 'utf-8-sig' if name.startswith('whale_') else 'utf-8'
+        df.to_csv(path, index=False, encoding=encoding)
+        files[name] = {'path': path, 'rows': len(df)}
+
+    return {
+        'scale': scale,
+        'seed': seed,
+        'hours': n_hours,
+        'channels': n_channels,
+        'files': files,
+        'events': [hours[i].isoformat() for i in event_starts],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 데이터 생성기')
+    parser.add_argument('--output', required=True, help='출력 디렉토리')
+    parser.add_argument('--scale', type=float, default=1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--channels', type=int, default=None)
+    args = parser.parse_args()
+
+    manifest = generate_dataset(args.output, args.scale, args.seed, args.channels)
+
+    with open(os.path.join(args.output, 'synthetic_manifest.json'), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print(f"=== 합성 데이터 생성 (scale={args.scale}, seed={args.seed}) ===")
+    for name, info in manifest['files'].items():
+        print(f"  {name:40s} {info['rows']:>10,}행")
+    print(f"  스파이크 이벤트: {len(manifest['events'])}개")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,18 +1,24 @@
 """
 Components package
-"""
-
-from . import charts
-from . import metrics
-from . import filters
-from . import alerts
-
-__all__ = ['charts', 'metrics', 'filters', 'alerts']
 
+하위 모듈은 처음 사용할 때 import 합니다 (모듈 수준 __getattr__).
+`from components import debug_panel` 은 plotly 를 불러오지 않습니다.
+"""
 
+import importlib
 
+# 지연 로딩하는 하위 모듈
+_LAZY_MODULES = ('charts', 'metrics', 'filters', 'alerts')
 
+__all__ = list(_LAZY_MODULES)
 
 
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        # import_module 이 패키지 속성(components.<name>)도 설정
+        return importlib.import_module(f'.{name}', __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -5,7 +5,6 @@ Plotly를 사용한 다양한 차트 생성 함수들
 """
 
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
@@ -16,6 +15,12 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from styles.coinness_theme import COLORS
+from components.downsample import downsample_frame, DEFAULT_MAX_POINTS
+
+# 포인트 수가 이 값을 넘으면 SVG 대신 WebGL(Scattergl) 트레이스 사용
+# (DEFAULT_MAX_POINTS 로 다운샘플링한 선 차트는 이보다 작으므로 max_points=None 일 때와
+#  다운샘플링하지 않는 마커/보조선 트레이스에만 해당)
+WEBGL_POINT_THRESHOLD = 5000
 
 
 def get_coinness_layout(title="", height=400):
@@ -62,6 +67,28 @@ def get_coinness_layout(title="", height=400):
     }
 
 
+def get_scatter_class(n_points, threshold=None, max_points=None):
+    """
+    포인트 수에 따라 SVG/WebGL 트레이스 클래스 선택
+    
+    다운샘플링한 트레이스(max_points 지정)는 차트 너비에 맞춘 포인트 수라 항상 SVG를 쓰고,
+    WebGL 전환은 원본 그대로 그리는 경우(max_points=None 또는 다운샘플링하지 않는 트레이스)에만 적용됩니다.
+    
+    Args:
+        n_points: 트레이스 포인트 수
+        threshold: WebGL 전환 기준 (기본값: WEBGL_POINT_THRESHOLD)
+        max_points: 트레이스에 적용한 다운샘플링 상한 (None이면 다운샘플링 안 함)
+        
+    Returns:
+        go.Scatter 또는 go.Scattergl
+    """
+    if max_points is not None:
+        return go.Scatter
+    if threshold is None:
+        threshold = WEBGL_POINT_THRESHOLD
+    return go.Scattergl if n_points > threshold else go.Scatter
+
+
 def get_chart_colors():
     """
     코인니스 차트 색상 팔레트 반환
@@ -78,7 +105,8 @@ def get_chart_colors():
     ]
 
 
-def create_time_series_chart(df, columns, title="Time Series", height=400):
+def create_time_series_chart(df, columns, title="Time Series", height=400,
+                             max_points=DEFAULT_MAX_POINTS):
     """
     시계열 차트 생성 (코인니스 스타일)
     
@@ -87,6 +115,7 @@ def create_time_series_chart(df, columns, title="Time Series", height=400):
         columns: 표시할 컬럼 리스트 또는 단일 컬럼
         title: 차트 제목
         height: 차트 높이
+        max_points: 트레이스당 최대 포인트 수 (None이면 원본 그대로)
         
     Returns:
         Plotly Figure
@@ -96,11 +125,14 @@ def create_time_series_chart(df, columns, title="Time Series", height=400):
     if isinstance(columns, str):
         columns = [columns]
     
+    df = downsample_frame(df, columns, max_points)
+    scatter = get_scatter_class(len(df), max_points=max_points)
+    
     colors = get_chart_colors()
     
     for i, col in enumerate(columns):
         if col in df.columns:
-            fig.add_trace(go.Scatter(
+            fig.add_trace(scatter(
                 x=df['timestamp'],
                 y=df[col],
                 mode='lines',
@@ -123,7 +155,8 @@ def create_time_series_chart(df, columns, title="Time Series", height=400):
     return fig
 
 
-def create_multi_axis_chart(df, left_col, right_col, title="Dual Axis Chart", height=400):
+def create_multi_axis_chart(df, left_col, right_col, title="Dual Axis Chart", height=400,
+                            max_points=DEFAULT_MAX_POINTS):
     """
     이중 축 차트 생성 (코인니스 스타일)
     
@@ -133,15 +166,19 @@ def create_multi_axis_chart(df, left_col, right_col, title="Dual Axis Chart", he
         right_col: 오른쪽 축 컬럼
         title: 차트 제목
         height: 차트 높이
+        max_points: 트레이스당 최대 포인트 수 (None이면 원본 그대로)
         
     Returns:
         Plotly Figure
     """
     fig = make_subplots(specs=[[{"secondary_y": True}]])
     
+    df = downsample_frame(df, [left_col, right_col], max_points)
+    scatter = get_scatter_class(len(df), max_points=max_points)
+    
     # 왼쪽 축 (코인니스 파란색)
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=df['timestamp'],
             y=df[left_col],
             mode='lines',
@@ -155,7 +192,7 @@ def create_multi_axis_chart(df, left_col, right_col, title="Dual Axis Chart", he
     
     # 오른쪽 축 (코인니스 초록색)
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=df['timestamp'],
             y=df[right_col],
             mode='lines',
@@ -272,6 +309,52 @@ def create_lag_correlation_chart(lag_corr_df, title="Lag Correlation", height=40
     return fig
 
 
+def create_rolling_correlation_chart(corr_df, columns=None, title="Correlation Over Time", height=400,
+                                     max_points=DEFAULT_MAX_POINTS):
+    """
+    상관관계 추이 차트 생성
+    
+    Args:
+        corr_df: 이동 상관계수 데이터프레임 (timestamp + 쌍별 상관계수 컬럼)
+        columns: 표시할 쌍 컬럼 리스트 (None이면 timestamp/window 외 전체)
+        title: 차트 제목
+        height: 차트 높이
+        max_points: 트레이스당 최대 포인트 수 (None이면 원본 그대로)
+        
+    Returns:
+        Plotly Figure
+    """
+    if columns is None:
+        columns = [c for c in corr_df.columns if c not in ('timestamp', 'window')]
+    
+    df = downsample_frame(corr_df, columns, max_points)
+    scatter = get_scatter_class(len(df), max_points=max_points)
+    colors = get_chart_colors()
+    
+    fig = go.Figure()
+    for i, col in enumerate(columns):
+        if col in df.columns:
+            fig.add_trace(scatter(
+                x=df['timestamp'],
+                y=df[col],
+                mode='lines',
+                name=col,
+                line=dict(color=colors[i % len(colors)], width=2),
+                connectgaps=False,
+                hovertemplate='%{x}<br>r = %{y:.3f}<extra></extra>'
+            ))
+    
+    fig.add_hline(y=0, line_dash="dash", line_color="gray")
+    
+    layout = get_coinness_layout(title, height)
+    layout['xaxis_title'] = "시간"
+    layout['yaxis_title'] = "상관계수"
+    layout['yaxis'] = {**layout['yaxis'], 'range': [-1.05, 1.05]}
+    fig.update_layout(**layout)
+    
+    return fig
+
+
 def create_spike_timeline(spike_df, title="Spike Timeline", height=400):
     """
     스파이크 타임라인 차트 생성
@@ -313,7 +396,7 @@ def create_spike_timeline(spike_df, title="Spike Timeline", height=400):
     for spike_type in spike_df['spike_type'].unique():
         type_data = spike_df[spike_df['spike_type'] == spike_type]
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(get_scatter_class(len(type_data))(
             x=type_data['timestamp'],
             y=type_data['spike_magnitude'],
             mode='markers',
@@ -366,7 +449,9 @@ def create_candlestick_chart(df, coin='ETH', title=None, height=400):
     
     # 볼린저 밴드 추가 (있으면)
     if f'{coin}_bb_upper' in df.columns:
-        fig.add_trace(go.Scatter(
+        scatter = get_scatter_class(len(df))
+        
+        fig.add_trace(scatter(
             x=df['timestamp'],
             y=df[f'{coin}_bb_upper'],
             mode='lines',
@@ -374,7 +459,7 @@ def create_candlestick_chart(df, coin='ETH', title=None, height=400):
             line=dict(color='rgba(250, 128, 114, 0.5)', dash='dash')
         ))
         
-        fig.add_trace(go.Scatter(
+        fig.add_trace(scatter(
             x=df['timestamp'],
             y=df[f'{coin}_bb_lower'],
             mode='lines',
@@ -407,6 +492,9 @@ def create_scatter_matrix(df, columns, title="Scatter Matrix", height=800):
     Returns:
         Plotly Figure
     """
+    # plotly.express 는 이 차트에서만 사용하므로 필요할 때 로드
+    import plotly.express as px
+    
     # 데이터 샘플링 (너무 많으면 느림)
     if len(df) > 1000:
         plot_df = df.sample(n=1000, random_state=42)
@@ -444,23 +532,26 @@ def create_volume_chart(df, coin='ETH', title=None, height=300):
     
     fig = go.Figure()
     
-    # 가격 상승/하락에 따른 색상 변경
-    colors = []
-    for i in range(len(df)):
-        if i == 0:
-            colors.append(COLORS['chart_neutral'])
-        else:
-            if df[f'{coin}_close'].iloc[i] >= df[f'{coin}_close'].iloc[i-1]:
-                colors.append(COLORS['success'])
-            else:
-                colors.append(COLORS['danger'])
+    # 가격 상승/하락에 따른 색상 변경 (벡터화)
+    # 상승 1, 하락 -1, 첫 봉 0 을 이산 컬러스케일로 매핑 (색상 문자열 배열보다 직렬화가 빠름)
+    close = df[f'{coin}_close'].to_numpy(dtype=np.float64)
+    direction = np.where(np.diff(close, prepend=np.nan) >= 0, 1, -1)
+    if len(direction) > 0:
+        direction[0] = 0
     
     fig.add_trace(go.Bar(
         x=df['timestamp'],
         y=df[f'{coin}_volume'],
         name='거래량',
         marker=dict(
-            color=colors,
+            color=direction,
+            cmin=-1,
+            cmax=1,
+            colorscale=[
+                [0.0, COLORS['danger']], [0.25, COLORS['danger']],
+                [0.25, COLORS['chart_neutral']], [0.75, COLORS['chart_neutral']],
+                [0.75, COLORS['success']], [1.0, COLORS['success']]
+            ],
             opacity=0.7,
             line=dict(width=0)
         ),
@@ -477,7 +568,8 @@ def create_volume_chart(df, coin='ETH', title=None, height=300):
     return fig
 
 
-def create_sentiment_chart(df, title="Community Sentiment", height=400):
+def create_sentiment_chart(df, title="Community Sentiment", height=400,
+                           max_points=DEFAULT_MAX_POINTS):
     """
     감정 분석 차트 생성
     
@@ -485,6 +577,7 @@ def create_sentiment_chart(df, title="Community Sentiment", height=400):
         df: 데이터프레임
         title: 차트 제목
         height: 차트 높이
+        max_points: 최대 포인트 수 (None이면 원본 그대로)
         
     Returns:
         Plotly Figure
@@ -500,10 +593,12 @@ def create_sentiment_chart(df, title="Community Sentiment", height=400):
         fig.update_layout(height=height, template='plotly_white')
         return fig
     
+    df = downsample_frame(df, 'avg_sentiment', max_points)
+    
     fig = go.Figure()
     
     # 감정 점수 (코인니스 스타일 - 파란색)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(get_scatter_class(len(df), max_points=max_points)(
         x=df['timestamp'],
         y=df['avg_sentiment'],
         mode='lines',
@@ -533,7 +628,8 @@ def create_sentiment_chart(df, title="Community Sentiment", height=400):
     return fig
 
 
-def create_comparison_chart(df, columns, normalize=True, title="Comparison", height=400):
+def create_comparison_chart(df, columns, normalize=True, title="Comparison", height=400,
+                            max_points=DEFAULT_MAX_POINTS):
     """
     여러 변수 비교 차트 (정규화 옵션, 코인니스 스타일)
     
@@ -543,6 +639,7 @@ def create_comparison_chart(df, columns, normalize=True, title="Comparison", hei
         normalize: 정규화 여부
         title: 차트 제목
         height: 차트 높이
+        max_points: 트레이스당 최대 포인트 수 (None이면 원본 그대로)
         
     Returns:
         Plotly Figure
@@ -551,18 +648,22 @@ def create_comparison_chart(df, columns, normalize=True, title="Comparison", hei
     
     colors = get_chart_colors()
     
+    # 정규화 범위는 원본 데이터 기준으로 계산
+    plot_df = downsample_frame(df, columns, max_points)
+    scatter = get_scatter_class(len(plot_df), max_points=max_points)
+    
     for i, col in enumerate(columns):
         if col in df.columns:
             if normalize:
                 # Min-Max 정규화 (0~1)
                 values = df[col].values
-                normalized = (values - np.nanmin(values)) / (np.nanmax(values) - np.nanmin(values) + 1e-10)
-                y_data = normalized
+                col_min, col_max = np.nanmin(values), np.nanmax(values)
+                y_data = (plot_df[col].values - col_min) / (col_max - col_min + 1e-10)
             else:
-                y_data = df[col]
+                y_data = plot_df[col]
             
-            fig.add_trace(go.Scatter(
-                x=df['timestamp'],
+            fig.add_trace(scatter(
+                x=plot_df['timestamp'],
                 y=y_data,
                 mode='lines',
                 name=col,
@@ -582,7 +683,8 @@ def create_comparison_chart(df, columns, normalize=True, title="Comparison", hei
     return fig
 
 
-def create_triple_axis_chart(df, title="통합 분석: 가격 vs 고래 거래 vs 텔레그램 활동", height=600):
+def create_triple_axis_chart(df, title="통합 분석: 가격 vs 고래 거래 vs 텔레그램 활동", height=600,
+                             max_points=DEFAULT_MAX_POINTS):
     """
     3-in-1 통합 차트 생성: 가격, 고래 거래, 텔레그램을 하나의 차트에 표시
     
@@ -590,12 +692,16 @@ def create_triple_axis_chart(df, title="통합 분석: 가격 vs 고래 거래 v
         df: 데이터프레임 (timestamp, ETH_close, tx_frequency, message_count 필요)
         title: 차트 제목
         height: 차트 높이
+        max_points: 트레이스당 최대 포인트 수 (None이면 원본 그대로)
         
     Returns:
         Plotly Figure with 3 Y-axes
     """
     from plotly.subplots import make_subplots
     
+    df = downsample_frame(df, ['ETH_close', 'tx_frequency', 'message_count'], max_points)
+    scatter = get_scatter_class(len(df), max_points=max_points)
+    
     # 서브플롯 생성 (3개의 Y축)
     fig = make_subplots(
         specs=[[{"secondary_y": True}]]
@@ -603,7 +709,7 @@ def create_triple_axis_chart(df, title="통합 분석: 가격 vs 고래 거래 v
     
     # 1. ETH 가격 (왼쪽 Y축, 파란색)
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=df['timestamp'],
             y=df['ETH_close'],
             name='ETH 가격',
@@ -615,7 +721,7 @@ def create_triple_axis_chart(df, title="통합 분석: 가격 vs 고래 거래 v
     
     # 2. 고래 거래 빈도 (오른쪽 Y축, 빨간색)
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=df['timestamp'],
             y=df['tx_frequency'],
             name='고래 거래',
@@ -628,7 +734,7 @@ def create_triple_axis_chart(df, title="통합 분석: 가격 vs 고래 거래 v
     # 3. 텔레그램 메시지 수 (세 번째 Y축, 초록색)
     if 'message_count' in df.columns:
         fig.add_trace(
-            go.Scatter(
+            scatter(
                 x=df['timestamp'],
                 y=df['message_count'],
                 name='텔레그램 메시지',
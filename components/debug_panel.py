@@ -0,0 +1,119 @@
+"""
+디버그 패널 (숨김)
+
+URL에 ?debug=1 (메모리까지 측정하려면 ?debug=memory) 을 붙이면
+utils.profiling 계측을 켜고 페이지 하단에 이번 렌더링의 단계별
+실행 시간 / 행 수 / 메모리 표와 JSON lines 다운로드 버튼을 표시합니다.
+
+- 실행 시간 계측은 프로세스 전역 설정이므로 한 번 켜면 서버를 재시작할 때까지 유지됩니다.
+- 메모리 측정(tracemalloc)은 모든 요청을 느리게 하므로 서버를 DASHBOARD_DEBUG_MEMORY=1
+  로 실행했을 때만 ?debug=memory 로 켤 수 있습니다. (그 외에는 실행 시간만 측정)
+- 기록에는 세션 id 를 붙여, 패널에는 이 세션의 이번 렌더링 단계만 표시합니다.
+"""
+
+import streamlit as st
+import pandas as pd
+import sys
+import os
+import time
+import uuid
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import profiling
+
+
+DEBUG_PARAM = 'debug'
+
+# ?debug=memory 허용 환경 변수 (프로세스 전역 tracemalloc)
+MEMORY_ENV = 'DASHBOARD_DEBUG_MEMORY'
+
+
+def _memory_allowed():
+    """?debug=memory 로 메모리 측정을 켤 수 있는지"""
+    return os.getenv(MEMORY_ENV, '').strip().lower() in ('1', 'true', 'yes', 'on')
+
+
+def _session_id():
+    """세션별 계측 기록 구분용 id"""
+    if '_debug_session' not in st.session_state:
+        st.session_state['_debug_session'] = uuid.uuid4().hex
+    return st.session_state['_debug_session']
+
+
+def _debug_mode():
+    """쿼리 파라미터의 디버그 모드 ('1', 'memory' 또는 None)"""
+    value = st.query_params.get(DEBUG_PARAM)
+    if value in ('1', 'true', 'on'):
+        return '1'
+    if value == 'memory':
+        return 'memory'
+    return None
+
+
+def begin():
+    """
+    렌더링 시작 시 호출 - 디버그 모드면 계측을 켜고 시작 시각 기록
+
+    Returns:
+        bool: 디버그 모드 여부
+    """
+    mode = _debug_mode()
+    if mode is None:
+        return False
+
+    trace_memory = mode == 'memory' and _memory_allowed()
+    if not profiling.is_enabled() or (trace_memory and not profiling.is_tracing_memory()):
+        profiling.enable(trace_memory=trace_memory or profiling.is_tracing_memory())
+
+    profiling.set_session(_session_id())
+    st.session_state['_debug_render_started'] = time.time()
+    return True
+
+
+def render(cache=None):
+    """
+    렌더링 끝에 호출 - 디버그 모드면 이번 렌더링의 계측 결과 표시
+
+    Args:
+        cache: SharedCache (주어지면 캐시 통계도 표시)
+    """
+    mode = _debug_mode()
+    if mode is None:
+        return
+
+    # 이 스레드의 이후 기록에는 세션 id 를 붙이지 않음
+    profiling.set_session(None)
+    started = st.session_state.get('_debug_render_started', 0)
+    records = [r for r in profiling.records(session=_session_id()) if r['started_at'] >= started]
+
+    with st.expander("🛠 Debug: 단계별 계측", expanded=True):
+        if cache is not None:
+            st.caption(f"SharedCache: {cache.stats()}")
+        if mode == 'memory' and not profiling.is_tracing_memory():
+            st.caption(f"메모리 측정이 꺼져 있습니다. (서버를 {MEMORY_ENV}=1 로 실행해야 사용 가능)")
+
+        if not records:
+            st.info("이번 렌더링에서 기록된 단계가 없습니다. (캐시된 결과만 사용)")
+            return
+
+        df = pd.DataFrame(records)
+        df['ms'] = df['seconds'] * 1000
+        if 'peak_bytes' in df.columns and df['peak_bytes'].notna().any():
+            df['peak_mb'] = df['peak_bytes'] / 1024 / 1024
+
+        columns = [c for c in ['name', 'parent', 'ms', 'rows_in', 'rows_out', 'peak_mb', 'error'] if c in df.columns]
+        st.write(f"**총 {len(df)}개 단계, {df.loc[df['parent'].isna(), 'ms'].sum():,.1f}ms**")
+        st.dataframe(
+            df[columns].sort_values('ms', ascending=False),
+            hide_index=True,
+            use_container_width=True
+        )
+
+        st.download_button(
+            "JSON lines 다운로드",
+            data=profiling.to_jsonl(records),
+            file_name='profile.jsonl',
+            mime='application/jsonl'
+        )
@@ -0,0 +1,177 @@
+"""
+차트 다운샘플링
+
+브라우저로 보내는 포인트 수를 차트 너비에 맞게 줄입니다.
+- LTTB (Largest-Triangle-Three-Buckets): 시각적 형태와 스파이크 보존
+- Min/Max 버킷: 버킷마다 최소/최대값을 남겨 극값을 정확히 보존
+
+날짜 필터로 구간을 좁히면 원본 해상도 데이터에서 다시 다운샘플링하므로
+확대할수록 세밀한 데이터가 표시됩니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# 차트 기본 너비 (px) 와 픽셀당 포인트 수
+DEFAULT_CHART_WIDTH = 1200
+POINTS_PER_PIXEL = 1.5
+
+# 기본 최대 포인트 수
+DEFAULT_MAX_POINTS = int(DEFAULT_CHART_WIDTH * POINTS_PER_PIXEL)
+
+
+def max_points_for_width(width_px=DEFAULT_CHART_WIDTH, points_per_pixel=POINTS_PER_PIXEL):
+    """
+    차트 너비에 맞는 최대 포인트 수
+
+    Args:
+        width_px: 차트 너비 (px)
+        points_per_pixel: 픽셀당 포인트 수
+
+    Returns:
+        int: 최대 포인트 수
+    """
+    return max(int(width_px * points_per_pixel), 3)
+
+
+def _to_numeric_x(x):
+    """x 값을 float 배열로 변환 (datetime은 epoch ns)"""
+    x = pd.Series(x) if not isinstance(x, pd.Series) else x
+    if pd.api.types.is_datetime64_any_dtype(x):
+        return x.astype('int64').to_numpy(dtype=np.float64)
+    return x.to_numpy(dtype=np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """
+    LTTB 다운샘플링 인덱스 계산
+
+    각 버킷에서 이전 선택점, 현재 후보, 다음 버킷 평균이 이루는
+    삼각형 면적이 가장 큰 점을 고릅니다. 버킷 내부 계산은 벡터화되어
+    전체 비용은 O(n) 입니다.
+
+    Args:
+        x: x 값 배열 (숫자 또는 datetime)
+        y: y 값 배열
+        n_out: 출력 포인트 수 (첫/마지막 점 포함)
+
+    Returns:
+        ndarray: 선택된 행 인덱스 (오름차순)
+    """
+    x = _to_numeric_x(x)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    # NaN은 면적 계산에서 후보가 되지 않도록 처리
+    y_filled = np.where(np.isnan(y), np.nanmean(y) if np.isfinite(y).any() else 0.0, y)
+
+    # 첫/마지막 점을 제외한 n_out - 2개 버킷 경계
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+
+    # 다음 버킷 평균 (누적합으로 한 번에 계산)
+    x_cum = np.concatenate(([0.0], np.cumsum(x)))
+    y_cum = np.concatenate(([0.0], np.cumsum(y_filled)))
+    next_start = np.append(edges[1:-1], n - 1)
+    next_end = np.append(edges[2:], n)
+    counts = np.maximum(next_end - next_start, 1)
+    next_x = (x_cum[next_end] - x_cum[next_start]) / counts
+    next_y = (y_cum[next_end] - y_cum[next_start]) / counts
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], max(edges[i + 1], edges[i] + 1)
+        bx = x[start:end]
+        by = y_filled[start:end]
+
+        area = np.abs(
+            (x[a] - next_x[i]) * (by - y_filled[a]) -
+            (x[a] - bx) * (next_y[i] - y_filled[a])
+        )
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+
+    return selected
+
+
+def minmax_indices(y, n_buckets):
+    """
+    Min/Max 버킷 다운샘플링 인덱스 계산 (완전 벡터화)
+
+    각 버킷에서 최소값과 최대값 위치를 남기므로 모든 극값이 보존됩니다.
+
+    Args:
+        y: y 값 배열
+        n_buckets: 버킷 수 (출력은 최대 2 * n_buckets + 2 포인트)
+
+    Returns:
+        ndarray: 선택된 행 인덱스 (오름차순)
+    """
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+
+    if n_buckets * 2 >= n or n_buckets < 1:
+        return np.arange(n)
+
+    size = int(np.ceil(n / n_buckets))
+    padded_len = size * n_buckets
+
+    y_max = np.full(padded_len, -np.inf)
+    y_min = np.full(padded_len, np.inf)
+    valid = ~np.isnan(y)
+    y_max[:n] = np.where(valid, y, -np.inf)
+    y_min[:n] = np.where(valid, y, np.inf)
+
+    offsets = np.arange(n_buckets) * size
+    idx_max = offsets + y_max.reshape(n_buckets, size).argmax(axis=1)
+    idx_min = offsets + y_min.reshape(n_buckets, size).argmin(axis=1)
+
+    idx = np.concatenate(([0, n - 1], idx_max, idx_min))
+    idx = idx[idx < n]
+    return np.unique(idx)
+
+
+def downsample_frame(df, columns, max_points=DEFAULT_MAX_POINTS, x_col='timestamp', method='lttb'):
+    """
+    여러 컬럼을 그리는 차트용 데이터프레임 다운샘플링
+
+    컬럼별로 선택된 인덱스의 합집합을 사용하므로 모든 트레이스가
+    같은 x 값을 공유하고, 각 컬럼의 스파이크가 보존됩니다.
+
+    Args:
+        df: 데이터프레임 (x_col 기준 정렬)
+        columns: 다운샘플링 기준 컬럼 리스트 또는 단일 컬럼
+        max_points: 컬럼당 최대 포인트 수 (None이면 다운샘플링 안 함)
+        x_col: x축 컬럼
+        method: 'lttb' 또는 'minmax'
+
+    Returns:
+        DataFrame: 다운샘플링된 데이터프레임
+    """
+    if isinstance(columns, str):
+        columns = [columns]
+
+    columns = [c for c in columns if c in df.columns]
+
+    if max_points is None or df.empty or len(df) <= max_points or not columns:
+        return df
+
+    x = df[x_col] if x_col in df.columns else np.arange(len(df))
+
+    selected = []
+    for col in columns:
+        y = pd.to_numeric(df[col], errors='coerce').to_numpy(dtype=np.float64)
+        if method == 'minmax':
+            selected.append(minmax_indices(y, max(max_points // 2, 1)))
+        else:
+            selected.append(lttb_indices(x, y, max_points))
+
+    idx = np.unique(np.concatenate(selected))
+    return df.iloc[idx]
@@ -13,6 +13,7 @@ from datetime import datetime, timedelta
 # 경로 설정
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from styles.coinness_theme import COLORS
+from utils.time_index import time_index
 
 
 def date_range_filter(df, key_prefix=""):
@@ -193,6 +194,9 @@ def apply_date_filter(df, start_date, end_date):
     """
     데이터프레임에 날짜 필터 적용
     
+    timestamp 정렬 배열을 이분 탐색해 [시작일 00:00, 종료일 다음날 00:00) 구간을
+    잘라냅니다 (전체 마스크를 만들지 않음).
+    
     Args:
         df: 데이터프레임
         start_date: 시작일
@@ -207,13 +211,36 @@ def apply_date_filter(df, start_date, end_date):
     if start_date is None or end_date is None:
         return df
     
-    # date를 datetime으로 변환
+    # date를 datetime으로 변환 (종료일은 하루 전체 포함)
     start_datetime = pd.to_datetime(start_date)
-    end_datetime = pd.to_datetime(end_date) + timedelta(days=1) - timedelta(seconds=1)
+    end_datetime = pd.to_datetime(end_date) + timedelta(days=1)
+    
+    return time_index(df).slice(start_datetime, end_datetime)
+
+
+def apply_rollup_filter(store, start_date, end_date, max_points=None):
+    """
+    롤업 저장소에서 날짜 범위를 포인트 예산에 맞는 해상도로 조회
     
-    filtered = df[(df['timestamp'] >= start_datetime) & (df['timestamp'] <= end_datetime)]
+    짧은 범위는 시간별 원본 그대로, 긴 범위는 4시간/일/주 단위 집계를 반환합니다.
+    
+    Args:
+        store: RollupStore
+        start_date: 시작일 (None이면 전체)
+        end_date: 종료일 (None이면 전체)
+        max_points: 최대 포인트 수 (None이면 저장소 기본값)
+        
+    Returns:
+        DataFrame: 집계된 데이터프레임 (attrs['resolution'] 에 해상도)
+    """
+    start_datetime = pd.to_datetime(start_date) if start_date is not None else None
+    end_datetime = None
+    if end_date is not None:
+        end_datetime = pd.to_datetime(end_date) + timedelta(days=1) - timedelta(seconds=1)
     
-    return filtered
+    if max_points is None:
+        return store.query(start_datetime, end_datetime)
+    return store.query(start_datetime, end_datetime, max_points=max_points)
 
 
 def convert_period_to_hours(period_str):
@@ -13,6 +13,118 @@ import os
 # 경로 설정
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from styles.coinness_theme import COLORS
+from utils.time_index import time_index
+from utils.range_index import RangeAggregateIndex, range_index
+
+# 지표 카드 기간 -> 시간 수
+PERIOD_HOURS = {
+    '1h': 1,
+    '24h': 24,
+    '7d': 24 * 7,
+    '30d': 24 * 30
+}
+
+# 일괄 계산 기본 기간 / 코인
+METRIC_PERIODS = ('1h', '24h', '7d', '30d')
+METRIC_COINS = ('ETH', 'BTC')
+
+# 지표 카드가 사용하는 컬럼 (범위 집계 인덱스 대상)
+CARD_COLUMNS = [
+    'ETH_close', 'BTC_close', 'ETH_volume', 'BTC_volume',
+    'message_count', 'avg_views', 'avg_sentiment', 'total_reactions',
+    'tx_frequency', 'tx_amount',
+]
+
+
+def recent_window(df, hours):
+    """
+    마지막 행 기준 최근 hours 시간의 데이터 (시간 기준, 빠진 시간이 있어도 정확)
+    
+    Args:
+        df: 데이터프레임
+        hours: 시간 수
+        
+    Returns:
+        DataFrame: (마지막 시각 - hours, 마지막 시각] 구간 (timestamp 가 없으면 tail)
+    """
+    index = time_index(df)
+    if index is None:
+        return df.tail(hours)
+    return index.last(hours)
+
+
+def _windows(df, hours_list, columns=CARD_COLUMNS):
+    """
+    최근 N시간 구간들을 범위 집계 인덱스의 행 구간으로 변환
+    
+    Args:
+        df: 데이터프레임 (비어 있지 않음)
+        hours_list: 시간 수 목록 (None은 전체 구간)
+        columns: 필요한 컬럼
+        
+    Returns:
+        tuple: (RangeAggregateIndex, lo 배열, hi 배열)
+    """
+    found = range_index(df, columns)
+    if found is None:
+        # timestamp 가 없으면 행 개수 기준 (한 행 = 1시간, None은 전체)
+        agg = RangeAggregateIndex(df, columns)
+        his = np.full(len(hours_list), len(df))
+        hours = np.array([len(df) if hours is None else hours for hours in hours_list])
+        return agg, np.maximum(his - hours, 0), his
+    
+    agg, index, offset = found
+    bounds = np.array([index.last_bounds(hours) for hours in hours_list]).reshape(-1, 2) + offset
+    return agg, bounds[:, 0], bounds[:, 1]
+
+
+def _price_changes(agg, coin, los, his):
+    """구간별 (현재 가격, 변화액, 변화율) - 구간 첫 행 대비 마지막 행"""
+    col = f'{coin}_close'
+    current = agg.value(col, his - 1)
+    past = agg.value(col, los)
+    change = current - past
+    with np.errstate(invalid='ignore', divide='ignore'):
+        change_pct = np.where(past > 0, change / past * 100, 0)
+    return [(current[i], change[i], change_pct[i]) for i in range(len(los))]
+
+
+def _volume_stats(agg, coin, los, his):
+    col = f'{coin}_volume'
+    total, avg = agg.sum(col, los, his), agg.mean(col, los, his)
+    high, low = agg.max(col, los, his), agg.min(col, los, his)
+    return [{'total': total[i], 'avg': avg[i], 'max': high[i], 'min': low[i]} for i in range(len(los))]
+
+
+def _community_stats(agg, los, his):
+    def optional(col, how):
+        return getattr(agg, how)(col, los, his) if col in agg else np.zeros(len(los))
+    
+    total, avg = agg.sum('message_count', los, his), agg.mean('message_count', los, his)
+    views = optional('avg_views', 'sum')
+    sentiment = optional('avg_sentiment', 'mean')
+    reactions = optional('total_reactions', 'sum')
+    return [{
+        'total_messages': total[i],
+        'avg_messages': avg[i],
+        'total_views': views[i],
+        'avg_sentiment': sentiment[i],
+        'total_reactions': reactions[i]
+    } for i in range(len(los))]
+
+
+def _whale_stats(agg, los, his):
+    total, avg = agg.sum('tx_frequency', los, his), agg.mean('tx_frequency', los, his)
+    if 'tx_amount' in agg:
+        amount, max_amount = agg.sum('tx_amount', los, his), agg.max('tx_amount', los, his)
+    else:
+        amount = max_amount = np.zeros(len(los))
+    return [{
+        'total_tx': total[i],
+        'avg_tx_frequency': avg[i],
+        'total_amount': amount[i],
+        'max_amount': max_amount[i]
+    } for i in range(len(los))]
 
 
 def calculate_price_change(df, coin='ETH', period='24h'):
@@ -30,25 +142,9 @@ def calculate_price_change(df, coin='ETH', period='24h'):
     if df.empty or f'{coin}_close' not in df.columns:
         return 0, 0, 0
     
-    # 시간 설정
-    hours = {
-        '1h': 1,
-        '24h': 24,
-        '7d': 24 * 7,
-        '30d': 24 * 30
-    }.get(period, 24)
-    
-    current_price = df[f'{coin}_close'].iloc[-1]
-    
-    if len(df) > hours:
-        past_price = df[f'{coin}_close'].iloc[-hours]
-    else:
-        past_price = df[f'{coin}_close'].iloc[0]
-    
-    change = current_price - past_price
-    change_pct = (change / past_price) * 100 if past_price > 0 else 0
-    
-    return current_price, change, change_pct
+    # 기간 시작 가격 = 최근 기간 구간의 첫 행 (데이터가 기간보다 짧으면 첫 행)
+    agg, los, his = _windows(df, [PERIOD_HOURS.get(period, 24)])
+    return _price_changes(agg, coin, los, his)[0]
 
 
 def calculate_volume_stats(df, coin='ETH', period_hours=24):
@@ -66,16 +162,8 @@ def calculate_volume_stats(df, coin='ETH', period_hours=24):
     if df.empty or f'{coin}_volume' not in df.columns:
         return {'total': 0, 'avg': 0, 'max': 0}
     
-    recent = df.tail(period_hours)
-    
-    stats = {
-        'total': recent[f'{coin}_volume'].sum(),
-        'avg': recent[f'{coin}_volume'].mean(),
-        'max': recent[f'{coin}_volume'].max(),
-        'min': recent[f'{coin}_volume'].min()
-    }
-    
-    return stats
+    agg, los, his = _windows(df, [period_hours])
+    return _volume_stats(agg, coin, los, his)[0]
 
 
 def calculate_community_stats(df, period_hours=24):
@@ -97,17 +185,8 @@ def calculate_community_stats(df, period_hours=24):
             'avg_sentiment': 0
         }
     
-    recent = df.tail(period_hours)
-    
-    stats = {
-        'total_messages': recent['message_count'].sum(),
-        'avg_messages': recent['message_count'].mean(),
-        'total_views': recent['avg_views'].sum() if 'avg_views' in df.columns else 0,
-        'avg_sentiment': recent['avg_sentiment'].mean() if 'avg_sentiment' in df.columns else 0,
-        'total_reactions': recent['total_reactions'].sum() if 'total_reactions' in df.columns else 0
-    }
-    
-    return stats
+    agg, los, his = _windows(df, [period_hours])
+    return _community_stats(agg, los, his)[0]
 
 
 def calculate_whale_activity(df, period_hours=24):
@@ -128,16 +207,193 @@ def calculate_whale_activity(df, period_hours=24):
             'total_amount': 0
         }
     
-    recent = df.tail(period_hours)
+    agg, los, his = _windows(df, [period_hours])
+    return _whale_stats(agg, los, his)[0]
+
+
+def calculate_metric_cards(df, periods=METRIC_PERIODS, coins=METRIC_COINS):
+    """
+    지표 카드 전체를 모든 기간에 대해 한 번에 계산
+    
+    범위 집계 인덱스(데이터 버전당 1회 생성)에서 기간별 구간을 O(1) 로 조회합니다.
+    값은 개별 함수(calculate_price_change 등)와 같습니다.
     
+    Args:
+        df: 데이터프레임 (필터로 잘라낸 프레임이면 끝 시각 기준)
+        periods: 기간 목록 ('1h', '24h', '7d', '30d')
+        coins: 코인 심볼 목록
+        
+    Returns:
+        dict: 기간 -> {'price': {코인: (현재 가격, 변화액, 변화율)},
+                       'volume': {코인: 거래량 통계},
+                       'community': 커뮤니티 통계, 'whale': 고래 활동 통계}
+    """
+    periods = list(periods)
+    if df.empty:
+        return {
+            period: {
+                'price': {coin: calculate_price_change(df, coin, period) for coin in coins},
+                'volume': {coin: calculate_volume_stats(df, coin) for coin in coins},
+                'community': calculate_community_stats(df),
+                'whale': calculate_whale_activity(df)
+            } for period in periods
+        }
+    
+    hours = [PERIOD_HOURS.get(period, 24) for period in periods]
+    agg, los, his = _windows(df, hours)
+    
+    def per_period(available, compute, default):
+        return compute() if available else [default] * len(periods)
+    
+    price = {coin: per_period(f'{coin}_close' in agg, lambda: _price_changes(agg, coin, los, his), (0, 0, 0))
+             for coin in coins}
+    volume = {coin: per_period(f'{coin}_volume' in agg, lambda: _volume_stats(agg, coin, los, his),
+                               calculate_volume_stats(df.iloc[:0], coin))
+              for coin in coins}
+    community = per_period('message_count' in agg, lambda: _community_stats(agg, los, his),
+                           calculate_community_stats(df.iloc[:0]))
+    whale = per_period('tx_frequency' in agg, lambda: _whale_stats(agg, los, his),
+                       calculate_whale_activity(df.iloc[:0]))
+    
+    return {
+        period: {
+            'price': {coin: price[coin][i] for coin in coins},
+            'volume': {coin: volume[coin][i] for coin in coins},
+            'community': community[i],
+            'whale': whale[i]
+        } for i, period in enumerate(periods)
+    }
+
+
+def _window_hours(windows):
+    """기간 목록 ('24h' 등 / 시간 수 / None=전체) -> (라벨, 시간 수) 목록"""
+    out = []
+    for window in windows:
+        if window is None:
+            out.append(('전체', None))
+        elif isinstance(window, str):
+            out.append((window, PERIOD_HOURS.get(window, 24)))
+        else:
+            out.append((f'{window}h', window))
+    return out
+
+
+def _trend_label(slope_pct):
+    """시간당 기울기(평균 대비 %) -> 트렌드 방향"""
+    if np.isnan(slope_pct):
+        return "알 수 없음"
+    if slope_pct > 1:
+        return "상승 ↗"
+    if slope_pct < -1:
+        return "하락 ↘"
+    return "횡보 →"
+
+
+def calculate_trend_table(df, columns, windows=('24h', '7d', '30d')):
+    """
+    여러 컬럼 x 여러 기간의 추세 / 변동성 통계를 한 번에 계산
+    
+    범위 집계 인덱스의 누적합에서 (기간 x 컬럼) 2차원으로 닫힌 형태 계산합니다.
+    (회귀 기울기 = (Sxy - SxSy/n) / (Sxx - Sx^2/n), x 는 경과 시간)
+    
+    Args:
+        df: 데이터프레임 (필터로 잘라낸 프레임이면 끝 시각 기준)
+        columns: 컬럼 목록 (없는 컬럼은 제외)
+        windows: 기간 목록 ('24h' 등 기간 문자열, 시간 수, None=전체)
+        
+    Returns:
+        DataFrame: column, window, hours, n, last, mean, std, min, max,
+                   slope (시간당), slope_pct (평균 대비 %), trend
+    """
+    table_columns = ['column', 'window', 'hours', 'n', 'last', 'mean', 'std', 'min', 'max',
+                     'slope', 'slope_pct', 'trend']
+    columns = [c for c in dict.fromkeys(columns) if c in df.columns]
+    if df.empty or not columns:
+        return pd.DataFrame(columns=table_columns)
+    
+    labels = _window_hours(windows)
+    agg, los, his = _windows(df, [hours for _, hours in labels], columns)
+    
+    n = agg.count(columns, los, his)
+    mean = agg.mean(columns, los, his)
+    slope = agg.slope(columns, los, his)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope_pct = np.where(mean != 0, slope / mean * 100, 0.0)
+    slope_pct = np.where(np.isnan(slope), np.nan, slope_pct)
     stats = {
-        'total_tx': recent['tx_frequency'].sum(),
-        'avg_tx_frequency': recent['tx_frequency'].mean(),
-        'total_amount': recent['tx_amount'].sum() if 'tx_amount' in df.columns else 0,
-        'max_amount': recent['tx_amount'].max() if 'tx_amount' in df.columns else 0
+        'n': n,
+        'last': agg.last_value(columns, los, his),
+        'mean': mean,
+        'std': agg.std(columns, los, his),
+        'min': agg.min(columns, los, his),
+        'max': agg.max(columns, los, his),
+        'slope': slope,
+        'slope_pct': slope_pct,
     }
     
-    return stats
+    # (기간 x 컬럼) -> 행 = 컬럼별 기간 순
+    w, c = n.shape
+    table = pd.DataFrame({
+        'column': np.repeat(columns, w),
+        'window': np.tile([label for label, _ in labels], c),
+        'hours': np.tile([np.nan if hours is None else hours for _, hours in labels], c),
+        **{name: values.T.reshape(-1) for name, values in stats.items()},
+    })
+    table['trend'] = [_trend_label(v) for v in table['slope_pct']]
+    return table[table_columns]
+
+
+def calculate_performance_table(df, coins=METRIC_COINS, windows=(None,)):
+    """
+    여러 코인 x 여러 기간의 성과 지표를 한 번에 계산
+    
+    수익률은 유효 가격끼리의 변화율 (pct_change().dropna() 와 동일) 누적합으로 계산합니다.
+    
+    Args:
+        df: 데이터프레임
+        coins: 코인 심볼 목록 (<coin>_close 가 없는 코인은 제외)
+        windows: 기간 목록 ('24h' 등 기간 문자열, 시간 수, None=전체)
+        
+    Returns:
+        DataFrame: coin, window, hours, total_return, avg_return, volatility, sharpe_ratio,
+                   max_price, min_price, current_price (수익률 / 변동성은 %)
+    """
+    table_columns = ['coin', 'window', 'hours', 'total_return', 'avg_return', 'volatility',
+                     'sharpe_ratio', 'max_price', 'min_price', 'current_price']
+    coins = [coin for coin in coins if f'{coin}_close' in df.columns]
+    if df.empty or not coins:
+        return pd.DataFrame(columns=table_columns)
+    
+    columns = [f'{coin}_close' for coin in coins]
+    labels = _window_hours(windows)
+    agg, los, his = _windows(df, [hours for _, hours in labels], columns)
+    
+    n = agg.count(columns, los, his)
+    first = agg.first_value(columns, los, his)
+    current = agg.last_value(columns, los, his)
+    mean, std, _ = agg.return_stats(columns, los, his)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        total_return = (current - first) / first * 100
+        sharpe = np.where(std > 0, mean / std, 0.0)
+    stats = {
+        'total_return': total_return,
+        'avg_return': mean * 100,
+        'volatility': std * 100,
+        'sharpe_ratio': sharpe,
+        'max_price': agg.max(columns, los, his),
+        'min_price': agg.min(columns, los, his),
+        'current_price': current,
+    }
+    stats = {name: np.where(n > 0, values, np.nan) for name, values in stats.items()}
+    
+    w, c = n.shape
+    table = pd.DataFrame({
+        'coin': np.repeat(coins, w),
+        'window': np.tile([label for label, _ in labels], c),
+        'hours': np.tile([np.nan if hours is None else hours for _, hours in labels], c),
+        **{name: values.T.reshape(-1) for name, values in stats.items()},
+    })
+    return table[table_columns]
 
 
 def get_correlation_strength(corr_value):
@@ -183,8 +439,7 @@ def calculate_volatility(df, column, window=24):
     if df.empty or column not in df.columns:
         return 0
     
-    recent = df.tail(window)
-    return recent[column].std()
+    return calculate_trend_table(df, [column], [window])['std'].iloc[0]
 
 
 def get_trend_direction(df, column, window=24):
@@ -202,32 +457,8 @@ def get_trend_direction(df, column, window=24):
     if df.empty or column not in df.columns or len(df) < window:
         return "알 수 없음"
     
-    recent = df.tail(window)
-    
-    # 선형 회귀 기울기 계산
-    x = np.arange(len(recent))
-    y = recent[column].values
-    
-    # NaN 제거
-    mask = ~np.isnan(y)
-    if sum(mask) < 2:
-        return "알 수 없음"
-    
-    x = x[mask]
-    y = y[mask]
-    
-    slope = np.polyfit(x, y, 1)[0]
-    
-    # 변화율 계산
-    mean_value = np.mean(y)
-    slope_pct = (slope / mean_value) * 100 if mean_value != 0 else 0
-    
-    if slope_pct > 1:
-        return "상승 ↗"
-    elif slope_pct < -1:
-        return "하락 ↘"
-    else:
-        return "횡보 →"
+    # 선형 회귀 기울기 (x 는 경과 시간 - 빠진 시간 반영, 시간당 기울기의 평균 대비 %)
+    return calculate_trend_table(df, [column], [window])['trend'].iloc[0]
 
 
 def format_large_number(num):
@@ -305,25 +536,12 @@ def calculate_performance_metrics(df, coin='ETH'):
     if df.empty or f'{coin}_close' not in df.columns:
         return {}
     
-    prices = df[f'{coin}_close'].dropna()
-    
-    if len(prices) == 0:
+    row = calculate_performance_table(df, [coin]).iloc[0]
+    if np.isnan(row['current_price']):
         return {}
     
-    # 수익률
-    returns = prices.pct_change().dropna()
-    
-    metrics = {
-        'total_return': ((prices.iloc[-1] - prices.iloc[0]) / prices.iloc[0]) * 100,
-        'avg_return': returns.mean() * 100,
-        'volatility': returns.std() * 100,
-        'sharpe_ratio': (returns.mean() / returns.std()) if returns.std() > 0 else 0,
-        'max_price': prices.max(),
-        'min_price': prices.min(),
-        'current_price': prices.iloc[-1]
-    }
-    
-    return metrics
+    keys = ['total_return', 'avg_return', 'volatility', 'sharpe_ratio', 'max_price', 'min_price', 'current_price']
+    return {key: row[key] for key in keys}
 
 
 def create_coinness_metric_card(title, value, delta=None, icon="📊", card_type="neutral"):
@@ -16,8 +16,17 @@ from datetime import datetime, timedelta
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from utils.data_loader import DataLoader
-from utils.composite_score import CompositeScoreCalculator
+from utils.cache import SharedCache, derive_fingerprint
+from utils.profiling import stage
+from components import debug_panel
 from analysis.spike_detector import SpikeDetector
+from utils.dashboard_snapshot import (
+    SNAPSHOT_FILE,
+    build_snapshot,
+    load_snapshot,
+    calculate_correlations_with_price,
+    calculate_correlations_with_whale,
+)
 
 # 페이지 설정
 st.set_page_config(
@@ -353,24 +362,92 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
-@st.cache_data(ttl=300)
+# 이 페이지가 사용하는 전처리 데이터 컬럼
+PAGE_COLUMNS = [
+    'timestamp', 'message_count', 'avg_sentiment', 'tx_frequency', 'ETH_close',
+    'twitter_count', 'twitter_sentiment_compound'
+]
+
+
+@st.cache_resource
+def get_shared_cache():
+    """세션 간 공유 캐시 (프로세스당 1개)"""
+    return SharedCache()
+
+
 def load_all_data():
-    """모든 데이터 로드 (5분 캐시)"""
+    """
+    모든 데이터 로드 (원본 파일이 바뀐 경우에만 다시 읽음)
+    
+    Returns:
+        tuple: (전처리 데이터, 개별 소스 데이터, 입력 지문)
+    """
+    cache = get_shared_cache()
     loader = DataLoader()
+    paths = loader.get_source_paths()
+    
+    # 전처리된 데이터 로드 (이 페이지에서 쓰는 컬럼만)
+    df_main, main_fp = cache.load_frame(
+        'landing_main',
+        os.path.join(loader.data_dir, 'processed_data.csv'),
+        lambda: loader.load_processed_data(columns=PAGE_COLUMNS)
+    )
+    if df_main.empty:
+        st.error("데이터 로드 실패: data/processed_data.csv")
+    
+    # 개별 소스 데이터 (점수 계산에 쓰는 뉴스/트위터만)
+    data, data_fp = cache.load_frame(
+        'landing_sources',
+        [paths['coinness'], paths['twitter']],
+        lambda: {'coinness': loader.load_coinness_data(), 'twitter': loader.load_twitter_data()}
+    )
+    
+    return df_main, data, derive_fingerprint(main_fp, data_fp)
+
+
+def load_dashboard_view():
+    """
+    랜딩 페이지 데이터 준비
+    
+    사전 계산된 스냅샷이 유효하면 그대로 사용하고 (pandas 계산 없음),
+    없거나 stale이면 데이터를 로드해 실시간으로 계산합니다.
+    
+    Returns:
+        dict: 스냅샷 형식의 뷰 데이터 (데이터가 없으면 None)
+    """
+    data_dir = DataLoader().data_dir
+    view = load_snapshot(os.path.join(data_dir, SNAPSHOT_FILE), data_dir=data_dir)
+    if view is not None:
+        return view
+    
+    with st.spinner("Loading market data..."):
+        df_main, data, fingerprint = load_all_data()
+    
+    if df_main.empty:
+        return None
     
-    # 전처리된 데이터 로드 (상대 경로)
     try:
-        data_path = os.path.join(os.path.dirname(__file__), 'data', 'processed_data.csv')
-        df_main = pd.read_csv(data_path)
-        df_main['timestamp'] = pd.to_datetime(df_main['timestamp'])
+        view = get_shared_cache().derived(
+            'landing_view', fingerprint, None,
+            lambda: build_snapshot(df_main, data)
+        )
     except Exception as e:
-        st.error(f"데이터 로드 실패: {e}")
-        df_main = pd.DataFrame()
-    
-    # 개별 소스 데이터
-    data = loader.load_all_data()
+        st.error(f"점수 계산 실패: {e}")
+        view = {
+            'scores': {'telegram': 50, 'news': 50, 'twitter': 50, 'composite': 50},
+            'score_change': 0,
+            'score_change_pct': 0,
+            'signal_summary': {'current_level': 'neutral'},
+            'correlations': {
+                'price': calculate_correlations_with_price(df_main),
+                'whale': calculate_correlations_with_whale(df_main),
+            },
+            'recent_spikes': [],
+            'recent_news': data.get('coinness', pd.DataFrame()).head(10),
+            'score_series': {'timestamp': [], 'composite_score': []},
+        }
     
-    return df_main, data
+    return view
 
 
 def render_top_navigation():
@@ -385,58 +462,6 @@ def render_top_navigation():
     """, unsafe_allow_html=True)
 
 
-def calculate_correlations_with_price(df):
-    """코인 가격과의 상관관계 계산"""
-    correlations = {}
-    
-    if df.empty or 'ETH_close' not in df.columns:
-        return correlations
-    
-    # 트위터 인플루언서
-    if 'twitter_count' in df.columns:
-        correlations['트위터 게시글 수'] = df['twitter_count'].corr(df['ETH_close'])
-    if 'twitter_sentiment_compound' in df.columns:
-        correlations['트위터 감정 분석'] = df['twitter_sentiment_compound'].corr(df['ETH_close'])
-    
-    # 텔레그램
-    if 'message_count' in df.columns:
-        correlations['텔레그램 게시글 수'] = df['message_count'].corr(df['ETH_close'])
-    if 'avg_sentiment' in df.columns:
-        correlations['텔레그램 감정 분석'] = df['avg_sentiment'].corr(df['ETH_close'])
-    
-    # 코인니스 (데이터 수집 중)
-    correlations['코인니스 게시글 수'] = None  # 데이터 수집 중
-    correlations['코인니스 감정 분석'] = None  # 데이터 수집 중
-    
-    return correlations
-
-
-def calculate_correlations_with_whale(df):
-    """고래 지갑과의 상관관계 계산"""
-    correlations = {}
-    
-    if df.empty or 'tx_frequency' not in df.columns:
-        return correlations
-    
-    # 트위터 인플루언서
-    if 'twitter_count' in df.columns:
-        correlations['트위터 게시글 수'] = df['twitter_count'].corr(df['tx_frequency'])
-    if 'twitter_sentiment_compound' in df.columns:
-        correlations['트위터 감정 분석'] = df['twitter_sentiment_compound'].corr(df['tx_frequency'])
-    
-    # 텔레그램
-    if 'message_count' in df.columns:
-        correlations['텔레그램 게시글 수'] = df['message_count'].corr(df['tx_frequency'])
-    if 'avg_sentiment' in df.columns:
-        correlations['텔레그램 감정 분석'] = df['avg_sentiment'].corr(df['tx_frequency'])
-    
-    # 코인니스 (데이터 수집 중)
-    correlations['코인니스 게시글 수'] = None  # 데이터 수집 중
-    correlations['코인니스 감정 분석'] = None  # 데이터 수집 중
-    
-    return correlations
-
-
 def render_correlation_indicators(correlations, target_name):
     """상관관계 지표 표시 (Upbit 스타일)"""
     st.markdown(f"""
@@ -580,53 +605,17 @@ def main():
     # 상단 네비게이션
     render_top_navigation()
     
-    # 데이터 로드
-    with st.spinner("Loading market data..."):
-        df_main, data = load_all_data()
+    # 데이터 로드 (스냅샷 우선)
+    view = load_dashboard_view()
     
-    if df_main.empty:
+    if view is None:
         st.error("데이터를 로드할 수 없습니다. 먼저 python scripts/preprocess_data.py를 실행하세요.")
         return
     
-    # 신호 점수 계산 (화면에는 표시 안 함)
-    calculator = CompositeScoreCalculator()
-    try:
-        df_scored = calculator.calculate_composite_score(
-            df_main, 
-            df_news=data.get('coinness', pd.DataFrame()), 
-            df_twitter=data.get('twitter', pd.DataFrame())
-        )
-        
-        # 최근 점수
-        telegram_score = df_scored['telegram_score'].iloc[-1] if not df_scored.empty else 50
-        news_score = df_scored['news_score'].iloc[-1] if not df_scored.empty else 50
-        twitter_score = df_scored['twitter_score'].iloc[-1] if not df_scored.empty else 50
-        composite_score = df_scored['composite_score'].iloc[-1] if not df_scored.empty else 50
-        
-        # 24시간 변화
-        if len(df_scored) > 24:
-            composite_score_24h = df_scored['composite_score'].iloc[-25]
-            score_change = composite_score - composite_score_24h
-            score_change_pct = (score_change / composite_score_24h) * 100 if composite_score_24h != 0 else 0
-        else:
-            score_change = 0
-            score_change_pct = 0
-        
-        signal_summary = calculator.get_signal_summary(df_scored)
-    except Exception as e:
-        st.error(f"점수 계산 실패: {e}")
-        df_scored = df_main
-        telegram_score = news_score = twitter_score = composite_score = 50
-        score_change = 0
-        score_change_pct = 0
-        signal_summary = {'current_level': 'neutral'}
-    
-    scores = {
-        'telegram': telegram_score,
-        'news': news_score,
-        'twitter': twitter_score,
-        'composite': composite_score
-    }
+    composite_score = view['scores']['composite']
+    score_change = view['score_change']
+    score_change_pct = view['score_change_pct']
+    score_series = view['score_series']
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -658,13 +647,13 @@ def main():
         st.markdown('<div class="chart-container">', unsafe_allow_html=True)
         st.markdown("### 📈 종합 점수 추이")
         
-        if not df_scored.empty and 'composite_score' in df_scored.columns:
-            # 종합 점수 차트
+        if score_series['timestamp']:
+            # 종합 점수 차트 (스냅샷에 다운샘플링되어 저장된 시계열)
             fig = go.Figure()
             
             fig.add_trace(go.Scatter(
-                x=df_scored['timestamp'],
-                y=df_scored['composite_score'],
+                x=score_series['timestamp'],
+                y=score_series['composite_score'],
                 name='Composite Score',
                 line=dict(color='#3b82f6', width=2.5),
                 fill='tozeroy',
@@ -730,21 +719,23 @@ def main():
         tab1, tab2, tab3 = st.tabs(["코인가격 관계", "고래지갑 관계", "지금 뉴스"])
         
         with tab1:
-            # 코인가격과의 상관관계 계산
-            correlations_price = calculate_correlations_with_price(df_scored)
-            render_correlation_indicators(correlations_price, "코인 가격")
+            # 코인가격과의 상관관계
+            render_correlation_indicators(view['correlations']['price'], "코인 가격")
         
         with tab2:
-            # 고래지갑과의 상관관계 계산
-            correlations_whale = calculate_correlations_with_whale(df_scored)
-            render_correlation_indicators(correlations_whale, "고래 거래")
+            # 고래지갑과의 상관관계
+            render_correlation_indicators(view['correlations']['whale'], "고래 거래")
         
         with tab3:
             # 최근 뉴스 표시
-            render_recent_news(data.get('coinness', pd.DataFrame()))
+            render_recent_news(pd.DataFrame(view.get('recent_news', [])))
     
     st.markdown('</div>', unsafe_allow_html=True)
 
 
 if __name__ == '__main__':
-    main()
+    # ?debug=1 이면 렌더링 단계별 계측 결과 표시
+    debug_panel.begin()
+    with stage('page.main'):
+        main()
+    debug_panel.render(get_shared_cache())
@@ -1,6 +1,8 @@
 'use client';
 
 import React, { useState, useEffect } from 'react';
+import { DATA_API_ENABLED, fetchDataset, toRecords } from '@/lib/dataApi';
+import { loadLatestShard, loadOlderShard } from '@/lib/staticShards';
 
 interface NewsItem {
   timestamp: string;
@@ -17,6 +19,76 @@ interface NewsItem {
   has_bearish?: boolean;
 }
 
+const NEWS_LIMIT = 50;
+const NEWS_COLUMNS = [
+  'timestamp',
+  'title',
+  'content',
+  'link',
+  'sentiment_compound',
+  'sentiment_positive',
+  'sentiment_negative',
+  'sentiment_neutral',
+];
+
+// 데이터 API / 샤드의 행 객체 -> NewsItem (최신순, /api/news/recent 와 같은 태그 규칙)
+const toNewsItems = (records: Record<string, string | number | null>[]): NewsItem[] =>
+  records
+    .filter((record) => record.timestamp && record.title && record.link)
+    .sort((a, b) => new Date(String(b.timestamp)).getTime() - new Date(String(a.timestamp)).getTime())
+    .slice(0, NEWS_LIMIT)
+    .map((record) => {
+      const title = String(record.title ?? '');
+      const content = String(record.content ?? '');
+      const sentiment_compound = Number(record.sentiment_compound) || 0;
+      return {
+        timestamp: String(record.timestamp),
+        title,
+        content,
+        link: String(record.link),
+        sentiment_compound,
+        sentiment_positive: Number(record.sentiment_positive) || 0,
+        sentiment_negative: Number(record.sentiment_negative) || 0,
+        sentiment_neutral: Number(record.sentiment_neutral) || 0,
+        has_bitcoin: /비트코인|BTC|bitcoin/i.test(title + content),
+        has_ethereum: /이더리움|ETH|ethereum/i.test(title + content),
+        has_bullish: sentiment_compound > 0.05,
+        has_bearish: sentiment_compound < -0.05,
+      };
+    });
+
+// 파이썬 데이터 API 에서 최근 1주일 뉴스의 필요한 컬럼만 요청 (미설정/실패 시 null)
+const loadNewsFromDataApi = async (): Promise<NewsItem[] | null> => {
+  if (!DATA_API_ENABLED) return null;
+  try {
+    const response = await fetchDataset('news', { last: 24 * 7, columns: NEWS_COLUMNS });
+    const items = toNewsItems(toRecords(response));
+    return items.length > 0 ? items : null;
+  } catch (error) {
+    console.warn('데이터 API 뉴스 로딩 실패, 다른 소스로 대체합니다:', error);
+    return null;
+  }
+};
+
+// 정적 샤드에서 최신 월 샤드부터 NEWS_LIMIT 개가 찰 때까지 과거 샤드를 이어 받음 (없으면 null)
+const loadNewsFromShards = async (): Promise<NewsItem[] | null> => {
+  try {
+    const parts = [await loadLatestShard('news', 'event')];
+    let rows = parts[0].rows;
+    while (rows < NEWS_LIMIT) {
+      const older = await loadOlderShard('news', 'event', parts.length);
+      if (!older) break;
+      parts.push(older);
+      rows += older.rows;
+    }
+    const items = toNewsItems(parts.flatMap(toRecords));
+    return items.length > 0 ? items : null;
+  } catch (error) {
+    console.warn('정적 샤드 뉴스 로딩 실패, CSV 라우트로 대체합니다:', error);
+    return null;
+  }
+};
+
 const NewsListPanel: React.FC = () => {
   const [news, setNews] = useState<NewsItem[]>([]);
   const [loading, setLoading] = useState(true);
@@ -30,8 +102,15 @@ const NewsListPanel: React.FC = () => {
   const loadNews = async () => {
     setLoading(true);
     try {
-      // 실제 환경에서는 API에서 데이터를 가져옵니다
-      const response = await fetch('/api/news/recent?limit=50');
+      // 데이터 API -> 정적 샤드 순으로 시도
+      const sourcedNews = (await loadNewsFromDataApi()) ?? (await loadNewsFromShards());
+      if (sourcedNews) {
+        setNews(sourcedNews);
+        return;
+      }
+
+      // 둘 다 없으면 기존 CSV 라우트 사용
+      const response = await fetch(`/api/news/recent?limit=${NEWS_LIMIT}`);
       
       let data;
       try {
@@ -0,0 +1,71 @@
+// 파이썬 데이터 API (scripts/run_data_api.py) 클라이언트
+// - 화면에 보이는 시간 범위 / 컬럼만 요청
+// - ETag 를 기억해 두고 If-None-Match 로 재요청 -> 데이터가 그대로면 304 (본문 없음)
+
+const API_BASE = process.env.NEXT_PUBLIC_DATA_API_URL || 'http://127.0.0.1:8765';
+
+// 배포 환경에서 데이터 API 주소를 지정했을 때만 화면이 이 클라이언트를 우선 사용
+export const DATA_API_ENABLED = Boolean(process.env.NEXT_PUBLIC_DATA_API_URL);
+
+export interface DataQuery {
+  start?: string; // ISO 시각
+  end?: string; // ISO 시각 (포함)
+  last?: number; // 데이터 끝에서부터 최근 N시간
+  columns?: string[];
+  maxPoints?: number; // 응답 전체 행 수 상한 (컬럼이 많을수록 컬럼당 포인트가 줄어듦 - columns 와 함께 사용 권장)
+}
+
+export interface DataFrameResponse {
+  dataset: string;
+  version: string;
+  rows: number;
+  frame: {
+    columns: string[];
+    data: (string | number | null)[][];
+  };
+}
+
+// URL -> (ETag, 마지막 응답)
+const etagCache = new Map<string, { etag: string; body: DataFrameResponse }>();
+
+export function buildDataUrl(dataset: string, query: DataQuery = {}): string {
+  const params = new URLSearchParams();
+  if (query.start) params.set('start', query.start);
+  if (query.end) params.set('end', query.end);
+  if (query.last) params.set('last', String(query.last));
+  if (query.columns?.length) params.set('columns', query.columns.join(','));
+  if (query.maxPoints) params.set('max_points', String(query.maxPoints));
+  const qs = params.toString();
+  return `${API_BASE}/api/data/${dataset}${qs ? `?${qs}` : ''}`;
+}
+
+export async function fetchDataset(dataset: string, query: DataQuery = {}): Promise<DataFrameResponse> {
+  const url = buildDataUrl(dataset, query);
+  const cached = etagCache.get(url);
+
+  const res = await fetch(url, {
+    headers: cached ? { 'If-None-Match': cached.etag } : {},
+    cache: 'no-store',
+  });
+
+  if (res.status === 304 && cached) {
+    return cached.body;
+  }
+  if (!res.ok) {
+    const error = await res.json().catch(() => ({ error: res.statusText }));
+    throw new Error(`데이터 API 오류 (${res.status}): ${error.error}`);
+  }
+
+  const body: DataFrameResponse = await res.json();
+  const etag = res.headers.get('ETag');
+  if (etag) {
+    etagCache.set(url, { etag, body });
+  }
+  return body;
+}
+
+// 열 기반 응답 -> 행 객체 배열 (차트 라이브러리용)
+export function toRecords(response: DataFrameResponse): Record<string, string | number | null>[] {
+  const { columns, data } = response.frame;
+  return data.map((row) => Object.fromEntries(columns.map((col, i) => [col, row[i]])));
+}
@@ -0,0 +1,110 @@
+// 정적 데이터 샤드 로더 (scripts/build_static_shards.py 결과, public/data/shards)
+// - manifest.json 을 읽고 최신 샤드만 먼저 받음 -> 첫 화면 전송량 최소화
+// - 과거 샤드는 화면을 뒤로 스크롤할 때 loadOlderShard 로 하나씩 받음
+// - 샤드 파일 이름에 내용 해시가 있어 브라우저/CDN 에 영구 캐시 가능
+import type { DataFrameResponse } from './dataApi';
+
+const SHARD_BASE = process.env.NEXT_PUBLIC_SHARD_BASE_URL || '/data/shards';
+
+export interface ShardEntry {
+  period: string; // '2025-11', '2025', 'all'
+  path: string;
+  start: string;
+  end: string;
+  rows: number;
+  bytes: number;
+  raw_bytes: number;
+  version: string;
+}
+
+export interface ShardManifest {
+  manifest_version: number;
+  generated_at: string;
+  datasets: Record<
+    string,
+    {
+      kind: 'rollup' | 'event';
+      version: string;
+      resolutions: Record<string, { columns: string[]; rows: number; shards: ShardEntry[] }>; // shards: 최신순
+    }
+  >;
+}
+
+let manifestPromise: Promise<ShardManifest> | null = null;
+const shardCache = new Map<string, Promise<DataFrameResponse>>();
+
+export function loadManifest(): Promise<ShardManifest> {
+  if (!manifestPromise) {
+    manifestPromise = fetch(`${SHARD_BASE}/manifest.json`, { cache: 'no-cache' }).then((res) => {
+      if (!res.ok) throw new Error(`샤드 매니페스트 로드 실패 (${res.status})`);
+      return res.json();
+    });
+    manifestPromise.catch(() => {
+      manifestPromise = null;
+    });
+  }
+  return manifestPromise;
+}
+
+async function decodeShard(res: Response): Promise<DataFrameResponse> {
+  // 정적 호스팅은 .gz 를 Content-Encoding 없이 보내므로 직접 압축 해제
+  // (서버가 Content-Encoding: gzip 으로 보내 이미 풀린 경우는 그대로 파싱)
+  const buffer = new Uint8Array(await res.arrayBuffer());
+  const isGzip = buffer[0] === 0x1f && buffer[1] === 0x8b;
+  if (!isGzip) {
+    return JSON.parse(new TextDecoder().decode(buffer));
+  }
+  const stream = new Blob([buffer]).stream().pipeThrough(new DecompressionStream('gzip'));
+  return JSON.parse(await new Response(stream).text());
+}
+
+export function loadShard(shard: ShardEntry): Promise<DataFrameResponse> {
+  let cached = shardCache.get(shard.path);
+  if (!cached) {
+    cached = fetch(`${SHARD_BASE}/${shard.path}`).then((res) => {
+      if (!res.ok) throw new Error(`샤드 로드 실패 (${res.status}): ${shard.path}`);
+      return decodeShard(res);
+    });
+    cached.catch(() => shardCache.delete(shard.path));
+    shardCache.set(shard.path, cached);
+  }
+  return cached;
+}
+
+export async function listShards(dataset: string, resolution: string): Promise<ShardEntry[]> {
+  const manifest = await loadManifest();
+  const entry = manifest.datasets[dataset]?.resolutions[resolution];
+  if (!entry) throw new Error(`샤드 없음: ${dataset}/${resolution}`);
+  return entry.shards;
+}
+
+// 최신 샤드 (첫 화면용)
+export async function loadLatestShard(dataset: string, resolution = '1h'): Promise<DataFrameResponse> {
+  const shards = await listShards(dataset, resolution);
+  if (!shards.length) throw new Error(`샤드 없음: ${dataset}/${resolution}`);
+  return loadShard(shards[0]);
+}
+
+// loaded 개 샤드를 이미 받았을 때 그다음 과거 샤드 (더 없으면 null)
+export async function loadOlderShard(
+  dataset: string,
+  resolution: string,
+  loaded: number
+): Promise<DataFrameResponse | null> {
+  const shards = await listShards(dataset, resolution);
+  return loaded < shards.length ? loadShard(shards[loaded]) : null;
+}
+
+// start 이후를 덮는 샤드만 받아 시간순으로 이어 붙임
+export async function loadRange(dataset: string, resolution: string, start: string): Promise<DataFrameResponse> {
+  const shards = (await listShards(dataset, resolution)).filter((s) => s.end >= start);
+  const parts = await Promise.all(shards.reverse().map(loadShard));
+  const columns = parts[0]?.frame.columns ?? [];
+  const data = parts.flatMap((p) => p.frame.data).filter((row) => String(row[0]) >= start);
+  return {
+    dataset,
+    version: parts.map((p) => p.version).join('.'),
+    rows: data.length,
+    frame: { columns, data },
+  };
+}
@@ -0,0 +1,47 @@
+"""
+커뮤니티 산출물 생성 스크립트
+
+트위터 인플루언서 / 레딧 CSV에서 community_ts_*, community_spike_events,
+community_keywords_daily, community_top_posts_daily 를 만듭니다.
+원본은 청크 단위로 읽으므로 파일 크기와 무관하게 메모리 사용량이 일정합니다.
+
+사용법:
+    python scripts/build_community_data.py                          (트위터 - 현재 산출물과 같은 소스)
+    python scripts/build_community_data.py --sources twitter reddit  (레딧 포함 - 기간 / 키워드가 달라짐)
+"""
+
+import argparse
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.community_pipeline import CommunityPipeline, CHUNK_ROWS, TOP_K
+
+
+def main():
+    parser = argparse.ArgumentParser(description='커뮤니티 산출물 생성')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--output-dir', default=None, help='출력 디렉토리 (기본값: <data-dir>)')
+    parser.add_argument('--sources', nargs='+', default=list(CommunityPipeline.DEFAULT_SOURCES),
+                        choices=CommunityPipeline.SOURCES, help='사용할 소스 (기본값: twitter)')
+    parser.add_argument('--chunksize', type=int, default=CHUNK_ROWS, help='청크당 행 수')
+    parser.add_argument('--top-k', type=int, default=TOP_K, help='일별/감정별 상위 게시글 수')
+    args = parser.parse_args()
+
+    print("=== 커뮤니티 산출물 생성 ===\n")
+    pipeline = CommunityPipeline(args.data_dir, chunk_rows=args.chunksize, top_k=args.top_k)
+
+    posts = pipeline.process(args.sources)
+    print(f"  읽은 행: {pipeline.rows_read:,}")
+    print(f"  처리한 게시글: {posts:,}")
+
+    paths = pipeline.save(args.output_dir)
+    for name, path in paths.items():
+        print(f"  - {name}: {path}")
+    print("\n저장 완료")
+
+
+if __name__ == '__main__':
+    main()
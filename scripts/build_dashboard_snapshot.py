@@ -0,0 +1,39 @@
+"""
+대시보드 스냅샷 생성 스크립트
+
+main.py 랜딩 페이지가 요청 시점에 pandas 계산 없이 렌더링할 수 있도록
+점수, 상관관계, 최근 스파이크, 종합 점수 시계열을 미리 계산해 저장합니다.
+
+사용법:
+    python scripts/build_dashboard_snapshot.py
+    python scripts/build_dashboard_snapshot.py --data-dir data --output data/dashboard_snapshot.json
+"""
+
+import argparse
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.dashboard_snapshot import refresh_snapshot
+
+
+def main():
+    parser = argparse.ArgumentParser(description='대시보드 스냅샷 생성')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--output', default=None, help='스냅샷 경로 (기본값: <data-dir>/dashboard_snapshot.json)')
+    args = parser.parse_args()
+
+    print("=== 대시보드 스냅샷 생성 ===\n")
+    snapshot = refresh_snapshot(args.data_dir, args.output)
+
+    print(f"  행 수: {snapshot['rows']:,}")
+    print(f"  종합 점수: {snapshot['scores']['composite']:.1f}")
+    print(f"  시계열 포인트: {len(snapshot['score_series']['timestamp']):,}")
+    print(f"  최근 스파이크: {len(snapshot['recent_spikes'])}개")
+    print("\n스냅샷 저장 완료")
+
+
+if __name__ == '__main__':
+    main()
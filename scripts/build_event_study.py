@@ -0,0 +1,50 @@
+"""
+이벤트 스터디 생성 스크립트
+
+monitor_config.json 의 event_study_pairs 각 쌍에 대해
+"소스 급증 -> 대상 반응" 시차별 통계를 pattern_<쌍 이름>_event_study.csv 로 저장합니다.
+
+사용법:
+    python scripts/build_event_study.py
+    python scripts/build_event_study.py --horizon 48 --n-boot 2000 --jobs 4
+"""
+
+import argparse
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import DataLoader
+from analysis.priority_engine import build_source_frame
+from analysis.event_study import EventStudy
+
+
+def main():
+    parser = argparse.ArgumentParser(description='이벤트 스터디 생성')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--output-dir', default=None, help='출력 디렉토리 (기본값: <data-dir>)')
+    parser.add_argument('--horizon', type=int, default=24, help='최대 시차 (시간)')
+    parser.add_argument('--n-boot', type=int, default=1000, help='부트스트랩 재표본 수')
+    parser.add_argument('--jobs', type=int, default=None, help='프로세스 수 (기본값: CPU 수)')
+    args = parser.parse_args()
+
+    loader = DataLoader(args.data_dir)
+    output_dir = args.output_dir or loader.data_dir
+
+    print("=== 이벤트 스터디 ===\n")
+    frame = build_source_frame(loader)
+    study = EventStudy.from_config(horizon=args.horizon, n_boot=args.n_boot, n_jobs=args.jobs)
+    results = study.run_pairs(frame)
+
+    for name, result in results.items():
+        path = os.path.join(output_dir, f'pattern_{name}_event_study.csv')
+        result.to_csv(path, index=False)
+        best = result.loc[result['lift'].idxmax()] if result['lift'].notna().any() else None
+        summary = f"최대 lift {best['lift']:.2f} ({int(best['horizon'])}시간)" if best is not None else "이벤트 없음"
+        print(f"  - {name}: {summary} -> {path}")
+
+
+if __name__ == '__main__':
+    main()
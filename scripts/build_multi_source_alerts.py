@@ -0,0 +1,48 @@
+"""
+다중 소스 알람 생성 스크립트
+
+텔레그램 / 고래 거래 / 트위터 시간별 데이터 전체 기간에 우선순위 점수를 매겨
+multi_source_alerts.csv 로 저장합니다. 규칙은 data/monitor_config.json 에서 읽습니다.
+
+사용법:
+    python scripts/build_multi_source_alerts.py
+    python scripts/build_multi_source_alerts.py --min-level HIGH --output data/multi_source_alerts.csv
+"""
+
+import argparse
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import DataLoader
+from analysis.priority_engine import PriorityEngine, build_source_frame, LEVELS
+
+
+def main():
+    parser = argparse.ArgumentParser(description='다중 소스 알람 생성')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--config', default=None, help='모니터링 설정 (기본값: data/monitor_config.json)')
+    parser.add_argument('--output', default=None, help='출력 경로 (기본값: <data-dir>/multi_source_alerts.csv)')
+    parser.add_argument('--min-level', default=None, choices=LEVELS, help='저장할 최소 알람 레벨')
+    args = parser.parse_args()
+
+    loader = DataLoader(args.data_dir)
+    output = args.output or os.path.join(loader.data_dir, 'multi_source_alerts.csv')
+
+    print("=== 다중 소스 알람 생성 ===\n")
+    frame = build_source_frame(loader)
+    print(f"  시간별 데이터: {len(frame):,} 행")
+
+    result = PriorityEngine(config_path=args.config).score(frame)
+    alerts = result.to_frame(args.min_level)
+    alerts.to_csv(output, index=False)
+
+    for level, count in alerts['alert_level'].value_counts().items():
+        print(f"  - {level}: {count:,}")
+    print(f"\n{output} 저장 완료 ({len(alerts):,} 행)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""
+정적 데이터 샤드 생성 스크립트
+
+Vercel 배포용으로 processed / scores / alerts / news 데이터를
+시간 단위 gzip JSON 샤드 + manifest.json 으로 내보냅니다.
+(nextjs-dashboard/data 에 CSV 전체를 복사하는 대신 사용, 형식은 utils/static_export.py 참고)
+
+사용법:
+    python scripts/build_static_shards.py
+    python scripts/build_static_shards.py --datasets processed scores --resolutions 1h 1d
+    python scripts/build_static_shards.py --output-dir /tmp/shards
+"""
+
+import argparse
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.static_export import StaticShardExporter, DEFAULT_OUTPUT_DIR, EXPORT_DATASETS
+
+
+def main():
+    parser = argparse.ArgumentParser(description='정적 데이터 샤드 생성')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='출력 디렉토리')
+    parser.add_argument('--datasets', nargs='+', default=list(EXPORT_DATASETS), choices=list(EXPORT_DATASETS))
+    parser.add_argument('--resolutions', nargs='+', default=['1h', '4h', '1d', '1w'],
+                        choices=['1h', '4h', '1d', '1w'], help='시계열 데이터셋 해상도')
+    args = parser.parse_args()
+
+    print("=== 정적 데이터 샤드 생성 ===\n")
+    exporter = StaticShardExporter(args.output_dir, args.data_dir, args.datasets, args.resolutions)
+    manifest = exporter.export()
+
+    total_bytes = total_raw = 0
+    for name in args.datasets:
+        entry = manifest['datasets'][name]
+        if not entry['resolutions']:
+            print(f"{name:10s} 데이터 없음")
+            continue
+        for resolution, res in entry['resolutions'].items():
+            shards = res['shards']
+            size = sum(s['bytes'] for s in shards)
+            raw = sum(s['raw_bytes'] for s in shards)
+            total_bytes += size
+            total_raw += raw
+            print(f"{name:10s} {resolution:6s} 샤드 {len(shards):3d}개  {res['rows']:7,d}행  "
+                  f"{size / 1024:8.1f}KB (원본 {raw / 1024:8.1f}KB)  최신 {shards[0]['bytes'] / 1024:6.1f}KB")
+
+    print(f"\n전체 {total_bytes / 1024:.1f}KB (압축 전 {total_raw / 1024:.1f}KB)")
+    print(f"✅ 매니페스트: {os.path.join(args.output_dir, 'manifest.json')}")
+
+
+if __name__ == '__main__':
+    main()
@@ -2,6 +2,9 @@
 데이터 전처리 스크립트
 
 모든 데이터를 통합하고 분석을 위한 파생 변수를 생성합니다.
+
+DASHBOARD_PROFILE=1 (또는 memory) 로 실행하면 단계별 계측 기록을
+<data_dir>/profile_preprocess.jsonl 에 추가하고 단계별 요약을 출력합니다.
 """
 
 import pandas as pd
@@ -10,17 +13,29 @@ import sys
 import os
 
 # 상위 디렉토리를 path에 추가
-sys.path.append('/Volumes/T7/class/2025-FALL/big_data')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils.data_loader import DataLoader
+from utils.cache import publish_data_version
+from utils import profiling
+from utils.profiling import instrument
+from utils.feature_kernel import FeatureKernel
+from utils.lazy_frame import write_cache
+from utils.timestamps import hour_key, hour_from_key
 
 
 class DataPreprocessor:
     """데이터 전처리 클래스"""
     
-    def __init__(self):
-        self.loader = DataLoader()
+    def __init__(self, data_dir=None):
+        """
+        Args:
+            data_dir: 데이터 디렉토리 경로 (기본값: 프로젝트 루트의 data/)
+        """
+        self.loader = DataLoader(data_dir)
+        self.feature_kernel = FeatureKernel()
         
+    @instrument()
     def aggregate_telegram_by_hour(self, telegram_df):
         """
         텔레그램 데이터를 채널별로 집계하여 시간당 총합 계산
@@ -34,11 +49,11 @@ class DataPreprocessor:
         if telegram_df.empty:
             return pd.DataFrame()
         
-        # 시간 단위로 내림
-        telegram_df['hour'] = telegram_df['timestamp'].dt.floor('H')
+        # 시간 버킷 정수 키
+        hour = pd.Series(hour_key(telegram_df['timestamp']), index=telegram_df.index, name='hour')
         
         # 시간별로 모든 채널 집계
-        hourly = telegram_df.groupby('hour').agg({
+        hourly = telegram_df.groupby(hour).agg({
             'message_count': 'sum',
             'avg_views': 'mean',
             'total_forwards': 'sum',
@@ -49,10 +64,12 @@ class DataPreprocessor:
             'avg_neutral': 'mean'
         }).reset_index()
         
+        hourly['hour'] = hour_from_key(hourly['hour'].to_numpy())
         hourly = hourly.rename(columns={'hour': 'timestamp'})
         
         return hourly
     
+    @instrument()
     def merge_all_data(self, whale_tx, eth_price, btc_price, telegram):
         """
         모든 데이터를 시간 기준으로 병합
@@ -69,6 +86,10 @@ class DataPreprocessor:
         # 1. 고래 거래 데이터를 기준으로 시작
         merged = whale_tx.copy()
         
+        # DataLoader 는 모든 소스를 tz-naive UTC 로 반환 (외부에서 받은 tz-aware 입력만 변환)
+        eth_price = self._to_naive_utc(eth_price)
+        btc_price = self._to_naive_utc(btc_price)
+        
         # 2. ETH 가격 데이터 병합
         eth_cols = ['timestamp', 'ETH_open', 'ETH_high', 'ETH_low', 'ETH_close', 'ETH_volume', 'ETH_trade_count']
         eth_data = eth_price[eth_cols].copy()
@@ -94,10 +115,19 @@ class DataPreprocessor:
         # 5. 가격 데이터 결측치 처리 (forward fill)
         price_cols = [col for col in merged.columns if 'ETH_' in col or 'BTC_' in col]
         for col in price_cols:
-            merged[col] = merged[col].fillna(method='ffill')
+            merged[col] = merged[col].ffill()
         
         return merged
     
+    def _to_naive_utc(self, df):
+        """tz-aware timestamp 컬럼을 tz-naive UTC로 변환"""
+        if df.empty or df['timestamp'].dt.tz is None:
+            return df
+        df = df.copy()
+        df['timestamp'] = df['timestamp'].dt.tz_convert('UTC').dt.tz_localize(None)
+        return df
+    
+    @instrument()
     def create_derived_features(self, df):
         """
         파생 변수 생성
@@ -108,60 +138,27 @@ class DataPreprocessor:
         Returns:
             DataFrame: 파생 변수가 추가된 데이터프레임
         """
-        # 1. 가격 변화율 (%)
-        df['ETH_price_change_pct'] = df['ETH_close'].pct_change() * 100
-        df['BTC_price_change_pct'] = df['BTC_close'].pct_change() * 100
-        
-        # 2. 거래량 변화율 (%)
-        df['ETH_volume_change_pct'] = df['ETH_volume'].pct_change() * 100
-        df['BTC_volume_change_pct'] = df['BTC_volume'].pct_change() * 100
-        
-        # 3. 고래 거래 빈도 변화율
-        df['tx_frequency_change_pct'] = df['tx_frequency'].pct_change() * 100
-        df['tx_amount_change_pct'] = df['tx_amount'].pct_change() * 100
-        
-        # 4. 텔레그램 활동 변화율
-        if 'message_count' in df.columns:
-            df['message_count_change_pct'] = df['message_count'].pct_change() * 100
-            df['avg_views_change_pct'] = df['avg_views'].pct_change() * 100
-            df['total_reactions_change_pct'] = df['total_reactions'].pct_change() * 100
-        
-        # 5. 이동평균 (24시간)
-        df['ETH_price_ma24'] = df['ETH_close'].rolling(window=24, min_periods=1).mean()
-        df['tx_frequency_ma24'] = df['tx_frequency'].rolling(window=24, min_periods=1).mean()
-        
-        if 'message_count' in df.columns:
-            df['message_count_ma24'] = df['message_count'].rolling(window=24, min_periods=1).mean()
-        
-        # 6. 이동 표준편차 (24시간) - 변동성 측정
-        df['ETH_price_std24'] = df['ETH_close'].rolling(window=24, min_periods=1).std()
-        df['tx_frequency_std24'] = df['tx_frequency'].rolling(window=24, min_periods=1).std()
-        
-        if 'message_count' in df.columns:
-            df['message_count_std24'] = df['message_count'].rolling(window=24, min_periods=1).std()
-        
-        # 7. Z-score (이상치 탐지용)
-        df['ETH_price_zscore'] = (df['ETH_close'] - df['ETH_price_ma24']) / (df['ETH_price_std24'] + 1e-10)
-        df['tx_frequency_zscore'] = (df['tx_frequency'] - df['tx_frequency_ma24']) / (df['tx_frequency_std24'] + 1e-10)
-        
-        if 'message_count' in df.columns:
-            df['message_count_zscore'] = (df['message_count'] - df['message_count_ma24']) / (df['message_count_std24'] + 1e-10)
+        # 1~7, 9. 변화율 / 이동평균 / 이동 표준편차 / Z-score / 볼린저 밴드
+        # (FEATURE_SPEC 의 컬럼 묶음 전체를 한 번의 2차원 연산으로 계산)
+        features = self.feature_kernel.transform(df)
+        bands = self.feature_kernel.band_columns(df.columns)
         
         # 8. 시간 특성
-        df['hour'] = df['timestamp'].dt.hour
-        df['day_of_week'] = df['timestamp'].dt.dayofweek
-        df['day'] = df['timestamp'].dt.day
-        df['month'] = df['timestamp'].dt.month
+        time_features = pd.DataFrame({
+            'hour': df['timestamp'].dt.hour,
+            'day_of_week': df['timestamp'].dt.dayofweek,
+            'day': df['timestamp'].dt.day,
+            'month': df['timestamp'].dt.month,
+        }, index=df.index)
         
-        # 9. 볼린저 밴드 (ETH 가격)
-        df['ETH_bb_upper'] = df['ETH_price_ma24'] + (2 * df['ETH_price_std24'])
-        df['ETH_bb_lower'] = df['ETH_price_ma24'] - (2 * df['ETH_price_std24'])
+        df = pd.concat([df, features.drop(columns=bands), time_features, features[bands]], axis=1)
         
         # 10. 무한대/NaN 값 처리
         df = df.replace([np.inf, -np.inf], np.nan)
         
         return df
     
+    @instrument()
     def save_processed_data(self, df, output_path):
         """
         전처리된 데이터 저장
@@ -171,16 +168,26 @@ class DataPreprocessor:
             output_path: 출력 파일 경로
         """
         df.to_csv(output_path, index=False)
+        
+        # 컬럼형 캐시도 메모리의 결과로 바로 갱신 (대시보드가 첫 요청에서 CSV 전체를 읽지 않도록)
+        write_cache(df, output_path)
+        
+        # 대시보드 캐시 무효화
+        publish_data_version(os.path.dirname(os.path.abspath(output_path)))
+        
         print(f"전처리된 데이터가 {output_path}에 저장되었습니다.")
         print(f"총 {len(df)} 행, {len(df.columns)} 컬럼")
     
-    def run(self, output_path='/Volumes/T7/class/2025-FALL/big_data/data/processed_data.csv'):
+    def run(self, output_path=None):
         """
         전체 전처리 파이프라인 실행
         
         Args:
-            output_path: 출력 파일 경로
+            output_path: 출력 파일 경로 (기본값: 데이터 디렉토리의 processed_data.csv)
         """
+        if output_path is None:
+            output_path = os.path.join(self.loader.data_dir, 'processed_data.csv')
+        
         print("=== 데이터 전처리 시작 ===\n")
         
         # 1. 데이터 로드
@@ -240,6 +247,13 @@ if __name__ == '__main__':
     print("\n컬럼 목록:")
     print(processed_data.columns.tolist())
 
+    if profiling.is_enabled():
+        profile_path = os.path.join(preprocessor.loader.data_dir, 'profile_preprocess.jsonl')
+        print("\n=== 단계별 계측 ===")
+        print(profiling.summary().to_string(index=False))
+        count = profiling.export_jsonl(profile_path, clear_after=True)
+        print(f"\n계측 기록 {count}개 -> {profile_path}")
+
 
 
 
@@ -0,0 +1,81 @@
+"""
+신호 백테스트 스크립트
+
+processed_data.csv 의 종합 점수 구성 요소(텔레그램/뉴스/트위터 점수)와
+스파이크 신호를 ETH/BTC 다음 시간 수익률로 백테스트합니다.
+결과는 총 수익률 순으로 정렬해 CSV로 저장합니다.
+
+사용법:
+    python scripts/run_backtest.py
+    python scripts/run_backtest.py --coin BTC --step 0.05 --entry 55 60 65 70 75 --jobs 4
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import DataLoader
+from utils.composite_score import CompositeScoreCalculator
+from analysis.backtest import SignalBacktester, weight_grid, COMPONENTS
+
+
+def main():
+    parser = argparse.ArgumentParser(description='신호 백테스트')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--output-dir', default=None, help='출력 디렉토리 (기본값: <data-dir>)')
+    parser.add_argument('--coin', default='ETH', choices=['ETH', 'BTC'], help='대상 코인')
+    parser.add_argument('--step', type=float, default=0.1, help='가중치 격자 간격')
+    parser.add_argument('--entry', type=float, nargs='+', default=[55, 60, 65, 70, 75], help='진입 임계값')
+    parser.add_argument('--exit', type=float, default=40, help='청산 임계값')
+    parser.add_argument('--fee-bps', type=float, default=10, help='편도 거래 비용 (bp)')
+    parser.add_argument('--jobs', type=int, default=None, help='프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 상위 조합 수')
+    args = parser.parse_args()
+
+    loader = DataLoader(args.data_dir)
+    output_dir = args.output_dir or loader.data_dir
+
+    print("=== 신호 백테스트 ===\n")
+    df = loader.load_processed_data().sort_values('timestamp').reset_index(drop=True)
+    calculator = CompositeScoreCalculator()
+    components = np.column_stack([
+        calculator.calculate_telegram_score(df),
+        calculator.calculate_news_score(loader.load_coinness_data(), df),
+        calculator.calculate_twitter_score(loader.load_twitter_data(), df),
+    ])
+
+    backtester = SignalBacktester.from_processed(df, coin=args.coin, fee_bps=args.fee_bps, n_jobs=args.jobs)
+    print(f"  기간: {df['timestamp'].min()} ~ {df['timestamp'].max()} ({len(df):,} 시간)")
+    print(f"  {args.coin} 보유 수익률: {backtester.buy_and_hold:.2%}\n")
+
+    weights = weight_grid(COMPONENTS, args.step)
+    composite = backtester.run_composite_grid(
+        components, weights, entry=args.entry, exit_=[args.exit] * len(args.entry)
+    )
+    path = os.path.join(output_dir, f'backtest_composite_{args.coin.lower()}.csv')
+    composite.to_csv(path, index=False)
+    print(f"종합 점수 격자 {len(composite):,}개 조합 -> {path}")
+    print(composite.head(args.top).to_string(index=False))
+
+    frames = []
+    for col in ['message_count', 'tx_frequency']:
+        if col in df.columns:
+            result = backtester.run_spike_grid(df[col].fillna(0).to_numpy())
+            result.insert(0, 'column', col)
+            frames.append(result)
+    if frames:
+        spikes = pd.concat(frames, ignore_index=True).sort_values('total_return', ascending=False)
+        path = os.path.join(output_dir, f'backtest_spike_{args.coin.lower()}.csv')
+        spikes.to_csv(path, index=False)
+        print(f"\n스파이크 격자 {len(spikes):,}개 조합 -> {path}")
+        print(spikes.head(args.top).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+대시보드 데이터 API 서버 실행 스크립트
+
+Next.js 대시보드가 사용하는 로컬 HTTP JSON API를 실행합니다.
+(엔드포인트와 쿼리 파라미터는 utils/data_api.py 참고)
+
+사용법:
+    python scripts/run_data_api.py
+    python scripts/run_data_api.py --port 8765 --allow-origin http://localhost:3000
+    curl 'http://127.0.0.1:8765/api/data/processed?last=168&columns=ETH_close,message_count'
+"""
+
+import argparse
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_api import create_server, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_CACHE_ENTRIES
+
+
+def main():
+    parser = argparse.ArgumentParser(description='대시보드 데이터 API 서버')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='바인딩 주소')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='포트')
+    parser.add_argument('--cache-entries', type=int, default=DEFAULT_CACHE_ENTRIES, help='LRU 항목 수')
+    parser.add_argument('--allow-origin', default='*', help='CORS 허용 origin')
+    parser.add_argument('--quiet', action='store_true', help='요청 로그 생략')
+    args = parser.parse_args()
+
+    server = create_server(args.host, args.port, args.data_dir, args.cache_entries, args.allow_origin, args.quiet)
+    host, port = server.server_address[:2]
+    print(f"=== 데이터 API 서버: http://{host}:{port}/api/datasets ===")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n서버 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
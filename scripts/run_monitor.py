@@ -0,0 +1,54 @@
+"""
+백그라운드 모니터링 데몬 실행 스크립트
+
+monitor_config.json 의 check_interval_seconds 마다 새 데이터를 확인해
+다중 소스 스파이크 알람을 alert_history.csv 에 기록하고
+대시보드 스냅샷 / monitor_status.json 을 갱신합니다. (동작은 utils/monitor_daemon.py 참고)
+
+사용법:
+    python scripts/run_monitor.py
+    python scripts/run_monitor.py --interval 30 --backfill-hours 48
+    python scripts/run_monitor.py --once
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.monitor_daemon import MonitorDaemon, DEFAULT_SNAPSHOT_INTERVAL_SECONDS
+
+
+def main():
+    parser = argparse.ArgumentParser(description='백그라운드 모니터링 데몬')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--config', default=None, help='모니터링 설정 (기본값: data/monitor_config.json)')
+    parser.add_argument('--interval', type=float, default=None, help='확인 간격 (초, 기본값: check_interval_seconds)')
+    parser.add_argument('--snapshot-interval', type=float, default=DEFAULT_SNAPSHOT_INTERVAL_SECONDS,
+                        help='스냅샷 갱신 확인 간격 (초)')
+    parser.add_argument('--backfill-hours', type=int, default=0, help='처음 시작할 때 점수화할 최근 시간 수')
+    parser.add_argument('--no-snapshot', action='store_true', help='대시보드 스냅샷 게시 안 함')
+    parser.add_argument('--once', action='store_true', help='한 번만 확인하고 종료')
+    args = parser.parse_args()
+
+    daemon = MonitorDaemon(args.data_dir, args.config, args.interval, args.snapshot_interval,
+                           args.backfill_hours, not args.no_snapshot)
+
+    if args.once:
+        count = daemon.check()
+        if daemon.publish_snapshot:
+            daemon.refresh_snapshot()
+        daemon.write_status()
+        print(f"확인 완료: 새 행 {daemon.stats['rows']}개, 알람 {count}개 (쿨다운 생략 {daemon.stats['suppressed']}개)")
+        return
+
+    print(f"=== 모니터링 데몬 시작 (간격 {daemon.interval:g}초, Ctrl+C 로 종료) ===")
+    asyncio.run(daemon.run())
+    print(f"\n모니터링 종료: {daemon.stats}")
+
+
+if __name__ == '__main__':
+    main()
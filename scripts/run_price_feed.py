@@ -0,0 +1,68 @@
+"""
+가격 피드 수집 스크립트
+
+거래소(또는 로컬 재생 서버) 체결 / kline 피드를 받아 시간 봉으로 집계하고
+완성된 봉을 price_history_<coin>_rows.csv 에 추가합니다. (동작은 utils/price_feed.py 참고)
+
+사용법:
+    python scripts/run_price_replay_server.py --speedup 3600 &
+    python scripts/run_price_feed.py --coin ETH --url 'http://127.0.0.1:8766/stream/trades?symbol=ETHUSDT'
+    python scripts/run_price_feed.py --coin BTC --mode klines --url http://127.0.0.1:8766 --poll-seconds 5
+    python scripts/run_price_feed.py --coin ETH --url wss://stream.binance.com:9443/ws/ethusdt@trade
+"""
+
+import argparse
+import asyncio
+import os
+import signal
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import DataLoader
+from utils.price_feed import BarAggregator, CsvBarSink, PriceFeed, DEFAULT_CAPACITY
+
+
+async def run(feed, stop):
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+    await feed.run(stop)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가격 피드 수집')
+    parser.add_argument('--coin', default='ETH', help='코인 심볼 (ETH, BTC)')
+    parser.add_argument('--url', required=True, help='체결 스트림 URL (http/ws) 또는 kline REST 기본 주소')
+    parser.add_argument('--mode', default='trades', choices=['trades', 'klines'])
+    parser.add_argument('--poll-seconds', type=float, default=10, help='kline 폴링 간격 (초)')
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY, help='메모리에 유지할 봉 수')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--dry-run', action='store_true', help='CSV 에 쓰지 않고 봉만 출력')
+    args = parser.parse_args()
+
+    coin = args.coin.upper()
+    sink = None if args.dry_run else CsvBarSink(DataLoader(args.data_dir).data_dir, coin)
+
+    def on_bar(coin, start_ms, values):
+        if sink is not None:
+            sink(coin, start_ms, values)
+        print(f"[{coin}] {start_ms}  O {values[0]:.2f}  H {values[1]:.2f}  L {values[2]:.2f}  "
+              f"C {values[3]:.2f}  V {values[4]:.4f}")
+
+    aggregator = BarAggregator(coin, capacity=args.capacity, on_bar=on_bar)
+    feed = PriceFeed(args.url, aggregator, args.mode, args.poll_seconds)
+
+    print(f"=== 가격 피드 수집 ({coin}, {args.mode}) - Ctrl+C 로 종료 ===")
+    if sink is not None:
+        print(f"  저장: {sink.path}")
+    asyncio.run(run(feed, asyncio.Event()))
+    print(f"\n수집 종료: {aggregator.stats} (재연결 {feed.reconnects}회)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+"""
+가격 피드 재생 서버 실행 스크립트
+
+price_history_*_rows.csv 를 Binance 형식의 실시간 체결 / kline 피드로 재생합니다.
+(엔드포인트는 utils/price_replay.py 참고)
+
+사용법:
+    python scripts/run_price_replay_server.py
+    python scripts/run_price_replay_server.py --speedup 36000 --start 2025-10-01
+    curl -N 'http://127.0.0.1:8766/stream/trades?symbol=ETHUSDT'
+"""
+
+import argparse
+import os
+import sys
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.price_replay import PriceReplay, create_server, DEFAULT_HOST, DEFAULT_PORT, DEFAULT_TICKS_PER_BAR
+
+
+def main():
+    parser = argparse.ArgumentParser(description='가격 피드 재생 서버')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--host', default=DEFAULT_HOST, help='바인딩 주소')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='포트')
+    parser.add_argument('--coins', nargs='+', default=['ETH', 'BTC'])
+    parser.add_argument('--speedup', type=float, default=3600, help='배속 (3600 = 1시간 봉이 1초마다)')
+    parser.add_argument('--start', default=None, help='재생 시작 시각 (기본값: 가장 이른 봉)')
+    parser.add_argument('--ticks-per-bar', type=int, default=DEFAULT_TICKS_PER_BAR, help='봉 하나의 가격 지점 수')
+    parser.add_argument('--quiet', action='store_true', help='요청 로그 생략')
+    args = parser.parse_args()
+
+    replay = PriceReplay(args.data_dir, args.coins, args.speedup, args.start, args.ticks_per_bar)
+    server = create_server(args.host, args.port, replay, args.quiet)
+    host, port = server.server_address[:2]
+    print(f"=== 가격 피드 재생 서버: http://{host}:{port} (x{args.speedup:g}) ===")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n서버 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+스파이크 감지 파라미터 스윕 스크립트
+
+시간별 소스 시계열(고래 거래 수, 텔레그램 메시지 수, 트위터 참여도)에 대해
+(window, Z-score, 이동평균 %, 변화율 %) 조합 전체의 스파이크 수를 계산합니다.
+라벨 이벤트 파일(합성 데이터의 synthetic_manifest.json 등)을 주면 정밀도/재현율도 계산합니다.
+
+사용법:
+    python scripts/run_spike_sweep.py
+    python scripts/run_spike_sweep.py --data-dir /tmp/syn --events /tmp/syn/synthetic_manifest.json --jobs 4
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import pandas as pd
+
+# 상위 디렉토리를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.data_loader import DataLoader
+from analysis.priority_engine import build_source_frame
+from analysis.spike_sweep import SpikeSweep
+
+
+def load_events(path):
+    """이벤트 파일 읽기 (JSON 목록 또는 'events' 키가 있는 매니페스트)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data['events'] if isinstance(data, dict) else data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='스파이크 감지 파라미터 스윕')
+    parser.add_argument('--data-dir', default=None, help='데이터 디렉토리 (기본값: 프로젝트 data/)')
+    parser.add_argument('--output-dir', default=None, help='출력 디렉토리 (기본값: <data-dir>)')
+    parser.add_argument('--columns', nargs='+', default=['whale_txs', 'telegram_msgs', 'twitter_engagement'],
+                        help='스윕할 컬럼')
+    parser.add_argument('--events', default=None, help='라벨 이벤트 JSON 파일')
+    parser.add_argument('--windows', type=int, nargs='+', default=[6, 12, 24, 48, 72], help='이동 윈도우 (시간)')
+    parser.add_argument('--z', type=float, nargs='+', default=[1.5, 2.0, 2.5, 3.0, 3.5], help='Z-score 임계값')
+    parser.add_argument('--ma', type=float, nargs='+', default=[30, 50, 100, 200], help='이동평균 대비 임계값 (%%)')
+    parser.add_argument('--roc', type=float, nargs='+', default=[30, 50, 100, 200], help='변화율 임계값 (%%)')
+    parser.add_argument('--tolerance', type=int, default=3, help='이벤트 허용 오차 (시간)')
+    parser.add_argument('--jobs', type=int, default=None, help='프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--top', type=int, default=10, help='출력할 상위 조합 수')
+    args = parser.parse_args()
+
+    loader = DataLoader(args.data_dir)
+    output_dir = args.output_dir or loader.data_dir
+    events = load_events(args.events) if args.events else None
+
+    print("=== 스파이크 감지 파라미터 스윕 ===\n")
+    frame = build_source_frame(loader)
+    sweep = SpikeSweep(args.windows, args.z, args.ma, args.roc, tolerance=args.tolerance, n_jobs=args.jobs)
+    print(f"  기간: {frame['timestamp'].min()} ~ {frame['timestamp'].max()} ({len(frame):,} 시간)")
+    print(f"  조합: {sweep.n_combos:,}개 x {len(args.columns)}개 컬럼")
+    if events is not None:
+        print(f"  라벨 이벤트: {len(events)}개 (허용 오차 ±{args.tolerance}시간)")
+
+    frames = []
+    for col in args.columns:
+        if col not in frame.columns:
+            print(f"경고: {col} 컬럼이 없습니다.")
+            continue
+        result = sweep.run(frame[col].to_numpy(), frame['timestamp'], events)
+        result.insert(0, 'column', col)
+        frames.append(result)
+
+    if not frames:
+        return
+
+    result = pd.concat(frames, ignore_index=True)
+    if events is not None:
+        result = result.sort_values(['precision', 'recall'], ascending=False, na_position='last')
+    path = os.path.join(output_dir, 'spike_sweep.csv')
+    result.to_csv(path, index=False)
+    print(f"\n{len(result):,}개 결과 -> {path}")
+    print(result.head(args.top).to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
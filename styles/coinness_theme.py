@@ -22,10 +22,12 @@ COLORS = {
     'text_primary_dark': '#E0E0E0',
     'text_secondary_light': '#6C757D',
     'text_secondary_dark': '#A0A0A0',
+    'text_primary': '#2C2C2C',
     
     # Border
     'border_light': '#E5E7EB',
     'border_dark': '#404040',
+    'border': '#E5E7EB',
     
     # Status Colors
     'success': '#00C853',
@@ -37,6 +39,7 @@ COLORS = {
     'chart_up': '#00C853',
     'chart_down': '#FF5252',
     'chart_grid': '#E5E7EB',
+    'chart_neutral': '#9CA3AF',
     'chart_line_1': '#5865F2',
     'chart_line_2': '#00C853',
     'chart_line_3': '#FFC107',
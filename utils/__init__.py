@@ -1,16 +1,28 @@
 """
 Utils package
-"""
-
-from .data_loader import DataLoader
-from .alert_system import AlertSystem, AlertConfig
-
-__all__ = ['DataLoader', 'AlertSystem', 'AlertConfig']
 
+클래스는 처음 사용할 때 해당 모듈을 import 합니다 (모듈 수준 __getattr__).
+"""
 
+import importlib
 
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY_ATTRS = {
+    'DataLoader': '.data_loader',
+    'AlertSystem': '.alert_system',
+    'AlertConfig': '.alert_system',
+}
 
+__all__ = list(_LAZY_ATTRS)
 
 
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
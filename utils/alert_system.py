@@ -62,6 +62,24 @@ class AlertSystem:
         self.history = pd.concat([self.history, new_alert], ignore_index=True)
         self.save_history()
     
+    def add_alerts(self, alerts):
+        """
+        여러 알람을 한 번에 추가 (이력 파일은 한 번만 저장)
+        
+        Args:
+            alerts: timestamp, alert_level, alert_type, alert_message, spike_magnitude 컬럼의 데이터프레임
+        """
+        if alerts.empty:
+            return
+        
+        new_alerts = alerts[['timestamp', 'alert_level', 'alert_type', 'alert_message', 'spike_magnitude']].copy()
+        new_alerts.insert(1, 'alert_time', datetime.now())
+        new_alerts['resolved'] = False
+        
+        frames = [self.history, new_alerts] if not self.history.empty else [new_alerts]
+        self.history = pd.concat(frames, ignore_index=True)
+        self.save_history()
+    
     def add_alerts_from_spikes(self, spike_data, alert_type):
         """
         스파이크 데이터에서 알람 생성
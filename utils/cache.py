@@ -0,0 +1,228 @@
+"""
+공유 캐시
+
+Streamlit 세션 간에 공유되는 프로세스 전역 캐시입니다.
+- 로드한 데이터프레임은 원본 파일 지문(크기, 수정 시각, 데이터 버전)으로 키를 만듭니다.
+- 파생 계산(점수, 상관관계, 스파이크 감지)은 (입력 지문, 파라미터)로 키를 만듭니다.
+
+파일이 바뀌면 지문이 달라지므로 TTL 없이도 항상 최신 데이터를 사용하고,
+바뀌지 않았으면 다시 읽지 않습니다. 전처리 스크립트는 새 데이터를 쓴 뒤
+publish_data_version()으로 데이터 버전을 올려 명시적으로 무효화합니다.
+
+캐시된 객체는 모든 세션이 공유하므로 호출하는 쪽에서 수정하면 안 됩니다.
+"""
+
+import hashlib
+import os
+import threading
+import uuid
+from collections import OrderedDict
+
+
+# 데이터 디렉토리의 버전 마커 파일
+DATA_VERSION_FILE = '.data_version'
+
+
+def read_data_version(data_dir):
+    """
+    데이터 버전 읽기
+
+    Args:
+        data_dir: 데이터 디렉토리
+
+    Returns:
+        str: 데이터 버전 (마커가 없으면 '0')
+    """
+    path = os.path.join(data_dir, DATA_VERSION_FILE)
+    try:
+        with open(path, 'r') as f:
+            return f.read().strip() or '0'
+    except OSError:
+        return '0'
+
+
+def publish_data_version(data_dir):
+    """
+    데이터 버전 갱신 (캐시 무효화 신호)
+
+    Args:
+        data_dir: 데이터 디렉토리
+
+    Returns:
+        str: 새 데이터 버전
+    """
+    version = uuid.uuid4().hex
+    path = os.path.join(data_dir, DATA_VERSION_FILE)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+
+    os.makedirs(data_dir, exist_ok=True)
+    with open(tmp_path, 'w') as f:
+        f.write(version)
+    os.replace(tmp_path, path)
+
+    return version
+
+
+def file_fingerprint(*paths):
+    """
+    파일 지문 계산 (경로, 크기, 수정 시각, 데이터 버전)
+
+    Args:
+        *paths: 파일 경로들
+
+    Returns:
+        str: 지문 (16자리 hex)
+    """
+    h = hashlib.sha1()
+    versions = set()
+
+    for path in paths:
+        h.update(os.path.abspath(path).encode('utf-8'))
+        try:
+            stat = os.stat(path)
+            h.update(f':{stat.st_size}:{stat.st_mtime_ns}'.encode('utf-8'))
+        except OSError:
+            h.update(b':missing')
+        versions.add(os.path.dirname(os.path.abspath(path)))
+
+    for data_dir in sorted(versions):
+        h.update(read_data_version(data_dir).encode('utf-8'))
+
+    return h.hexdigest()[:16]
+
+
+def derive_fingerprint(fingerprint, *params):
+    """
+    기존 지문과 파라미터로 새 지문 계산 (필터된 데이터 등)
+
+    Args:
+        fingerprint: 입력 지문
+        *params: 파라미터
+
+    Returns:
+        str: 지문 (16자리 hex)
+    """
+    h = hashlib.sha1(fingerprint.encode('utf-8'))
+    h.update(repr(_freeze(params)).encode('utf-8'))
+    return h.hexdigest()[:16]
+
+
+def _freeze(value):
+    """딕셔너리/리스트를 해시 가능한 튜플로 변환"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        items = [_freeze(v) for v in value]
+        return tuple(sorted(items, key=repr)) if isinstance(value, set) else tuple(items)
+    return value
+
+
+class SharedCache:
+    """지문 기반 공유 캐시 (LRU, 스레드 안전)"""
+
+    def __init__(self, max_entries=128):
+        """
+        Args:
+            max_entries: 최대 항목 수 (초과하면 오래된 항목부터 제거)
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_compute(self, key, compute):
+        """
+        캐시 조회, 없으면 계산 후 저장
+
+        같은 키를 여러 세션이 동시에 요청하면 한 번만 계산합니다.
+
+        Args:
+            key: 해시 가능한 키
+            compute: 인자 없는 계산 함수
+
+        Returns:
+            계산 결과
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._entries[key]
+
+            value = compute()
+
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = value
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                self._key_locks.pop(key, None)
+
+        return value
+
+    def load_frame(self, name, paths, loader):
+        """
+        파일 지문 기준으로 데이터 로드
+
+        Args:
+            name: 데이터 이름
+            paths: 원본 파일 경로 (문자열 또는 리스트)
+            loader: 인자 없는 로드 함수
+
+        Returns:
+            tuple: (데이터, 지문)
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+        fingerprint = file_fingerprint(*paths)
+        value = self.get_or_compute(('frame', name, fingerprint), loader)
+        return value, fingerprint
+
+    def derived(self, name, fingerprint, params, compute):
+        """
+        (입력 지문, 파라미터) 기준 파생 계산 캐시
+
+        Args:
+            name: 계산 이름
+            fingerprint: 입력 데이터 지문
+            params: 계산 파라미터 (딕셔너리/튜플 등)
+            compute: 인자 없는 계산 함수
+
+        Returns:
+            계산 결과
+        """
+        return self.get_or_compute(('derived', name, fingerprint, _freeze(params)), compute)
+
+    def invalidate(self, fingerprint=None):
+        """
+        캐시 무효화
+
+        Args:
+            fingerprint: 이 지문에 해당하는 항목만 제거 (None이면 전체)
+        """
+        with self._lock:
+            if fingerprint is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if fingerprint in k]:
+                del self._entries[key]
+
+    def stats(self):
+        """캐시 통계"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
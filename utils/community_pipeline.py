@@ -0,0 +1,524 @@
+"""
+커뮤니티 데이터 파이프라인
+
+트위터 인플루언서 / 레딧 CSV를 청크 단위로 한 번만 읽으면서
+Next.js 대시보드가 사용하는 커뮤니티 산출물을 만듭니다.
+기본 소스는 현재 산출물을 만든 트위터뿐이며, 레딧은 sources 에 명시해야 포함됩니다.
+(레딧을 넣으면 시계열 기간이 레딧 게시글 범위까지 늘어나고 키워드 / 상위 게시글도 바뀜)
+    community_ts_1h.csv / 4h / 1d      시간별 감정 평균, 표본 분산, 게시글 수, 라벨별 개수
+    community_spike_events.csv         1h 감정 변화량의 z-score 와 임계값별 스파이크 플래그
+    community_keywords_daily.csv       일별 키워드 빈도 (감정 라벨별)
+    community_top_posts_daily.csv      일별/감정별 참여도 상위 게시글
+
+메모리는 원본 크기와 무관하게 (시간 버킷 수 + 일별 고유 단어 수 + 일별 상위 K개)
+에 비례합니다.
+- 시계열: 청크마다 시간별 (개수, 평균, 분산)을 만들어 RollupStore 에 병합
+- 키워드: 단어를 정수 id로 바꿔 (일, 단어) 키와 라벨별 개수 배열로 누적
+- 상위 게시글: (일, 감정)별 크기 K 힙
+
+집계 규칙 (기존 산출물과 동일)
+- avg_sentiment / variance / pos / neg / neu: 감정 라벨이 있는 모든 행
+- total_posts: 본문이 있는 게시글 수
+- 빈 시간 버킷은 0으로 채움
+- engagement_score = likes + 2 * shares + 3 * comments
+
+키워드는 정규식 토큰 + 불용어 목록으로 셉니다. 기존 community_keywords_daily.csv 는
+기록되지 않은 품사 기반 필터(부사 / 수사 / 전치사 제외)로 만들어졌으므로 다시 만들면
+트위터만으로도 행 수가 달라집니다. (121,420 -> 127,758행)
+상위 게시글의 동점(같은 참여도)은 먼저 읽은 게시글을 앞에 두는데, 기존
+community_top_posts_daily.csv 의 동점 순서는 기록되지 않은 정렬 결과라 재현되지 않습니다.
+다시 만들면 동점 게시글의 순서가 바뀌고(트위터 기준 57행), K번째 자리가 동점인 그룹은
+포함되는 게시글도 달라질 수 있습니다(6건). 시계열 / 스파이크 산출물은 동일합니다.
+"""
+
+import heapq
+import os
+import sys
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.rollup import RollupStore
+from utils.profiling import instrument, stage
+
+
+# 청크당 행 수
+CHUNK_ROWS = 2000
+
+# 출력 해상도 (파일 접미사, RollupStore 해상도)
+TS_FREQUENCIES = ['1h', '4h', '1d']
+
+# 스파이크 탐지: 감정 변화량의 롤링 z-score
+SPIKE_WINDOW = 24
+SPIKE_MIN_PERIODS = 5
+SPIKE_THRESHOLDS = (2.0, 2.5, 3.0)
+
+# (일, 감정)별 상위 게시글 수
+TOP_K = 10
+
+# 레딧 중복 제거용으로 기억할 최근 게시글 id 수 (덤프 파일 버전 간 중복 제거, 메모리 상한)
+REDDIT_DEDUP_IDS = 200_000
+
+LABELS = ('positive', 'negative', 'neutral')
+TOP_POST_CATEGORIES = LABELS + ('all',)
+
+# 점수 없이 라벨만 있는 소스(레딧)의 감정 점수 - 트위터 점수 단계의 중간값
+LABEL_SCORES = {'positive': 0.6, 'negative': -0.6, 'neutral': 0.0}
+
+# 영문 소문자로 시작하는 2자 이상 토큰 (l2, web3, a16z 등 유지)
+TOKEN_PATTERN = r'[a-z][a-z0-9]+'
+
+STOPWORDS = frozenset("""
+a about above across actually after again against ago all almost along already also always
+am among an and another any are aren around as at away back be because been before behind
+being below between beyond both but by can cannot could couldn did didn do does doesn doing
+don down during each either else even ever every far few for from further had hadn has hasn
+have haven having he her here hers herself him himself his how however http https i if in
+instead into is isn it its itself just like ll may maybe me might more most must mustn my
+myself near never no nor not now of off often on once only onto or other our ours ourselves
+out over own per quite rather re really same shall shan she should shouldn since so some
+soon still such than that the their theirs them themselves then there these they this those
+though through to together too toward under until up upon us ve very via was wasn we well
+were weren what when where whether which while who whom why will with within without won
+would wouldn yet you your yours yourself yourselves
+""".split())
+
+
+def engagement_score(likes, shares, comments):
+    """참여도 점수 (결측은 0)"""
+    return (
+        pd.to_numeric(likes, errors='coerce').fillna(0)
+        + 2 * pd.to_numeric(shares, errors='coerce').fillna(0)
+        + 3 * pd.to_numeric(comments, errors='coerce').fillna(0)
+    )
+
+
+def _normalize_twitter(chunk):
+    """트위터 인플루언서 CSV 청크 -> 공통 게시글 형식"""
+    return pd.DataFrame({
+        'post_content': chunk['post_content'],
+        'post_date': pd.to_datetime(chunk['post_date'], format='ISO8601', utc=True, errors='coerce'),
+        'comments': pd.to_numeric(chunk['comments'], errors='coerce'),
+        'shares': pd.to_numeric(chunk['shares'], errors='coerce'),
+        'likes': pd.to_numeric(chunk['likes'], errors='coerce'),
+        'sentiment': chunk['sentiment'],
+        'sentiment_score': pd.to_numeric(chunk['sentiment_score'], errors='coerce'),
+    })
+
+
+def _normalize_reddit(chunk):
+    """레딧 CSV 청크 -> 공통 게시글 형식 (제목 + 본문, 공유 수 없음)"""
+    title = chunk['title'].fillna('')
+    text = chunk['text'].fillna('').str.strip()
+    content = title.where(text == '', title + '\n\n' + text)
+    likes = chunk['like_count'] if 'like_count' in chunk.columns else chunk['score']
+
+    return pd.DataFrame({
+        'post_content': content.where(content != ''),
+        'post_date': pd.to_datetime(chunk['created_utc'], utc=True, errors='coerce'),
+        'comments': pd.to_numeric(chunk['num_comments'], errors='coerce'),
+        'shares': 0.0,
+        'likes': pd.to_numeric(likes, errors='coerce'),
+        'sentiment': chunk['sentiment'],
+        'sentiment_score': chunk['sentiment'].map(LABEL_SCORES),
+    })
+
+
+class _KeywordCounter:
+    """
+    일별 키워드 카운터
+
+    단어는 정수 id로 바꾸고 (일 번호 << 32 | 단어 id) 키 배열과
+    라벨별 개수 행렬 [키 수, 3] 으로 저장합니다.
+    """
+
+    def __init__(self):
+        self.vocab = {}
+        self.words = []
+        self.keys = np.empty(0, dtype=np.int64)
+        self.counts = np.empty((0, len(LABELS)), dtype=np.int64)
+
+    def _word_ids(self, tokens):
+        """토큰 Series -> 단어 id 배열 (처음 본 단어는 새 id)"""
+        codes, uniques = pd.factorize(tokens)
+        mapping = np.empty(len(uniques), dtype=np.int64)
+        for i, word in enumerate(uniques):
+            word_id = self.vocab.get(word)
+            if word_id is None:
+                word_id = self.vocab[word] = len(self.words)
+                self.words.append(word)
+            mapping[i] = word_id
+        return mapping[codes]
+
+    def add(self, days, tokens, labels):
+        """
+        토큰 누적
+
+        Args:
+            days: 토큰별 일 번호 (int64 배열)
+            tokens: 토큰 Series
+            labels: 토큰별 라벨 인덱스 (0=positive, 1=negative, 2=neutral)
+        """
+        if len(tokens) == 0:
+            return
+
+        keys = (days.astype(np.int64) << 32) | self._word_ids(tokens)
+        all_keys = np.concatenate((self.keys, keys))
+        unique, inverse = np.unique(all_keys, return_inverse=True)
+
+        counts = np.zeros((len(unique), len(LABELS)), dtype=np.int64)
+        counts[inverse[:len(self.keys)]] += self.counts
+        np.add.at(counts, (inverse[len(self.keys):], labels), 1)
+
+        self.keys, self.counts = unique, counts
+
+    def to_frame(self):
+        """period, word, total_count, positive, negative, neutral (일별 빈도 내림차순)"""
+        days = self.keys >> 32
+        word_ids = self.keys & 0xFFFFFFFF
+        total = self.counts.sum(axis=1)
+
+        # 같은 빈도는 먼저 등장한 단어 순
+        order = np.lexsort((word_ids, -total, days))
+        words = np.array(self.words, dtype=object)
+
+        return pd.DataFrame({
+            'period': pd.to_datetime(days[order], unit='D').strftime('%Y-%m-%d'),
+            'word': words[word_ids[order]] if len(order) else np.empty(0, dtype=object),
+            'total_count': total[order],
+            'positive': self.counts[order, 0],
+            'negative': self.counts[order, 1],
+            'neutral': self.counts[order, 2],
+        })
+
+
+class _TopPosts:
+    """(일, 감정)별 참여도 상위 K개 게시글 (크기 K 최소 힙)"""
+
+    COLUMNS = ['post_content', 'post_date', 'comments', 'shares', 'likes', 'engagement_score']
+
+    def __init__(self, k=TOP_K):
+        self.k = k
+        self.heaps = {}
+
+    def push(self, key, score, seq, row):
+        """동점이면 먼저 읽은 게시글 우선 (seq 가 작은 쪽)"""
+        item = (score, -seq, row)
+        heap = self.heaps.setdefault(key, [])
+        if len(heap) < self.k:
+            heapq.heappush(heap, item)
+        elif item[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, item)
+
+    def add(self, posts):
+        """
+        청크 반영
+
+        청크 안에서 먼저 (일, 감정)별 상위 K개로 줄인 뒤 힙에 넣습니다.
+
+        Args:
+            posts: day, sentiment, seq, engagement_score 컬럼이 있는 게시글
+        """
+        ranked = posts.sort_values(['engagement_score', 'seq'], ascending=[False, True], kind='stable')
+        candidates = [
+            ranked[ranked['sentiment'].isin(LABELS)].groupby(['day', 'sentiment'], sort=False).head(self.k),
+            ranked.groupby('day', sort=False).head(self.k).assign(sentiment='all'),
+        ]
+
+        for frame in candidates:
+            for day, sentiment, seq, score, *row in zip(
+                frame['day'], frame['sentiment'], frame['seq'], *(frame[c] for c in ['engagement_score'] + self.COLUMNS)
+            ):
+                self.push((day, sentiment), score, seq, tuple(row))
+
+    def to_frame(self):
+        """period, sentiment, post_content, ... (일 / 감정 / 참여도 내림차순)"""
+        category_order = {c: i for i, c in enumerate(TOP_POST_CATEGORIES)}
+        rows = []
+        for (day, sentiment) in sorted(self.heaps, key=lambda k: (k[0], category_order[k[1]])):
+            period = pd.Timestamp(day, unit='D').strftime('%Y-%m-%d')
+            for score, neg_seq, row in sorted(self.heaps[(day, sentiment)], key=lambda x: (-x[0], -x[1])):
+                rows.append((period, sentiment) + row)
+
+        return pd.DataFrame(rows, columns=['period', 'sentiment'] + self.COLUMNS)
+
+
+class CommunityPipeline:
+    """커뮤니티 산출물 생성 파이프라인"""
+
+    SOURCES = ('twitter', 'reddit')
+    # 기존 산출물(community_*.csv)을 만든 소스
+    DEFAULT_SOURCES = ('twitter',)
+
+    def __init__(self, data_dir=None, chunk_rows=CHUNK_ROWS, top_k=TOP_K):
+        """
+        Args:
+            data_dir: 데이터 디렉토리 경로 (기본값: 프로젝트 루트의 data/)
+            chunk_rows: 청크당 행 수
+            top_k: (일, 감정)별 상위 게시글 수
+        """
+        if data_dir is None:
+            data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+        self.data_dir = data_dir
+        self.chunk_rows = chunk_rows
+
+        self.store = None
+        self.keywords = _KeywordCounter()
+        self.top_posts = _TopPosts(top_k)
+        self.rows_read = 0
+        self.posts = 0
+        # 최근 REDDIT_DEDUP_IDS 개 레딧 id (집합 + 들어온 순서)
+        self._reddit_ids = set()
+        self._reddit_order = deque()
+
+    def get_source_paths(self, sources=DEFAULT_SOURCES):
+        """
+        소스별 입력 파일 경로
+
+        Args:
+            sources: 사용할 소스 ('twitter', 'reddit', 기본값: DEFAULT_SOURCES)
+
+        Returns:
+            list: (소스, 파일 경로) 리스트
+        """
+        paths = []
+        if 'twitter' in sources:
+            paths.append(('twitter', os.path.join(self.data_dir, 'twitter_influencer_labeled_rows.csv')))
+        if 'reddit' in sources:
+            reddit_dir = os.path.join(self.data_dir, 'reddit')
+            if os.path.isdir(reddit_dir):
+                for name in sorted(os.listdir(reddit_dir)):
+                    if name.endswith('.csv'):
+                        paths.append(('reddit', os.path.join(reddit_dir, name)))
+        return paths
+
+    def _read_chunks(self, source, path):
+        """소스 파일을 청크 단위로 읽어 공통 형식으로 반환"""
+        reader = pd.read_csv(path, chunksize=self.chunk_rows, encoding='utf-8-sig')
+        for chunk in reader:
+            self.rows_read += len(chunk)
+
+            if 'sentiment' not in chunk.columns:
+                print(f"경고: {os.path.basename(path)} 에 감정 라벨이 없어 건너뜁니다.")
+                return
+
+            if source == 'reddit':
+                # 레딧 덤프 파일들은 같은 게시글의 다른 버전이므로 id 기준 중복 제거
+                ids = chunk['id'].astype(str)
+                seen = np.fromiter((i in self._reddit_ids for i in ids), dtype=bool, count=len(ids))
+                fresh = ~seen & ~ids.duplicated().to_numpy()
+                self._remember_reddit_ids(ids[fresh])
+                chunk = chunk[fresh]
+                posts = _normalize_reddit(chunk)
+            else:
+                posts = _normalize_twitter(chunk)
+
+            yield posts.dropna(subset=['post_date'])
+
+    def _remember_reddit_ids(self, ids):
+        """레딧 id 기록 (오래된 id 부터 버려 REDDIT_DEDUP_IDS 개 유지)"""
+        self._reddit_ids.update(ids)
+        self._reddit_order.extend(ids)
+        while len(self._reddit_order) > REDDIT_DEDUP_IDS:
+            self._reddit_ids.discard(self._reddit_order.popleft())
+
+    def _hourly(self, posts, hour):
+        """청크의 시간별 (점수 개수, 평균, 표본 분산, 게시글 수, 라벨별 개수)"""
+        labels = posts['sentiment']
+        grouped = pd.DataFrame({
+            'score': posts['sentiment_score'],
+            'has_content': posts['post_content'].notna(),
+            'pos': labels == 'positive',
+            'neg': labels == 'negative',
+            'neu': labels == 'neutral',
+        }).groupby(hour.rename('post_date'))
+
+        hourly = grouped['score'].agg(['count', 'mean', 'var'])
+        hourly.columns = ['scored_posts', 'avg_sentiment', 'variance']
+        hourly['variance'] = hourly['variance'].fillna(0.0)
+        hourly['total_posts'] = grouped['has_content'].sum()
+        hourly[['pos', 'neg', 'neu']] = grouped[['pos', 'neg', 'neu']].sum()
+        return hourly.reset_index()
+
+    def _add_hourly(self, hourly):
+        if self.store is None:
+            self.store = RollupStore(
+                hourly,
+                modes={'total_posts': 'sum', 'pos': 'sum', 'neg': 'sum', 'neu': 'sum'},
+                weighted={'avg_sentiment': ('scored_posts', 'variance')},
+                timestamp_col='post_date',
+                default_mode=None
+            )
+        else:
+            self.store.update(hourly)
+
+    def _add_keywords(self, posts, days, label_idx):
+        """본문을 한 번 토큰화해 일별/라벨별 빈도 누적"""
+        has_text = posts['post_content'].notna().to_numpy() & (label_idx >= 0)
+        if not has_text.any():
+            return
+
+        tokens = posts['post_content'][has_text].str.lower().str.findall(TOKEN_PATTERN).explode().dropna()
+        tokens = tokens[~tokens.isin(STOPWORDS)]
+
+        # explode 후 인덱스는 원래 행의 위치 -> 행별 일 번호/라벨 반복
+        position = posts.index.get_indexer(tokens.index)
+        self.keywords.add(days[position], tokens, label_idx[position])
+
+    def process_chunk(self, posts):
+        """
+        공통 형식 게시글 청크 하나를 모든 집계에 반영
+
+        Args:
+            posts: post_content, post_date(UTC), comments, shares, likes, sentiment, sentiment_score
+        """
+        if posts.empty:
+            return
+
+        posts = posts.reset_index(drop=True)
+        hour = posts['post_date'].dt.floor('h')
+        days = (posts['post_date'].dt.tz_localize(None).to_numpy().astype('datetime64[D]')
+                .astype(np.int64))
+        label_idx = (posts['sentiment'].map({label: i for i, label in enumerate(LABELS)})
+                     .fillna(-1).astype(np.int64).to_numpy())
+
+        self._add_hourly(self._hourly(posts, hour))
+        self._add_keywords(posts, days, label_idx)
+
+        top = posts.assign(
+            day=days,
+            seq=np.arange(self.posts, self.posts + len(posts)),
+            engagement_score=lambda d: engagement_score(d['likes'], d['shares'], d['comments']),
+            post_date=lambda d: d['post_date'].astype(str),
+        )
+        self.top_posts.add(top)
+
+        self.posts += len(posts)
+
+    @instrument()
+    def process(self, sources=DEFAULT_SOURCES):
+        """
+        소스 파일 전체를 청크 단위로 처리
+
+        Args:
+            sources: 사용할 소스 ('twitter', 'reddit', 기본값: DEFAULT_SOURCES)
+
+        Returns:
+            int: 처리한 게시글 수
+        """
+        for source, path in self.get_source_paths(sources):
+            if not os.path.exists(path):
+                print(f"경고: {path} 파일이 없습니다.")
+                continue
+
+            with stage(f'community.read.{source}') as s:
+                before = self.posts
+                for posts in self._read_chunks(source, path):
+                    self.process_chunk(posts)
+                s.set_rows(rows_out=self.posts - before)
+
+        return self.posts
+
+    @instrument()
+    def build_timeseries(self):
+        """
+        해상도별 감정 시계열 (빈 버킷은 0)
+
+        Returns:
+            dict: 해상도 -> DataFrame (post_date, avg_sentiment, variance, total_posts, pos, neg, neu)
+        """
+        columns = ['post_date', 'avg_sentiment', 'variance', 'total_posts', 'pos', 'neg', 'neu']
+        if self.store is None:
+            return {freq: pd.DataFrame(columns=columns) for freq in TS_FREQUENCIES}
+
+        result = {}
+        for freq in TS_FREQUENCIES:
+            df = self.store.query(resolution=freq, stats=True,
+                                  columns=['avg_sentiment', 'total_posts', 'pos', 'neg', 'neu'])
+            df['variance'] = df['avg_sentiment_var']
+
+            full_range = pd.date_range(df['post_date'].iloc[0], df['post_date'].iloc[-1], freq=freq)
+            df = df.set_index('post_date')[columns[1:]].reindex(full_range).fillna(0)
+            df.index.name = 'post_date'
+
+            counts = ['total_posts', 'pos', 'neg', 'neu']
+            df[counts] = df[counts].round().astype(np.int64)
+            result[freq] = df.reset_index()
+
+        return result
+
+    @instrument()
+    def detect_spikes(self, ts_1h):
+        """
+        1h 감정 변화량의 롤링 z-score 와 임계값별 스파이크 플래그 (상승 방향)
+
+        Args:
+            ts_1h: 1h 감정 시계열
+
+        Returns:
+            DataFrame: ts_1h + diff, roll_mean, roll_std, zscore, spike_2_0, spike_2_5, spike_3_0
+        """
+        df = ts_1h.copy()
+        df['diff'] = df['avg_sentiment'].diff()
+
+        rolling = df['diff'].rolling(SPIKE_WINDOW, min_periods=SPIKE_MIN_PERIODS)
+        df['roll_mean'] = rolling.mean()
+        df['roll_std'] = rolling.std()
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            zscore = (df['diff'].to_numpy() - df['roll_mean'].to_numpy()) / df['roll_std'].to_numpy()
+        zscore[~np.isfinite(zscore)] = np.nan
+        df['zscore'] = zscore
+
+        # 모든 임계값을 한 번에 비교 [행 수, 임계값 수]
+        with np.errstate(invalid='ignore'):
+            flags = zscore[:, None] > np.array(SPIKE_THRESHOLDS)[None, :]
+        for i, threshold in enumerate(SPIKE_THRESHOLDS):
+            df[f"spike_{str(threshold).replace('.', '_')}"] = flags[:, i]
+
+        return df
+
+    def save(self, output_dir=None):
+        """
+        산출물 저장
+
+        Args:
+            output_dir: 출력 디렉토리 (기본값: 데이터 디렉토리)
+
+        Returns:
+            dict: 산출물 이름 -> 파일 경로
+        """
+        output_dir = output_dir or self.data_dir
+        os.makedirs(output_dir, exist_ok=True)
+
+        timeseries = self.build_timeseries()
+        outputs = {f'community_ts_{freq}': df for freq, df in timeseries.items()}
+        outputs['community_spike_events'] = self.detect_spikes(timeseries['1h'])
+        outputs['community_keywords_daily'] = self.keywords.to_frame()
+        outputs['community_top_posts_daily'] = self.top_posts.to_frame()
+
+        paths = {}
+        for name, df in outputs.items():
+            path = os.path.join(output_dir, f'{name}.csv')
+            with stage(f'community.write.{name}', rows_in=df):
+                df.to_csv(path, index=False)
+            paths[name] = path
+        return paths
+
+    def run(self, sources=DEFAULT_SOURCES, output_dir=None):
+        """
+        전체 파이프라인 실행
+
+        Args:
+            sources: 사용할 소스 ('twitter', 'reddit', 기본값: DEFAULT_SOURCES)
+            output_dir: 출력 디렉토리 (기본값: 데이터 디렉토리)
+
+        Returns:
+            dict: 산출물 이름 -> 파일 경로
+        """
+        self.process(sources)
+        return self.save(output_dir)
@@ -7,6 +7,13 @@
 import pandas as pd
 import numpy as np
 from datetime import timedelta
+import os
+import sys
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.profiling import instrument
+from utils.timestamps import hour_key
 
 
 class CompositeScoreCalculator:
@@ -36,6 +43,7 @@ class CompositeScoreCalculator:
             return 0.5
         return np.clip((value - min_val) / (max_val - min_val), 0, 1)
     
+    @instrument()
     def calculate_telegram_score(self, df, window_hours=24):
         """
         텔레그램 신호 점수 계산
@@ -73,6 +81,7 @@ class CompositeScoreCalculator:
         
         return telegram_score.fillna(50)
     
+    @instrument()
     def calculate_news_score(self, df_news, df_main):
         """
         뉴스 신호 점수 계산
@@ -87,13 +96,12 @@ class CompositeScoreCalculator:
         if df_news.empty:
             return pd.Series(50, index=df_main.index)
         
-        # 시간당 뉴스 수 집계
-        df_news['hour'] = df_news['timestamp'].dt.floor('H')
-        news_count = df_news.groupby('hour').size().reset_index(name='news_count')
+        # 시간당 뉴스 수 집계 (입력은 공유 캐시 객체일 수 있으므로 수정하지 않음)
+        news_hour = pd.Series(hour_key(df_news['timestamp']), name='hour')
+        news_count = news_hour.groupby(news_hour).size().reset_index(name='news_count')
         
         # 메인 데이터와 병합
-        df_temp = df_main[['timestamp']].copy()
-        df_temp['hour'] = df_temp['timestamp'].dt.floor('H')
+        df_temp = pd.DataFrame({'hour': hour_key(df_main['timestamp'])}, index=df_main.index)
         df_temp = df_temp.merge(news_count, on='hour', how='left')
         df_temp['news_count'] = df_temp['news_count'].fillna(0)
         
@@ -109,30 +117,31 @@ class CompositeScoreCalculator:
         
         return (news_score * 100).fillna(50)
     
+    @instrument()
     def calculate_twitter_score(self, df_twitter, df_main):
         """
         트위터 신호 점수 계산
         
         Args:
-            df_twitter: 트위터 데이터
+            df_twitter: 트위터 데이터 (DataLoader 의 'timestamp' 또는 원본 'post_date' 컬럼)
             df_main: 메인 데이터프레임
             
         Returns:
             Series: 트위터 점수 (0-100)
         """
-        if df_twitter.empty or 'post_date' not in df_twitter.columns:
+        time_col = 'timestamp' if 'timestamp' in df_twitter.columns else 'post_date'
+        if df_twitter.empty or time_col not in df_twitter.columns:
             return pd.Series(50, index=df_main.index)
         
-        # 시간당 트윗 수 집계
-        df_twitter['hour'] = df_twitter['post_date'].dt.floor('H')
+        # 시간당 트윗 수 집계 (입력은 공유 캐시 객체일 수 있으므로 수정하지 않음)
+        df_twitter = df_twitter.assign(hour=hour_key(df_twitter[time_col]))
         twitter_agg = df_twitter.groupby('hour').agg({
             'likes': 'sum',
             'sentiment_score': 'mean'
         }).reset_index()
         
         # 메인 데이터와 병합
-        df_temp = df_main[['timestamp']].copy()
-        df_temp['hour'] = df_temp['timestamp'].dt.floor('H')
+        df_temp = pd.DataFrame({'hour': hour_key(df_main['timestamp'])}, index=df_main.index)
         df_temp = df_temp.merge(twitter_agg, on='hour', how='left')
         df_temp['likes'] = df_temp['likes'].fillna(0)
         df_temp['sentiment_score'] = df_temp['sentiment_score'].fillna(0)
@@ -151,6 +160,7 @@ class CompositeScoreCalculator:
         
         return twitter_score.fillna(50)
     
+    @instrument()
     def calculate_composite_score(self, df, df_news=None, df_twitter=None):
         """
         종합 점수 계산
@@ -0,0 +1,316 @@
+"""
+대시보드 스냅샷
+
+랜딩 페이지(main.py)가 필요한 값을 미리 계산해 하나의 JSON 파일로 저장합니다.
+- 최신 점수 및 24시간 변화
+- 코인 가격 / 고래 거래와의 상관관계 지표
+- 최근 스파이크 목록
+- 다운샘플링된 종합 점수 시계열
+
+스냅샷은 임시 파일에 쓴 뒤 os.replace로 교체하므로 읽는 쪽은 항상
+완전한 파일만 보게 됩니다. 원본 데이터가 바뀌었거나 너무 오래되면
+load_snapshot이 None을 반환하고, 페이지는 실시간 계산으로 대체합니다.
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.composite_score import CompositeScoreCalculator
+from analysis.spike_detector import SpikeDetector
+from components.downsample import downsample_frame
+
+
+SNAPSHOT_FILE = 'dashboard_snapshot.json'
+SNAPSHOT_VERSION = 1
+
+# 스냅샷 최대 유효 시간 (초)
+DEFAULT_MAX_AGE_SECONDS = 6 * 3600
+
+# 스냅샷이 의존하는 원본 파일 (변경되면 스냅샷은 stale)
+SOURCE_FILES = [
+    'processed_data.csv',
+    'coinness_data.csv',
+    'twitter_influencer_labeled_rows.csv',
+]
+
+# 스냅샷 계산에 필요한 전처리 데이터 컬럼
+SNAPSHOT_COLUMNS = [
+    'timestamp', 'message_count', 'avg_sentiment', 'tx_frequency', 'ETH_close',
+    'twitter_count', 'twitter_sentiment_compound'
+]
+
+# 종합 점수 시계열 최대 포인트 수
+SERIES_MAX_POINTS = 1500
+
+
+def calculate_correlations_with_price(df):
+    """코인 가격과의 상관관계 계산"""
+    correlations = {}
+
+    if df.empty or 'ETH_close' not in df.columns:
+        return correlations
+
+    # 트위터 인플루언서
+    if 'twitter_count' in df.columns:
+        correlations['트위터 게시글 수'] = df['twitter_count'].corr(df['ETH_close'])
+    if 'twitter_sentiment_compound' in df.columns:
+        correlations['트위터 감정 분석'] = df['twitter_sentiment_compound'].corr(df['ETH_close'])
+
+    # 텔레그램
+    if 'message_count' in df.columns:
+        correlations['텔레그램 게시글 수'] = df['message_count'].corr(df['ETH_close'])
+    if 'avg_sentiment' in df.columns:
+        correlations['텔레그램 감정 분석'] = df['avg_sentiment'].corr(df['ETH_close'])
+
+    # 코인니스 (데이터 수집 중)
+    correlations['코인니스 게시글 수'] = None  # 데이터 수집 중
+    correlations['코인니스 감정 분석'] = None  # 데이터 수집 중
+
+    return correlations
+
+
+def calculate_correlations_with_whale(df):
+    """고래 지갑과의 상관관계 계산"""
+    correlations = {}
+
+    if df.empty or 'tx_frequency' not in df.columns:
+        return correlations
+
+    # 트위터 인플루언서
+    if 'twitter_count' in df.columns:
+        correlations['트위터 게시글 수'] = df['twitter_count'].corr(df['tx_frequency'])
+    if 'twitter_sentiment_compound' in df.columns:
+        correlations['트위터 감정 분석'] = df['twitter_sentiment_compound'].corr(df['tx_frequency'])
+
+    # 텔레그램
+    if 'message_count' in df.columns:
+        correlations['텔레그램 게시글 수'] = df['message_count'].corr(df['tx_frequency'])
+    if 'avg_sentiment' in df.columns:
+        correlations['텔레그램 감정 분석'] = df['avg_sentiment'].corr(df['tx_frequency'])
+
+    # 코인니스 (데이터 수집 중)
+    correlations['코인니스 게시글 수'] = None  # 데이터 수집 중
+    correlations['코인니스 감정 분석'] = None  # 데이터 수집 중
+
+    return correlations
+
+
+def _to_json_value(value):
+    """NaN/inf/NumPy 타입을 JSON 호환 값으로 변환"""
+    if value is None:
+        return None
+    if isinstance(value, (np.integer,)):
+        return int(value)
+    if isinstance(value, (float, np.floating)):
+        value = float(value)
+        return value if math.isfinite(value) else None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    return value
+
+
+def _source_mtimes(data_dir):
+    """원본 파일별 수정 시각 (없는 파일은 None)"""
+    mtimes = {}
+    for name in SOURCE_FILES:
+        path = os.path.join(data_dir, name)
+        mtimes[name] = os.path.getmtime(path) if os.path.exists(path) else None
+    return mtimes
+
+
+def _recent_spikes(df_scored, n=10):
+    """메시지 수 Z-score 스파이크 중 최근 n개"""
+    if df_scored.empty or 'message_count' not in df_scored.columns:
+        return []
+
+    detector = SpikeDetector(df_scored[['timestamp', 'message_count']])
+    spikes = detector.detect_zscore_spike('message_count', threshold=2.0)
+    if spikes.empty:
+        return []
+
+    spikes = spikes.tail(n).sort_values('timestamp', ascending=False)
+    return [
+        {
+            'timestamp': row.timestamp.isoformat(),
+            'spike_column': row.spike_column,
+            'spike_type': row.spike_type,
+            'spike_magnitude': _to_json_value(row.spike_magnitude),
+        }
+        for row in spikes.itertuples(index=False)
+    ]
+
+
+def _recent_news(df_news, n=10):
+    """최근 뉴스 n개를 JSON 레코드로 변환"""
+    if df_news is None or df_news.empty:
+        return []
+
+    records = df_news.head(n).to_dict(orient='records')
+    return [{k: _to_json_value(v) for k, v in record.items()} for record in records]
+
+
+def build_snapshot(df_main, data, data_dir=None, calculator=None):
+    """
+    랜딩 페이지용 스냅샷 계산
+
+    Args:
+        df_main: 전처리 데이터
+        data: DataLoader.load_all_data() 결과 (coinness, twitter 사용)
+        data_dir: 원본 파일 디렉토리 (수정 시각 기록용, None이면 기록 안 함)
+        calculator: CompositeScoreCalculator (None이면 기본 가중치)
+
+    Returns:
+        dict: 스냅샷
+    """
+    calculator = calculator or CompositeScoreCalculator()
+
+    df_scored = calculator.calculate_composite_score(
+        df_main,
+        df_news=data.get('coinness', pd.DataFrame()),
+        df_twitter=data.get('twitter', pd.DataFrame())
+    )
+
+    if df_scored.empty:
+        scores = {'telegram': 50, 'news': 50, 'twitter': 50, 'composite': 50}
+    else:
+        last = df_scored.iloc[-1]
+        scores = {
+            'telegram': last['telegram_score'],
+            'news': last['news_score'],
+            'twitter': last['twitter_score'],
+            'composite': last['composite_score'],
+        }
+
+    # 24시간 변화
+    if len(df_scored) > 24:
+        composite_score_24h = df_scored['composite_score'].iloc[-25]
+        score_change = scores['composite'] - composite_score_24h
+        score_change_pct = (score_change / composite_score_24h) * 100 if composite_score_24h != 0 else 0
+    else:
+        score_change = 0
+        score_change_pct = 0
+
+    signal_summary = calculator.get_signal_summary(df_scored)
+
+    series = downsample_frame(df_scored, 'composite_score', SERIES_MAX_POINTS)
+
+    snapshot = {
+        'version': SNAPSHOT_VERSION,
+        'generated_at': time.time(),
+        'sources': _source_mtimes(data_dir) if data_dir else {},
+        'rows': len(df_scored),
+        'scores': {k: _to_json_value(v) for k, v in scores.items()},
+        'score_change': _to_json_value(score_change),
+        'score_change_pct': _to_json_value(score_change_pct),
+        'signal_summary': {k: _to_json_value(v) for k, v in signal_summary.items()},
+        'correlations': {
+            'price': {k: _to_json_value(v) for k, v in calculate_correlations_with_price(df_scored).items()},
+            'whale': {k: _to_json_value(v) for k, v in calculate_correlations_with_whale(df_scored).items()},
+        },
+        'recent_spikes': _recent_spikes(df_scored),
+        'recent_news': _recent_news(data.get('coinness')),
+        'score_series': {
+            'timestamp': series['timestamp'].dt.strftime('%Y-%m-%dT%H:%M:%S').tolist() if not series.empty else [],
+            'composite_score': [_to_json_value(v) for v in series['composite_score']] if not series.empty else [],
+        },
+    }
+
+    return snapshot
+
+
+def save_snapshot(snapshot, path):
+    """
+    스냅샷을 원자적으로 저장 (임시 파일 작성 후 교체)
+
+    Args:
+        snapshot: build_snapshot 결과
+        path: 저장 경로
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # 같은 디렉토리의 고유 임시 파일 (여러 프로세스 / 스레드가 동시에 저장해도 섞이지 않음)
+    fd, tmp_path = tempfile.mkstemp(prefix=f'{os.path.basename(path)}.', suffix='.tmp', dir=directory)
+
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp 는 0600 으로 만들므로 일반 파일 권한으로 (다른 사용자 대시보드도 읽도록)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_snapshot(path, data_dir=None, max_age_seconds=DEFAULT_MAX_AGE_SECONDS):
+    """
+    유효한 스냅샷 로드
+
+    Args:
+        path: 스냅샷 경로
+        data_dir: 원본 파일 디렉토리 (주어지면 원본 변경 여부 확인)
+        max_age_seconds: 최대 유효 시간 (None이면 시간 제한 없음)
+
+    Returns:
+        dict: 스냅샷 (없거나 stale이면 None)
+    """
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"경고: 스냅샷 로드 실패 - {e}")
+        return None
+
+    if snapshot.get('version') != SNAPSHOT_VERSION:
+        return None
+
+    if max_age_seconds is not None and time.time() - snapshot.get('generated_at', 0) > max_age_seconds:
+        return None
+
+    if data_dir is not None and snapshot.get('sources') != _source_mtimes(data_dir):
+        return None
+
+    return snapshot
+
+
+def refresh_snapshot(data_dir=None, output_path=None):
+    """
+    데이터를 로드해 스냅샷을 다시 만들고 저장
+
+    Args:
+        data_dir: 데이터 디렉토리 (None이면 DataLoader 기본값)
+        output_path: 저장 경로 (None이면 data_dir/dashboard_snapshot.json)
+
+    Returns:
+        dict: 저장된 스냅샷
+    """
+    from utils.data_loader import DataLoader
+
+    loader = DataLoader(data_dir)
+    output_path = output_path or os.path.join(loader.data_dir, SNAPSHOT_FILE)
+
+    df_main = loader.load_processed_data(columns=SNAPSHOT_COLUMNS)
+    data = {
+        'coinness': loader.load_coinness_data(),
+        'twitter': loader.load_twitter_data(),
+    }
+
+    snapshot = build_snapshot(df_main, data, data_dir=loader.data_dir)
+    save_snapshot(snapshot, output_path)
+
+    return snapshot
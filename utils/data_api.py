@@ -0,0 +1,505 @@
+"""
+대시보드 데이터 API (로컬 HTTP JSON 서비스)
+
+Next.js 대시보드가 CSV 사본 대신 필요한 시간 범위 / 컬럼만 가져가도록
+DataLoader / CompositeScoreCalculator / SpikeDetector 결과를 HTTP로 제공합니다.
+
+    GET /api/health
+    GET /api/datasets                         데이터셋 목록 (컬럼, 기간, 행 수)
+    GET /api/data/<dataset>?start=&end=&columns=&last=&max_points=&format=json|arrow
+
+- start / end: ISO 시각 (end 포함), last: 데이터 끝에서부터 최근 N시간
+- columns: 쉼표로 구분한 컬럼 (timestamp 는 항상 포함)
+- max_points: 차트용 다운샘플링 (LTTB, 스파이크 보존) - 응답 전체 행 수 상한
+  (여러 컬럼이면 컬럼별 예산으로 나눠 선택한 뒤 합집합이 넘치면 고르게 추림)
+- format=arrow: Arrow IPC 스트림 (pyarrow 필요)
+- 원본 파일이 없는 데이터셋은 컬럼 없는 빈 프레임 (200, rows 0)
+
+응답 캐시:
+- ETag 는 원본 파일 지문(크기, 수정 시각, 데이터 버전) + 쿼리 파라미터로 만든 강한 ETag
+  -> If-None-Match 가 같으면 데이터를 읽지 않고 304
+- Accept-Encoding: gzip 이면 압축 (인코딩별로 ETag 가 다름)
+- 인코딩된 응답 본문은 프로세스 LRU(SharedCache)에 보관 -> 자주 보는 범위는 재직렬화 없음
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.cache import SharedCache, derive_fingerprint, file_fingerprint
+from utils.data_loader import DataLoader
+from utils.time_index import time_index
+from utils.timestamps import normalize_timestamp_column
+
+try:
+    import pyarrow as pa
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# 이보다 작은 본문은 압축하지 않음 (바이트)
+GZIP_MIN_BYTES = 1024
+
+# 응답 본문 LRU 항목 수
+DEFAULT_CACHE_ENTRIES = 256
+
+CONTENT_TYPES = {
+    'json': 'application/json; charset=utf-8',
+    'arrow': 'application/vnd.apache.arrow.stream',
+}
+
+
+def downsample_total(df, max_points):
+    """
+    응답 전체를 max_points 행 이하로 다운샘플링
+
+    수치 컬럼마다 max_points / 컬럼 수 개를 LTTB 로 고르고 (컬럼별 스파이크 보존),
+    합집합이 max_points 를 넘으면 그 안에서 고르게 추립니다.
+
+    Args:
+        df: timestamp 오름차순 데이터프레임
+        max_points: 최대 행 수
+
+    Returns:
+        DataFrame: 최대 max_points 행
+    """
+    from components.downsample import downsample_frame
+
+    numeric = [c for c in df.columns if c != 'timestamp' and pd.api.types.is_numeric_dtype(df[c])]
+    if numeric:
+        # LTTB 는 처음 / 끝 포함 최소 3개
+        df = downsample_frame(df, numeric, max(max_points // len(numeric), 3))
+    if len(df) > max_points:
+        df = df.iloc[np.linspace(0, len(df) - 1, max_points).round().astype(int)]
+    return df
+
+
+class ApiError(Exception):
+    """HTTP 오류 응답"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _to_naive_utc(df):
+    """timestamp 기준 정렬 + tz-aware 는 tz-naive UTC로 변환"""
+    if df.empty or 'timestamp' not in df.columns:
+        return df
+    if df['timestamp'].dt.tz is not None:
+        df = df.copy()
+        df['timestamp'] = df['timestamp'].dt.tz_convert('UTC').dt.tz_localize(None)
+    return df.sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+
+def _scores(loader):
+    """종합 점수 시계열"""
+    from utils.composite_score import CompositeScoreCalculator
+
+    df = loader.load_processed_data()
+    if df.empty:
+        return df
+    scored = CompositeScoreCalculator().calculate_composite_score(
+        df, df_news=loader.load_coinness_data(), df_twitter=loader.load_twitter_data()
+    )
+    columns = ['timestamp', 'telegram_score', 'news_score', 'twitter_score', 'composite_score']
+    return scored[[c for c in columns if c in scored.columns]]
+
+
+def _spikes(loader):
+    """Z-score 스파이크 (텔레그램 메시지 수, 고래 거래 빈도)"""
+    from analysis.spike_detector import SpikeDetector
+
+    df = loader.load_processed_data()
+    if df.empty:
+        return df
+    detector = SpikeDetector(df)
+    frames = [
+        detector.detect_zscore_spike(col, threshold=2.5)[['timestamp', 'spike_column', 'spike_type', 'spike_magnitude']]
+        for col in ['message_count', 'tx_frequency'] if col in df.columns
+    ]
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+
+def _alerts(loader):
+    """다중 소스 알림 (scripts/build_multi_source_alerts.py 결과)"""
+    file_path = os.path.join(loader.data_dir, EXTRA_FILES['alerts'])
+    if not os.path.exists(file_path):
+        print(f"경고: {file_path} 파일이 없습니다.")
+        return pd.DataFrame()
+    return pd.read_csv(file_path, parse_dates=['timestamp'])
+
+
+def news_path(data_dir):
+    """
+    뉴스 원본 CSV 경로 (NEWS_FILES 중 처음 존재하는 파일)
+
+    Args:
+        data_dir: 데이터 디렉토리
+
+    Returns:
+        str: 파일 경로 (모두 없으면 첫 번째 후보)
+    """
+    candidates = [os.path.normpath(os.path.join(data_dir, f)) for f in NEWS_FILES]
+    return next((p for p in candidates if os.path.exists(p)), candidates[0])
+
+
+def _news(loader):
+    """코인니스 뉴스 (Next.js 대시보드가 읽는 CSV 포함)"""
+    file_path = news_path(loader.data_dir)
+    if not os.path.exists(file_path):
+        print(f"경고: {file_path} 파일이 없습니다.")
+        return pd.DataFrame()
+    # 수집/병합 스크립트가 utf-8-sig 로 저장하므로 BOM 제거
+    df = pd.read_csv(file_path, encoding='utf-8-sig')
+    return normalize_timestamp_column(df, 'timestamp', 'coinness')
+
+
+# 뉴스 원본 후보 (데이터 디렉토리 기준, 앞에서부터 처음 있는 파일 사용)
+# - coinness_data.csv: update_all_news_data.py 가 병합한 전체 뉴스
+# - coinness_data2.csv: 수집기 출력 / Next.js 대시보드용 사본 (/api/news/recent 와 같은 순서)
+NEWS_FILES = (
+    'coinness_data.csv',
+    'coinness_data2.csv',
+    os.path.join(os.pardir, 'nextjs-dashboard', 'data', 'coinness_data2.csv'),
+    os.path.join(os.pardir, 'nextjs-dashboard', 'data', 'coinness_data2_latest.csv'),
+)
+
+# DataLoader.get_source_paths() 에 없는 원본 파일
+EXTRA_FILES = {
+    'processed': 'processed_data.csv',
+    'alerts': 'multi_source_alerts.csv',
+}
+
+# 데이터셋 이름 -> (원본 파일 키, 로드 함수)
+# 원본 파일 키는 DataLoader.get_source_paths() 키 또는 EXTRA_FILES 키
+DATASETS = {
+    'processed': (['processed'], lambda loader: loader.load_processed_data()),
+    'scores': (['processed', 'coinness', 'twitter'], _scores),
+    'spikes': (['processed'], _spikes),
+    'whale': (['whale_transactions'], lambda loader: loader.load_whale_transactions()),
+    'price_eth': (['eth_price'], lambda loader: loader.load_price_data('ETH')),
+    'price_btc': (['btc_price'], lambda loader: loader.load_price_data('BTC')),
+    'telegram': (['telegram'], lambda loader: loader.load_telegram_data()),
+    'news': (['news'], _news),
+    'alerts': (['alerts'], _alerts),
+}
+
+
+def encode_frame(name, df, version, fmt='json', double_precision=10):
+    """
+    데이터프레임 -> 응답 본문 (bytes)
+
+    JSON 은 {"dataset", "version", "rows", "frame": split 형식} 입니다.
+
+    Args:
+        name: 데이터셋 이름
+        df: 데이터프레임
+        version: 데이터 버전 문자열
+        fmt: 'json' 또는 'arrow'
+        double_precision: JSON 실수 유효 자릿수
+
+    Returns:
+        bytes: 본문
+    """
+    if fmt == 'arrow':
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    frame = df.to_json(orient='split', index=False, date_format='iso', date_unit='s',
+                       double_precision=double_precision)
+    header = json.dumps({'dataset': name, 'version': version, 'rows': len(df)})
+    return (header[:-1] + ', "frame": ' + frame + '}').encode('utf-8')
+
+
+class DataService:
+    """데이터셋 로드 / 범위 조회 / 응답 인코딩"""
+
+    def __init__(self, data_dir=None, cache=None):
+        """
+        Args:
+            data_dir: 데이터 디렉토리 (기본값: 프로젝트 data/)
+            cache: SharedCache (None이면 새로 생성)
+        """
+        self.loader = DataLoader(data_dir)
+        self.cache = cache or SharedCache(DEFAULT_CACHE_ENTRIES)
+
+    def source_paths(self, name):
+        """데이터셋의 원본 파일 경로 목록"""
+        if name not in DATASETS:
+            raise ApiError(404, f'알 수 없는 데이터셋: {name}')
+        paths = self.loader.get_source_paths()
+        paths.update({key: os.path.join(self.loader.data_dir, f) for key, f in EXTRA_FILES.items()})
+        paths['news'] = news_path(self.loader.data_dir)
+        return [paths[key] for key in DATASETS[name][0]]
+
+    def fingerprint(self, name):
+        """데이터셋 지문 (파일 stat 만 사용 - 데이터를 읽지 않음)"""
+        return file_fingerprint(*self.source_paths(name))
+
+    def frame(self, name):
+        """
+        데이터셋 로드 (원본 지문 기준 캐시)
+
+        Returns:
+            tuple: (timestamp 순 데이터프레임, 지문)
+        """
+        builder = DATASETS[name][1]
+        return self.cache.load_frame(
+            f'api:{name}', self.source_paths(name), lambda: _to_naive_utc(builder(self.loader))
+        )
+
+    def describe(self):
+        """데이터셋 목록 (컬럼, 기간, 행 수, 지문)"""
+        result = []
+        for name in DATASETS:
+            df, fingerprint = self.frame(name)
+            has_ts = not df.empty and 'timestamp' in df.columns
+            result.append({
+                'name': name,
+                'rows': len(df),
+                'columns': list(df.columns),
+                'start': df['timestamp'].iloc[0].isoformat() if has_ts else None,
+                'end': df['timestamp'].iloc[-1].isoformat() if has_ts else None,
+                'version': fingerprint,
+            })
+        return result
+
+    @staticmethod
+    def parse_query(params):
+        """
+        쿼리 문자열 -> 정규화된 조회 파라미터 (ETag 계산에도 사용)
+
+        Args:
+            params: parse_qs 결과
+
+        Returns:
+            dict: start, end, last, columns, max_points, format
+        """
+        def one(key):
+            values = params.get(key)
+            return values[-1] if values else None
+
+        def timestamp(key):
+            value = one(key)
+            if not value:
+                return None
+            try:
+                ts = pd.Timestamp(value)
+            except ValueError:
+                raise ApiError(400, f'{key} 시각 형식이 올바르지 않습니다: {value}')
+            if ts.tz is not None:
+                ts = ts.tz_convert('UTC').tz_localize(None)
+            return ts.isoformat()
+
+        def integer(key):
+            value = one(key)
+            if value is None:
+                return None
+            try:
+                number = int(value)
+            except ValueError:
+                raise ApiError(400, f'{key} 는 정수여야 합니다: {value}')
+            if number <= 0:
+                raise ApiError(400, f'{key} 는 양수여야 합니다: {value}')
+            return number
+
+        fmt = one('format') or 'json'
+        if fmt not in CONTENT_TYPES:
+            raise ApiError(400, f'지원하지 않는 형식: {fmt}')
+        if fmt == 'arrow' and not HAS_PYARROW:
+            raise ApiError(406, 'Arrow 형식에는 pyarrow 가 필요합니다.')
+
+        columns = one('columns')
+        return {
+            'start': timestamp('start'),
+            'end': timestamp('end'),
+            'last': integer('last'),
+            'columns': tuple(c.strip() for c in columns.split(',') if c.strip()) if columns else None,
+            'max_points': integer('max_points'),
+            'format': fmt,
+        }
+
+    def select(self, df, query):
+        """
+        시간 범위 / 컬럼 선택 (utils.time_index 이분 탐색 - 캐시된 프레임은 O(log n))
+
+        Args:
+            df: 데이터셋
+            query: parse_query 결과
+
+        Returns:
+            DataFrame: 선택된 부분
+        """
+        # 원본이 없어 컬럼조차 없는 데이터셋은 빈 프레임 그대로 (컬럼 400 대신)
+        if query['columns'] is not None and len(df.columns):
+            missing = [c for c in query['columns'] if c not in df.columns]
+            if missing:
+                raise ApiError(400, f'없는 컬럼: {", ".join(missing)}')
+
+        index = time_index(df) if not df.empty else None
+        if index is not None:
+            lo, hi = index.bounds(query['start'], query['end'], inclusive_end=True)
+            if query['last'] is not None:
+                lo = max(lo, index.last_bounds(query['last'])[0])
+            df = df.iloc[lo:max(lo, hi)]
+
+        if query['columns'] is not None:
+            columns = ['timestamp'] + [c for c in query['columns'] if c != 'timestamp']
+            df = df[[c for c in columns if c in df.columns]]
+
+        if query['max_points'] is not None and len(df) > query['max_points']:
+            df = downsample_total(df, query['max_points'])
+        return df
+
+    def encode(self, name, df, query, version):
+        """선택된 데이터 -> 응답 본문 (bytes)"""
+        return encode_frame(name, df, version, query['format'])
+
+    def response(self, name, query, accept_gzip=False):
+        """
+        데이터 조회 응답
+
+        Args:
+            name: 데이터셋 이름
+            query: parse_query 결과
+            accept_gzip: 클라이언트가 gzip 을 받는지
+
+        Returns:
+            tuple: (ETag, 본문 함수) - 본문 함수는 (bytes, Content-Encoding 또는 None) 을 반환하며
+                   304 가 아닐 때만 호출 (그때 데이터를 읽음)
+        """
+        version = self.fingerprint(name)
+        tag = derive_fingerprint(version, name, query)
+        etag = f'"{tag}-gz"' if accept_gzip else f'"{tag}"'
+
+        def body():
+            raw = self.cache.get_or_compute(
+                ('api-body', tag),
+                lambda: self.encode(name, self.select(self.frame(name)[0], query), query, version)
+            )
+            if not accept_gzip or len(raw) < GZIP_MIN_BYTES:
+                return raw, None
+            return self.cache.get_or_compute(('api-body-gz', tag), lambda: gzip.compress(raw, 6)), 'gzip'
+
+        return etag, body
+
+
+def _matches(if_none_match, etag):
+    """If-None-Match 헤더가 ETag 와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    tags = [t.strip() for t in if_none_match.split(',')]
+    return '*' in tags or any(t.removeprefix('W/') == etag for t in tags)
+
+
+class DataApiHandler(BaseHTTPRequestHandler):
+    """HTTP 요청 처리 (service 는 create_server 에서 지정)"""
+
+    service = None
+    allow_origin = '*'
+    server_version = 'CryptoSignalDataAPI/1.0'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=b'', headers=None):
+        self.send_response(status)
+        self.send_header('Access-Control-Allow-Origin', self.allow_origin)
+        self.send_header('Access-Control-Expose-Headers', 'ETag, X-Rows')
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send(status, body, {'Content-Type': CONTENT_TYPES['json'], 'Cache-Control': 'no-store'})
+
+    def do_OPTIONS(self):
+        self._send(204, headers={
+            'Access-Control-Allow-Methods': 'GET, HEAD, OPTIONS',
+            'Access-Control-Allow-Headers': 'If-None-Match',
+            'Access-Control-Max-Age': '86400',
+        })
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        parts = [p for p in url.path.split('/') if p]
+        try:
+            if parts == ['api', 'health']:
+                self._send_json(200, {'status': 'ok', 'time': time.time(), 'cache': self.service.cache.stats()})
+            elif parts == ['api', 'datasets']:
+                self._send_json(200, {'datasets': self.service.describe()})
+            elif len(parts) == 3 and parts[:2] == ['api', 'data']:
+                self._data(parts[2], parse_qs(url.query))
+            else:
+                raise ApiError(404, f'없는 경로: {url.path}')
+        except ApiError as e:
+            self._send_json(e.status, {'error': str(e)})
+        except Exception as e:
+            print(f"경고: API 요청 처리 실패 ({self.path}) - {e}")
+            self._send_json(500, {'error': str(e)})
+
+    def _data(self, name, params):
+        query = self.service.parse_query(params)
+        accept_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+        etag, body_fn = self.service.response(name, query, accept_gzip)
+
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+        if _matches(self.headers.get('If-None-Match'), etag):
+            self._send(304, headers=headers)
+            return
+
+        body, encoding = body_fn()
+        headers['Content-Type'] = CONTENT_TYPES[query['format']]
+        if encoding:
+            headers['Content-Encoding'] = encoding
+        self._send(200, body, headers)
+
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, data_dir=None, cache_entries=DEFAULT_CACHE_ENTRIES,
+                  allow_origin='*', quiet=False):
+    """
+    API 서버 생성 (serve_forever 로 실행)
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 임의 포트)
+        data_dir: 데이터 디렉토리
+        cache_entries: 응답/데이터 LRU 항목 수
+        allow_origin: CORS Access-Control-Allow-Origin
+        quiet: 요청 로그 생략
+
+    Returns:
+        ThreadingHTTPServer
+    """
+    handler = type('Handler', (DataApiHandler,), {
+        'service': DataService(data_dir, SharedCache(cache_entries)),
+        'allow_origin': allow_origin,
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.quiet = quiet
+    return server
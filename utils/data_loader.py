@@ -3,12 +3,20 @@
 
 모든 데이터 파일을 로드하고 기본 전처리를 수행합니다.
 파일이 없으면 빈 DataFrame을 반환하여 앱이 중단되지 않도록 합니다.
+모든 소스의 timestamp 는 tz-naive UTC datetime64[ns] 로 통일합니다. (utils/timestamps.py)
 """
 
 import pandas as pd
 import numpy as np
 from datetime import datetime
 import os
+import sys
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.lazy_frame import LazyFrame
+from utils.profiling import instrument
+from utils.timestamps import normalize_timestamp_column
 
 
 class DataLoader:
@@ -26,6 +34,24 @@ class DataLoader:
             data_dir = os.path.join(project_root, 'data')
         self.data_dir = data_dir
         
+    def get_source_paths(self):
+        """
+        load_all_data()가 읽는 원본 파일 경로
+        
+        Returns:
+            dict: 데이터 이름 -> 파일 경로
+        """
+        files = {
+            'whale_transactions': 'whale_transactions_rows_ETH_rev1.csv',
+            'eth_price': 'price_history_eth_rows.csv',
+            'btc_price': 'price_history_btc_rows.csv',
+            'telegram': 'telegram_data.csv',
+            'twitter': 'twitter_influencer_labeled_rows.csv',
+            'coinness': 'coinness_data.csv'
+        }
+        return {name: os.path.join(self.data_dir, f) for name, f in files.items()}
+    
+    @instrument()
     def load_whale_transactions(self):
         """
         고래 지갑 거래 데이터 로드 (시간별 집계)
@@ -41,25 +67,19 @@ class DataLoader:
         
         try:
             df = pd.read_csv(file_path)
-            df['Time'] = pd.to_datetime(df['Time'], errors='coerce')
-            df = df.dropna(subset=['Time'])
-            
-            if df['Time'].dt.tz is not None:
-                df['Time'] = df['Time'].dt.tz_localize(None)
+            df = normalize_timestamp_column(df, 'Time', 'whale_transactions')
             
             df = df.rename(columns={
-                'Time': 'timestamp',
                 'frequency': 'tx_frequency',
                 'sum_amount': 'tx_amount',
                 'sum_amount_usd': 'tx_amount_usd'
             })
-            
-            df = df.sort_values('timestamp').reset_index(drop=True)
             return df
         except Exception as e:
             print(f"경고: 고래 거래 데이터 로드 실패 - {e}")
             return pd.DataFrame()
     
+    @instrument()
     def load_price_data(self, coin='ETH'):
         """
         가격 데이터 로드
@@ -68,7 +88,7 @@ class DataLoader:
             coin: 'ETH' 또는 'BTC'
             
         Returns:
-            DataFrame: 가격 데이터 (없으면 빈 DataFrame)
+            DataFrame: 가격 데이터 (timestamp 는 tz-naive UTC, 없으면 빈 DataFrame)
         """
         file_path = os.path.join(self.data_dir, f'price_history_{coin.lower()}_rows.csv')
         
@@ -78,23 +98,19 @@ class DataLoader:
         
         try:
             df = pd.read_csv(file_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-            df = df.dropna(subset=['timestamp'])
-            
-            if df['timestamp'].dt.tz is None:
-                df['timestamp'] = df['timestamp'].dt.tz_localize('UTC')
-            else:
-                df['timestamp'] = df['timestamp'].dt.tz_convert('UTC')
+            df = normalize_timestamp_column(df, 'timestamp', 'price')
             
+            # open_price -> open 등 컬럼명 정규화 후 코인 접두사 추가
+            df = df.rename(columns=lambda col: col[:-len('_price')] if col.endswith('_price') else col)
             rename_dict = {col: f'{coin}_{col}' for col in df.columns if col != 'timestamp'}
             df = df.rename(columns=rename_dict)
-            df = df.sort_values('timestamp').reset_index(drop=True)
             
             return df
         except Exception as e:
             print(f"경고: {coin} 가격 데이터 로드 실패 - {e}")
             return pd.DataFrame()
     
+    @instrument()
     def load_telegram_data(self):
         """
         텔레그램 데이터 로드
@@ -110,20 +126,17 @@ class DataLoader:
         
         try:
             df = pd.read_csv(file_path)
-            df['date'] = pd.to_datetime(df['date'], errors='coerce')
-            df = df.dropna(subset=['date'])
-            
-            if df['date'].dt.tz is not None:
-                df['date'] = df['date'].dt.tz_localize(None)
             
-            df = df.rename(columns={'date': 'timestamp'})
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            # 수집 버전에 따라 시간 컬럼명이 'date' 또는 'timestamp'
+            date_col = 'date' if 'date' in df.columns else 'timestamp'
+            df = normalize_timestamp_column(df, date_col, 'telegram')
             
             return df
         except Exception as e:
             print(f"경고: 텔레그램 데이터 로드 실패 - {e}")
             return pd.DataFrame()
     
+    @instrument()
     def load_twitter_data(self):
         """
         트위터 인플루언서 데이터 로드
@@ -139,20 +152,14 @@ class DataLoader:
         
         try:
             df = pd.read_csv(file_path)
-            df['post_date'] = pd.to_datetime(df['post_date'], errors='coerce')
-            df = df.dropna(subset=['post_date'])
-            
-            if df['post_date'].dt.tz is not None:
-                df['post_date'] = df['post_date'].dt.tz_localize(None)
-            
-            df = df.rename(columns={'post_date': 'timestamp'})
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            df = normalize_timestamp_column(df, 'post_date', 'twitter')
             
             return df
         except Exception as e:
             print(f"경고: 트위터 데이터 로드 실패 - {e}")
             return pd.DataFrame()
     
+    @instrument()
     def load_coinness_data(self):
         """
         코인니스 뉴스 데이터 로드
@@ -168,19 +175,53 @@ class DataLoader:
         
         try:
             df = pd.read_csv(file_path)
-            df['timestamp'] = pd.to_datetime(df['timestamp'], errors='coerce')
-            df = df.dropna(subset=['timestamp'])
-            
-            if df['timestamp'].dt.tz is not None:
-                df['timestamp'] = df['timestamp'].dt.tz_localize(None)
-            
-            df = df.sort_values('timestamp').reset_index(drop=True)
+            df = normalize_timestamp_column(df, 'timestamp', 'coinness')
             
             return df
         except Exception as e:
             print(f"경고: 코인니스 데이터 로드 실패 - {e}")
             return pd.DataFrame()
     
+    @instrument()
+    def load_processed_data(self, columns=None):
+        """
+        전처리 데이터 로드 (필요한 컬럼만)
+        
+        Args:
+            columns: 로드할 컬럼 리스트 (None이면 전체, 없는 컬럼은 무시)
+            
+        Returns:
+            DataFrame: 전처리 데이터 (없으면 빈 DataFrame)
+        """
+        lazy = self.lazy_processed_data(columns)
+        return lazy.to_frame() if lazy is not None else pd.DataFrame()
+    
+    def lazy_processed_data(self, columns=None):
+        """
+        전처리 데이터의 지연 로딩 프레임 반환
+        
+        선언한 컬럼만 먼저 읽고, 나머지 컬럼은 처음 접근할 때 로드합니다.
+        
+        Args:
+            columns: 먼저 로드할 컬럼 리스트 (None이면 전체)
+            
+        Returns:
+            LazyFrame: 지연 로딩 프레임 (파일이 없으면 None)
+        """
+        file_path = os.path.join(self.data_dir, 'processed_data.csv')
+        
+        if not os.path.exists(file_path):
+            print(f"경고: {file_path} 파일이 없습니다.")
+            return None
+        
+        try:
+            if columns is not None and 'timestamp' not in columns:
+                columns = ['timestamp'] + list(columns)
+            return LazyFrame(file_path, columns=columns)
+        except Exception as e:
+            print(f"경고: 전처리 데이터 로드 실패 - {e}")
+            return None
+    
     def load_all_data(self):
         """
         모든 데이터를 로드하고 반환
@@ -0,0 +1,222 @@
+"""
+파생 변수 커널
+
+선언적 명세(FEATURE_SPEC)에 적힌 컬럼 묶음 전체의 변화율 / 이동 평균 / 이동 표준편차 /
+Z-score / 볼린저 밴드를 [시간, 컬럼] 2차원 배열 연산 한 번으로 계산해
+미리 할당한 출력 배열에 바로 씁니다.
+
+- 변화율: x[t] / x[t-1] - 1 (%) - pandas pct_change 와 동일 (결측치 채움 없음)
+- 이동 평균/표준편차: 누적합 기반 O(T), 결측치 제외, 표본 1개면 표준편차 NaN
+  (pandas rolling(window, min_periods=1).mean()/.std() 와 동일)
+- Z-score: (x - ma) / (std + 1e-10)
+- 볼린저 밴드: ma ± k * std
+
+컬럼이 수백 개로 늘어나도 컬럼별 pandas 호출 / 임시 Series 가 생기지 않습니다.
+
+명세 항목:
+    column:   원본 컬럼
+    name:     출력 컬럼 이름 접두어 (기본값: column)
+    features: 'change_pct', 'ma', 'std', 'zscore' 중 계산할 것
+    bands:    볼린저 밴드 출력 접두어 (없으면 생략) -> <bands>_upper, <bands>_lower
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# processed_data.csv 파생 변수 명세
+FEATURE_SPEC = [
+    {'column': 'ETH_close', 'name': 'ETH_price', 'features': ['change_pct', 'ma', 'std', 'zscore'], 'bands': 'ETH_bb'},
+    {'column': 'BTC_close', 'name': 'BTC_price', 'features': ['change_pct']},
+    {'column': 'ETH_volume', 'features': ['change_pct']},
+    {'column': 'BTC_volume', 'features': ['change_pct']},
+    {'column': 'tx_frequency', 'features': ['change_pct', 'ma', 'std', 'zscore']},
+    {'column': 'tx_amount', 'features': ['change_pct']},
+    {'column': 'message_count', 'features': ['change_pct', 'ma', 'std', 'zscore']},
+    {'column': 'avg_views', 'features': ['change_pct']},
+    {'column': 'total_reactions', 'features': ['change_pct']},
+]
+
+FEATURES = ('change_pct', 'ma', 'std', 'zscore')
+
+
+def _window_sums(values, window):
+    """[시간, 컬럼] 배열의 최근 window개 합 (누적합 차분, 처음 window-1 행은 앞부분 전체 합)"""
+    sums = np.cumsum(values, axis=0)
+    sums[window:] -= sums[:-window].copy()
+    return sums
+
+
+def rolling_mean_std(x, window):
+    """
+    [시간, 컬럼] 배열의 이동 평균 / 표본 표준편차 (min_periods=1, 결측치 제외)
+
+    Args:
+        x: [시간, 컬럼] 배열
+        window: 윈도우 크기
+
+    Returns:
+        tuple: (mean, std) 각 [시간, 컬럼]
+    """
+    valid = np.isfinite(x)
+    has_missing = not valid.all()
+    with np.errstate(invalid='ignore'):
+        # 상쇄 오차를 줄이기 위해 컬럼 평균을 빼고 누적
+        offset = np.nanmean(np.where(valid, x, np.nan), axis=0) if has_missing else x.mean(axis=0)
+    offset = np.nan_to_num(offset)
+    centered = x - offset
+    if has_missing:
+        centered[~valid] = 0.0
+        n = _window_sums(valid.astype(np.float64), window)
+    else:
+        n = np.minimum(np.arange(1, x.shape[0] + 1, dtype=np.float64), window)[:, None]
+
+    s1 = _window_sums(centered, window)
+    centered *= centered
+    total2 = np.cumsum(centered, axis=0)
+    s2 = _window_sums(centered, window)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = s1 / n
+        s1 *= mean
+        s2 -= s1
+        # 누적합 반올림 오차 수준의 편차 제곱합은 상수 구간으로 보고 0
+        s2[s2 <= 1e-12 * total2] = 0.0
+        s2 /= n - 1
+        std = np.sqrt(s2, out=s2)
+
+    mean += offset
+    if has_missing:
+        mean[n < 1] = np.nan
+    std[np.broadcast_to(n < 2, std.shape)] = np.nan
+    return mean, std
+
+
+class FeatureKernel:
+    """선언적 명세 기반 파생 변수 일괄 계산"""
+
+    def __init__(self, spec=None, window=24, band_k=2):
+        """
+        Args:
+            spec: 파생 변수 명세 (None이면 FEATURE_SPEC)
+            window: 이동 윈도우 크기 (시간)
+            band_k: 볼린저 밴드 표준편차 배수
+        """
+        self.spec = FEATURE_SPEC if spec is None else spec
+        self.window = window
+        self.band_k = band_k
+
+    def _suffix(self, feature):
+        return {'change_pct': 'change_pct', 'ma': f'ma{self.window}',
+                'std': f'std{self.window}', 'zscore': 'zscore'}[feature]
+
+    def plan(self, columns):
+        """
+        입력 컬럼 기준 계산 계획
+
+        원본 컬럼이 없는 명세 항목은 건너뜁니다.
+        출력 순서는 변화율 -> 이동 평균 -> 이동 표준편차 -> Z-score -> 볼린저 밴드 입니다.
+
+        Args:
+            columns: 입력 데이터프레임 컬럼
+
+        Returns:
+            tuple: (입력 컬럼 목록, {기능: [(입력 위치, 출력 이름)]}, [(입력 위치, 밴드 접두어)])
+        """
+        entries = [e for e in self.spec if e['column'] in columns]
+        inputs = [e['column'] for e in entries]
+        outputs = {
+            feature: [
+                (i, f"{e.get('name', e['column'])}_{self._suffix(feature)}")
+                for i, e in enumerate(entries) if feature in e['features']
+            ]
+            for feature in FEATURES
+        }
+        bands = [(i, e['bands']) for i, e in enumerate(entries) if e.get('bands')]
+        return inputs, outputs, bands
+
+    def band_columns(self, columns):
+        """볼린저 밴드 출력 컬럼 이름 목록"""
+        _, _, bands = self.plan(columns)
+        return [f'{prefix}_{side}' for _, prefix in bands for side in ('upper', 'lower')]
+
+    def output_columns(self, columns):
+        """출력 컬럼 이름 목록 (compute 의 출력 열 순서)"""
+        _, outputs, _ = self.plan(columns)
+        return [name for feature in FEATURES for _, name in outputs[feature]] + self.band_columns(columns)
+
+    def compute(self, values, columns, out=None):
+        """
+        파생 변수 계산
+
+        Args:
+            values: [시간, 입력 컬럼] 배열 (plan(columns) 의 입력 컬럼 순서)
+            columns: 입력 데이터프레임 컬럼 (plan 기준)
+            out: [시간, 출력 컬럼] 출력 배열 (None이면 새로 할당, Fortran 순서 권장)
+
+        Returns:
+            ndarray: out
+        """
+        _, outputs, bands = self.plan(columns)
+        x = np.asarray(values, dtype=np.float64)
+        T = x.shape[0]
+        n_out = sum(len(v) for v in outputs.values()) + 2 * len(bands)
+        if out is None:
+            out = np.empty((T, n_out), dtype=np.float64, order='F')
+
+        need_moments = sorted({i for f in ('ma', 'std', 'zscore') for i, _ in outputs[f]} | {i for i, _ in bands})
+        if need_moments:
+            mean, std = rolling_mean_std(x[:, need_moments], self.window)
+            pos = {i: k for k, i in enumerate(need_moments)}
+
+        col = 0
+        with np.errstate(invalid='ignore', divide='ignore'):
+            idx = [i for i, _ in outputs['change_pct']]
+            if idx:
+                block = out[:, col:col + len(idx)]
+                block[0] = np.nan
+                np.divide(x[1:, idx], x[:-1, idx], out=block[1:])
+                block[1:] -= 1
+                block[1:] *= 100
+                col += len(idx)
+
+            for feature in ('ma', 'std', 'zscore'):
+                idx = [pos[i] for i, _ in outputs[feature]]
+                if not idx:
+                    continue
+                block = out[:, col:col + len(idx)]
+                if feature == 'ma':
+                    block[:] = mean[:, idx]
+                elif feature == 'std':
+                    block[:] = std[:, idx]
+                else:
+                    src = [i for i, _ in outputs[feature]]
+                    np.divide(x[:, src] - mean[:, idx], std[:, idx] + 1e-10, out=block)
+                    # 상수 구간은 현재 값 = 평균 (누적합 반올림 오차가 1e-10 으로 나뉘어 커지지 않도록)
+                    block[std[:, idx] == 0] = 0.0
+                col += len(idx)
+
+            for i, _ in bands:
+                k = pos[i]
+                out[:, col] = mean[:, k] + self.band_k * std[:, k]
+                out[:, col + 1] = mean[:, k] - self.band_k * std[:, k]
+                col += 2
+
+        # 0으로 나눈 변화율 등 무한대는 NaN
+        out[~np.isfinite(out)] = np.nan
+        return out
+
+    def transform(self, df):
+        """
+        데이터프레임 -> 파생 변수 데이터프레임 (같은 인덱스)
+
+        Args:
+            df: 입력 데이터프레임
+
+        Returns:
+            DataFrame: output_columns 순서의 파생 변수
+        """
+        inputs, _, _ = self.plan(df.columns)
+        values = df[inputs].to_numpy(dtype=np.float64)
+        out = self.compute(values, df.columns)
+        return pd.DataFrame(out, index=df.index, columns=self.output_columns(df.columns))
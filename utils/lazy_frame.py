@@ -0,0 +1,227 @@
+"""
+지연 로딩 프레임
+
+대시보드 페이지가 필요한 컬럼만 선언하면 해당 컬럼만 읽어옵니다.
+- CSV는 usecols로 필요한 컬럼만 파싱
+- pyarrow가 있으면 컬럼형 캐시(parquet)에서 컬럼 단위로 읽기
+  (캐시는 전처리 저장 시점이나 전체 컬럼을 읽을 때만 만들고, 일부 컬럼 요청 때문에 CSV 전체를 읽지 않음)
+- 선언하지 않은 컬럼은 처음 접근할 때 추가로 로드
+"""
+
+import os
+import tempfile
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+
+# 날짜로 파싱할 컬럼
+DATE_COLUMNS = ('timestamp',)
+
+
+def cache_path_for(path, cache_dir=None):
+    """
+    CSV에 대응하는 parquet 캐시 경로
+
+    Args:
+        path: CSV 파일 경로
+        cache_dir: 캐시 디렉토리 (기본값: CSV 옆의 .cache/)
+
+    Returns:
+        str: 캐시 파일 경로
+    """
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(path), '.cache')
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f'{name}.parquet')
+
+
+def write_cache(df, path, cache_dir=None):
+    """
+    CSV와 같은 내용의 parquet 캐시 저장 (pyarrow가 없으면 아무것도 하지 않음)
+
+    같은 디렉토리의 고유 임시 파일에 쓴 뒤 교체하므로
+    여러 프로세스가 동시에 만들어도 깨진 캐시를 읽지 않습니다.
+
+    Args:
+        df: CSV 전체 내용 (timestamp 는 datetime)
+        path: CSV 파일 경로
+        cache_dir: 캐시 디렉토리 (기본값: CSV 옆의 .cache/)
+
+    Returns:
+        bool: 저장 성공 여부
+    """
+    if not HAS_PYARROW:
+        return False
+
+    cache_path = cache_path_for(path, cache_dir)
+    directory = os.path.dirname(cache_path)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f'{os.path.basename(cache_path)}.', suffix='.tmp', dir=directory)
+        os.close(fd)
+    except OSError as e:
+        print(f"경고: 컬럼형 캐시 생성 실패 - {e}")
+        return False
+
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, cache_path)
+        return True
+    except Exception as e:
+        print(f"경고: 컬럼형 캐시 생성 실패 - {e}")
+        return False
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+class LazyFrame:
+    """컬럼 단위 지연 로딩 데이터프레임"""
+
+    def __init__(self, path, columns=None, cache_dir=None, use_cache=True):
+        """
+        Args:
+            path: CSV 파일 경로
+            columns: 처음에 로드할 컬럼 리스트 (None이면 전체)
+            cache_dir: 컬럼형 캐시 디렉토리 (기본값: CSV 옆의 .cache/)
+            use_cache: 컬럼형 캐시 사용 여부 (pyarrow 필요)
+        """
+        self.path = path
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache and HAS_PYARROW
+
+        self._available = None
+        self._frame = pd.DataFrame()
+
+        if columns is None:
+            columns = self.available_columns
+        self.ensure(columns)
+
+    @property
+    def available_columns(self):
+        """파일에 존재하는 전체 컬럼 (헤더만 읽음)"""
+        if self._available is None:
+            if not os.path.exists(self.path):
+                self._available = []
+            else:
+                self._available = pd.read_csv(self.path, nrows=0).columns.tolist()
+        return self._available
+
+    @property
+    def columns(self):
+        """현재 메모리에 로드된 컬럼"""
+        return self._frame.columns
+
+    @property
+    def empty(self):
+        return self._frame.empty
+
+    def __len__(self):
+        return len(self._frame)
+
+    def __contains__(self, column):
+        return column in self.available_columns
+
+    def __getitem__(self, key):
+        """
+        컬럼 접근 - 로드되지 않은 컬럼은 이 시점에 로드
+
+        Args:
+            key: 컬럼명 또는 컬럼 리스트
+
+        Returns:
+            Series 또는 DataFrame
+        """
+        if isinstance(key, str):
+            if key not in self.available_columns:
+                raise KeyError(key)
+            self.ensure([key])
+            return self._frame[key]
+
+        missing = [c for c in key if c not in self.available_columns]
+        if missing:
+            raise KeyError(missing)
+        self.ensure(key)
+        return self._frame[list(key)]
+
+    def ensure(self, columns):
+        """
+        지정한 컬럼이 메모리에 있도록 보장 (없는 컬럼은 무시)
+
+        Args:
+            columns: 컬럼 리스트
+
+        Returns:
+            LazyFrame: self
+        """
+        missing = [
+            c for c in columns
+            if c in self.available_columns and c not in self._frame.columns
+        ]
+        if not missing:
+            return self
+
+        new_data = self._read_columns(missing)
+
+        if self._frame.empty and len(self._frame.columns) == 0:
+            self._frame = new_data
+        else:
+            for col in missing:
+                self._frame[col] = new_data[col].values
+
+        # 원본 파일의 컬럼 순서 유지
+        ordered = [c for c in self.available_columns if c in self._frame.columns]
+        self._frame = self._frame[ordered]
+        return self
+
+    def to_frame(self, columns=None):
+        """
+        로드된 컬럼으로 DataFrame 반환
+
+        Args:
+            columns: 포함할 컬럼 (None이면 로드된 전체)
+
+        Returns:
+            DataFrame
+        """
+        if columns is None:
+            return self._frame
+        self.ensure(columns)
+        return self._frame[[c for c in columns if c in self._frame.columns]]
+
+    def _read_columns(self, columns):
+        """컬럼형 캐시 또는 CSV에서 컬럼 읽기"""
+        if self.use_cache:
+            cache_path = self._cache_path()
+            if cache_path is not None:
+                return pd.read_parquet(cache_path, columns=columns)
+
+        parse_dates = [c for c in DATE_COLUMNS if c in columns]
+        df = pd.read_csv(self.path, usecols=columns, parse_dates=parse_dates)[columns]
+
+        # 전체 컬럼을 읽은 경우에만 추가 비용 없이 캐시 생성
+        if self.use_cache and set(self.available_columns) <= set(columns):
+            self.use_cache = write_cache(df, self.path, self.cache_dir)
+        return df
+
+    def _cache_path(self):
+        """
+        CSV와 동기화된 parquet 캐시 경로 반환
+
+        캐시가 없거나 CSV보다 오래되었으면 None을 반환합니다
+        (이때는 CSV에서 요청한 컬럼만 읽음).
+        """
+        cache_path = cache_path_for(self.path, self.cache_dir)
+        try:
+            if os.path.getmtime(cache_path) >= os.path.getmtime(self.path):
+                return cache_path
+        except OSError:
+            pass
+        return None
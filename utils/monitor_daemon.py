@@ -0,0 +1,317 @@
+"""
+백그라운드 모니터링 데몬
+
+Streamlit 페이지 렌더링과 분리된 상시 실행 프로세스로, asyncio 일정에 따라
+- check_interval_seconds 마다 원본 파일(고래 / 텔레그램 / 트위터) 지문을 확인하고
+  바뀌었으면 새로 확정된 시간 행만 FeatureKernel 로 Z-score 를 계산(전처리)한 뒤
+  PriorityEngine 규칙으로 점수화
+  (Z-score 윈도우에 필요한 직전 window_hours-1 행만 이력으로 유지 -> 전체 재계산 없음)
+- alert_cooldown_hours 안에 같은 레벨 알람이 이미 나갔으면 생략하고 AlertSystem 이력에 기록
+- 전처리 데이터가 바뀌면 대시보드 스냅샷(종합 점수, 스파이크 등)을 다시 만들어 게시
+- 상태(마지막 처리 시각, 최신 Z-score, 가중 신호 등)를 monitor_status.json 에 원자적으로 저장
+  (확인 / 스냅샷 작업은 각각 스레드에서 돌므로 상태 변경과 저장은 잠금으로 직렬화)
+
+가장 최근 시간 버킷은 아직 데이터가 들어오는 중일 수 있으므로
+다음 시간 행이 나타날 때 확정해서 점수화합니다.
+재시작하면 monitor_status.json 의 last_timestamp 이후 행부터 이어서 처리합니다.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from analysis.priority_engine import PriorityEngine, build_source_frame
+from utils.alert_system import AlertSystem
+from utils.cache import file_fingerprint
+from utils.dashboard_snapshot import SNAPSHOT_FILE, load_snapshot, refresh_snapshot, save_snapshot
+from utils.data_loader import DataLoader
+from utils.feature_kernel import FeatureKernel
+
+
+STATUS_FILE = 'monitor_status.json'
+ALERT_HISTORY_FILE = 'alert_history.csv'
+
+# 소스 프레임을 만드는 원본 파일 (DataLoader.get_source_paths() 키)
+SOURCE_KEYS = ['whale_transactions', 'telegram', 'twitter']
+
+# 소스 이름 -> 가중치 설정 키 (monitor_config.json)
+WEIGHT_KEYS = {'telegram': 'telegram_weight', 'whale': 'whale_weight', 'twitter': 'twitter_weight'}
+
+# 스냅샷 갱신 확인 간격 (초)
+DEFAULT_SNAPSHOT_INTERVAL_SECONDS = 300
+
+
+def _iso(value):
+    return pd.Timestamp(value).isoformat() if value is not None and not pd.isna(value) else None
+
+
+class MonitorDaemon:
+    """증분 스파이크 감지 + 알람 기록 + 스냅샷 게시"""
+
+    def __init__(self, data_dir=None, config_path=None, interval=None,
+                 snapshot_interval=DEFAULT_SNAPSHOT_INTERVAL_SECONDS, backfill_hours=0, publish_snapshot=True):
+        """
+        Args:
+            data_dir: 데이터 디렉토리 (기본값: 프로젝트 data/)
+            config_path: 모니터링 설정 (기본값: data/monitor_config.json)
+            interval: 확인 간격 (초, None이면 check_interval_seconds)
+            snapshot_interval: 스냅샷 갱신 확인 간격 (초)
+            backfill_hours: 처음 시작할 때 점수화할 최근 시간 수 (0이면 이후 들어오는 행만)
+            publish_snapshot: 대시보드 스냅샷 게시 여부
+        """
+        self.loader = DataLoader(data_dir)
+        self.engine = PriorityEngine(config_path=config_path)
+        config = self.engine.config
+
+        self.interval = float(interval or config.get('check_interval_seconds', 60))
+        self.snapshot_interval = float(snapshot_interval)
+        self.cooldown = pd.Timedelta(hours=float(config.get('alert_cooldown_hours', 1)))
+        self.weights = np.array([float(config.get(WEIGHT_KEYS.get(s['name'], ''), 0)) for s in self.engine.sources])
+        # 소스별 롤링 Z-score (PriorityEngine.score 의 rolling_zscores 와 같은 정의)
+        self.kernel = FeatureKernel([{'column': c, 'features': ['zscore']} for c in self.engine.columns],
+                                    window=self.engine.window)
+        self.backfill_hours = backfill_hours
+        self.publish_snapshot = publish_snapshot
+
+        self.status_path = os.path.join(self.loader.data_dir, STATUS_FILE)
+        self.snapshot_path = os.path.join(self.loader.data_dir, SNAPSHOT_FILE)
+        self.alerts = AlertSystem(os.path.join(self.loader.data_dir, ALERT_HISTORY_FILE))
+
+        paths = self.loader.get_source_paths()
+        self.source_paths = [paths[key] for key in SOURCE_KEYS]
+
+        # 증분 상태
+        self.history = None          # 점수화가 끝난 마지막 window-1 행
+        self.last_timestamp = None   # 점수화가 끝난 마지막 시간
+        self.fingerprint = None
+        self.last_sent = {}          # 레벨 -> 마지막으로 기록한 알람 이벤트 시각
+        self.latest = {}
+        self.stats = {'checks': 0, 'rows': 0, 'alerts': 0, 'suppressed': 0, 'snapshots': 0, 'errors': 0}
+        # 확인 / 스냅샷 스레드가 함께 쓰는 상태(stats, latest, last_sent)와 상태 파일 저장 보호
+        self._lock = threading.RLock()
+        self._resume()
+
+    def _resume(self):
+        """이전 상태 파일에서 마지막 처리 시각 / 쿨다운 복원"""
+        if not os.path.exists(self.status_path):
+            return
+        try:
+            with open(self.status_path, 'r', encoding='utf-8') as f:
+                status = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"경고: 모니터링 상태 로드 실패 - {e}")
+            return
+        if status.get('last_timestamp'):
+            self.last_timestamp = pd.Timestamp(status['last_timestamp'])
+        self.last_sent = {level: pd.Timestamp(ts) for level, ts in status.get('last_sent', {}).items()}
+
+    def poll(self):
+        """
+        새로 확정된 시간 행
+
+        Returns:
+            DataFrame: 이전 확인 이후 확정된 행 (원본이 그대로면 빈 프레임)
+        """
+        fingerprint = file_fingerprint(*self.source_paths)
+        if fingerprint == self.fingerprint:
+            return pd.DataFrame()
+
+        frame = build_source_frame(self.loader)
+        self.fingerprint = fingerprint
+        if frame.empty:
+            return frame
+
+        # 마지막 시간 버킷은 아직 채워지는 중 -> 다음 확인에서 확정
+        final = frame[frame['timestamp'] < frame['timestamp'].iloc[-1]]
+        if final.empty:
+            return final
+
+        if self.history is None:
+            start = self.last_timestamp
+            if start is None:
+                start = final['timestamp'].iloc[-1] - pd.Timedelta(hours=self.backfill_hours)
+            warmup = final[final['timestamp'] <= start]
+            self.history = warmup.tail(self.engine.window - 1).reset_index(drop=True)
+            self.last_timestamp = start
+
+        return final[final['timestamp'] > self.last_timestamp].reset_index(drop=True)
+
+    def preprocess(self, rows):
+        """
+        이력 + 새 행의 소스별 Z-score (FeatureKernel, 새 행 구간만 계산)
+
+        Args:
+            rows: poll() 결과
+
+        Returns:
+            tuple: (이력 + 새 행 데이터프레임, [행, 소스] Z-score)
+        """
+        context = pd.concat([self.history, rows], ignore_index=True) if len(self.history) else rows
+        context = context.reset_index(drop=True)
+        zscores = self.kernel.compute(context[self.engine.columns].to_numpy(dtype=np.float64), self.engine.columns)
+        return context, zscores
+
+    def detect(self, rows, prepared=None):
+        """
+        새 행 점수화 (이력 + 새 행만 계산, 전체 기간 계산과 같은 Z-score)
+
+        Args:
+            rows: poll() 결과
+            prepared: preprocess(rows) 결과 (None이면 여기서 계산)
+
+        Returns:
+            DataFrame: 새 행의 알람 (PriorityResult.to_frame 형식)
+        """
+        context, zscores = self.preprocess(rows) if prepared is None else prepared
+        result = self.engine.score(context, zscores=zscores)
+        alerts = result.to_frame(first_row=len(context) - len(rows))
+
+        last = len(context) - 1
+        z = result.zscores[last]
+        self.latest = {
+            'timestamp': _iso(context['timestamp'].iloc[last]),
+            'zscores': {s['name']: (float(v) if np.isfinite(v) else None) for s, v in zip(self.engine.sources, z)},
+            'weighted_signal': float(np.nansum(z * self.weights)),
+            'priority_score': int(result.priority[last]),
+            'alert_level': str(result.level[last]) or None,
+        }
+
+        self.history = context.tail(self.engine.window - 1).reset_index(drop=True)
+        self.last_timestamp = context['timestamp'].iloc[last]
+        return alerts
+
+    def apply_cooldown(self, alerts):
+        """
+        같은 레벨 알람은 alert_cooldown_hours 에 한 번만 (이벤트 시각 기준)
+
+        Returns:
+            DataFrame: 기록할 알람 (시간 순)
+        """
+        keep = []
+        for row in alerts.sort_values('timestamp', kind='stable').itertuples(index=False):
+            ts = pd.Timestamp(row.timestamp)
+            previous = self.last_sent.get(row.alert_level)
+            if previous is not None and ts - previous < self.cooldown:
+                continue
+            self.last_sent[row.alert_level] = ts
+            keep.append(row)
+        self.stats['suppressed'] += len(alerts) - len(keep)
+        return pd.DataFrame(keep, columns=alerts.columns)
+
+    def record(self, alerts):
+        """AlertSystem 이력에 기록 (레벨은 소문자, 크기는 우선순위 점수)"""
+        if alerts.empty:
+            return
+        self.alerts.add_alerts(pd.DataFrame({
+            'timestamp': alerts['timestamp'],
+            'alert_level': alerts['alert_level'].str.lower(),
+            'alert_type': 'multi_source',
+            'alert_message': alerts['reasons'],
+            'spike_magnitude': alerts['priority_score'],
+        }))
+        self.stats['alerts'] += len(alerts)
+
+    def check(self):
+        """
+        한 번 확인 (동기 - 이벤트 루프에서는 스레드로 실행)
+
+        Returns:
+            int: 기록한 알람 수
+        """
+        self._count('checks')
+        rows = self.poll()
+        if rows.empty:
+            return 0
+
+        with self._lock:
+            alerts = self.apply_cooldown(self.detect(rows))
+            self.record(alerts)
+            self.stats['rows'] += len(rows)
+
+        if len(alerts):
+            print(f"[{pd.Timestamp.now():%H:%M:%S}] 새 행 {len(rows)}개, 알람 {len(alerts)}개 "
+                  f"(최고 {alerts['alert_level'].iloc[alerts['priority_score'].argmax()]})")
+        self.write_status()
+        return len(alerts)
+
+    def refresh_snapshot(self):
+        """전처리 데이터 / 뉴스 / 트위터가 바뀌었으면 대시보드 스냅샷 다시 생성"""
+        if load_snapshot(self.snapshot_path, self.loader.data_dir, max_age_seconds=None) is not None:
+            return False
+        refresh_snapshot(self.loader.data_dir, self.snapshot_path)
+        self._count('snapshots')
+        self.write_status()
+        return True
+
+    def _count(self, key, n=1):
+        with self._lock:
+            self.stats[key] += n
+
+    def status(self):
+        """현재 상태 (JSON 호환)"""
+        with self._lock:
+            return {
+                'version': 1,
+                'generated_at': time.time(),
+                'pid': os.getpid(),
+                'interval_seconds': self.interval,
+                'last_timestamp': _iso(self.last_timestamp),
+                'last_sent': {level: _iso(ts) for level, ts in self.last_sent.items()},
+                'latest': dict(self.latest),
+                'stats': dict(self.stats),
+            }
+
+    def write_status(self):
+        """상태 파일 저장 (잠금 안에서 만들고 저장 -> 오래된 상태가 새 상태를 덮어쓰지 않음)"""
+        with self._lock:
+            save_snapshot(self.status(), self.status_path)
+
+    async def _every(self, seconds, func, stop):
+        """stop 이 설정될 때까지 seconds 간격(고정 주기)으로 func 를 스레드에서 실행"""
+        loop = asyncio.get_running_loop()
+        next_run = loop.time()
+        while not stop.is_set():
+            try:
+                await asyncio.to_thread(func)
+            except Exception as e:
+                self._count('errors')
+                print(f"경고: 모니터링 작업 실패 ({func.__name__}) - {e}")
+
+            # 작업이 주기보다 오래 걸리면 밀린 회차는 건너뜀
+            next_run += seconds
+            next_run = max(next_run, loop.time())
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=next_run - loop.time())
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, stop=None):
+        """
+        데몬 실행 (stop 이벤트 또는 SIGINT / SIGTERM 까지)
+
+        Args:
+            stop: asyncio.Event (None이면 새로 만들고 시그널에 연결)
+        """
+        if stop is None:
+            stop = asyncio.Event()
+            loop = asyncio.get_running_loop()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.add_signal_handler(sig, stop.set)
+                except (NotImplementedError, RuntimeError):
+                    pass
+
+        tasks = [self._every(self.interval, self.check, stop)]
+        if self.publish_snapshot:
+            tasks.append(self._every(self.snapshot_interval, self.refresh_snapshot, stop))
+        await asyncio.gather(*tasks)
+        self.write_status()
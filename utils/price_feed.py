@@ -0,0 +1,417 @@
+"""
+거래소 가격 피드 수집
+
+틱(체결) 또는 캔들(kline) 피드를 받아 시간 봉(OHLCV)으로 집계하고
+완성된 봉을 전처리 단계로 넘깁니다. 메시지 형식은 Binance 와 같습니다.
+
+    체결 스트림  {"e": "trade", "t": 체결 ID, "p": 가격, "q": 수량, "T": 체결 시각(ms), "m": 매수자가 메이커}
+    kline REST  [시작(ms), 시가, 고가, 저가, 종가, 거래량, 종료(ms), 거래대금, 체결 수, 테이커 매수량, 테이커 매수 대금, -]
+
+- BarAggregator: 진행 중인 봉 하나 + 고정 크기 링 버퍼(BarRing) -> 가동 시간과 무관하게 메모리 일정
+  (체결 ID 가 있으면 체결 수 = 마지막 ID - 처음 ID + 1, Binance kline 과 같은 방식)
+- 체결이 없던 시간은 직전 종가로 거래량 0 봉을 채움 (전처리의 시간별 병합 기준)
+- 체결 스트림에 (재)접속한 직후의 봉은 빠진 체결이 있으므로 버림 (mark_gap)
+- CsvBarSink: 완성된 봉을 price_history_<coin>_rows.csv 에 같은 형식으로 추가
+  -> DataLoader.load_price_data / DataPreprocessor / 모니터링 데몬이 그대로 사용
+- 피드: HTTP 체결 스트림(NDJSON), WebSocket 체결 스트림(websockets 필요), HTTP kline 폴링
+  연결이 끊기면 지수 백오프로 재연결
+
+로컬 테스트용 재생 서버는 utils/price_replay.py 참고.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import uuid
+from urllib.parse import urlencode, urlparse
+from urllib.request import urlopen
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.timestamps import TIMESTAMP_DTYPE
+
+try:
+    import websockets
+    HAS_WEBSOCKETS = True
+except ImportError:
+    HAS_WEBSOCKETS = False
+
+
+# 봉 값 필드 (price_history_*_rows.csv 컬럼 순서)
+BAR_FIELDS = ('open', 'high', 'low', 'close', 'volume', 'quote_volume', 'trade_count',
+              'taker_buy_volume', 'taker_buy_quote_volume')
+OPEN, HIGH, LOW, CLOSE, VOLUME, QUOTE, TRADES, TAKER, TAKER_QUOTE = range(len(BAR_FIELDS))
+
+# 링 버퍼 기본 크기 (시간 봉 30일)
+DEFAULT_CAPACITY = 24 * 30
+
+# 재연결 백오프 (초)
+RECONNECT_MIN_SECONDS = 1
+RECONNECT_MAX_SECONDS = 60
+
+# price_history_*_rows.csv 컬럼
+CSV_COLUMNS = ['id', 'coin_symbol', 'timestamp', 'open_price', 'high_price', 'low_price', 'close_price',
+               'volume', 'quote_volume', 'trade_count', 'taker_buy_volume', 'taker_buy_quote_volume']
+
+
+def symbol_for(coin, quote='USDT'):
+    """'ETH' -> 'ETHUSDT'"""
+    return f'{coin.upper()}{quote}'
+
+
+def coin_for(symbol, quote='USDT'):
+    """'ETHUSDT' -> 'ETH'"""
+    symbol = symbol.upper()
+    return symbol[:-len(quote)] if symbol.endswith(quote) else symbol
+
+
+class BarRing:
+    """완성된 봉 고정 크기 링 버퍼"""
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.starts = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros((capacity, len(BAR_FIELDS)), dtype=np.float64)
+        self.head = 0   # 다음에 쓸 위치
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, start_ms, values):
+        self.starts[self.head] = start_ms
+        self.values[self.head] = values
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def last(self, n=None):
+        """
+        최근 n개 봉 (시간 순)
+
+        Returns:
+            tuple: (시작 시각 ms 배열, [봉, 필드] 배열) - 복사본
+        """
+        n = self.size if n is None else min(n, self.size)
+        idx = (self.head - n + np.arange(n)) % self.capacity
+        return self.starts[idx], self.values[idx]
+
+    def to_frame(self, coin, n=None):
+        """
+        DataLoader.load_price_data 와 같은 형식의 데이터프레임
+
+        Args:
+            coin: 'ETH' 또는 'BTC'
+            n: 최근 봉 수 (None이면 전체)
+
+        Returns:
+            DataFrame: timestamp (tz-naive UTC) + <coin>_open ... <coin>_taker_buy_quote_volume
+        """
+        starts, values = self.last(n)
+        df = pd.DataFrame(values, columns=[f'{coin}_{f}' for f in BAR_FIELDS])
+        df[f'{coin}_trade_count'] = df[f'{coin}_trade_count'].astype(np.int64)
+        df.insert(0, 'timestamp', pd.to_datetime(starts, unit='ms').astype(TIMESTAMP_DTYPE))
+        return df
+
+
+class BarAggregator:
+    """체결 / kline -> 시간 봉 집계"""
+
+    def __init__(self, coin, interval_seconds=3600, capacity=DEFAULT_CAPACITY, on_bar=None, fill_gaps=True):
+        """
+        Args:
+            coin: 코인 심볼 ('ETH')
+            interval_seconds: 봉 길이 (초)
+            capacity: 링 버퍼 크기 (봉 수)
+            on_bar: 완성된 봉 콜백 f(coin, start_ms, values)
+            fill_gaps: 체결이 없던 구간을 직전 종가 / 거래량 0 봉으로 채울지
+        """
+        self.coin = coin
+        self.interval_ms = int(interval_seconds * 1000)
+        self.ring = BarRing(capacity)
+        self.on_bar = on_bar
+        self.fill_gaps = fill_gaps
+
+        self._start = None                      # 진행 중인 봉 시작 (ms)
+        self._bar = np.zeros(len(BAR_FIELDS))
+        self._first_id = self._last_id = None
+        self._partial = False    # 진행 중(또는 다음) 봉에 빠진 체결이 있을 수 있음
+        self._resync = False     # 다음 봉 시작 때 빈 구간을 채우지 않음
+        self.stats = {'ticks': 0, 'late_ticks': 0, 'klines': 0, 'bars': 0, 'gap_bars': 0, 'partial_bars': 0}
+
+    def bucket(self, ts_ms):
+        return ts_ms - ts_ms % self.interval_ms
+
+    @property
+    def current(self):
+        """진행 중인 봉 (start_ms, values) 또는 None"""
+        if self._start is None:
+            return None
+        return self._start, self._bar.copy()
+
+    def _emit(self, start_ms, values):
+        self.ring.append(start_ms, values)
+        self.stats['bars'] += 1
+        if self.on_bar is not None:
+            self.on_bar(self.coin, start_ms, values.copy())
+
+    def _is_late(self, start):
+        """이미 확정된 봉 구간인지"""
+        if self._start is not None:
+            return start < self._start
+        return len(self.ring) > 0 and start <= self.ring.starts[(self.ring.head - 1) % self.ring.capacity]
+
+    def mark_gap(self):
+        """
+        체결 스트림에 (재)접속했을 때 호출
+
+        진행 중인 봉(없으면 다음 봉)은 접속 전 체결이 빠졌으므로 버리고,
+        끊긴 동안의 구간은 거래량 0 봉으로 채우지 않고 비워 둡니다.
+        """
+        self._partial = True
+        self._resync = True
+
+    def _close(self):
+        """진행 중인 봉 확정 (빠진 체결이 있는 봉은 버림)"""
+        if self._start is None:
+            return
+        if self._partial:
+            self.stats['partial_bars'] += 1
+            self._partial = False
+            self._resync = True
+            self._start = None
+            return
+        if self._first_id is not None:
+            self._bar[TRADES] = self._last_id - self._first_id + 1
+        self._emit(self._start, self._bar)
+        self._start = None
+
+    def _open(self, start):
+        """새 봉 시작 (마지막 확정 봉과의 빈 구간은 직전 종가 / 거래량 0 봉으로 채움)"""
+        if self.fill_gaps and len(self.ring) and not self._resync:
+            starts, values = self.ring.last(1)
+            empty = np.zeros(len(BAR_FIELDS))
+            empty[[OPEN, HIGH, LOW, CLOSE]] = values[0, CLOSE]
+            for gap_start in range(int(starts[0]) + self.interval_ms, start, self.interval_ms):
+                self._emit(gap_start, empty)
+                self.stats['gap_bars'] += 1
+        self._resync = False
+        self._start = start
+        self._bar[:] = 0
+        self._first_id = self._last_id = None
+
+    def add_trade(self, ts_ms, price, qty, buyer_is_maker=False, trade_id=None):
+        """
+        체결 하나 반영 (시각 순서대로 들어온다고 가정, 닫힌 봉의 늦은 체결은 버림)
+
+        Returns:
+            bool: 반영 여부
+        """
+        self.stats['ticks'] += 1
+        start = self.bucket(int(ts_ms))
+        if self._is_late(start):
+            self.stats['late_ticks'] += 1
+            return False
+        if start != self._start:
+            self._close()
+            self._open(start)
+            self._bar[[OPEN, HIGH, LOW]] = price
+
+        bar = self._bar
+        if price > bar[HIGH]:
+            bar[HIGH] = price
+        if price < bar[LOW]:
+            bar[LOW] = price
+        bar[CLOSE] = price
+        bar[VOLUME] += qty
+        bar[QUOTE] += price * qty
+        bar[TRADES] += 1
+        if not buyer_is_maker:
+            bar[TAKER] += qty
+            bar[TAKER_QUOTE] += price * qty
+        if trade_id is not None:
+            if self._first_id is None:
+                self._first_id = trade_id
+            self._last_id = trade_id
+        return True
+
+    def add_kline(self, start_ms, values, closed=False):
+        """
+        kline 하나 반영 (진행 중인 봉은 값 교체, closed 면 바로 확정)
+
+        Returns:
+            bool: 반영 여부
+        """
+        self.stats['klines'] += 1
+        start = self.bucket(int(start_ms))
+        if self._is_late(start):
+            return False
+        if start != self._start:
+            self._close()
+            self._open(start)
+        self._bar[:] = values
+        if closed:
+            self._close()
+        return True
+
+    def flush(self, now_ms):
+        """now_ms 기준으로 끝난 진행 중인 봉 확정 (체결이 뜸할 때 피드가 주기적으로 호출)"""
+        if self._start is not None and now_ms >= self._start + self.interval_ms:
+            self._close()
+
+    def on_trade_message(self, message):
+        """Binance trade / aggTrade 메시지 반영 (heartbeat 는 E 시각 기준 flush)"""
+        if message.get('e') == 'heartbeat':
+            self.flush(int(message['E']))
+            return False
+        if message.get('e') not in ('trade', 'aggTrade'):
+            return False
+        return self.add_trade(int(message['T']), float(message['p']), float(message['q']),
+                              bool(message.get('m', False)), message.get('t', message.get('a')))
+
+    def on_rest_kline(self, row, closed):
+        """Binance REST kline 배열 반영"""
+        values = [float(row[i]) for i in (1, 2, 3, 4, 5, 7, 8, 9, 10)]
+        return self.add_kline(int(row[0]), values, closed)
+
+
+class CsvBarSink:
+    """완성된 봉 -> price_history_<coin>_rows.csv 추가 (이미 있는 시각은 건너뜀)"""
+
+    def __init__(self, data_dir, coin):
+        self.path = os.path.join(data_dir, f'price_history_{coin.lower()}_rows.csv')
+        self.last_start = None
+        if os.path.exists(self.path):
+            ts = pd.to_datetime(pd.read_csv(self.path, usecols=['timestamp'])['timestamp'], utc=True, errors='coerce')
+            if ts.notna().any():
+                self.last_start = int(ts.max().value // 1_000_000)
+
+    def __call__(self, coin, start_ms, values):
+        if self.last_start is not None and start_ms <= self.last_start:
+            return
+        ts = pd.Timestamp(start_ms, unit='ms', tz='UTC').strftime('%Y-%m-%d %H:%M:%S+00')
+        row = [str(uuid.uuid4()), coin, ts] + [f'{v:.8f}' for v in values[:TRADES]] + [str(int(values[TRADES]))] \
+            + [f'{v:.8f}' for v in values[TAKER:]]
+
+        new_file = not os.path.exists(self.path)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            if new_file:
+                f.write(','.join(CSV_COLUMNS) + '\n')
+            f.write(','.join(row) + '\n')
+        self.last_start = start_ms
+
+
+class PriceFeed:
+    """가격 피드 연결 (재연결 포함) -> BarAggregator"""
+
+    def __init__(self, url, aggregator, mode='trades', poll_seconds=10, interval='1h'):
+        """
+        Args:
+            url: 'http(s)://.../stream/trades?symbol=ETHUSDT' (mode='trades'),
+                 'ws(s)://.../ws/ethusdt@trade' (mode='trades'),
+                 'http(s)://host' REST 기본 주소 (mode='klines')
+            aggregator: BarAggregator
+            mode: 'trades' (체결 스트림) 또는 'klines' (REST 폴링)
+            poll_seconds: kline 폴링 간격 (초)
+            interval: kline 간격 ('1h')
+        """
+        if mode not in ('trades', 'klines'):
+            raise ValueError(f"알 수 없는 피드 방식: {mode}")
+        self.url = url
+        self.aggregator = aggregator
+        self.mode = mode
+        self.poll_seconds = poll_seconds
+        self.interval = interval
+        self.connected = False
+        self.reconnects = 0
+
+    async def run(self, stop):
+        """stop(asyncio.Event) 이 설정될 때까지 수신 (끊기면 재연결)"""
+        delay = RECONNECT_MIN_SECONDS
+        while not stop.is_set():
+            try:
+                if self.mode == 'klines':
+                    await self._poll_klines(stop)
+                elif urlparse(self.url).scheme in ('ws', 'wss'):
+                    await self._stream_ws(stop)
+                else:
+                    await self._stream_http(stop)
+                delay = RECONNECT_MIN_SECONDS
+            except (OSError, ValueError, asyncio.IncompleteReadError) as e:
+                print(f"경고: 가격 피드 연결 실패 ({self.url}) - {e}")
+            self.connected = False
+            if stop.is_set():
+                break
+            self.reconnects += 1
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+            delay = min(delay * 2, RECONNECT_MAX_SECONDS)
+
+    async def _stream_http(self, stop):
+        """HTTP NDJSON 체결 스트림 (한 줄에 메시지 하나)"""
+        url = urlparse(self.url)
+        port = url.port or (443 if url.scheme == 'https' else 80)
+        reader, writer = await asyncio.open_connection(url.hostname, port, ssl=url.scheme == 'https')
+        try:
+            path = url.path + (f'?{url.query}' if url.query else '')
+            writer.write(f'GET {path} HTTP/1.1\r\nHost: {url.netloc}\r\nConnection: close\r\n\r\n'.encode())
+            await writer.drain()
+
+            status = (await reader.readline()).decode().split()
+            if len(status) < 2 or status[1] != '200':
+                raise ValueError(f"HTTP 응답 오류: {' '.join(status)}")
+            while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                pass
+
+            self.connected = True
+            self.aggregator.mark_gap()
+            while not stop.is_set():
+                line = await reader.readline()
+                if not line:
+                    return
+                if line.strip():
+                    self.aggregator.on_trade_message(json.loads(line))
+        finally:
+            writer.close()
+
+    async def _stream_ws(self, stop):
+        """WebSocket 체결 스트림"""
+        if not HAS_WEBSOCKETS:
+            raise ValueError('WebSocket 피드에는 websockets 패키지가 필요합니다.')
+        async with websockets.connect(self.url) as ws:
+            self.connected = True
+            self.aggregator.mark_gap()
+            async for raw in ws:
+                message = json.loads(raw)
+                self.aggregator.on_trade_message(message.get('data', message))  # 결합 스트림은 data 안에
+                if stop.is_set():
+                    return
+
+    def _fetch_klines(self, start_ms):
+        params = {'symbol': symbol_for(self.aggregator.coin), 'interval': self.interval, 'limit': 1000}
+        if start_ms is not None:
+            params['startTime'] = start_ms
+        with urlopen(f"{self.url.rstrip('/')}/api/v3/klines?{urlencode(params)}", timeout=30) as res:
+            return json.loads(res.read())
+
+    async def _poll_klines(self, stop):
+        """REST kline 폴링 (진행 중인 봉부터 다시 요청)"""
+        while not stop.is_set():
+            current = self.aggregator.current
+            last = self.aggregator.ring.last(1)[0]
+            start_ms = current[0] if current else (int(last[0]) + self.aggregator.interval_ms if len(last) else None)
+
+            rows = await asyncio.to_thread(self._fetch_klines, start_ms)
+            self.connected = True
+            # 마지막 kline 은 진행 중인 봉 -> 다음 봉이 나타날 때 확정 (서버 시계 기준)
+            for i, row in enumerate(rows):
+                self.aggregator.on_rest_kline(row, closed=i < len(rows) - 1)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
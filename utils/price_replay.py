@@ -0,0 +1,280 @@
+"""
+가격 피드 재생 서버 (로컬 테스트용 거래소 대역)
+
+price_history_eth_rows.csv / price_history_btc_rows.csv 를 재생 시계에 맞춰
+Binance 형식의 실시간 피드로 제공합니다. 네트워크 없이 utils/price_feed.py 를 시험할 때 사용합니다.
+
+    GET /api/v3/time                                   {"serverTime": 재생 시각(ms)}
+    GET /api/v3/klines?symbol=ETHUSDT&interval=1h&startTime=&endTime=&limit=
+        재생 시각까지의 봉 (마지막 봉은 지금까지 나온 체결로 만든 진행 중인 봉)
+    GET /stream/trades?symbol=ETHUSDT                  NDJSON 체결 스트림 (접속 시점부터)
+
+재생 시각 = start + (경과 실제 시간 * speedup)
+
+봉마다 ticks_per_bar 개 지점에서 체결을 만들고 (시가 -> 고가/저가 -> 종가 경로),
+각 지점은 테이커 매수 / 매도 두 체결로 나눠 거래량과 테이커 매수량이 원본과 같게 합니다.
+체결 ID 는 원본 체결 수만큼 벌려 두어 BarAggregator 가 만든 봉의
+시가 / 고가 / 저가 / 종가 / 거래량 / 체결 수 / 테이커 매수량이 원본 CSV 와 같습니다.
+(거래대금은 체결 가격 * 수량 합이라 원본과 다를 수 있음)
+"""
+
+import json
+import os
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.price_feed import BAR_FIELDS, CLOSE, HIGH, LOW, OPEN, QUOTE, TAKER, TAKER_QUOTE, TRADES, VOLUME, coin_for
+
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8766
+
+# 봉 하나에서 만들 가격 지점 수
+DEFAULT_TICKS_PER_BAR = 12
+
+# 스트림 heartbeat 간격 (실제 초)
+HEARTBEAT_SECONDS = 1.0
+
+INTERVAL_MS = 3600 * 1000
+
+# CSV 컬럼 -> BAR_FIELDS
+CSV_FIELDS = ['open_price', 'high_price', 'low_price', 'close_price', 'volume', 'quote_volume', 'trade_count',
+              'taker_buy_volume', 'taker_buy_quote_volume']
+
+
+def load_bars(data_dir, coin):
+    """
+    가격 CSV -> (봉 시작 ms 배열, [봉, 필드] 배열) (시각 순, 중복 제거)
+    """
+    path = os.path.join(data_dir, f'price_history_{coin.lower()}_rows.csv')
+    df = pd.read_csv(path, usecols=['timestamp'] + CSV_FIELDS)
+    ts = pd.to_datetime(df['timestamp'], utc=True, errors='coerce')
+    df = df.assign(timestamp=ts).dropna(subset=['timestamp'])
+    df = df.sort_values('timestamp').drop_duplicates('timestamp', keep='last')
+    starts = df['timestamp'].dt.as_unit('ms').astype('int64').to_numpy()
+    return starts, df[CSV_FIELDS].to_numpy(dtype=np.float64)
+
+
+def bar_ticks(start_ms, values, first_id, n=DEFAULT_TICKS_PER_BAR):
+    """
+    봉 하나 -> 체결 메시지 목록
+
+    Args:
+        start_ms: 봉 시작 (ms)
+        values: BAR_FIELDS 순서 값
+        first_id: 첫 체결 ID
+        n: 가격 지점 수
+
+    Returns:
+        list: (체결 시각 ms, 메시지) - 시각 순
+    """
+    o, h, l, c = values[OPEN], values[HIGH], values[LOW], values[CLOSE]
+    # 양봉은 시가 -> 저가 -> 고가 -> 종가, 음봉은 시가 -> 고가 -> 저가 -> 종가
+    middle = (l, h) if c >= o else (h, l)
+    anchors = [0, max(1, n // 3), max(2, 2 * n // 3), n - 1]
+    prices = np.interp(np.arange(n), anchors, [o, middle[0], middle[1], c])
+
+    volume, taker = values[VOLUME], values[TAKER]
+    trades = max(int(values[TRADES]), 2 * n)
+    ids = first_id + np.linspace(0, trades - 1, 2 * n).round().astype(np.int64)
+    times = start_ms + (np.arange(n) * INTERVAL_MS) // n
+
+    ticks = []
+    for i in range(n):
+        for j, (qty, maker) in enumerate([(taker / n, False), ((volume - taker) / n, True)]):
+            ticks.append((int(times[i]), {
+                'e': 'trade', 'E': int(times[i]), 't': int(ids[2 * i + j]),
+                'p': f'{prices[i]:.8f}', 'q': f'{qty:.8f}', 'T': int(times[i]), 'm': maker,
+            }))
+    return ticks
+
+
+class PriceReplay:
+    """재생 시계 + 코인별 봉 / 체결"""
+
+    def __init__(self, data_dir=None, coins=('ETH', 'BTC'), speedup=3600.0, start=None,
+                 ticks_per_bar=DEFAULT_TICKS_PER_BAR):
+        """
+        Args:
+            data_dir: 데이터 디렉토리 (기본값: 프로젝트 data/)
+            coins: 재생할 코인
+            speedup: 배속 (3600 = 1시간 봉이 1초마다)
+            start: 재생 시작 시각 (None이면 가장 이른 봉)
+            ticks_per_bar: 봉 하나의 가격 지점 수
+        """
+        data_dir = data_dir or os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+        self.bars = {coin: load_bars(data_dir, coin) for coin in coins}
+        # 체결 ID: 봉 순서대로 원본 체결 수만큼 이어 붙임
+        self.first_ids = {
+            coin: np.concatenate([[1], 1 + np.cumsum(np.maximum(values[:, TRADES], 2 * ticks_per_bar))[:-1]])
+            .astype(np.int64)
+            for coin, (_, values) in self.bars.items()
+        }
+        self.speedup = float(speedup)
+        self.ticks_per_bar = ticks_per_bar
+
+        first = min(starts[0] for starts, _ in self.bars.values())
+        self.start_ms = int(pd.Timestamp(start, tz='UTC').value // 1_000_000) if start is not None else int(first)
+        self._t0 = time.monotonic()
+
+    def now_ms(self):
+        """현재 재생 시각 (ms)"""
+        return self.start_ms + int((time.monotonic() - self._t0) * self.speedup * 1000)
+
+    def wall_delay(self, ts_ms):
+        """재생 시각 ts_ms 까지 남은 실제 시간 (초)"""
+        return max(0.0, (ts_ms - self.now_ms()) / self.speedup / 1000)
+
+    def ticks(self, coin, index):
+        starts, values = self.bars[coin]
+        return bar_ticks(starts[index], values[index], self.first_ids[coin][index], self.ticks_per_bar)
+
+    def klines(self, coin, start_ms=None, end_ms=None, limit=500):
+        """
+        Binance REST kline 배열 (재생 시각 이후 봉은 없음, 진행 중인 봉은 지금까지의 체결로 계산)
+        """
+        starts, values = self.bars[coin]
+        now = self.now_ms()
+        lo = np.searchsorted(starts, start_ms, side='left') if start_ms is not None else 0
+        hi = np.searchsorted(starts, min(now, end_ms) if end_ms is not None else now, side='right')
+        if start_ms is None:
+            lo = max(0, hi - limit)
+        hi = min(hi, lo + limit)
+
+        rows = []
+        for i in range(lo, hi):
+            bar = values[i]
+            if starts[i] + INTERVAL_MS > now:
+                bar = self._partial(coin, i, now)
+            rows.append([
+                int(starts[i]), f'{bar[OPEN]:.8f}', f'{bar[HIGH]:.8f}', f'{bar[LOW]:.8f}', f'{bar[CLOSE]:.8f}',
+                f'{bar[VOLUME]:.8f}', int(starts[i]) + INTERVAL_MS - 1, f'{bar[QUOTE]:.8f}', int(bar[TRADES]),
+                f'{bar[TAKER]:.8f}', f'{bar[TAKER_QUOTE]:.8f}', '0',
+            ])
+        return rows
+
+    def _partial(self, coin, index, now):
+        """진행 중인 봉: now 까지의 체결 집계"""
+        bar = np.zeros(len(BAR_FIELDS))
+        done = [m for ts, m in self.ticks(coin, index) if ts <= now]
+        if not done:
+            return bar
+        prices = np.array([float(m['p']) for m in done])
+        qty = np.array([float(m['q']) for m in done])
+        taker = np.array([not m['m'] for m in done])
+        bar[[OPEN, HIGH, LOW, CLOSE]] = prices[0], prices.max(), prices.min(), prices[-1]
+        bar[VOLUME], bar[QUOTE] = qty.sum(), (prices * qty).sum()
+        bar[TRADES] = done[-1]['t'] - done[0]['t'] + 1
+        bar[TAKER], bar[TAKER_QUOTE] = qty[taker].sum(), (prices * qty)[taker].sum()
+        return bar
+
+    def stream(self, coin):
+        """
+        접속 시점 이후 체결 메시지 (재생 시각에 맞춰 대기, heartbeat 포함)
+
+        Yields:
+            dict: 체결 또는 {'e': 'heartbeat', 'E': 재생 시각}
+        """
+        starts, _ = self.bars[coin]
+        now = self.now_ms()
+        index = max(0, np.searchsorted(starts, now, side='right') - 1)
+        last_beat = time.monotonic()
+        for i in range(index, len(starts)):
+            for ts, message in self.ticks(coin, i):
+                if ts < now:
+                    continue
+                while True:
+                    delay = self.wall_delay(ts)
+                    if delay <= 0:
+                        break
+                    time.sleep(min(delay, HEARTBEAT_SECONDS))
+                    if time.monotonic() - last_beat >= HEARTBEAT_SECONDS:
+                        last_beat = time.monotonic()
+                        yield {'e': 'heartbeat', 'E': self.now_ms()}
+                yield dict(message, s=f'{coin}USDT')
+        yield {'e': 'heartbeat', 'E': int(starts[-1]) + INTERVAL_MS}
+
+
+class PriceReplayHandler(BaseHTTPRequestHandler):
+    """재생 서버 요청 처리 (replay 는 create_server 에서 지정)"""
+
+    replay = None
+    server_version = 'PriceReplay/1.0'
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _coin(self, params):
+        symbol = params.get('symbol', [''])[-1]
+        coin = coin_for(symbol)
+        if coin not in self.replay.bars:
+            raise ValueError(f'알 수 없는 심볼: {symbol}')
+        return coin
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+        try:
+            if url.path == '/api/v3/time':
+                self._send_json(200, {'serverTime': self.replay.now_ms()})
+            elif url.path == '/api/v3/klines':
+                if params.get('interval', ['1h'])[-1] != '1h':
+                    raise ValueError('interval 은 1h 만 지원합니다.')
+                number = lambda key: int(params[key][-1]) if key in params else None
+                self._send_json(200, self.replay.klines(
+                    self._coin(params), number('startTime'), number('endTime'), min(number('limit') or 500, 1000)
+                ))
+            elif url.path == '/stream/trades':
+                self._stream(self._coin(params))
+            else:
+                self._send_json(404, {'msg': f'없는 경로: {url.path}'})
+        except ValueError as e:
+            self._send_json(400, {'msg': str(e)})
+
+    def _stream(self, coin):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/x-ndjson')
+        self.send_header('Connection', 'close')
+        self.end_headers()
+        try:
+            for message in self.replay.stream(coin):
+                self.wfile.write(json.dumps(message).encode('utf-8') + b'\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def create_server(host=DEFAULT_HOST, port=DEFAULT_PORT, replay=None, quiet=False):
+    """
+    재생 서버 생성 (serve_forever 로 실행)
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 임의 포트)
+        replay: PriceReplay (None이면 기본 설정)
+        quiet: 요청 로그 생략
+
+    Returns:
+        ThreadingHTTPServer
+    """
+    handler = type('Handler', (PriceReplayHandler,), {'replay': replay or PriceReplay()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.quiet = quiet
+    return server
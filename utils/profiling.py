@@ -0,0 +1,361 @@
+"""
+단계별 계측 (실행 시간 / 행 수 / 메모리)
+
+대시보드 렌더링이나 전처리 실행에서 시간이 어디에 쓰이는지 기록합니다.
+- stage(): with 블록 계측용 컨텍스트 매니저
+- instrument(): 함수/메서드 계측용 데코레이터
+
+기록 항목: 단계 이름, 실행 시간, 입력/출력 행 수, 최대 메모리 할당량.
+메모리 측정은 tracemalloc을 사용하므로 별도로 켜야 합니다 (느려짐).
+
+기본값은 꺼짐이며, 꺼져 있으면 데코레이터는 플래그 확인 한 번만 하고
+원래 함수를 그대로 호출합니다. 환경 변수로 켤 수 있습니다.
+    DASHBOARD_PROFILE=1         실행 시간/행 수
+    DASHBOARD_PROFILE=memory    + 최대 메모리 할당량
+
+기록은 프로세스 전역 버퍼(최근 N개)에 쌓이고 JSON lines로 내보낼 수 있습니다.
+set_session() 으로 현재 스레드의 기록에 세션 id 를 붙이면 (Streamlit 세션별 디버그 패널)
+records(session=...) 로 그 세션의 기록만 골라낼 수 있습니다.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+
+import pandas as pd
+
+
+# 보관할 최대 기록 수
+MAX_RECORDS = 5000
+
+PROFILE_ENV = 'DASHBOARD_PROFILE'
+
+
+class _State:
+    """계측 설정 및 기록 버퍼"""
+
+    def __init__(self):
+        self.enabled = False
+        self.trace_memory = False
+        self.records = deque(maxlen=MAX_RECORDS)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+
+_state = _State()
+
+
+def enable(trace_memory=False):
+    """
+    계측 켜기
+
+    Args:
+        trace_memory: 최대 메모리 할당량 측정 여부 (tracemalloc 사용)
+    """
+    _state.trace_memory = trace_memory
+    if trace_memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _state.enabled = True
+
+
+def disable():
+    """계측 끄기"""
+    _state.enabled = False
+    if _state.trace_memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _state.trace_memory = False
+
+
+def is_enabled():
+    return _state.enabled
+
+
+def is_tracing_memory():
+    return _state.enabled and _state.trace_memory
+
+
+def set_session(session_id):
+    """
+    현재 스레드에서 기록되는 단계에 세션 id 붙이기
+
+    Args:
+        session_id: 세션 id (None이면 해제)
+    """
+    _state.local.session = session_id
+
+
+def _stack():
+    """현재 스레드의 실행 중인 단계 스택"""
+    stack = getattr(_state.local, 'stack', None)
+    if stack is None:
+        stack = _state.local.stack = []
+    return stack
+
+
+def _rows(value):
+    """DataFrame/Series/리스트의 행 수 (그 외는 None)"""
+    if isinstance(value, (pd.DataFrame, pd.Series, list)):
+        return len(value)
+    if isinstance(value, tuple) and value and isinstance(value[0], (pd.DataFrame, pd.Series)):
+        return len(value[0])
+    return None
+
+
+def _infer_rows_in(args):
+    """
+    인자에서 입력 행 수 추정
+
+    첫 번째 DataFrame 인자, 또는 self.df 를 가진 객체의 행 수를 사용합니다.
+    """
+    for arg in args:
+        if isinstance(arg, (pd.DataFrame, pd.Series)):
+            return len(arg)
+        df = getattr(arg, 'df', None)
+        if isinstance(df, pd.DataFrame):
+            return len(df)
+    return None
+
+
+class _Stage:
+    """실행 중인 단계 (stage() 블록 안에서 rows_out 등을 설정)"""
+
+    __slots__ = ('name', 'rows_in', 'rows_out', 'extra', 'peak', 'base')
+
+    def __init__(self, name, rows_in=None):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.extra = {}
+        self.peak = 0
+        self.base = 0
+
+    def set_rows(self, rows_in=None, rows_out=None):
+        """입력/출력 행 수 설정 (DataFrame을 넘기면 행 수 사용)"""
+        if rows_in is not None:
+            self.rows_in = rows_in if isinstance(rows_in, int) else _rows(rows_in)
+        if rows_out is not None:
+            self.rows_out = rows_out if isinstance(rows_out, int) else _rows(rows_out)
+
+    def note(self, **extra):
+        """기록에 추가 정보 첨부"""
+        self.extra.update(extra)
+
+
+class _NullStage:
+    """계측이 꺼져 있을 때 사용하는 빈 단계"""
+
+    def set_rows(self, rows_in=None, rows_out=None):
+        pass
+
+    def note(self, **extra):
+        pass
+
+
+_NULL_STAGE = _NullStage()
+
+
+@contextmanager
+def _null_context():
+    yield _NULL_STAGE
+
+
+@contextmanager
+def _traced_stage(name, rows_in):
+    current = _Stage(name, rows_in)
+    stack = _stack()
+    parent = stack[-1] if stack else None
+    trace = _state.trace_memory and tracemalloc.is_tracing()
+
+    if trace:
+        # 중첩 단계: 부모의 최대값을 먼저 반영한 뒤 카운터 초기화
+        used, peak = tracemalloc.get_traced_memory()
+        if parent is not None:
+            parent.peak = max(parent.peak, peak - parent.base)
+        tracemalloc.reset_peak()
+        current.base = used
+
+    stack.append(current)
+    start = time.perf_counter()
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = type(e).__name__
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+
+        peak_bytes = None
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+            current.peak = max(current.peak, peak - current.base)
+            peak_bytes = current.peak
+            if parent is not None:
+                parent.peak = max(parent.peak, current.base - parent.base + current.peak)
+            tracemalloc.reset_peak()
+
+        record = {
+            'name': name,
+            'parent': parent.name if parent is not None else None,
+            'started_at': time.time() - elapsed,
+            'seconds': elapsed,
+            'rows_in': current.rows_in,
+            'rows_out': current.rows_out,
+            'peak_bytes': peak_bytes,
+        }
+        if error:
+            record['error'] = error
+        session = getattr(_state.local, 'session', None)
+        if session is not None:
+            record['session'] = session
+        if current.extra:
+            record.update(current.extra)
+
+        with _state.lock:
+            _state.records.append(record)
+
+
+def stage(name, rows_in=None):
+    """
+    with 블록 계측
+
+    사용 예:
+        with stage('preprocess.merge', rows_in=df) as s:
+            merged = ...
+            s.set_rows(rows_out=merged)
+
+    Args:
+        name: 단계 이름
+        rows_in: 입력 행 수 또는 DataFrame
+
+    Returns:
+        컨텍스트 매니저 (계측이 꺼져 있으면 아무것도 하지 않음)
+    """
+    if not _state.enabled:
+        return _null_context()
+    if rows_in is not None and not isinstance(rows_in, int):
+        rows_in = _rows(rows_in)
+    return _traced_stage(name, rows_in)
+
+
+def instrument(name=None):
+    """
+    함수/메서드 계측 데코레이터
+
+    입력 행 수는 첫 DataFrame 인자(또는 self.df), 출력 행 수는 반환값에서 구합니다.
+
+    Args:
+        name: 단계 이름 (기본값: 함수의 qualname)
+    """
+    def decorator(fn):
+        stage_name = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return fn(*args, **kwargs)
+
+            with _traced_stage(stage_name, _infer_rows_in(args)) as s:
+                result = fn(*args, **kwargs)
+                s.rows_out = _rows(result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def records(session=None):
+    """
+    기록 리스트 복사본
+
+    Args:
+        session: 세션 id (주어지면 set_session() 으로 그 세션에서 기록된 것만)
+    """
+    with _state.lock:
+        items = list(_state.records)
+    if session is None:
+        return items
+    return [r for r in items if r.get('session') == session]
+
+
+def clear():
+    """기록 초기화"""
+    with _state.lock:
+        _state.records.clear()
+
+
+def summary():
+    """
+    단계별 집계
+
+    Returns:
+        DataFrame: 단계별 호출 수, 총/평균/최대 시간, 최대 메모리 (총 시간 내림차순)
+    """
+    df = pd.DataFrame(records())
+    if df.empty:
+        return df
+
+    if 'peak_bytes' not in df.columns:
+        df['peak_bytes'] = None
+
+    grouped = df.groupby('name').agg(
+        calls=('seconds', 'size'),
+        total_seconds=('seconds', 'sum'),
+        mean_seconds=('seconds', 'mean'),
+        max_seconds=('seconds', 'max'),
+        max_rows_in=('rows_in', 'max'),
+        max_peak_mb=('peak_bytes', lambda s: s.max() / 1024 / 1024 if s.notna().any() else None),
+    ).reset_index()
+
+    return grouped.sort_values('total_seconds', ascending=False).reset_index(drop=True)
+
+
+def to_jsonl(items=None):
+    """
+    기록을 JSON lines 문자열로 변환
+
+    Args:
+        items: 변환할 기록 리스트 (None이면 전체)
+    """
+    items = records() if items is None else items
+    return ''.join(json.dumps(r, ensure_ascii=False, default=str) + '\n' for r in items)
+
+
+def export_jsonl(path, clear_after=False):
+    """
+    기록을 JSON lines 파일로 내보내기 (기존 파일에 추가)
+
+    Args:
+        path: 출력 경로
+        clear_after: 내보낸 뒤 기록 초기화 여부
+
+    Returns:
+        int: 내보낸 기록 수
+    """
+    lines = to_jsonl()
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(lines)
+
+    count = lines.count('\n')
+    if clear_after:
+        clear()
+    return count
+
+
+def _enable_from_env():
+    value = os.getenv(PROFILE_ENV, '').strip().lower()
+    if value in ('1', 'true', 'yes', 'on'):
+        enable()
+    elif value == 'memory':
+        enable(trace_memory=True)
+
+
+_enable_from_env()
@@ -0,0 +1,337 @@
+"""
+범위 집계 인덱스
+
+데이터 버전(최상위 프레임)마다 한 번 만들고, 임의의 행 구간 [lo, hi) 에 대한
+합계 / 개수 / 평균 / 최소 / 최대 / 표준편차 / 회귀 기울기 / 수익률 통계를 O(1) 로
+계산합니다.
+
+- 합계 / 평균: NaN 을 0 으로 둔 누적합과 유효값 누적 개수 (prefix sum)
+- 최소 / 최대: 희소 테이블 (2^k 길이 구간의 최소/최대를 미리 계산, 겹치는 두 구간으로 조회)
+  (전체 컬럼을 [레벨, 행, 컬럼] 배열 하나로 - 메모리는 값 배열의 log2(행 수) 배)
+- 표준편차 / 기울기: x(경과 시간), y, x^2, xy, y^2 누적합으로 닫힌 형태 계산
+  (y 는 컬럼별 첫 유효값을 빼고 누적 -> 큰 값의 상쇄 오차 완화)
+- 수익률: 유효값끼리의 변화율(pct_change)과 제곱의 누적합
+- 모든 누적합은 (행 x 컬럼) 2차원 배열에 한 번에 계산하고, lo / hi 에 배열을 주면
+  (구간 x 컬럼) 결과를 한 번에 반환 (지표 카드 x 기간 일괄 계산)
+
+NaN 처리는 pandas 기본값과 같습니다. (유효값이 없으면 합계 0, 평균/최소/최대 NaN)
+필터로 잘라낸 프레임은 utils.time_index 의 최상위 접근자 인덱스를 행 오프셋으로
+공유하므로 날짜 범위를 바꿔도 다시 만들지 않습니다.
+(잘라낸 프레임의 컬럼이 최상위 프레임 배열의 뷰일 때만 공유 - 컬럼을 다시 대입하거나
+ 새 컬럼을 추가한 프레임은 자기 값으로 인덱스를 따로 만들어 캐시)
+"""
+
+import numpy as np
+
+from utils.time_index import time_index
+
+
+def _cumsum0(values):
+    """앞에 0 행을 붙인 누적합 (행 방향)"""
+    out = np.zeros((values.shape[0] + 1,) + values.shape[1:], dtype=np.float64)
+    np.cumsum(values, axis=0, out=out[1:])
+    return out
+
+
+def _column_array(df, col):
+    """컬럼의 numpy 배열 (프레임 메모리의 뷰가 아니면 None - 변경 여부를 확인할 수 없음)"""
+    values = df[col].to_numpy()
+    if not isinstance(values, np.ndarray) or values.base is None:
+        return None
+    return values
+
+
+class RangeAggregateIndex:
+    """행 구간 집계 인덱스 (prefix sum + 희소 테이블)"""
+
+    def __init__(self, df, columns, hours=None):
+        """
+        Args:
+            df: timestamp 오름차순 데이터프레임
+            columns: 인덱싱할 수치형 컬럼 (없는 컬럼은 무시)
+            hours: 행별 경과 시간 (기울기 x 축, None이면 행 번호)
+        """
+        columns = [c for c in dict.fromkeys(columns) if c in df.columns]
+        self.n = len(df)
+        self._pos = {col: j for j, col in enumerate(columns)}
+        self.values = (df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+                       if columns else np.empty((self.n, 0)))
+        self.hours = np.arange(self.n, dtype=np.float64) if hours is None else np.asarray(hours, dtype=np.float64)
+
+        valid = ~np.isnan(self.values)
+        self._valid = valid
+        self._prefix = _cumsum0(np.where(valid, self.values, 0.0))
+        self._counts = _cumsum0(valid.astype(np.float64)).astype(np.int64)
+        self._tables = {}
+        self._moments = None
+        self._returns = None
+        # 인덱싱한 원본 컬럼 배열 (프레임 컬럼이 바뀌었는지 확인용)
+        self._sources = {col: _column_array(df, col) for col in columns}
+
+    @property
+    def columns(self):
+        return list(self._pos)
+
+    def covers(self, df, columns, offset=0):
+        """
+        df 의 컬럼 값이 이 인덱스의 행 오프셋 위치 값과 같은 배열인지 확인
+
+        Args:
+            df: 확인할 프레임 (인덱스 원본 또는 그 행 구간 슬라이스)
+            columns: 확인할 컬럼
+            offset: df 첫 행의 인덱스 행 번호
+
+        Returns:
+            bool: 모든 컬럼이 인덱싱한 원본 배열(의 뷰)이면 True
+        """
+        if offset + len(df) > self.n:
+            return False
+        for col in columns:
+            source = self._sources.get(col)
+            if source is None:
+                return False
+            current = _column_array(df, col)
+            if (current is None or current.strides != source.strides
+                    or current.ctypes.data != source.ctypes.data + offset * source.strides[0]):
+                return False
+        return True
+
+    def __contains__(self, col):
+        return col in self._pos
+
+    def _col(self, cols):
+        """컬럼 이름(또는 목록) -> 열 번호 (목록이면 결과는 (구간 x 컬럼))"""
+        if isinstance(cols, str):
+            return self._pos[cols]
+        return np.array([self._pos[c] for c in cols], dtype=np.int64)
+
+    @staticmethod
+    def _bounds(lo, hi, j):
+        lo, hi = np.asarray(lo), np.asarray(hi)
+        if not isinstance(j, np.ndarray):
+            return lo, hi
+        return lo[..., None], hi[..., None]
+
+    def _range_sum(self, prefix, cols, lo, hi):
+        j = self._col(cols)
+        lo, hi = self._bounds(lo, hi, j)
+        return prefix[hi, j] - prefix[lo, j]
+
+    def count(self, cols, lo, hi):
+        """구간의 유효값(NaN 제외) 개수"""
+        return self._range_sum(self._counts, cols, lo, hi)
+
+    def sum(self, cols, lo, hi):
+        """구간 합계 (유효값이 없으면 0)"""
+        return self._range_sum(self._prefix, cols, lo, hi)
+
+    def mean(self, cols, lo, hi):
+        """구간 평균 (유효값이 없으면 NaN)"""
+        count = self.count(cols, lo, hi)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(count > 0, self.sum(cols, lo, hi) / np.maximum(count, 1), np.nan)[()]
+
+    def min(self, cols, lo, hi):
+        """구간 최소 (유효값이 없으면 NaN)"""
+        return self._extreme(cols, 'min', lo, hi)
+
+    def max(self, cols, lo, hi):
+        """구간 최대 (유효값이 없으면 NaN)"""
+        return self._extreme(cols, 'max', lo, hi)
+
+    def value(self, cols, i):
+        """행 i 의 값"""
+        j = self._col(cols)
+        i, _ = self._bounds(i, i, j)
+        return self.values[i, j]
+
+    def first_valid(self, cols, lo, hi):
+        """구간 첫 유효값의 행 번호 (유효값이 없으면 hi)"""
+        return self._valid_position(cols, lo, hi, first=True)
+
+    def last_valid(self, cols, lo, hi):
+        """구간 마지막 유효값의 행 번호 (유효값이 없으면 hi)"""
+        return self._valid_position(cols, lo, hi, first=False)
+
+    def first_value(self, cols, lo, hi):
+        """구간 첫 유효값 (유효값이 없으면 NaN)"""
+        return self._valid_value(cols, lo, hi, first=True)
+
+    def last_value(self, cols, lo, hi):
+        """구간 마지막 유효값 (유효값이 없으면 NaN)"""
+        return self._valid_value(cols, lo, hi, first=False)
+
+    def _valid_value(self, cols, lo, hi, first):
+        pos = np.asarray(self._valid_position(cols, lo, hi, first))
+        lo, hi, j = np.broadcast_arrays(*self._bounds(lo, hi, self._col(cols)), self._col(cols))
+        if self.n == 0:
+            return np.full(pos.shape, np.nan)[()]
+        return np.where(pos < hi, self.values[np.minimum(pos, self.n - 1), j], np.nan)[()]
+
+    def _valid_position(self, cols, lo, hi, first):
+        # counts[k] = [0, k) 의 유효값 수 -> 목표 개수에 처음 도달하는 k 를 이분 탐색
+        j = self._col(cols)
+        lo, hi, jj = np.broadcast_arrays(*self._bounds(lo, hi, j), j)
+        counts = self._counts
+        target = counts[lo, jj] + 1 if first else counts[hi, jj]
+        pos = np.empty(lo.shape, dtype=np.int64)
+        for col in np.unique(jj):
+            m = jj == col
+            pos[m] = np.searchsorted(counts[:, col], target[m], side='left') - 1
+        empty = counts[hi, jj] - counts[lo, jj] == 0
+        return np.where(empty, hi, pos)[()]
+
+    def _table(self, how):
+        """
+        희소 테이블 (처음 조회할 때 전체 컬럼을 한 번에 생성)
+
+        table[k, i, j] = values[i : i + 2^k, j] 의 최소/최대 (범위를 벗어나는 칸은 항등원)
+        """
+        if how not in self._tables:
+            fill = np.inf if how == 'min' else -np.inf
+            reduce = np.minimum if how == 'min' else np.maximum
+            levels = max(1, int(self.n).bit_length())
+            table = np.full((levels,) + self.values.shape, fill)
+            table[0] = np.where(self._valid, self.values, fill)
+            for k in range(1, levels):
+                half = 1 << (k - 1)
+                reduce(table[k - 1, :self.n - half], table[k - 1, half:], out=table[k, :self.n - half])
+            self._tables[how] = table
+        return self._tables[how]
+
+    def _extreme(self, cols, how, lo, hi):
+        j = self._col(cols)
+        lo, hi = self._bounds(lo, hi, j)
+        length = hi - lo
+        if self.n == 0:
+            return np.full(np.broadcast_shapes(length.shape, np.shape(j)), np.nan)[()]
+        table = self._table(how)
+        reduce = np.minimum if how == 'min' else np.maximum
+        k = np.frexp(np.maximum(length, 1))[1] - 1  # floor(log2(length))
+        last = np.clip(hi - (1 << k), 0, self.n - 1)
+        result = reduce(table[k, np.clip(lo, 0, self.n - 1), j], table[k, last, j])
+        empty = (length <= 0) | (self._counts[hi, j] - self._counts[lo, j] == 0)
+        return np.where(empty, np.nan, result)[()]
+
+    def _moment_prefixes(self):
+        """x, x^2, y, y^2, xy 누적합 (유효값만, y 는 첫 유효값 기준으로 이동)"""
+        if self._moments is None:
+            valid = self._valid
+            first = np.argmax(valid, axis=0)
+            self._shift = np.where(valid.any(axis=0), self.values[first, np.arange(valid.shape[1])], 0.0)
+            y = np.where(valid, self.values - self._shift, 0.0)
+            x = np.where(valid, self.hours[:, None], 0.0)
+            self._moments = {
+                'x': _cumsum0(x), 'xx': _cumsum0(x * x),
+                'y': _cumsum0(y), 'yy': _cumsum0(y * y), 'xy': _cumsum0(x * y),
+            }
+        return self._moments
+
+    def std(self, cols, lo, hi, ddof=1):
+        """구간 표준편차 (유효값이 ddof 이하이면 NaN)"""
+        m = self._moment_prefixes()
+        n = self.count(cols, lo, hi)
+        sy, syy = self._range_sum(m['y'], cols, lo, hi), self._range_sum(m['yy'], cols, lo, hi)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            var = (syy - sy * sy / np.maximum(n, 1)) / (n - ddof)
+            return np.where(n > ddof, np.sqrt(np.maximum(var, 0.0)), np.nan)[()]
+
+    def slope(self, cols, lo, hi):
+        """
+        구간 최소제곱 회귀 기울기 (x = 경과 시간, 유효값만 / 2개 미만이면 NaN)
+
+        slope = (Sxy - Sx*Sy/n) / (Sxx - Sx^2/n)
+        """
+        m = self._moment_prefixes()
+        n = self.count(cols, lo, hi)
+        sx, sxx = self._range_sum(m['x'], cols, lo, hi), self._range_sum(m['xx'], cols, lo, hi)
+        sy, sxy = self._range_sum(m['y'], cols, lo, hi), self._range_sum(m['xy'], cols, lo, hi)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            nn = np.maximum(n, 1)
+            sxx_c = sxx - sx * sx / nn
+            slope = (sxy - sx * sy / nn) / sxx_c
+            return np.where((n >= 2) & (sxx_c > 0), slope, np.nan)[()]
+
+    def _return_prefixes(self):
+        """유효값끼리의 변화율 r 과 r^2 누적합 (r 은 뒤쪽 값의 행에 기록)"""
+        if self._returns is None:
+            returns = np.full(self.values.shape, np.nan)
+            for j in range(self.values.shape[1]):
+                rows = np.flatnonzero(self._valid[:, j])
+                if len(rows) > 1:
+                    prev, cur = self.values[rows[:-1], j], self.values[rows[1:], j]
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        returns[rows[1:], j] = cur / prev - 1
+            finite = np.isfinite(returns)
+            r = np.where(finite, returns, 0.0)
+            self._returns = {'n': _cumsum0(finite.astype(np.float64)), 'r': _cumsum0(r), 'rr': _cumsum0(r * r)}
+        return self._returns
+
+    def return_stats(self, cols, lo, hi):
+        """
+        구간 수익률 평균 / 표준편차 (구간 안의 유효값끼리만, pct_change().dropna() 와 동일)
+
+        Returns:
+            tuple: (평균, 표준편차(ddof=1), 수익률 개수)
+        """
+        p = self._return_prefixes()
+        # 구간 첫 유효값의 수익률은 구간 밖 값 기준이므로 제외
+        first = self.first_valid(cols, lo, hi)
+        j = self._col(cols)
+        lo, hi, j = np.broadcast_arrays(*self._bounds(lo, hi, j), j)
+        start = np.minimum(first + 1, hi)
+        n = p['n'][hi, j] - p['n'][start, j]
+        s, ss = p['r'][hi, j] - p['r'][start, j], p['rr'][hi, j] - p['rr'][start, j]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(n > 0, s / np.maximum(n, 1), np.nan)
+            var = (ss - s * s / np.maximum(n, 1)) / (n - 1)
+            std = np.where(n > 1, np.sqrt(np.maximum(var, 0.0)), np.nan)
+        return mean[()], std[()], n[()]
+
+
+def range_index(df, columns):
+    """
+    프레임의 범위 집계 인덱스와 행 오프셋
+
+    필터로 잘라낸 프레임은 필요한 컬럼이 모두 최상위 프레임 배열의 뷰일 때
+    최상위 프레임의 인덱스를 공유합니다. 그렇지 않으면 (컬럼을 다시 대입 / 추가했거나
+    최상위 프레임이 이미 사라졌으면) 현재 프레임의 값으로 인덱스를 만들어 캐시합니다.
+
+    Args:
+        df: timestamp 컬럼이 있는 데이터프레임
+        columns: 필요한 컬럼 목록
+
+    Returns:
+        tuple: (RangeAggregateIndex, TimeIndex, 오프셋) - df 의 행 i 는 인덱스의 행 오프셋 + i
+               (timestamp 가 없으면 None)
+    """
+    index = time_index(df)
+    if index is None:
+        return None
+
+    frame = index.df
+    wanted = [c for c in dict.fromkeys(columns) if c in frame.columns]
+    root = index.root
+    if root is not index:
+        cached = getattr(root, '_range_index', None)
+        if cached is not None and cached.covers(frame, wanted, index.offset):
+            return cached, index, index.offset
+        root_df = root.df
+        if root_df is not None and all(c in root_df.columns for c in wanted):
+            # 최상위 인덱스에 컬럼이 없거나 오래됐으면 최상위 프레임 값으로 갱신
+            cached = _cached_index(root, root_df, wanted)
+            if cached.covers(frame, wanted, index.offset):
+                return cached, index, index.offset
+    return _cached_index(index, frame, wanted), index, 0
+
+
+def _cached_index(index, frame, columns):
+    """접근자에 캐시된 인덱스 (컬럼이 없거나 값이 바뀌었으면 기존 컬럼과 함께 다시 만듦)"""
+    cached = getattr(index, '_range_index', None)
+    if cached is not None and cached.covers(frame, columns):
+        return cached
+    known = [c for c in cached.columns if c in frame.columns] if cached is not None else []
+    cached = RangeAggregateIndex(frame, known + [c for c in columns if c not in known],
+                                 hours=index.hours_since_start())
+    index._range_index = cached
+    return cached
@@ -0,0 +1,409 @@
+"""
+다중 해상도 롤업 저장소
+
+시간별 원본에서 1h / 4h / 1d / 1w 집계를 한 번에 만들고 유지합니다.
+각 버킷은 병합 가능한 통계(개수, 합, 편차 제곱합 M2, 최소, 최대, 처음, 마지막)를
+저장하므로 상위 해상도는 하위 해상도 버킷을 병합해서 계산합니다.
+(평균/분산 병합은 Chan et al. 병렬 알고리즘)
+
+- update(): 새 행이 들어오면 영향을 받는 마지막 버킷들만 다시 계산
+- query(): 시간 범위와 포인트 예산을 주면 예산 안에 들어오는
+  가장 세밀한 해상도를 골라 반환 (1년 범위 -> 수백 행)
+
+컬럼마다 대표값 방식을 지정합니다.
+    'sum'   버킷 합계 (메시지 수, 거래 수, 거래량 등)
+    'mean'  버킷 평균 (감정 점수 등)
+    'last'  버킷 마지막 값 (종가)
+    'first' 버킷 처음 값 (시가)
+    'max' / 'min'
+
+이미 집계된 (개수, 평균, 분산) 컬럼 묶음(예: community_ts 의
+total_posts / avg_sentiment / variance)은 weighted 로 지정하면
+게시글 수 가중 평균과 표본 분산으로 병합됩니다.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# 해상도 (이름, 시간 단위 버킷 크기) - 세밀한 것부터
+RESOLUTIONS = [('1h', 1), ('4h', 4), ('1d', 24), ('1w', 168)]
+
+# 기본 포인트 예산
+DEFAULT_MAX_POINTS = 1500
+
+# 주 단위 버킷을 월요일 00:00 에 맞추기 위한 오프셋 (1970-01-01은 목요일)
+WEEK_OFFSET_HOURS = 3 * 24
+
+STAT_FIELDS = ('n', 'sum', 'm2', 'min', 'max', 'first', 'last')
+
+MODES = ('sum', 'mean', 'last', 'first', 'max', 'min')
+
+# processed_data.csv 기본 집계 방식 (나머지 수치형 컬럼은 'mean')
+PROCESSED_MODES = {
+    'tx_frequency': 'sum', 'tx_amount': 'sum', 'tx_amount_usd': 'sum',
+    'ETH_open': 'first', 'ETH_high': 'max', 'ETH_low': 'min', 'ETH_close': 'last',
+    'ETH_volume': 'sum', 'ETH_trade_count': 'sum',
+    'BTC_open': 'first', 'BTC_high': 'max', 'BTC_low': 'min', 'BTC_close': 'last',
+    'BTC_volume': 'sum', 'BTC_trade_count': 'sum',
+    'message_count': 'sum', 'total_forwards': 'sum', 'total_reactions': 'sum',
+    'twitter_count': 'sum',
+}
+
+# community_ts_*.csv 형식
+COMMUNITY_MODES = {'pos': 'sum', 'neg': 'sum', 'neu': 'sum'}
+COMMUNITY_WEIGHTED = {'avg_sentiment': ('total_posts', 'variance')}
+
+
+def _hour_keys(timestamps):
+    """timestamp -> epoch 기준 시간 번호 (int64)"""
+    ts = pd.DatetimeIndex(timestamps)
+    if ts.tz is not None:
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    return ts.as_unit('s').asi8 // 3600
+
+
+def _bucket_keys(hour_keys, hours):
+    """시간 번호 -> 해당 해상도의 버킷 시작 시간 번호"""
+    if hours == 168:
+        return (hour_keys + WEEK_OFFSET_HOURS) // 168 * 168 - WEEK_OFFSET_HOURS
+    return hour_keys // hours * hours
+
+
+def _segments(keys):
+    """정렬된 키 배열의 그룹 시작 인덱스와 고유 키"""
+    if len(keys) == 0:
+        return np.empty(0, dtype=np.int64), keys
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    return starts, keys[starts]
+
+
+def _observation_stats(values):
+    """원본 관측값 -> 관측 1개짜리 통계 (NaN은 개수 0)"""
+    values = np.asarray(values, dtype=np.float64)
+    valid = ~np.isnan(values)
+    filled = np.where(valid, values, 0.0)
+    return {
+        'n': valid.astype(np.float64),
+        'sum': filled,
+        'm2': np.zeros(len(values)),
+        'min': np.where(valid, values, np.inf),
+        'max': np.where(valid, values, -np.inf),
+        'first': values.copy(),
+        'last': values.copy(),
+    }
+
+
+def _weighted_stats(counts, means, variances, ddof=1):
+    """(개수, 평균, 분산) 집계값 -> 통계"""
+    n = np.nan_to_num(np.asarray(counts, dtype=np.float64))
+    mean = np.nan_to_num(np.asarray(means, dtype=np.float64))
+    var = np.nan_to_num(np.asarray(variances, dtype=np.float64))
+    has = n > 0
+    return {
+        'n': n,
+        'sum': mean * n,
+        'm2': var * np.maximum(n - ddof, 0),
+        'min': np.where(has, mean, np.inf),
+        'max': np.where(has, mean, -np.inf),
+        'first': np.where(has, mean, np.nan),
+        'last': np.where(has, mean, np.nan),
+    }
+
+
+def _merge(stats, starts):
+    """
+    정렬된 구간(starts 기준)별로 통계 병합
+
+    M2 병합: M2 = sum(M2_i) + sum(n_i * (mean_i - mean)^2)
+    """
+    n_groups = len(starts)
+    if n_groups == 0:
+        return {k: np.empty(0) for k in STAT_FIELDS}
+
+    n = np.add.reduceat(stats['n'], starts)
+    total = np.add.reduceat(stats['sum'], starts)
+
+    lengths = np.diff(np.append(starts, len(stats['n'])))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean = np.where(n > 0, total / n, 0.0)
+        child_mean = np.where(stats['n'] > 0, stats['sum'] / np.where(stats['n'] > 0, stats['n'], 1), 0.0)
+    dev = child_mean - np.repeat(mean, lengths)
+    m2 = np.add.reduceat(stats['m2'] + stats['n'] * dev * dev, starts)
+
+    # 처음/마지막 값: 구간 안에서 NaN이 아닌 첫/마지막 값
+    first = _edge_valid(stats['first'], starts, lengths, last=False)
+    last = _edge_valid(stats['last'], starts, lengths, last=True)
+
+    return {
+        'n': n,
+        'sum': total,
+        'm2': m2,
+        'min': np.minimum.reduceat(stats['min'], starts),
+        'max': np.maximum.reduceat(stats['max'], starts),
+        'first': first,
+        'last': last,
+    }
+
+
+def _edge_valid(values, starts, lengths, last=False):
+    """구간별 NaN이 아닌 첫 값 또는 마지막 값 (없으면 NaN)"""
+    idx = np.arange(len(values))
+    valid = ~np.isnan(values)
+    if last:
+        pos = np.maximum.reduceat(np.where(valid, idx, -1), starts)
+        found = pos >= starts
+    else:
+        pos = np.minimum.reduceat(np.where(valid, idx, len(values)), starts)
+        found = pos < starts + lengths
+    return np.where(found, values[np.clip(pos, 0, len(values) - 1)], np.nan)
+
+
+def _slice_stats(stats, start, end=None):
+    return {k: v[start:end] for k, v in stats.items()}
+
+
+def _concat_stats(a, b):
+    return {k: np.concatenate((a[k], b[k])) for k in STAT_FIELDS}
+
+
+class _Level:
+    """한 해상도의 버킷 키와 컬럼별 통계"""
+
+    __slots__ = ('name', 'hours', 'keys', 'stats')
+
+    def __init__(self, name, hours, keys, stats):
+        self.name = name
+        self.hours = hours
+        self.keys = keys
+        self.stats = stats
+
+
+class RollupStore:
+    """다중 해상도 롤업 저장소"""
+
+    def __init__(self, df, modes=None, weighted=None, timestamp_col='timestamp', default_mode='mean', ddof=1):
+        """
+        Args:
+            df: 시간별(또는 더 세밀한) 원본 데이터프레임
+            modes: 컬럼별 대표값 방식 {컬럼: 'sum'|'mean'|'last'|...}
+            weighted: 집계된 컬럼 묶음 {평균 컬럼: (개수 컬럼, 분산 컬럼 또는 None)}
+            timestamp_col: 시간 컬럼
+            default_mode: modes에 없는 수치형 컬럼의 방식 (None이면 modes에 있는 컬럼만)
+            ddof: weighted 분산의 자유도 (1 = 표본 분산)
+        """
+        self.timestamp_col = timestamp_col
+        self.ddof = ddof
+        self.weighted = dict(weighted or {})
+
+        modes = dict(modes or {})
+        skip = {timestamp_col} | set(self.weighted)
+        for count_col, var_col in self.weighted.values():
+            skip.add(var_col)
+            modes.setdefault(count_col, 'sum')
+
+        if default_mode is not None:
+            for col in df.select_dtypes(include=[np.number, 'bool']).columns:
+                if col not in skip:
+                    modes.setdefault(col, default_mode)
+
+        unknown = set(modes.values()) - set(MODES)
+        if unknown:
+            raise ValueError(f"알 수 없는 집계 방식: {unknown}")
+
+        self.modes = {col: mode for col, mode in modes.items() if col in df.columns and col not in skip}
+        for col in self.weighted:
+            self.modes[col] = 'mean'
+
+        self.levels = []
+        self._tz = None
+        self._build(df)
+
+    @classmethod
+    def for_processed(cls, df):
+        """processed_data.csv 용 저장소"""
+        return cls(df, modes=PROCESSED_MODES)
+
+    @classmethod
+    def for_community(cls, df, timestamp_col='post_date'):
+        """community_ts_1h.csv 형식 (게시글 수 가중 감정 평균/표본 분산) 용 저장소"""
+        return cls(df, modes=COMMUNITY_MODES, weighted=COMMUNITY_WEIGHTED,
+                   timestamp_col=timestamp_col, default_mode=None)
+
+    @property
+    def columns(self):
+        return list(self.modes)
+
+    def _raw_stats(self, df):
+        """원본 행 -> 컬럼별 관측 통계"""
+        stats = {}
+        for col in self.modes:
+            if col in self.weighted:
+                count_col, var_col = self.weighted[col]
+                variances = df[var_col] if var_col else np.zeros(len(df))
+                stats[col] = _weighted_stats(df[count_col], df[col], variances, self.ddof)
+            else:
+                stats[col] = _observation_stats(pd.to_numeric(df[col], errors='coerce'))
+        return stats
+
+    def _prepare(self, df):
+        """시간 순 정렬 후 (시간 번호, 컬럼별 통계)"""
+        ts = pd.to_datetime(df[self.timestamp_col])
+        if self._tz is None and ts.dt.tz is not None:
+            self._tz = ts.dt.tz
+        keys = _hour_keys(ts)
+        order = np.argsort(keys, kind='stable')
+        return keys[order], self._raw_stats(df.iloc[order])
+
+    def _build(self, df):
+        """원본 -> 1h -> 4h -> 1d -> 1w 를 한 번에 계산"""
+        keys, stats = self._prepare(df)
+        self.levels = []
+
+        for name, hours in RESOLUTIONS:
+            keys, stats = self._rollup(keys, stats, hours)
+            self.levels.append(_Level(name, hours, keys, stats))
+
+    def _rollup(self, keys, stats, hours):
+        """하위 해상도 (키, 통계) -> 상위 해상도"""
+        bucket = _bucket_keys(keys, hours)
+        starts, unique = _segments(bucket)
+        return unique, {col: _merge(s, starts) for col, s in stats.items()}
+
+    def update(self, df):
+        """
+        새 행 반영 (증분)
+
+        새 행의 가장 이른 시각이 속한 버킷부터만 다시 계산합니다.
+        같은 시간의 기존 행과 새 행은 병합됩니다.
+
+        Args:
+            df: 새 원본 행
+        """
+        if df is None or df.empty:
+            return
+        if not self.levels:
+            self._build(df)
+            return
+
+        keys, stats = self._prepare(df)
+        first_hour = keys[0]
+
+        # 이전 해상도의 "다시 계산할 꼬리" 를 다음 해상도에 전달
+        tail_keys, tail_stats = keys, stats
+        for level in self.levels:
+            cut_key = _bucket_keys(np.array([first_hour]), level.hours)[0]
+            cut = np.searchsorted(level.keys, cut_key)
+
+            if level.hours == 1:
+                # 기존 1h 버킷 중 영향 받는 시간과 새 행을 함께 다시 병합
+                old_keys = level.keys[cut:]
+                old_stats = {c: _slice_stats(level.stats[c], cut) for c in self.modes}
+                merged_keys = np.concatenate((old_keys, tail_keys))
+                order = np.argsort(merged_keys, kind='stable')
+                merged_keys = merged_keys[order]
+                merged_stats = {
+                    c: {k: v[order] for k, v in _concat_stats(old_stats[c], tail_stats[c]).items()}
+                    for c in self.modes
+                }
+                new_keys, new_stats = self._rollup(merged_keys, merged_stats, 1)
+            else:
+                # 하위 해상도에서 cut_key 이후 버킷을 모두 모아 다시 계산
+                child = self.levels[self.levels.index(level) - 1]
+                child_cut = np.searchsorted(child.keys, cut_key)
+                new_keys, new_stats = self._rollup(
+                    child.keys[child_cut:],
+                    {c: _slice_stats(child.stats[c], child_cut) for c in self.modes},
+                    level.hours
+                )
+
+            level.keys = np.concatenate((level.keys[:cut], new_keys))
+            level.stats = {
+                c: _concat_stats(_slice_stats(level.stats[c], 0, cut), new_stats[c]) for c in self.modes
+            }
+
+    def level(self, name):
+        for level in self.levels:
+            if level.name == name:
+                return level
+        raise KeyError(f"알 수 없는 해상도: {name}")
+
+    def _range(self, level, start, end):
+        """[start, end] 범위에 해당하는 버킷 인덱스 구간"""
+        lo = 0 if start is None else np.searchsorted(
+            level.keys, _bucket_keys(_hour_keys([pd.Timestamp(start)]), level.hours)[0])
+        hi = len(level.keys) if end is None else np.searchsorted(
+            level.keys, _hour_keys([pd.Timestamp(end)])[0], side='right')
+        return lo, hi
+
+    def resolution_for(self, start=None, end=None, max_points=DEFAULT_MAX_POINTS):
+        """
+        포인트 예산 안에 들어오는 가장 세밀한 해상도
+
+        Args:
+            start, end: 조회 범위 (None이면 전체)
+            max_points: 최대 포인트 수
+
+        Returns:
+            str: 해상도 이름 (예산을 넘으면 가장 거친 해상도)
+        """
+        for level in self.levels:
+            lo, hi = self._range(level, start, end)
+            if hi - lo <= max_points:
+                return level.name
+        return self.levels[-1].name
+
+    def query(self, start=None, end=None, max_points=DEFAULT_MAX_POINTS, columns=None,
+              resolution=None, stats=False):
+        """
+        시간 범위 조회
+
+        Args:
+            start, end: 조회 범위 (None이면 전체)
+            max_points: 최대 포인트 수 (resolution 미지정 시 해상도 선택에 사용)
+            columns: 반환할 컬럼 (None이면 전체)
+            resolution: 해상도 고정 ('1h', '4h', '1d', '1w')
+            stats: True면 컬럼별 _count / _mean / _var 도 반환
+
+        Returns:
+            DataFrame: timestamp + 컬럼 (attrs['resolution'] 에 해상도)
+        """
+        name = resolution or self.resolution_for(start, end, max_points)
+        level = self.level(name)
+        lo, hi = self._range(level, start, end)
+
+        timestamps = pd.to_datetime(level.keys[lo:hi] * 3600, unit='s')
+        if self._tz is not None:
+            timestamps = timestamps.tz_localize('UTC').tz_convert(self._tz)
+        out = {self.timestamp_col: timestamps}
+
+        for col in (columns or self.columns):
+            if col not in self.modes:
+                continue
+            s = _slice_stats(level.stats[col], lo, hi)
+            out[col] = self._representative(s, self.modes[col])
+
+            if stats:
+                n = s['n']
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    out[f'{col}_count'] = n
+                    out[f'{col}_mean'] = np.where(n > 0, s['sum'] / n, np.nan)
+                    denom = n - self.ddof
+                    out[f'{col}_var'] = np.where(denom > 0, s['m2'] / np.where(denom > 0, denom, 1), 0.0)
+
+        result = pd.DataFrame(out)
+        result.attrs['resolution'] = name
+        return result
+
+    def _representative(self, s, mode):
+        n = s['n']
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if mode == 'sum':
+                return s['sum']
+            if mode == 'mean':
+                return np.where(n > 0, s['sum'] / np.where(n > 0, n, 1), np.nan)
+            if mode == 'max':
+                return np.where(n > 0, s['max'], np.nan)
+            if mode == 'min':
+                return np.where(n > 0, s['min'], np.nan)
+        return s[mode]
@@ -0,0 +1,259 @@
+"""
+정적 데이터 샤드 내보내기
+
+Python 서비스를 띄울 수 없는 배포(Vercel)에서 CSV 전체 사본 대신
+시간 단위로 나눈 gzip 압축 JSON 파일(샤드)과 작은 매니페스트를 만듭니다.
+프런트엔드는 매니페스트를 읽고 최신 샤드만 먼저 받은 뒤 과거 샤드는 필요할 때 받습니다.
+
+    <out_dir>/manifest.json
+    <out_dir>/<dataset>/<resolution>/<period>.<hash>.json.gz
+
+- 시계열(processed, scores)은 RollupStore 로 1h / 4h / 1d / 1w 해상도를 만들고
+  해상도별로 월(1h) / 연(4h, 1d) / 전체(1w) 단위로 나눔
+- 이벤트(alerts, news)는 원본 행을 월 단위로 나눔 (resolution 'event')
+- 샤드 본문은 데이터 API(utils/data_api.py) JSON 응답과 같은 형식이고
+  version 은 샤드 내용 해시 -> 내용이 같은 과거 샤드는 파일 이름이 바뀌지 않아 CDN 캐시 유지
+- gzip 헤더 시각을 0으로 고정해 같은 데이터면 같은 바이트
+- 매니페스트의 샤드 목록은 최신순, 매니페스트는 마지막에 원자적으로 교체하고
+  더 이상 참조되지 않는 샤드 파일은 삭제 (내보낸 데이터셋 / 해상도 디렉토리의 샤드 이름 파일만)
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime
+
+import pandas as pd
+
+# 경로 설정
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.data_api import DataService, encode_frame
+from utils.feature_kernel import FeatureKernel
+from utils.rollup import RollupStore
+
+
+DEFAULT_OUTPUT_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'nextjs-dashboard', 'public', 'data', 'shards'
+)
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# 해상도 -> 샤드 기간 (pandas Period 빈도, None이면 전체 한 개)
+SHARD_PERIODS = {'1h': 'M', '4h': 'Y', '1d': 'Y', '1w': None, 'event': 'M'}
+
+# 데이터셋 -> 내보내기 방식 ('rollup' 이면 RollupStore 해상도별, 'event' 면 원본 행)
+EXPORT_DATASETS = {
+    'processed': 'rollup',
+    'scores': 'rollup',
+    'alerts': 'event',
+    'news': 'event',
+}
+
+# 샤드 파일 이름 (<period>.<내용 해시 12자리>.json.gz) - prune 대상 판별
+SHARD_NAME = re.compile(r'^[0-9A-Za-z-]+\.[0-9a-f]{12}\.json\.gz$')
+
+# JSON 실수 유효 자릿수 (차트 표시에 충분한 정도)
+DOUBLE_PRECISION = 6
+
+
+def _period_keys(timestamps, freq):
+    """timestamp -> 샤드 기간 문자열 ('2025-11', '2025', 'all')"""
+    if freq is None:
+        return pd.Series('all', index=timestamps.index)
+    return timestamps.dt.to_period(freq).astype(str)
+
+
+def _rollup_store(name, df):
+    """데이터셋별 롤업 저장소"""
+    if name == 'processed':
+        # 이동 평균 / Z-score 등 파생 변수는 집계하면 의미가 없으므로 원본 컬럼만
+        derived = set(FeatureKernel().output_columns(df.columns))
+        return RollupStore.for_processed(df[[c for c in df.columns if c not in derived]])
+    return RollupStore(df)
+
+
+class StaticShardExporter:
+    """데이터셋 -> 시간 샤드 (gzip JSON) + 매니페스트"""
+
+    def __init__(self, output_dir=DEFAULT_OUTPUT_DIR, data_dir=None, datasets=None,
+                 resolutions=('1h', '4h', '1d', '1w'), compresslevel=9):
+        """
+        Args:
+            output_dir: 출력 디렉토리
+            data_dir: 데이터 디렉토리 (기본값: 프로젝트 data/)
+            datasets: 내보낼 데이터셋 이름 (None이면 EXPORT_DATASETS 전체)
+            resolutions: 롤업 데이터셋 해상도
+            compresslevel: gzip 압축 수준
+        """
+        self.output_dir = output_dir
+        self.service = DataService(data_dir)
+        self.datasets = list(datasets or EXPORT_DATASETS)
+        self.resolutions = list(resolutions)
+        self.compresslevel = compresslevel
+
+        unknown = [d for d in self.datasets if d not in EXPORT_DATASETS]
+        if unknown:
+            raise ValueError(f"내보낼 수 없는 데이터셋: {unknown}")
+
+    def frames(self, name):
+        """
+        데이터셋 -> 해상도별 데이터프레임
+
+        Returns:
+            dict: {해상도: timestamp 순 데이터프레임}
+        """
+        df, _ = self.service.frame(name)
+        if df.empty or 'timestamp' not in df.columns:
+            return {}
+        if EXPORT_DATASETS[name] == 'event':
+            return {'event': df}
+
+        store = _rollup_store(name, df)
+        return {res: store.query(resolution=res) for res in self.resolutions}
+
+    def write_shard(self, name, resolution, period, df):
+        """
+        샤드 파일 하나 쓰기 (같은 내용의 파일이 있으면 그대로 둠)
+
+        해시 이름의 파일은 영구 캐시되므로 같은 디렉토리의 고유 임시 파일에 다 쓴 뒤 교체합니다
+        (중간에 끊겨도 잘린 파일이 최종 이름으로 남지 않음).
+
+        Returns:
+            dict: 매니페스트 샤드 항목
+        """
+        frame = df.to_json(orient='split', index=False, date_format='iso', date_unit='s',
+                           double_precision=DOUBLE_PRECISION)
+        digest = hashlib.sha256(frame.encode('utf-8')).hexdigest()[:12]
+        raw = encode_frame(name, df, digest, double_precision=DOUBLE_PRECISION)
+
+        rel_path = f'{name}/{resolution}/{period}.{digest}.json.gz'
+        path = os.path.join(self.output_dir, rel_path)
+        if os.path.exists(path):
+            size = os.path.getsize(path)
+        else:
+            body = gzip.compress(raw, self.compresslevel, mtime=0)
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', suffix='.tmp', dir=directory)
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(body)
+                    f.flush()
+                    os.fsync(f.fileno())
+                # mkstemp 는 0600 으로 만들므로 정적 호스팅이 읽을 수 있는 권한으로
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+            size = len(body)
+
+        return {
+            'period': period,
+            'path': rel_path,
+            'start': df['timestamp'].iloc[0].isoformat(),
+            'end': df['timestamp'].iloc[-1].isoformat(),
+            'rows': len(df),
+            'bytes': size,
+            'raw_bytes': len(raw),
+            'version': digest,
+        }
+
+    def export_dataset(self, name):
+        """
+        데이터셋 하나 내보내기
+
+        Returns:
+            dict: 매니페스트 데이터셋 항목 (해상도별 최신순 샤드 목록)
+        """
+        entry = {'kind': EXPORT_DATASETS[name], 'version': self.service.fingerprint(name), 'resolutions': {}}
+        for resolution, df in self.frames(name).items():
+            df = df.sort_values('timestamp', kind='stable').reset_index(drop=True)
+            periods = _period_keys(df['timestamp'], SHARD_PERIODS[resolution])
+            shards = [
+                self.write_shard(name, resolution, period, part.reset_index(drop=True))
+                for period, part in df.groupby(periods, sort=True)
+            ]
+            entry['resolutions'][resolution] = {
+                'columns': list(df.columns),
+                'rows': len(df),
+                'shards': shards[::-1],
+            }
+        return entry
+
+    def export(self):
+        """
+        전체 내보내기 (매니페스트 교체 + 참조되지 않는 샤드 삭제)
+
+        Returns:
+            dict: 매니페스트
+        """
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = {
+            'manifest_version': MANIFEST_VERSION,
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'datasets': {name: self.export_dataset(name) for name in self.datasets},
+        }
+
+        # 다른 데이터셋의 기존 샤드는 유지 (일부 데이터셋만 내보낸 경우)
+        previous = load_manifest(self.output_dir)
+        for name, entry in (previous or {}).get('datasets', {}).items():
+            manifest['datasets'].setdefault(name, entry)
+
+        path = os.path.join(self.output_dir, MANIFEST_NAME)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, path)
+
+        self.prune(manifest)
+        return manifest
+
+    def prune(self, manifest):
+        """
+        매니페스트가 참조하지 않는 샤드 파일 삭제
+
+        내보낸 데이터셋의 <output_dir>/<dataset>/<resolution>/ 바로 아래에서
+        샤드 이름 형식(<period>.<hash>.json.gz)인 파일만 대상으로 합니다.
+        (출력 디렉토리에 있는 다른 파일은 건드리지 않음)
+
+        Returns:
+            int: 삭제한 파일 수
+        """
+        referenced = {
+            os.path.normpath(os.path.join(self.output_dir, shard['path']))
+            for entry in manifest['datasets'].values()
+            for res in entry['resolutions'].values()
+            for shard in res['shards']
+        }
+        removed = 0
+        for name in self.datasets:
+            for resolution in SHARD_PERIODS:
+                directory = os.path.join(self.output_dir, name, resolution)
+                if not os.path.isdir(directory):
+                    continue
+                for filename in os.listdir(directory):
+                    path = os.path.normpath(os.path.join(directory, filename))
+                    if SHARD_NAME.match(filename) and os.path.isfile(path) and path not in referenced:
+                        os.remove(path)
+                        removed += 1
+        return removed
+
+
+def load_manifest(output_dir=DEFAULT_OUTPUT_DIR):
+    """기존 매니페스트 (없으면 None)"""
+    path = os.path.join(output_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"경고: 매니페스트 로드 실패 - {e}")
+        return None
@@ -0,0 +1,168 @@
+"""
+시간 인덱스 접근자
+
+timestamp 정렬 배열에 searchsorted 이분 탐색을 적용해 시간 범위를 행 구간
+[lo, hi) 로 바꾸고, iloc 슬라이스(복사 없는 뷰)로 잘라냅니다.
+
+- 날짜 필터 / 지표 카드가 같은 접근자를 사용 (범위 변경은 O(log n))
+- '최근 N시간' 은 행 개수(tail)가 아니라 시간으로 계산 -> 빠진 시간이 있어도 정확
+- 데이터프레임별 접근자는 한 번만 만들고, 잘라낸 프레임에는 부모 배열의 뷰로
+  접근자를 미리 등록 (필터 -> 지표 계산 흐름에서 다시 정렬 검사하지 않음)
+- 접근자는 프레임 id 로 캐시하므로, 캐시된 프레임의 timestamp 를 제자리에서
+  수정하지 않는다는 (SharedCache 프레임과 같은) 가정을 따름
+"""
+
+import weakref
+
+import numpy as np
+import pandas as pd
+
+_NS_PER_HOUR = 3_600_000_000_000
+
+# id(df) -> (weakref(df), TimeIndex) - 프레임이 사라지면 함께 제거
+_INDEXES = {}
+
+
+def _to_ns(value):
+    """시각 값 -> epoch ns (tz-aware 는 UTC 기준, naive 는 UTC 로 간주)"""
+    ts = pd.Timestamp(value)
+    if ts.tz is not None:
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    return ts.as_unit('ns').value
+
+
+class TimeIndex:
+    """정렬된 timestamp 컬럼 기준 시간 범위 접근자"""
+
+    # timestamp 가 정렬되어 있지 않을 때 정렬한 복사본
+    _sorted = None
+
+    def __init__(self, df, column='timestamp', _ns=None):
+        """
+        Args:
+            df: 데이터프레임 (timestamp 오름차순이 아니면 정렬한 복사본을 사용)
+            column: 시간 컬럼 이름
+        """
+        if _ns is None:
+            ts = df[column]
+            if ts.dt.tz is not None:
+                ts = ts.dt.tz_convert('UTC').dt.tz_localize(None)
+            _ns = ts.astype('datetime64[ns]').to_numpy().view('int64')
+            if len(_ns) > 1 and (np.diff(_ns) < 0).any():
+                order = np.argsort(_ns, kind='stable')
+                self._sorted = df.iloc[order].reset_index(drop=True)
+                _ns = _ns[order]
+        # 원본 프레임은 약한 참조 (접근자 캐시가 프레임 수명을 늘리지 않도록)
+        self._df = weakref.ref(df)
+        self.column = column
+        self.ns = _ns
+        # 잘라낸 프레임이면 최상위 접근자와 그 안에서의 시작 행 (범위 집계 인덱스 공유용)
+        self.root = self
+        self.offset = 0
+
+    @property
+    def df(self):
+        """접근 대상 프레임 (timestamp 오름차순)"""
+        return self._sorted if self._sorted is not None else self._df()
+
+    def __len__(self):
+        return len(self.ns)
+
+    def bounds(self, start=None, end=None, inclusive_end=False):
+        """
+        시간 범위 -> 행 구간
+
+        Args:
+            start: 시작 시각 (포함, None이면 처음부터)
+            end: 끝 시각 (None이면 끝까지)
+            inclusive_end: True면 end 시각의 행도 포함
+
+        Returns:
+            tuple: (lo, hi) - df.iloc[lo:hi]
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.ns, _to_ns(start), side='left'))
+        hi = len(self.ns) if end is None else int(
+            np.searchsorted(self.ns, _to_ns(end), side='right' if inclusive_end else 'left'))
+        return lo, max(lo, hi)
+
+    def last_bounds(self, hours, end=None):
+        """
+        끝 시각 기준 최근 hours 시간 (end - hours, end] 의 행 구간
+
+        Args:
+            hours: 시간 수 (None이면 전체)
+            end: 기준 끝 시각 (None이면 마지막 행)
+
+        Returns:
+            tuple: (lo, hi)
+        """
+        if len(self.ns) == 0:
+            return 0, 0
+        hi = len(self.ns) if end is None else int(np.searchsorted(self.ns, _to_ns(end), side='right'))
+        if hours is None or hi == 0:
+            return 0, hi
+        cutoff = self.ns[hi - 1] - int(round(hours * _NS_PER_HOUR))
+        lo = int(np.searchsorted(self.ns[:hi], cutoff, side='right'))
+        return lo, hi
+
+    def take(self, lo, hi):
+        """
+        행 구간 슬라이스 (접근자도 함께 등록)
+
+        Returns:
+            DataFrame: df.iloc[lo:hi]
+        """
+        if lo == 0 and hi == len(self.ns):
+            return self.df
+        part = self.df.iloc[lo:hi]
+        child = TimeIndex(part, self.column, _ns=self.ns[lo:hi])
+        child.root, child.offset = self.root, self.offset + lo
+        _register(part, child)
+        return part
+
+    def slice(self, start=None, end=None, inclusive_end=False):
+        """시간 범위 [start, end) 의 데이터프레임 (inclusive_end 면 [start, end])"""
+        return self.take(*self.bounds(start, end, inclusive_end))
+
+    def last(self, hours, end=None):
+        """최근 hours 시간 (end - hours, end] 의 데이터프레임"""
+        return self.take(*self.last_bounds(hours, end))
+
+    def hours_since_start(self, lo=0, hi=None):
+        """
+        구간 첫 행 기준 경과 시간 (회귀 x 축)
+
+        Returns:
+            ndarray: float64 시간
+        """
+        ns = self.ns[lo:hi]
+        if len(ns) == 0:
+            return np.empty(0)
+        return (ns - ns[0]) / _NS_PER_HOUR
+
+
+def _register(df, index):
+    key = id(df)
+    _INDEXES[key] = (weakref.ref(df), index)
+    weakref.finalize(df, _INDEXES.pop, key, None)
+
+
+def time_index(df, column='timestamp'):
+    """
+    데이터프레임의 시간 접근자 (프레임별로 한 번만 생성)
+
+    Args:
+        df: timestamp 컬럼이 있는 데이터프레임
+        column: 시간 컬럼 이름
+
+    Returns:
+        TimeIndex: 접근자 (컬럼이 없으면 None)
+    """
+    if df is None or column not in df.columns:
+        return None
+    cached = _INDEXES.get(id(df))
+    if cached is not None and cached[0]() is df and cached[1].column == column:
+        return cached[1]
+    index = TimeIndex(df, column)
+    _register(df, index)
+    return index
@@ -0,0 +1,166 @@
+"""
+타임스탬프 정규화 유틸리티
+
+모든 원본 데이터의 시간 컬럼을 하나의 형식으로 맞춥니다.
+
+- 저장 형식: tz-naive UTC datetime64[ns] (processed_data.csv 와 동일한 기준)
+- 파싱: 소스별 명시적 포맷을 순서대로 적용하고, 같은 문자열은 한 번만 파싱
+  (포맷 끝의 UTC 표기 '+00' / '+00:00' / 'Z' 는 잘라낸 뒤 tz 없는 포맷으로 파싱 -
+   오프셋 파싱보다 수 배 빠름)
+- 시간 버킷: 1970-01-01 부터의 경과 시간(int64)으로 병합/집계 키를 만듦
+"""
+
+import numpy as np
+import pandas as pd
+
+# 모든 로더가 반환하는 timestamp 컬럼 dtype
+TIMESTAMP_DTYPE = 'datetime64[ns]'
+
+# 소스별 시간 문자열 포맷 (앞에서부터 시도, 남은 값만 다음 포맷으로)
+#   고래 거래: '2025-01-01 0:00' (시가 한 자리일 수 있음)
+#   가격: '2025-06-20 04:00:00+00', '2025-10-25 21:54:47.989+00'
+#   텔레그램: '2025-01-01 00:00:00+00:00'
+#   트위터: '2025-08-08T17:05:00.000Z'
+SOURCE_FORMATS = {
+    'whale_transactions': ('%Y-%m-%d %H:%M', 'ISO8601'),
+    'price': ('%Y-%m-%d %H:%M:%S+00', '%Y-%m-%d %H:%M:%S.%f+00', 'ISO8601'),
+    'telegram': ('%Y-%m-%d %H:%M:%S+00:00', 'ISO8601'),
+    'twitter': ('%Y-%m-%dT%H:%M:%S.%fZ', 'ISO8601'),
+    'coinness': ('ISO8601',),
+}
+DEFAULT_FORMATS = ('ISO8601',)
+
+# 포맷 끝에 붙은 고정 UTC 표기 (긴 것부터 검사)
+UTC_SUFFIXES = ('+00:00', '+00', 'Z')
+
+_NS_PER_HOUR = 3_600_000_000_000
+
+
+def parse_timestamps(values, formats=DEFAULT_FORMATS, infer_fallback=True):
+    """
+    시간 문자열을 tz-naive UTC 타임스탬프로 변환
+
+    중복 문자열은 한 번만 파싱한 뒤 코드로 펼치고, 오프셋이 있는 값은 UTC 로
+    변환, 오프셋이 없는 값은 UTC 로 간주합니다.
+
+    Args:
+        values: 시간 문자열(또는 datetime) Series / 배열
+        formats: 순서대로 시도할 strftime 포맷 또는 'ISO8601'
+        infer_fallback: 모든 포맷이 실패한 값에 한해 형식 추론 파싱 시도
+
+    Returns:
+        Series: TIMESTAMP_DTYPE (파싱 실패는 NaT), 입력과 같은 인덱스
+    """
+    index = values.index if isinstance(values, pd.Series) else None
+    values = pd.Series(values, index=index, copy=False)
+
+    if pd.api.types.is_datetime64_any_dtype(values.dtype):
+        return pd.Series(_to_canonical(values.array), index=values.index)
+
+    codes, uniques = pd.factorize(values.to_numpy(dtype=object), use_na_sentinel=True)
+    parsed = np.full(len(uniques), np.datetime64('NaT'), dtype=TIMESTAMP_DTYPE)
+
+    pending = np.arange(len(uniques))
+    for fmt in formats:
+        if len(pending) == 0:
+            break
+        parsed[pending] = _parse_format(uniques[pending], fmt)
+        pending = pending[np.isnat(parsed[pending])]
+
+    if infer_fallback and len(pending) > 0:
+        attempt = pd.to_datetime(uniques[pending], format='mixed', utc=True, errors='coerce')
+        parsed[pending] = _to_canonical(attempt)
+
+    out = parsed[codes]
+    out[codes < 0] = np.datetime64('NaT')
+    return pd.Series(out, index=values.index)
+
+
+def _parse_format(strings, fmt):
+    """
+    한 가지 포맷으로 파싱 (UTC 표기로 끝나는 포맷은 접미사를 잘라 tz 없이 파싱)
+
+    Args:
+        strings: 시간 문자열 object 배열
+        fmt: strftime 포맷 또는 'ISO8601'
+
+    Returns:
+        ndarray: TIMESTAMP_DTYPE 배열 (실패는 NaT)
+    """
+    suffix = None if fmt == 'ISO8601' else next((sfx for sfx in UTC_SUFFIXES if fmt.endswith(sfx)), None)
+    if suffix is None:
+        return _to_canonical(pd.to_datetime(strings, format=fmt, utc=True, errors='coerce'))
+
+    matched = np.fromiter((isinstance(v, str) and v.endswith(suffix) for v in strings),
+                          dtype=bool, count=len(strings))
+    out = np.full(len(strings), np.datetime64('NaT'), dtype=TIMESTAMP_DTYPE)
+    if matched.any():
+        stripped = [v[:-len(suffix)] for v in strings[matched]]
+        out[matched] = _to_canonical(pd.to_datetime(stripped, format=fmt[:-len(suffix)], errors='coerce'))
+    return out
+
+
+def _to_canonical(ts):
+    """DatetimeIndex / DatetimeArray 를 tz-naive UTC TIMESTAMP_DTYPE 배열로 변환"""
+    ts = pd.DatetimeIndex(ts)
+    if ts.tz is not None:
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    return ts.to_numpy().astype(TIMESTAMP_DTYPE)
+
+
+def normalize_timestamp_column(df, column, source=None, formats=None):
+    """
+    데이터프레임의 시간 컬럼을 'timestamp' 로 정규화
+
+    파싱 실패 행은 제거하고 시간순으로 정렬합니다.
+
+    Args:
+        df: 원본 데이터프레임
+        column: 시간 컬럼 이름
+        source: SOURCE_FORMATS 키 (formats 가 없을 때 사용)
+        formats: 시도할 포맷 목록 (기본값: 소스별 포맷)
+
+    Returns:
+        DataFrame: 'timestamp' 컬럼이 정규화된 데이터프레임
+    """
+    if formats is None:
+        formats = SOURCE_FORMATS.get(source, DEFAULT_FORMATS)
+
+    df = df.copy()
+    df[column] = parse_timestamps(df[column], formats)
+    df = df.dropna(subset=[column])
+    if column != 'timestamp':
+        df = df.rename(columns={column: 'timestamp'})
+    return df.sort_values('timestamp', kind='stable').reset_index(drop=True)
+
+
+def hour_key(timestamps):
+    """
+    시간 버킷 정수 키 (1970-01-01 00:00 UTC 부터 경과한 시간 수)
+
+    dt.floor('h') 대신 병합/그룹 키로 사용합니다.
+
+    Args:
+        timestamps: datetime Series / DatetimeIndex (tz-aware 는 UTC 기준)
+
+    Returns:
+        ndarray: int64 시간 키
+    """
+    ts = pd.Series(timestamps, copy=False)
+    if ts.dt.tz is not None:
+        ts = ts.dt.tz_convert('UTC').dt.tz_localize(None)
+    ns = ts.astype(TIMESTAMP_DTYPE).to_numpy().view('int64')
+    return np.floor_divide(ns, _NS_PER_HOUR)
+
+
+def hour_from_key(keys):
+    """
+    hour_key() 값을 다시 timestamp 로 변환
+
+    Args:
+        keys: int64 시간 키 배열
+
+    Returns:
+        ndarray: TIMESTAMP_DTYPE 배열
+    """
+    return (np.asarray(keys, dtype='int64') * _NS_PER_HOUR).view(TIMESTAMP_DTYPE)